@@ -15,6 +15,7 @@ from .types import (
 )
 from .config import (
     LLMConfig,
+    SimulationConfig,
     AgentConfig,
     DEFAULT_AGENT_CONFIGS,
     get_default_config,
@@ -37,6 +38,13 @@ from .registry import (
     agent,
 )
 from .registration import register_all_agents, ensure_agents_registered
+from .usage_ledger import (
+    LLMCallRecord,
+    StreamTimer,
+    UsageLedger,
+    estimate_cost,
+    get_active_ledger,
+)
 
 # Blue Team Agents
 from .blue import StrategyArchitectAgent
@@ -63,6 +71,7 @@ __all__ = [
     "get_roles_by_category",
     # Config
     "LLMConfig",
+    "SimulationConfig",
     "AgentConfig",
     "DEFAULT_AGENT_CONFIGS",
     "get_default_config",
@@ -84,6 +93,12 @@ __all__ = [
     # Registration
     "register_all_agents",
     "ensure_agents_registered",
+    # Usage Ledger
+    "LLMCallRecord",
+    "StreamTimer",
+    "UsageLedger",
+    "estimate_cost",
+    "get_active_ledger",
     # Blue Team Agents
     "StrategyArchitectAgent",
     # Orchestrator Agents
@@ -9,8 +9,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Optional, List, Dict, Any, TYPE_CHECKING, Union
 import asyncio
+import hashlib
 import logging
 import os
+import time
 import uuid
 
 # Ensure .env is loaded before anything else
@@ -21,7 +23,11 @@ import anthropic
 import groq
 
 from .types import AgentRole, AgentCategory
-from .config import AgentConfig
+from .config import PROVIDER_API_KEY_ENV_VARS, AgentConfig
+from .simulated_llm import SimulatedLLMClient
+from .usage_ledger import LLMCallRecord, StreamTimer, get_active_ledger
+from .utils.section_resolver import SectionResolver
+from comms.tracing import span
 
 if TYPE_CHECKING:
     from models.document_types import DocumentType
@@ -84,6 +90,11 @@ class AgentOutput:
         }
 
 
+def section_fingerprint(content: str) -> str:
+    """Fingerprint of a section's content, for detecting edits between rounds."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
 @dataclass
 class SwarmContext:
     """
@@ -109,6 +120,10 @@ class SwarmContext:
     # Current document state
     current_draft: Optional[Dict[str, Any]] = None
     section_drafts: Dict[str, str] = field(default_factory=dict)
+    # Section fingerprints as of the last red team critique
+    section_fingerprints: Dict[str, str] = field(default_factory=dict)
+    # Resolver for critique targets, shared by copies of this context
+    section_resolver: Optional[SectionResolver] = field(default=None, repr=False, compare=False)
 
     # Debate context
     round_number: int = 1
@@ -136,6 +151,27 @@ class SwarmContext:
         """Get the current content for a section."""
         return self.section_drafts.get(section_name)
 
+    def changed_sections(self) -> List[str]:
+        """Sections added or edited since mark_sections_critiqued(), in draft order."""
+        return [
+            name for name, content in self.section_drafts.items()
+            if self.section_fingerprints.get(name) != section_fingerprint(content)
+        ]
+
+    def mark_sections_critiqued(self) -> None:
+        """Record the current section content as critiqued."""
+        self.section_fingerprints = {
+            name: section_fingerprint(content) for name, content in self.section_drafts.items()
+        }
+
+    def get_section_resolver(self) -> SectionResolver:
+        """Get the critique target resolver, rebuilding it if the section names changed."""
+        resolver = self.section_resolver
+        if resolver is None or not resolver.is_current(self.section_drafts):
+            resolver = SectionResolver(self.section_drafts)
+            self.section_resolver = resolver
+        return resolver
+
     def get_critiques_for_section(self, section_name: str) -> List[Dict[str, Any]]:
         """Get pending critiques for a specific section."""
         return [
@@ -149,10 +185,11 @@ class SwarmContext:
             "session_id": self.session_id,
             "document_type": self.document_type,
             "document_id": self.document_id,
-            "company_profile": self.company_profile,
+            "company_profile": dict(self.company_profile) if self.company_profile is not None else None,
             "opportunity": self.opportunity,
             "current_draft": self.current_draft,
             "section_drafts": self.section_drafts,
+            "section_fingerprints": self.section_fingerprints,
             "round_number": self.round_number,
             "round_type": self.round_type,
             "previous_outputs": self.previous_outputs,
@@ -165,6 +202,16 @@ class SwarmContext:
         }
 
 
+def _anthropic_cache_usage(usage: Any) -> Dict[str, int]:
+    """Extract prompt cache token counts from an Anthropic usage object, if any."""
+    cache_usage = {}
+    for key in ("cache_creation_input_tokens", "cache_read_input_tokens"):
+        value = getattr(usage, key, None)
+        if isinstance(value, int) and value > 0:
+            cache_usage[key] = value
+    return cache_usage
+
+
 class AbstractAgent(ABC):
     """
     Abstract base class for all agents in the adversarial swarm.
@@ -185,14 +232,20 @@ class AbstractAgent(ABC):
         self._initialized = False
         self._call_count = 0
         self._total_tokens = 0
-        self._stream_callback: Optional[Callable[[str], None]] = None
+        self._stream_callback: Optional[Callable[..., None]] = None
         self._provider = config.llm_config.provider
 
         # Initialize LLM client based on provider
         api_key = os.getenv(config.llm_config.api_key_env_var)
-        if api_key:
+        if self._provider == "simulated":
+            self._llm_client: Union[anthropic.AsyncAnthropic, groq.AsyncGroq, SimulatedLLMClient, None] = SimulatedLLMClient(
+                config.llm_config.simulation,
+                self._generate_mock_content,
+                name=config.role.value,
+            )
+        elif api_key:
             if self._provider == "groq":
-                self._llm_client: Union[anthropic.AsyncAnthropic, groq.AsyncGroq, None] = groq.AsyncGroq(
+                self._llm_client = groq.AsyncGroq(
                     api_key=api_key,
                     timeout=config.llm_config.timeout,
                 )
@@ -250,18 +303,36 @@ class AbstractAgent(ABC):
         """Get the agent's priority for ordering."""
         return self._config.priority
 
-    def set_stream_callback(self, callback: Optional[Callable[[str], None]]) -> None:
+    def set_stream_callback(self, callback: Optional[Callable[..., None]]) -> None:
         """
         Set a callback to receive streaming LLM output.
 
-        The callback is invoked with each text chunk as it's generated.
-        This enables real-time streaming to the frontend.
+        The callback is invoked as callback(chunk, section=None) with each
+        text chunk as it's generated. This enables real-time streaming to
+        the frontend. section names the section the chunk belongs to when
+        an agent generates several sections concurrently.
 
         Args:
-            callback: Function that receives each text chunk, or None to disable
+            callback: Function taking a chunk and an optional section name,
+                or None to disable
         """
         self._stream_callback = callback
 
+    def _section_stream_callback(self, section_name: str) -> Optional[Callable[[str], None]]:
+        """
+        Get a stream callback that tags each chunk with a section name.
+
+        Args:
+            section_name: Section the streamed output belongs to
+
+        Returns:
+            Chunk callback, or None if streaming is disabled
+        """
+        callback = self._stream_callback
+        if callback is None:
+            return None
+        return lambda chunk: callback(chunk, section_name)
+
     @abstractmethod
     async def process(self, context: SwarmContext) -> AgentOutput:
         """
@@ -389,6 +460,7 @@ class AbstractAgent(ABC):
         system_prompt: str,
         user_prompt: str,
         stream_callback: Optional[Callable[[str], None]] = None,
+        operation: str = "",
     ) -> Dict[str, Any]:
         """
         Call the LLM to generate content.
@@ -400,17 +472,82 @@ class AbstractAgent(ABC):
             system_prompt: System prompt for the LLM
             user_prompt: User prompt with the specific request
             stream_callback: Optional callback for streaming chunks
+            operation: Agent operation making the call, recorded in the
+                usage ledger (e.g. "comprehensive_analysis")
 
         Returns:
             Dictionary with:
                 - success: bool indicating if the call succeeded
                 - content: The generated text content
                 - usage: Dict with input_tokens and output_tokens
+                - streaming: Stream telemetry (streaming calls only, see StreamTimer)
                 - error: Optional error message if success is False
         """
+        effective_callback = stream_callback or self._stream_callback
+        ledger = get_active_ledger()
+        if ledger is None:
+            return await self._call_llm_with_retries(system_prompt, user_prompt, effective_callback, {})
+
+        # Record the call in the generation's usage ledger
+        record = LLMCallRecord(
+            agent_name=self.name,
+            agent_role=self.role.value,
+            provider=self._provider,
+            model=self._config.llm_config.model,
+            phase=ledger.current_phase,
+            round_number=ledger.current_round,
+            operation=operation,
+            streamed=effective_callback is not None,
+        )
+        call_stats = {"attempts": 0}
+        started = time.perf_counter()
+
+        response = await self._call_llm_with_retries(
+            system_prompt, user_prompt, effective_callback, call_stats
+        )
+
+        usage = response.get("usage", {})
+        record.latency_ms = (time.perf_counter() - started) * 1000
+        record.retries = max(0, call_stats["attempts"] - 1)
+        record.input_tokens = usage.get("input_tokens", 0)
+        record.output_tokens = usage.get("output_tokens", 0)
+        record.cache_creation_input_tokens = usage.get("cache_creation_input_tokens", 0)
+        record.cache_read_input_tokens = usage.get("cache_read_input_tokens", 0)
+        record.success = response.get("success", False)
+        record.error = response.get("error")
+        streaming = response.get("streaming")
+        if streaming:
+            record.time_to_first_token_ms = streaming["time_to_first_token_ms"]
+            record.chunk_count = streaming["chunk_count"]
+            record.mean_inter_chunk_ms = streaming["mean_inter_chunk_ms"]
+            record.max_inter_chunk_ms = streaming["max_inter_chunk_ms"]
+            record.output_tokens_per_second = streaming["output_tokens_per_second"]
+        ledger.record(record)
+
+        return response
+
+    async def _call_llm_with_retries(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stream_callback: Optional[Callable[[str], None]],
+        call_stats: Dict[str, int],
+    ) -> Dict[str, Any]:
+        """
+        Call the configured provider, retrying rate limits and transient errors.
+
+        Args:
+            system_prompt: System prompt for the LLM
+            user_prompt: User prompt with the specific request
+            stream_callback: Optional callback for streaming chunks
+            call_stats: Updated with the number of attempts made
+
+        Returns:
+            Response dictionary as described in _call_llm()
+        """
         if not self._llm_client:
             self.log_error("LLM client not initialized - API key may be missing")
-            api_key_var = "GROQ_API_KEY" if self._provider == "groq" else "ANTHROPIC_API_KEY"
+            api_key_var = PROVIDER_API_KEY_ENV_VARS.get(self._provider, "ANTHROPIC_API_KEY")
             return {
                 "success": False,
                 "content": "",
@@ -422,23 +559,32 @@ class AbstractAgent(ABC):
         last_error: Optional[Exception] = None
 
         for attempt in range(llm_config.max_retries):
+            call_stats["attempts"] = attempt + 1
             try:
                 self.log_debug(
                     f"Calling LLM [{self._provider}] (attempt {attempt + 1}/{llm_config.max_retries})"
                 )
 
-                # Use streaming if callback provided or set on agent
-                effective_callback = stream_callback or self._stream_callback
-                if effective_callback:
-                    return await self._call_llm_streaming(
-                        system_prompt, user_prompt, effective_callback
-                    )
-
-                # Route to appropriate provider
-                if self._provider == "groq":
-                    return await self._call_groq(system_prompt, user_prompt, llm_config)
-                else:
-                    return await self._call_anthropic(system_prompt, user_prompt, llm_config)
+                with span(
+                    "llm.attempt",
+                    agent=self.name,
+                    provider=self._provider,
+                    model=llm_config.model,
+                    attempt=attempt + 1,
+                ):
+                    # Use streaming if a callback was provided or set on the agent
+                    if stream_callback:
+                        return await self._call_llm_streaming(
+                            system_prompt, user_prompt, stream_callback
+                        )
+
+                    # Route to appropriate provider
+                    if self._provider == "simulated":
+                        return await self._call_simulated(system_prompt, user_prompt)
+                    elif self._provider == "groq":
+                        return await self._call_groq(system_prompt, user_prompt, llm_config)
+                    else:
+                        return await self._call_anthropic(system_prompt, user_prompt, llm_config)
 
             except (anthropic.RateLimitError, groq.RateLimitError) as e:
                 last_error = e
@@ -533,6 +679,7 @@ class AbstractAgent(ABC):
             "usage": {
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
+                **_anthropic_cache_usage(response.usage),
             },
         }
 
@@ -602,12 +749,28 @@ class AbstractAgent(ABC):
             stream_callback: Callback invoked with each text chunk
 
         Returns:
-            Dictionary with success, content, usage, and optional error
+            Dictionary with success, content, usage, streaming telemetry,
+            and optional error
         """
-        if self._provider == "groq":
-            return await self._call_groq_streaming(system_prompt, user_prompt, stream_callback)
+        timer = StreamTimer(stream_callback)
+        if self._provider == "simulated":
+            response = await self._call_simulated(system_prompt, user_prompt, timer)
+        elif self._provider == "groq":
+            response = await self._call_groq_streaming(system_prompt, user_prompt, timer)
         else:
-            return await self._call_anthropic_streaming(system_prompt, user_prompt, stream_callback)
+            response = await self._call_anthropic_streaming(system_prompt, user_prompt, timer)
+
+        streaming = timer.summary(response.get("usage", {}).get("output_tokens", 0))
+        response["streaming"] = streaming
+        if streaming["time_to_first_token_ms"] is not None:
+            rate = streaming["output_tokens_per_second"]
+            self.log_debug(
+                f"Stream: first token {streaming['time_to_first_token_ms']:.0f}ms, "
+                f"{streaming['chunk_count']} chunks, "
+                f"max gap {streaming['max_inter_chunk_ms'] or 0:.0f}ms"
+                + (f", {rate:.1f} tokens/s" if rate else "")
+            )
+        return response
 
     async def _call_anthropic_streaming(
         self,
@@ -652,6 +815,7 @@ class AbstractAgent(ABC):
                 "usage": {
                     "input_tokens": input_tokens,
                     "output_tokens": output_tokens,
+                    **_anthropic_cache_usage(final_message.usage),
                 },
             }
 
@@ -727,6 +891,49 @@ class AbstractAgent(ABC):
                 "error": str(e),
             }
 
+    async def _call_simulated(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stream_callback: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call the simulated provider.
+
+        Injected 429/5xx errors propagate to _call_llm's retry handling.
+        """
+        if stream_callback:
+            response = await self._llm_client.stream(system_prompt, user_prompt, stream_callback)
+        else:
+            response = await self._llm_client.create(system_prompt, user_prompt)
+
+        usage = response["usage"]
+        self._track_usage(usage["input_tokens"], usage["output_tokens"])
+
+        self.log_debug(
+            f"Simulated call successful: {usage['input_tokens']} input, {usage['output_tokens']} output tokens"
+        )
+
+        return {
+            "success": True,
+            "content": response["content"],
+            "usage": usage,
+        }
+
+    def _generate_mock_content(self, prompt: str) -> str:
+        """
+        Generate placeholder content for the simulated provider.
+
+        Agents override this with role-specific mock responses.
+        """
+        return (
+            f"## {self.name} Response\n\n"
+            f"Simulated response to a {len(prompt):,}-character prompt.\n\n"
+            "- Key finding one\n"
+            "- Key finding two\n"
+            "- Recommended next step\n"
+        )
+
     def get_stats(self) -> Dict[str, Any]:
         """Get agent usage statistics."""
         return {
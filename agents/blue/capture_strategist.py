@@ -333,6 +333,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="develop_win_themes",
         )
 
         if not llm_response.get("success"):
@@ -372,6 +373,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="identify_discriminators",
         )
 
         if not llm_response.get("success"):
@@ -414,6 +416,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="analyze_ghost_team",
         )
 
         if not llm_response.get("success"):
@@ -458,6 +461,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="analyze_price_to_win",
         )
 
         if not llm_response.get("success"):
@@ -502,6 +506,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_strategy_summary",
         )
 
         if not llm_response.get("success"):
@@ -587,6 +592,7 @@ class CaptureStrategistAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=CAPTURE_STRATEGIST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="revise_section",
         )
 
         if llm_response.get("success"):
@@ -325,6 +325,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="assess_eligibility",
         )
 
         if llm_response.get("success"):
@@ -398,6 +399,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="check_far_compliance",
         )
 
         if llm_response.get("success"):
@@ -439,6 +441,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="analyze_oci",
         )
 
         if llm_response.get("success"):
@@ -486,6 +489,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_checklist",
         )
 
         if llm_response.get("success"):
@@ -528,6 +532,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="check_subcontracting",
         )
 
         if llm_response.get("success"):
@@ -605,6 +610,7 @@ class ComplianceNavigatorAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPLIANCE_NAVIGATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="revise_section",
         )
 
         if llm_response.get("success"):
@@ -15,6 +15,7 @@ from typing import Dict, List, Any, Optional
 from agents.base import BlueTeamAgent, SwarmContext, AgentOutput
 from agents.config import AgentConfig
 from agents.types import AgentRole, AgentCategory
+from models.market_analytics import analyze_market_data
 
 from .prompts.market_analyst_prompts import (
     MARKET_ANALYST_SYSTEM_PROMPT,
@@ -215,18 +216,25 @@ class MarketAnalystAgent(BlueTeamAgent):
         target_agencies = context.custom_data.get("target_agencies")
         focus_areas = context.custom_data.get("focus_areas")
 
+        # Precomputed analytics (supplied by the caller or computed here)
+        market_analytics = context.custom_data.get("market_analytics")
+        if market_analytics is None and market_data:
+            market_analytics = self._compute_market_analytics(market_data, context.company_profile)
+
         # Build prompt
         prompt = get_market_analysis_prompt(
             company_profile=context.company_profile,
             market_data=market_data,
             target_agencies=target_agencies,
             focus_areas=focus_areas,
+            market_analytics=market_analytics,
         )
 
         # Call LLM
         llm_response = await self._call_llm(
             system_prompt=MARKET_ANALYST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="comprehensive_analysis",
         )
 
         if not llm_response.get("success"):
@@ -239,8 +247,43 @@ class MarketAnalystAgent(BlueTeamAgent):
         result = self._parse_analysis_response(content, result)
         result.token_usage = llm_response.get("usage", {})
 
+        # Fall back to the computed award dollars in company NAICS (in millions)
+        if result.total_addressable_market is None and market_analytics:
+            company_tam = market_analytics.get("company_naics_tam")
+            if company_tam:
+                result.total_addressable_market = company_tam / 1e6
+                result.market_sizing_assumptions.append(
+                    "TAM from recent award dollars in company NAICS codes"
+                )
+
         return result
 
+    def _compute_market_analytics(
+        self,
+        market_data: Dict[str, Any],
+        company_profile: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Compute award and budget analytics for the prompt.
+
+        Args:
+            market_data: MarketData.to_dict() style market data
+            company_profile: Company profile data (for NAICS codes)
+
+        Returns:
+            MarketAnalytics.to_dict(), or None if the data cannot be parsed
+        """
+        naics_codes = [
+            n.get("code") if isinstance(n, dict) else str(n)
+            for n in company_profile.get("naics_codes", [])
+        ]
+        try:
+            analytics = analyze_market_data(market_data, naics_codes=naics_codes or None)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            self.log_warning(f"Could not compute market analytics: {e}")
+            return None
+        return analytics.to_dict()
+
     async def _rank_opportunities(self, context: SwarmContext) -> MarketAnalysisResult:
         """
         Rank and prioritize opportunities.
@@ -269,6 +312,7 @@ class MarketAnalystAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=MARKET_ANALYST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="rank_opportunities",
         )
 
         if not llm_response.get("success"):
@@ -310,6 +354,7 @@ class MarketAnalystAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=MARKET_ANALYST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="analyze_incumbent",
         )
 
         if not llm_response.get("success"):
@@ -347,6 +392,7 @@ class MarketAnalystAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=MARKET_ANALYST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="analyze_timing",
         )
 
         if not llm_response.get("success"):
@@ -459,6 +505,7 @@ class MarketAnalystAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=MARKET_ANALYST_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="revise_section",
         )
 
         if llm_response.get("success"):
@@ -14,7 +14,8 @@ from agents.utils.profile_formatter import (
     format_socioeconomic_status,
     format_teaming_relationships,
     format_geographic_coverage,
-    extract_certification_types,
+    profile_certification_types,
+    relevant_past_performance,
 )
 
 
@@ -117,10 +118,10 @@ def get_win_theme_development_prompt(
             prompt_parts.append("")
 
         # Past performance
-        past_perf = company_profile.get('past_performance', [])
+        past_perf = relevant_past_performance(company_profile, opportunity, k=5)
         if past_perf:
             prompt_parts.append("**Relevant Past Performance**:")
-            for pp in past_perf[:5]:  # Limit to top 5
+            for pp in past_perf:
                 # Handle both dict format and string format
                 if isinstance(pp, dict):
                     prompt_parts.append(f"  - **{pp.get('contract_name', 'N/A')}**")
@@ -142,7 +143,7 @@ def get_win_theme_development_prompt(
         # Certifications
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_list = extract_certification_types(certs)
+            cert_list = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_list)}")
             prompt_parts.append("")
 
@@ -372,10 +373,10 @@ def get_discriminator_identification_prompt(
             prompt_parts.append("")
 
         # Past performance highlights
-        past_perf = company_profile.get('past_performance', [])
+        past_perf = relevant_past_performance(company_profile, opportunity, k=5)
         if past_perf:
             prompt_parts.append("**Past Performance Highlights**:")
-            for pp in past_perf[:5]:
+            for pp in past_perf:
                 # Handle both dict format and string format
                 if isinstance(pp, dict):
                     prompt_parts.append(f"  - {pp.get('contract_name', 'N/A')} ({pp.get('agency', 'N/A')})")
@@ -602,7 +603,7 @@ def get_ghost_team_analysis_prompt(
 
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         prompt_parts.append("")
@@ -16,7 +16,7 @@ from agents.utils.profile_formatter import (
     format_sam_registration,
     format_hubzone_info,
     format_federal_history,
-    extract_certification_types,
+    profile_certification_types,
 )
 
 
@@ -555,7 +555,7 @@ def get_compliance_checklist_prompt(
 
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         prompt_parts.append("")
@@ -13,7 +13,7 @@ from agents.utils.profile_formatter import (
     format_teaming_relationships,
     format_geographic_coverage,
     format_socioeconomic_status,
-    extract_certification_types,
+    profile_certification_types,
 )
 
 
@@ -64,6 +64,7 @@ def get_market_analysis_prompt(
     market_data: Optional[Dict[str, Any]] = None,
     target_agencies: Optional[List[str]] = None,
     focus_areas: Optional[List[str]] = None,
+    market_analytics: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Generate a prompt for comprehensive market analysis.
@@ -73,6 +74,8 @@ def get_market_analysis_prompt(
         market_data: Market data including budgets, awards, forecasts
         target_agencies: Specific agencies to focus on
         focus_areas: Specific areas or capabilities to analyze
+        market_analytics: Precomputed MarketAnalytics.to_dict(); replaces
+            the raw award listing with aggregate figures
 
     Returns:
         Formatted prompt string
@@ -187,8 +190,13 @@ def get_market_analysis_prompt(
                     prompt_parts.append(f"  - Priority Areas: {', '.join(budget.get('priority_areas', []))}")
             prompt_parts.append("")
 
-        # Recent awards
-        awards = market_data.get('recent_awards', [])
+        # Precomputed award and budget analytics
+        if market_analytics:
+            prompt_parts.extend(format_market_analytics(market_analytics))
+            prompt_parts.append("")
+
+        # Recent awards (already summarized by the analytics when present)
+        awards = [] if market_analytics else market_data.get('recent_awards', [])
         if awards:
             prompt_parts.append("### Recent Contract Awards")
             for award in awards[:10]:  # Limit to top 10
@@ -288,6 +296,94 @@ def get_market_analysis_prompt(
     return "\n".join(prompt_parts)
 
 
+def _format_dollars(amount: float) -> str:
+    """Format a dollar amount compactly ($1.2B, $45.0M, $250K)."""
+    if abs(amount) >= 1e9:
+        return f"${amount / 1e9:,.1f}B"
+    if abs(amount) >= 1e6:
+        return f"${amount / 1e6:,.1f}M"
+    if abs(amount) >= 1e3:
+        return f"${amount / 1e3:,.0f}K"
+    return f"${amount:,.0f}"
+
+
+def format_market_analytics(analytics: Dict[str, Any]) -> List[str]:
+    """
+    Format precomputed market analytics as compact prompt lines.
+
+    Args:
+        analytics: MarketAnalytics.to_dict() output
+
+    Returns:
+        List of formatted lines (empty if there is nothing to report)
+    """
+    lines: List[str] = []
+    award_count = analytics.get('award_count', 0)
+    budget_slopes = analytics.get('budget_slopes', {})
+    if not award_count and not budget_slopes:
+        return lines
+
+    lines.append("### Market Analytics (computed from award and budget data)")
+
+    if award_count:
+        lines.append(
+            f"**Awards Analyzed**: {award_count:,} totaling "
+            f"{_format_dollars(analytics.get('total_award_value', 0.0))}"
+        )
+        if analytics.get('company_naics_tam') is not None:
+            lines.append(
+                f"**Award Dollars in Company NAICS**: {_format_dollars(analytics['company_naics_tam'])}"
+            )
+
+        tam_by_naics = analytics.get('tam_by_naics', {})
+        if tam_by_naics:
+            lines.append("**Award Dollars by NAICS**: " + ", ".join(
+                f"{code or 'Unknown'} {_format_dollars(total)}" for code, total in tam_by_naics.items()
+            ))
+
+        tam_by_agency = analytics.get('tam_by_agency', {})
+        if tam_by_agency:
+            lines.append("**Award Dollars by Agency**: " + ", ".join(
+                f"{agency or 'Unknown'} {_format_dollars(total)}" for agency, total in tam_by_agency.items()
+            ))
+
+        values = analytics.get('award_values', {})
+        percentiles = values.get('percentiles', {})
+        if values.get('count'):
+            lines.append(
+                f"**Award Value Distribution**: median {_format_dollars(percentiles.get('50', 0.0))}, "
+                f"P25 {_format_dollars(percentiles.get('25', 0.0))}, "
+                f"P75 {_format_dollars(percentiles.get('75', 0.0))}, "
+                f"P90 {_format_dollars(percentiles.get('90', 0.0))}, "
+                f"max {_format_dollars(values.get('maximum', 0.0))}"
+            )
+
+        shares = analytics.get('incumbent_share', {})
+        if shares:
+            lines.append(
+                f"**Awardee Concentration**: {analytics.get('awardee_count', 0)} awardees, "
+                f"HHI {analytics.get('concentration_hhi', 0.0):,.0f}"
+            )
+            lines.append("**Largest Awardees (share of dollars)**: " + ", ".join(
+                f"{name or 'Unknown'} {share:.1%}" for name, share in shares.items()
+            ))
+
+        annual = analytics.get('annual_award_totals', {})
+        if len(annual) > 1:
+            lines.append("**Award Dollars by Year**: " + ", ".join(
+                f"{year} {_format_dollars(total)}" for year, total in annual.items()
+            ))
+
+    if budget_slopes:
+        lines.append("**Budget Trend (change per fiscal year)**: " + ", ".join(
+            f"{agency} {'+' if slope >= 0 else '-'}${abs(slope):,.1f}M" for agency, slope in budget_slopes.items()
+        ))
+
+    lines.append("")
+    lines.append("Use these computed figures for market sizing rather than re-deriving them.")
+    return lines
+
+
 def get_opportunity_ranking_prompt(
     company_profile: Dict[str, Any],
     opportunities: List[Dict[str, Any]],
@@ -326,7 +422,7 @@ def get_opportunity_ranking_prompt(
 
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         caps = company_profile.get('core_capabilities', [])
@@ -18,7 +18,7 @@ from agents.utils.profile_formatter import (
     format_federal_history,
     format_teaming_relationships,
     format_geographic_coverage,
-    extract_certification_types,
+    profile_certification_types,
     extract_past_performance_names,
 )
 
@@ -432,7 +432,7 @@ def get_revision_prompt(
 
     certs = company_profile.get('certifications', [])
     if certs:
-        cert_types = extract_certification_types(certs)
+        cert_types = profile_certification_types(company_profile)
         prompt_parts.append("Certifications: " + ", ".join(cert_types))
 
     if opportunity:
@@ -522,7 +522,7 @@ def get_section_prompt(
         prompt_parts.append(f"**Capabilities**: {', '.join(caps)}")
 
     if company_profile.get('certifications'):
-        cert_types = extract_certification_types(company_profile.get('certifications', []))
+        cert_types = profile_certification_types(company_profile)
         prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
     prompt_parts.append("")
@@ -25,12 +25,22 @@ from .small_business_rules import (
     get_size_standard,
     get_common_size_standards,
 )
+from .size_standard_table import (
+    SizeStandardTable,
+    load_size_standard_table,
+)
 from .setaside_rules import (
     SetAsideEligibility,
     SetAsideType,
     SetAsideValidator,
     EligibilityStatus,
     check_setaside_eligibility,
+    parse_setaside_type,
+)
+from .eligibility_batch import (
+    BatchEligibilityEngine,
+    EligibilityMatrix,
+    ProfileFeatureTable,
 )
 
 __all__ = [
@@ -51,10 +61,17 @@ __all__ = [
     "SizeStandardType",
     "get_size_standard",
     "get_common_size_standards",
+    "SizeStandardTable",
+    "load_size_standard_table",
     # Set-Aside
     "SetAsideEligibility",
     "SetAsideType",
     "SetAsideValidator",
     "EligibilityStatus",
     "check_setaside_eligibility",
+    "parse_setaside_type",
+    # Batch eligibility
+    "BatchEligibilityEngine",
+    "EligibilityMatrix",
+    "ProfileFeatureTable",
 ]
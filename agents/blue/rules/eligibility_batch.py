@@ -0,0 +1,413 @@
+"""
+Batch Eligibility Screening
+
+Evaluates many company profiles against many opportunities in one pass.
+Profile facts (certifications, size inputs, NAICS codes) are extracted
+once per profile into a columnar feature table, and the eligibility
+matrix is assembled from per-profile set-aside and size lookups instead
+of re-walking each profile for every opportunity.
+
+NumPy is used for the matrix when installed; otherwise the same
+computation runs over plain Python lists.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from models.company_profile import ProfileSnapshot
+from .setaside_rules import (
+    SetAsideType,
+    SetAsideValidator,
+    SetAsideEligibility,
+    EligibilityStatus,
+    SETASIDE_CERTIFICATIONS,
+    parse_setaside_type,
+)
+from .small_business_rules import SmallBusinessValidator, SizeStandardType
+
+
+# Certification columns tracked in the feature table
+CERTIFICATION_COLUMNS: Tuple[str, ...] = ("8(a)", "HUBZone", "SDVOSB", "VOSB", "WOSB", "EDWOSB")
+
+# Compact status codes stored in the eligibility matrix
+STATUS_CODES: Tuple[EligibilityStatus, ...] = (
+    EligibilityStatus.NOT_ELIGIBLE,
+    EligibilityStatus.ELIGIBLE,
+    EligibilityStatus.EXPIRED,
+)
+STATUS_NOT_ELIGIBLE = 0
+STATUS_ELIGIBLE = 1
+STATUS_EXPIRED = 2
+
+SIZE_NOT_SMALL = 0
+SIZE_SMALL = 1
+SIZE_UNKNOWN = -1
+
+_SETASIDE_COLUMNS: Tuple[SetAsideType, ...] = tuple(SetAsideType)
+_SETASIDE_INDEX: Dict[SetAsideType, int] = {sa: i for i, sa in enumerate(_SETASIDE_COLUMNS)}
+
+
+@dataclass
+class ProfileFeatureTable:
+    """
+    Columnar eligibility features for a set of company profiles.
+
+    Each attribute is a column with one entry per profile, in the order
+    the profiles were supplied.
+    """
+
+    profile_ids: List[str] = field(default_factory=list)
+    annual_revenue: List[Optional[float]] = field(default_factory=list)
+    employee_count: List[Optional[int]] = field(default_factory=list)
+
+    # Per certification column: whether held, and days until the first
+    # matching certification expires (None if it has no expiration date)
+    has_certification: Dict[str, List[bool]] = field(default_factory=dict)
+    days_until_expiry: Dict[str, List[Optional[int]]] = field(default_factory=dict)
+
+    # Per profile: NAICS codes listed on the profile
+    naics_codes: List[List[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.profile_ids)
+
+    @classmethod
+    def from_profiles(
+        cls,
+        profiles: List[Dict[str, Any]],
+        as_of: Optional[date] = None,
+    ) -> "ProfileFeatureTable":
+        """
+        Extract features from company profiles.
+
+        Args:
+            profiles: Company profile data, one dict or ProfileSnapshot per profile
+            as_of: Date used to evaluate certification expiration (default: today)
+
+        Returns:
+            ProfileFeatureTable with one row per profile
+        """
+        as_of = as_of or date.today()
+        table = cls(
+            has_certification={cert: [] for cert in CERTIFICATION_COLUMNS},
+            days_until_expiry={cert: [] for cert in CERTIFICATION_COLUMNS},
+        )
+
+        for index, data in enumerate(profiles):
+            profile = ProfileSnapshot.of(data)
+            table.profile_ids.append(str(profile.get("id") or profile.get("name") or index))
+            table.annual_revenue.append(profile.get("annual_revenue"))
+            table.employee_count.append(profile.get("employee_count"))
+            table.naics_codes.append(list(profile.naics_codes))
+
+            for cert in CERTIFICATION_COLUMNS:
+                match = profile.find_certification(cert)
+                table.has_certification[cert].append(match is not None)
+                table.days_until_expiry[cert].append(_days_until_expiry(match, as_of))
+
+        return table
+
+
+def _days_until_expiry(
+    cert: Optional[Union[str, Dict[str, Any]]],
+    as_of: date,
+) -> Optional[int]:
+    """Get days until a certification expires, or None if unknown."""
+    if not isinstance(cert, dict):
+        return None
+    exp_date = cert.get("expiration_date")
+    if not exp_date:
+        return None
+    if isinstance(exp_date, str):
+        exp_date = date.fromisoformat(exp_date)
+    return (exp_date - as_of).days
+
+
+@dataclass
+class EligibilityMatrix:
+    """
+    Eligibility of N profiles against M opportunities.
+
+    Matrices are indexed [profile, opportunity]. When NumPy is available
+    they are ndarrays; otherwise nested lists.
+    """
+
+    profile_ids: List[str]
+    opportunity_ids: List[str]
+    setaside_types: List[SetAsideType]
+    naics_codes: List[str]
+    setaside_status: Any  # status codes, see STATUS_CODES
+    size_status: Any  # SIZE_SMALL / SIZE_NOT_SMALL / SIZE_UNKNOWN
+    eligible: Any  # bool
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (len(self.profile_ids), len(self.opportunity_ids))
+
+    def is_eligible(self, profile_index: int, opportunity_index: int) -> bool:
+        """Check whether a profile is eligible to bid on an opportunity."""
+        return bool(self.eligible[profile_index][opportunity_index])
+
+    def status(self, profile_index: int, opportunity_index: int) -> EligibilityStatus:
+        """Get the set-aside eligibility status for a cell."""
+        return STATUS_CODES[int(self.setaside_status[profile_index][opportunity_index])]
+
+    def eligible_opportunities(self, profile_index: int) -> List[str]:
+        """Get IDs of opportunities a profile is eligible for."""
+        row = self.eligible[profile_index]
+        return [opp_id for opp_id, ok in zip(self.opportunity_ids, row) if ok]
+
+    def eligible_profiles(self, opportunity_index: int) -> List[str]:
+        """Get IDs of profiles eligible for an opportunity."""
+        return [
+            profile_id
+            for profile_id, row in zip(self.profile_ids, self.eligible)
+            if row[opportunity_index]
+        ]
+
+    def to_dict(self) -> dict:
+        def as_lists(matrix: Any) -> List[List[Any]]:
+            return matrix.tolist() if hasattr(matrix, "tolist") else [list(row) for row in matrix]
+
+        return {
+            "profile_ids": self.profile_ids,
+            "opportunity_ids": self.opportunity_ids,
+            "setaside_types": [sa.value for sa in self.setaside_types],
+            "naics_codes": self.naics_codes,
+            "setaside_status": [
+                [STATUS_CODES[code].value for code in row]
+                for row in as_lists(self.setaside_status)
+            ],
+            "size_status": as_lists(self.size_status),
+            "eligible": as_lists(self.eligible),
+        }
+
+
+class BatchEligibilityEngine:
+    """
+    Screens many company profiles against many opportunities.
+
+    Produces the same set-aside determinations as SetAsideValidator and
+    the same size determinations as SmallBusinessValidator, but extracts
+    profile features once and evaluates each profile against each
+    distinct set-aside type and NAICS code only once.
+    """
+
+    def __init__(
+        self,
+        small_business_validator: Optional[SmallBusinessValidator] = None,
+        setaside_validator: Optional[SetAsideValidator] = None,
+        use_numpy: bool = True,
+    ):
+        self._sb_validator = small_business_validator or SmallBusinessValidator()
+        self._setaside_validator = setaside_validator or SetAsideValidator()
+        self._use_numpy = use_numpy and NUMPY_AVAILABLE
+
+    def evaluate(
+        self,
+        profiles: Union[List[Dict[str, Any]], ProfileFeatureTable],
+        opportunities: List[Dict[str, Any]],
+        as_of: Optional[date] = None,
+    ) -> EligibilityMatrix:
+        """
+        Build the eligibility matrix for profiles x opportunities.
+
+        A cell is eligible when the profile is eligible for the
+        opportunity's set-aside and, for set-asides other than full and
+        open, does not exceed the size standard for the opportunity's
+        NAICS code. Unknown size standards do not disqualify.
+
+        Args:
+            profiles: Company profile dicts, or a prebuilt ProfileFeatureTable
+            opportunities: Opportunity dicts with set_aside and naics_code
+            as_of: Date used for certification expiration and size standard versions
+
+        Returns:
+            EligibilityMatrix indexed [profile, opportunity]
+        """
+        if isinstance(profiles, ProfileFeatureTable):
+            features = profiles
+        else:
+            features = ProfileFeatureTable.from_profiles(profiles, as_of=as_of)
+
+        opportunity_ids = [
+            str(opp.get("id") or opp.get("solicitation_number") or index)
+            for index, opp in enumerate(opportunities)
+        ]
+        setaside_types = [parse_setaside_type(opp.get("set_aside")) for opp in opportunities]
+        naics_codes = [str(opp.get("naics_code") or "") for opp in opportunities]
+
+        # Distinct NAICS codes across the batch
+        unique_naics = list(dict.fromkeys(naics_codes))
+        naics_index = {code: i for i, code in enumerate(unique_naics)}
+
+        setaside_columns = [_SETASIDE_INDEX[sa] for sa in setaside_types]
+        naics_columns = [naics_index[code] for code in naics_codes]
+        open_columns = [sa == SetAsideType.FULL_AND_OPEN for sa in setaside_types]
+
+        if self._use_numpy:
+            by_setaside = self._setaside_status_numpy(features)
+            by_naics = self._size_status_numpy(features, unique_naics, as_of)
+
+            setaside_status = by_setaside[:, setaside_columns]
+            size_status = by_naics[:, naics_columns]
+            eligible = (setaside_status == STATUS_ELIGIBLE) & (
+                (size_status != SIZE_NOT_SMALL) | np.array(open_columns, dtype=bool)
+            )
+        else:
+            by_setaside = self._setaside_status_rows(features)
+            by_naics = self._size_status_rows(features, unique_naics, as_of)
+
+            setaside_status = [[row[c] for c in setaside_columns] for row in by_setaside]
+            size_status = [[row[c] for c in naics_columns] for row in by_naics]
+            eligible = [
+                [
+                    sa_code == STATUS_ELIGIBLE and (is_open or size_code != SIZE_NOT_SMALL)
+                    for sa_code, size_code, is_open in zip(sa_row, size_row, open_columns)
+                ]
+                for sa_row, size_row in zip(setaside_status, size_status)
+            ]
+
+        return EligibilityMatrix(
+            profile_ids=list(features.profile_ids),
+            opportunity_ids=opportunity_ids,
+            setaside_types=setaside_types,
+            naics_codes=naics_codes,
+            setaside_status=setaside_status,
+            size_status=size_status,
+            eligible=eligible,
+        )
+
+    def explain(
+        self,
+        company_profile: Dict[str, Any],
+        opportunity: Dict[str, Any],
+    ) -> SetAsideEligibility:
+        """
+        Get the detailed set-aside determination behind a matrix cell.
+
+        Args:
+            company_profile: Company profile data
+            opportunity: Opportunity data
+
+        Returns:
+            SetAsideEligibility from the full validator
+        """
+        return self._setaside_validator.check_eligibility(
+            parse_setaside_type(opportunity.get("set_aside")),
+            company_profile,
+            opportunity,
+        )
+
+    # =========================================================================
+    # Per-profile lookups
+    # =========================================================================
+
+    @staticmethod
+    def _setaside_code(has_cert: bool, days_left: Optional[int]) -> int:
+        """Status code for a certification-based set-aside."""
+        if not has_cert:
+            return STATUS_NOT_ELIGIBLE
+        if days_left is not None and days_left < 0:
+            return STATUS_EXPIRED
+        return STATUS_ELIGIBLE
+
+    def _setaside_status_rows(self, features: ProfileFeatureTable) -> List[List[int]]:
+        """Status code per profile per SetAsideType (pure Python)."""
+        rows = []
+        for p in range(len(features)):
+            row = []
+            for sa in _SETASIDE_COLUMNS:
+                cert = SETASIDE_CERTIFICATIONS.get(sa)
+                if cert is None:
+                    row.append(STATUS_ELIGIBLE)
+                else:
+                    row.append(self._setaside_code(
+                        features.has_certification[cert][p],
+                        features.days_until_expiry[cert][p],
+                    ))
+            rows.append(row)
+        return rows
+
+    def _setaside_status_numpy(self, features: ProfileFeatureTable) -> Any:
+        """Status code per profile per SetAsideType (vectorized)."""
+        n = len(features)
+        status = np.full((n, len(_SETASIDE_COLUMNS)), STATUS_ELIGIBLE, dtype=np.int8)
+
+        for cert in CERTIFICATION_COLUMNS:
+            held = np.array(features.has_certification[cert], dtype=bool)
+            days = np.array(
+                [d if d is not None else 0 for d in features.days_until_expiry[cert]],
+                dtype=np.int64,
+            )
+            column = np.where(
+                held,
+                np.where(days < 0, STATUS_EXPIRED, STATUS_ELIGIBLE),
+                STATUS_NOT_ELIGIBLE,
+            ).astype(np.int8)
+
+            for sa, required in SETASIDE_CERTIFICATIONS.items():
+                if required == cert:
+                    status[:, _SETASIDE_INDEX[sa]] = column
+
+        return status
+
+    def _size_status_rows(
+        self,
+        features: ProfileFeatureTable,
+        naics_codes: List[str],
+        as_of: Optional[date] = None,
+    ) -> List[List[int]]:
+        """Size code per profile per NAICS code (pure Python)."""
+        standards = [self._sb_validator.get_size_standard(code, as_of) for code in naics_codes]
+        rows = []
+        for p in range(len(features)):
+            row = []
+            for standard in standards:
+                if standard is None:
+                    row.append(SIZE_UNKNOWN)
+                elif standard.is_small(features.annual_revenue[p], features.employee_count[p]):
+                    row.append(SIZE_SMALL)
+                else:
+                    row.append(SIZE_NOT_SMALL)
+            rows.append(row)
+        return rows
+
+    def _size_status_numpy(
+        self,
+        features: ProfileFeatureTable,
+        naics_codes: List[str],
+        as_of: Optional[date] = None,
+    ) -> Any:
+        """Size code per profile per NAICS code (vectorized)."""
+        n = len(features)
+        status = np.full((n, len(naics_codes)), SIZE_UNKNOWN, dtype=np.int8)
+
+        # Missing values become NaN, which never compares as small
+        revenue_millions = np.array(
+            [r if r is not None else np.nan for r in features.annual_revenue],
+            dtype=float,
+        ) / 1_000_000
+        employees = np.array(
+            [e if e is not None else np.nan for e in features.employee_count],
+            dtype=float,
+        )
+
+        for column, code in enumerate(naics_codes):
+            standard = self._sb_validator.get_size_standard(code, as_of)
+            if standard is None:
+                continue
+            values = revenue_millions if standard.standard_type == SizeStandardType.REVENUE else employees
+            with np.errstate(invalid="ignore"):
+                small = values <= standard.threshold
+            status[:, column] = np.where(small, SIZE_SMALL, SIZE_NOT_SMALL)
+
+        return status
@@ -8,10 +8,19 @@ documents against regulatory requirements.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, Set, Tuple
 import re
 
 
+# Contract value above which negotiated-procurement (FAR 15) rules apply
+NEGOTIATED_PROCUREMENT_THRESHOLD = 750_000
+
+# Value bands used to key memoized applicability lookups
+VALUE_BAND_NONE = 0
+VALUE_BAND_BELOW_THRESHOLD = 1
+VALUE_BAND_ABOVE_THRESHOLD = 2
+
+
 class FARSubpart(str, Enum):
     """Major FAR subparts relevant to GovCon strategy."""
 
@@ -156,16 +165,83 @@ class FARComplianceChecker:
 
     def __init__(self):
         self._rules: Dict[str, FARRule] = {}
+
+        # Applicability indexes, maintained by add_rule()
+        self._rule_order: Dict[str, int] = {}
+        self._applicability_text: Dict[str, str] = {}
+        self._general_rule_ids: Set[str] = set()
+        self._small_business_rule_ids: Set[str] = set()
+        self._dod_rule_ids: Set[str] = set()
+        self._negotiated_rule_ids: Set[str] = set()
+
+        # Memoized lookups, invalidated whenever the rule set changes
+        self._term_matches: Dict[str, FrozenSet[str]] = {}
+        self._applicable_cache: Dict[Tuple[str, str, bool, int], Tuple[FARRule, ...]] = {}
+
         self._load_default_rules()
 
     def _load_default_rules(self) -> None:
         """Load the default set of FAR compliance rules."""
         for rule in get_common_far_rules():
-            self._rules[rule.id] = rule
+            self.add_rule(rule)
 
     def add_rule(self, rule: FARRule) -> None:
         """Add a custom rule to the checker."""
+        if rule.id in self._rules:
+            self._unindex_rule(rule.id)
+        else:
+            self._rule_order[rule.id] = len(self._rule_order)
+
         self._rules[rule.id] = rule
+        self._index_rule(rule)
+
+        self._term_matches.clear()
+        self._applicable_cache.clear()
+
+    def _index_rule(self, rule: FARRule) -> None:
+        """Classify a rule's applicability once so queries become set lookups."""
+        applicability = rule.applicability.lower()
+        self._applicability_text[rule.id] = applicability
+
+        if "all" in applicability or "general" in applicability:
+            self._general_rule_ids.add(rule.id)
+        if "small business" in applicability:
+            self._small_business_rule_ids.add(rule.id)
+        if "dod" in applicability or "dfars" in rule.subpart.value.lower():
+            self._dod_rule_ids.add(rule.id)
+        if "simplified acquisition" not in applicability and (
+            "negotiated" in applicability or "far 15" in applicability
+        ):
+            self._negotiated_rule_ids.add(rule.id)
+
+    def _unindex_rule(self, rule_id: str) -> None:
+        """Remove a rule from all applicability indexes."""
+        self._applicability_text.pop(rule_id, None)
+        self._general_rule_ids.discard(rule_id)
+        self._small_business_rule_ids.discard(rule_id)
+        self._dod_rule_ids.discard(rule_id)
+        self._negotiated_rule_ids.discard(rule_id)
+
+    def _rules_mentioning(self, term: str) -> FrozenSet[str]:
+        """Get IDs of rules whose applicability text contains a term."""
+        matches = self._term_matches.get(term)
+        if matches is None:
+            matches = frozenset(
+                rule_id
+                for rule_id, applicability in self._applicability_text.items()
+                if term in applicability
+            )
+            self._term_matches[term] = matches
+        return matches
+
+    @staticmethod
+    def _value_band(contract_value: Optional[float]) -> int:
+        """Map a contract value onto the thresholds used by applicability checks."""
+        if not contract_value:
+            return VALUE_BAND_NONE
+        if contract_value >= NEGOTIATED_PROCUREMENT_THRESHOLD:
+            return VALUE_BAND_ABOVE_THRESHOLD
+        return VALUE_BAND_BELOW_THRESHOLD
 
     def get_rule(self, rule_id: str) -> Optional[FARRule]:
         """Get a rule by ID."""
@@ -185,6 +261,10 @@ class FARComplianceChecker:
         """
         Get rules applicable to a specific contract situation.
 
+        Rules are pre-indexed by applicability when added, so a lookup is a
+        handful of set unions. Results are memoized per
+        (contract type, set-aside, DoD flag, value band).
+
         Args:
             contract_type: Type of contract (FFP, T&M, etc.)
             set_aside: Set-aside type if applicable
@@ -194,43 +274,46 @@ class FARComplianceChecker:
         Returns:
             List of applicable FAR rules
         """
-        applicable = []
-
-        for rule in self._rules.values():
-            # Check applicability keywords
-            applicability = rule.applicability.lower()
-
-            # Always include general rules
-            if "all" in applicability or "general" in applicability:
-                applicable.append(rule)
-                continue
-
-            # Check contract type applicability
-            if contract_type and contract_type.lower() in applicability:
-                applicable.append(rule)
-                continue
-
-            # Check set-aside applicability
-            if set_aside:
-                if set_aside.lower() in applicability:
-                    applicable.append(rule)
-                    continue
-                if "small business" in applicability and set_aside != "Full and Open":
-                    applicable.append(rule)
-                    continue
-
-            # Check DoD applicability
-            if is_dod and ("dod" in applicability or "dfars" in rule.subpart.value.lower()):
-                applicable.append(rule)
-                continue
-
-            # Check value thresholds
-            if contract_value:
-                if contract_value >= 750000 and "simplified acquisition" not in applicability:
-                    if "negotiated" in applicability or "far 15" in applicability.lower():
-                        applicable.append(rule)
-
-        return applicable
+        cache_key = (
+            (contract_type or "").lower(),
+            set_aside or "",
+            bool(is_dod),
+            self._value_band(contract_value),
+        )
+
+        cached = self._applicable_cache.get(cache_key)
+        if cached is None:
+            cached = self._resolve_applicable_rules(*cache_key)
+            self._applicable_cache[cache_key] = cached
+
+        return list(cached)
+
+    def _resolve_applicable_rules(
+        self,
+        contract_type: str,
+        set_aside: str,
+        is_dod: bool,
+        value_band: int,
+    ) -> Tuple[FARRule, ...]:
+        """Resolve applicable rules from the indexes, in rule insertion order."""
+        rule_ids: Set[str] = set(self._general_rule_ids)
+
+        if contract_type:
+            rule_ids |= self._rules_mentioning(contract_type)
+
+        if set_aside:
+            rule_ids |= self._rules_mentioning(set_aside.lower())
+            if set_aside != "Full and Open":
+                rule_ids |= self._small_business_rule_ids
+
+        if is_dod:
+            rule_ids |= self._dod_rule_ids
+
+        if value_band == VALUE_BAND_ABOVE_THRESHOLD:
+            rule_ids |= self._negotiated_rule_ids
+
+        ordered_ids = sorted(rule_ids, key=self._rule_order.__getitem__)
+        return tuple(self._rules[rule_id] for rule_id in ordered_ids)
 
     def check_compliance(
         self,
@@ -7,10 +7,10 @@ company qualifications against specific set-aside requirements.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any, Set, Union
+from typing import List, Optional, Dict, Any, Set
 from datetime import date
 
-from agents.utils.profile_formatter import extract_certification_type
+from models.company_profile import ProfileSnapshot
 
 
 class SetAsideType(str, Enum):
@@ -381,6 +381,19 @@ SETASIDE_REQUIREMENTS: Dict[SetAsideType, List[SetAsideRequirement]] = {
 }
 
 
+# Certification each set-aside type requires the company to hold
+SETASIDE_CERTIFICATIONS: Dict[SetAsideType, str] = {
+    SetAsideType.SBA_8A: "8(a)",
+    SetAsideType.COMPETITIVE_8A: "8(a)",
+    SetAsideType.SOLE_SOURCE_8A: "8(a)",
+    SetAsideType.HUBZONE: "HUBZone",
+    SetAsideType.SDVOSB: "SDVOSB",
+    SetAsideType.VOSB: "VOSB",
+    SetAsideType.WOSB: "WOSB",
+    SetAsideType.EDWOSB: "EDWOSB",
+}
+
+
 class SetAsideValidator:
     """
     Validates company eligibility for federal contract set-asides.
@@ -428,12 +441,11 @@ class SetAsideValidator:
             return result
 
         requirements = self._requirements.get(set_aside, [])
-        certifications = company_profile.get("certifications", [])
-        cert_types = {extract_certification_type(c) for c in certifications}
+        profile = ProfileSnapshot.of(company_profile)
 
         # Check each requirement
         for req in requirements:
-            is_met = self._check_requirement(req, company_profile, certifications, opportunity)
+            is_met = self._check_requirement(req, profile, opportunity)
 
             if is_met:
                 result.met_requirements.append(req.description)
@@ -445,20 +457,9 @@ class SetAsideValidator:
                     result.warnings.append(f"Optional requirement not verified: {req.description}")
 
         # Check certification status specifically
-        cert_mapping = {
-            SetAsideType.SBA_8A: "8(a)",
-            SetAsideType.COMPETITIVE_8A: "8(a)",
-            SetAsideType.SOLE_SOURCE_8A: "8(a)",
-            SetAsideType.HUBZONE: "HUBZone",
-            SetAsideType.SDVOSB: "SDVOSB",
-            SetAsideType.VOSB: "VOSB",
-            SetAsideType.WOSB: "WOSB",
-            SetAsideType.EDWOSB: "EDWOSB",
-        }
-
-        required_cert = cert_mapping.get(set_aside)
+        required_cert = SETASIDE_CERTIFICATIONS.get(set_aside)
         if required_cert:
-            matching_cert = self._find_certification(certifications, required_cert)
+            matching_cert = profile.find_certification(required_cert)
             if matching_cert:
                 result.certification_status = "Active"
                 # Only check expiration if cert is a dict (string certs don't have expiration info)
@@ -506,21 +507,18 @@ class SetAsideValidator:
     def _check_requirement(
         self,
         req: SetAsideRequirement,
-        company_profile: Dict[str, Any],
-        certifications: List[Dict[str, Any]],
+        profile: ProfileSnapshot,
         opportunity: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Check if a specific requirement is met."""
 
         # Check certification requirement
         if req.certification_required:
-            matching_cert = self._find_certification(certifications, req.certification_required)
-            if matching_cert is None:
+            if not profile.has_certification(req.certification_required):
                 return False
 
         # For other requirements, we do basic keyword matching
         # In production, this would have more sophisticated logic
-        profile_str = str(company_profile).lower()
 
         # Check for obvious indicators
         if "size standard" in req.description.lower():
@@ -536,21 +534,6 @@ class SetAsideValidator:
 
         return True  # Default to true for requirements we can't verify
 
-    def _find_certification(
-        self,
-        certifications: List[Union[str, Dict[str, Any]]],
-        cert_type: str,
-    ) -> Optional[Union[str, Dict[str, Any]]]:
-        """Find a certification by type. Handles both string and dict formats."""
-        for cert in certifications:
-            cert_type_value = extract_certification_type(cert)
-            if cert_type_value == cert_type:
-                return cert
-            # Handle SDVOSB satisfying VOSB requirement
-            if cert_type == "VOSB" and cert_type_value == "SDVOSB":
-                return cert
-        return None
-
     def check_all_setasides(
         self,
         company_profile: Dict[str, Any],
@@ -566,9 +549,10 @@ class SetAsideValidator:
         Returns:
             Dictionary mapping each set-aside type to eligibility result
         """
+        profile = ProfileSnapshot.of(company_profile)
         results = {}
         for set_aside in SetAsideType:
-            results[set_aside] = self.check_eligibility(set_aside, company_profile, opportunity)
+            results[set_aside] = self.check_eligibility(set_aside, profile, opportunity)
         return results
 
     def get_eligible_setasides(
@@ -647,6 +631,31 @@ class SetAsideValidator:
         return recommendations
 
 
+def parse_setaside_type(set_aside_type: Optional[str]) -> SetAsideType:
+    """
+    Convert a free-text set-aside name to a SetAsideType.
+
+    Args:
+        set_aside_type: Set-aside name as it appears on an opportunity
+
+    Returns:
+        Matching SetAsideType, defaulting to full and open if not found
+    """
+    if not set_aside_type:
+        return SetAsideType.FULL_AND_OPEN
+
+    try:
+        return SetAsideType(set_aside_type)
+    except ValueError:
+        # Try to match by partial name
+        set_aside_lower = set_aside_type.lower()
+        for sa in SetAsideType:
+            if set_aside_lower in sa.value.lower():
+                return sa
+        # Default to full and open if not found
+        return SetAsideType.FULL_AND_OPEN
+
+
 def check_setaside_eligibility(
     set_aside_type: str,
     company_profile: Dict[str, Any],
@@ -663,19 +672,7 @@ def check_setaside_eligibility(
     Returns:
         SetAsideEligibility result
     """
-    # Convert string to enum
-    try:
-        sa_type = SetAsideType(set_aside_type)
-    except ValueError:
-        # Try to match by partial name
-        set_aside_lower = set_aside_type.lower()
-        for sa in SetAsideType:
-            if set_aside_lower in sa.value.lower():
-                sa_type = sa
-                break
-        else:
-            # Default to full and open if not found
-            sa_type = SetAsideType.FULL_AND_OPEN
+    sa_type = parse_setaside_type(set_aside_type)
 
     validator = SetAsideValidator()
     return validator.check_eligibility(sa_type, company_profile, opportunity)
@@ -0,0 +1,388 @@
+"""
+SBA Size Standard Table
+
+Compiles the complete SBA table of size standards from a CSV export into a
+compact binary file of fixed-width records sorted by (NAICS code,
+effective date). The compiled file is memory-mapped, so opening it costs
+no parsing and each lookup is a binary search over the mapped records.
+
+Multiple versions of a NAICS code's standard can coexist; lookups return
+the version in effect on a given date so historical evaluations use the
+table that applied at the time.
+"""
+
+import csv
+import mmap
+import os
+import re
+import struct
+from datetime import date
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+from .small_business_rules import SizeStandard, SizeStandardType
+
+
+# File layout: header, fixed-width records, then a UTF-8 description blob
+_MAGIC = b"SBSS"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHxxI")  # magic, version, record count
+_RECORD = struct.Struct("<IIBxxxdII")  # naics, effective ordinal, type, threshold, desc offset, desc length
+_KEY = struct.Struct("<II")  # leading (naics, effective ordinal) of a record
+
+_TYPE_CODES = {SizeStandardType.REVENUE: 0, SizeStandardType.EMPLOYEES: 1}
+_TYPES_BY_CODE = {code: t for t, code in _TYPE_CODES.items()}
+
+# Default location of the compiled table; override with SBA_SIZE_STANDARDS_PATH
+DEFAULT_SIZE_TABLE_PATH = "./data/sba_size_standards.bin"
+
+# Effective date assigned to rows without one
+_UNDATED = date(1900, 1, 1)
+
+# Revenue cells at or above this are full dollars, not millions (no SBA
+# revenue or asset standard reaches a billion dollars)
+_FULL_DOLLARS_MIN = 1_000
+
+# Accepted CSV header names, normalized (lowercase, non-alphanumerics -> "_")
+_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "naics_code": ("naics_code", "naics_codes", "naics", "code"),
+    "description": ("naics_description", "naics_u_s_industry_title", "description", "title"),
+    "standard_type": ("standard_type", "type"),
+    "threshold": ("threshold",),
+    "revenue_millions": ("size_standards_in_millions_of_dollars", "revenue_millions", "receipts_millions"),
+    "employees": ("size_standards_in_number_of_employees", "employees", "employee_count"),
+    "effective_date": ("effective_date", "effective"),
+}
+
+
+class SizeStandardTable:
+    """
+    Memory-mapped, versioned SBA size standard table.
+
+    Use compile() to build the binary file from a CSV once, then open()
+    it at startup.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._file = open(self._path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Not a size standard table (or unsupported version): {self._path}")
+
+        self._count = count
+        self._blob_offset = _HEADER.size + count * _RECORD.size
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "SizeStandardTable":
+        """Open a compiled table file."""
+        return cls(path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "SizeStandardTable":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def lookup(self, naics_code: str, as_of: Optional[date] = None) -> Optional[SizeStandard]:
+        """
+        Get the size standard in effect for a NAICS code.
+
+        Args:
+            naics_code: Six-digit NAICS code
+            as_of: Evaluation date (default: today)
+
+        Returns:
+            SizeStandard effective on as_of, or None if not in the table
+        """
+        code = _naics_to_int(naics_code)
+        if code is None:
+            return None
+
+        target = (code, (as_of or date.today()).toordinal())
+
+        # Last record with key <= target
+        index = self._bisect_right(target) - 1
+        if index < 0:
+            return None
+
+        record_code, _ = self._key(index)
+        if record_code != code:
+            return None
+
+        return self._standard(index)
+
+    def __contains__(self, naics_code: str) -> bool:
+        """Check whether the table has any version of a NAICS code's standard."""
+        code = _naics_to_int(naics_code)
+        if code is None:
+            return False
+        index = self._bisect_right((code, 0))
+        return index < self._count and self._key(index)[0] == code
+
+    def versions(self, naics_code: str) -> List[SizeStandard]:
+        """Get every version of a NAICS code's standard, oldest first."""
+        code = _naics_to_int(naics_code)
+        if code is None:
+            return []
+
+        index = self._bisect_right((code, 0))
+        versions = []
+        while index < self._count and self._key(index)[0] == code:
+            versions.append(self._standard(index))
+            index += 1
+        return versions
+
+    def _key(self, index: int) -> Tuple[int, int]:
+        return _KEY.unpack_from(self._map, _HEADER.size + index * _RECORD.size)
+
+    def _bisect_right(self, target: Tuple[int, int]) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if target < self._key(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _standard(self, index: int) -> SizeStandard:
+        code, ordinal, type_code, threshold, desc_offset, desc_length = _RECORD.unpack_from(
+            self._map, _HEADER.size + index * _RECORD.size
+        )
+        start = self._blob_offset + desc_offset
+        description = self._map[start:start + desc_length].decode("utf-8")
+
+        return SizeStandard(
+            naics_code=f"{code:06d}",
+            naics_description=description,
+            standard_type=_TYPES_BY_CODE[type_code],
+            threshold=threshold,
+            effective_date=None if ordinal == _UNDATED.toordinal() else date.fromordinal(ordinal),
+        )
+
+    # =========================================================================
+    # Compilation
+    # =========================================================================
+
+    @staticmethod
+    def compile(
+        csv_paths: Union[str, Path, List[Union[str, Path]]],
+        output_path: Union[str, Path],
+        effective_date: Optional[date] = None,
+    ) -> int:
+        """
+        Compile size standard CSVs into a binary table file.
+
+        Accepts either normalized columns (naics_code, naics_description,
+        standard_type, threshold, effective_date) or the SBA table layout
+        with separate "millions of dollars" and "number of employees"
+        columns. Rows without an effective date use effective_date. Pass
+        one CSV per table version to keep historical standards.
+
+        Args:
+            csv_paths: Source CSV file, or several
+            output_path: Destination binary file (written atomically)
+            effective_date: Default effective date for undated rows
+
+        Returns:
+            Number of records written
+        """
+        if isinstance(csv_paths, (str, Path)):
+            csv_paths = [csv_paths]
+
+        rows = []
+        for csv_path in csv_paths:
+            rows.extend(_read_size_standard_csv(Path(csv_path), effective_date or _UNDATED))
+
+        # Later duplicates of the same (code, date) replace earlier ones
+        by_key: Dict[Tuple[int, int], Tuple[int, float, str]] = {}
+        for code, ordinal, type_code, threshold, description in rows:
+            by_key[(code, ordinal)] = (type_code, threshold, description)
+
+        records = bytearray()
+        blob = bytearray()
+        description_offsets: Dict[str, Tuple[int, int]] = {}
+        for (code, ordinal), (type_code, threshold, description) in sorted(by_key.items()):
+            if description not in description_offsets:
+                encoded = description.encode("utf-8")
+                description_offsets[description] = (len(blob), len(encoded))
+                blob += encoded
+            offset, length = description_offsets[description]
+            records += _RECORD.pack(code, ordinal, type_code, threshold, offset, length)
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(by_key)))
+            f.write(records)
+            f.write(blob)
+        os.replace(tmp_path, output_path)
+
+        return len(by_key)
+
+
+def _naics_to_int(naics_code: Any) -> Optional[int]:
+    """Convert a NAICS code to its integer key, or None if malformed."""
+    code = str(naics_code).strip()
+    if not code.isdigit() or len(code) > 6:
+        return None
+    return int(code)
+
+
+def _normalize_header(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.strip().lower()).strip("_")
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric cell such as "$34.0", "1,000" or "34.0 million"."""
+    if value is None:
+        return None
+    cleaned = re.sub(r"[^0-9.]", "", value)
+    if not cleaned:
+        return None
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def _parse_millions(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a revenue cell in millions of dollars.
+
+    SBA tables write these as "$34.0" or "34.0 million". A full-dollar
+    figure such as "$34,000,000" (thousands separators, or a value no
+    standard reaches in millions) is scaled to millions.
+    """
+    number = _parse_number(value)
+    if number is None or "million" in value.lower():
+        return number
+    if "," in value or number >= _FULL_DOLLARS_MIN:
+        return number / 1_000_000
+    return number
+
+
+def _parse_standard_type(value: str) -> Optional[SizeStandardType]:
+    lowered = value.strip().lower()
+    if lowered.startswith(("rev", "receipt", "annual rev", "$")):
+        return SizeStandardType.REVENUE
+    if lowered.startswith(("emp", "number of emp")):
+        return SizeStandardType.EMPLOYEES
+    return None
+
+
+def _read_size_standard_csv(
+    csv_path: Path,
+    default_effective: date,
+) -> List[Tuple[int, int, int, float, str]]:
+    """Read (naics, effective ordinal, type code, threshold, description) rows."""
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        columns: Dict[str, str] = {}
+        for header in reader.fieldnames or []:
+            normalized = _normalize_header(header)
+            for canonical, aliases in _COLUMN_ALIASES.items():
+                if normalized in aliases and canonical not in columns:
+                    columns[canonical] = header
+
+        if "naics_code" not in columns:
+            raise ValueError(f"No NAICS code column found in {csv_path}")
+
+        def cell(row: Dict[str, str], name: str) -> Optional[str]:
+            header = columns.get(name)
+            value = row.get(header) if header else None
+            return value.strip() if value else None
+
+        for row in reader:
+            code = _naics_to_int(cell(row, "naics_code") or "")
+            if code is None:
+                continue  # Section headings and footnote rows
+
+            standard_type = None
+            threshold = None
+            if cell(row, "standard_type") and cell(row, "threshold"):
+                standard_type = _parse_standard_type(cell(row, "standard_type"))
+                if standard_type == SizeStandardType.REVENUE:
+                    threshold = _parse_millions(cell(row, "threshold"))
+                else:
+                    threshold = _parse_number(cell(row, "threshold"))
+            elif _parse_millions(cell(row, "revenue_millions")) is not None:
+                standard_type = SizeStandardType.REVENUE
+                threshold = _parse_millions(cell(row, "revenue_millions"))
+            elif _parse_number(cell(row, "employees")) is not None:
+                standard_type = SizeStandardType.EMPLOYEES
+                threshold = _parse_number(cell(row, "employees"))
+
+            if standard_type is None or threshold is None:
+                continue
+
+            effective = cell(row, "effective_date")
+            effective_date = date.fromisoformat(effective) if effective else default_effective
+
+            rows.append((
+                code,
+                effective_date.toordinal(),
+                _TYPE_CODES[standard_type],
+                threshold,
+                cell(row, "description") or "",
+            ))
+
+    return rows
+
+
+# Module-level cache for the default table
+_default_table: Optional[SizeStandardTable] = None
+_default_table_loaded = False
+
+
+def load_size_standard_table(path: Optional[Union[str, Path]] = None) -> Optional[SizeStandardTable]:
+    """
+    Open the compiled size standard table, if one is installed.
+
+    With no path, the table at SBA_SIZE_STANDARDS_PATH (or the default
+    data path) is opened once per process and shared.
+
+    Args:
+        path: Explicit table file to open
+
+    Returns:
+        SizeStandardTable, or None if no compiled table exists
+    """
+    global _default_table, _default_table_loaded
+
+    if path is not None:
+        return SizeStandardTable.open(path)
+
+    if not _default_table_loaded:
+        _default_table_loaded = True
+        default_path = Path(os.getenv("SBA_SIZE_STANDARDS_PATH", DEFAULT_SIZE_TABLE_PATH))
+        if default_path.is_file():
+            _default_table = SizeStandardTable.open(default_path)
+
+    return _default_table
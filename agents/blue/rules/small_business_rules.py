@@ -7,10 +7,13 @@ including size standards, affiliation rules, and program eligibility.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from datetime import date
 
-from agents.utils.profile_formatter import extract_certification_type
+from models.company_profile import ProfileSnapshot
+
+if TYPE_CHECKING:
+    from .size_standard_table import SizeStandardTable
 
 
 class SmallBusinessProgram(str, Enum):
@@ -41,6 +44,7 @@ class SizeStandard:
     standard_type: SizeStandardType
     threshold: float  # In millions for revenue, count for employees
     exceptions: List[str] = field(default_factory=list)
+    effective_date: Optional[date] = None
 
     def is_small(
         self,
@@ -77,6 +81,7 @@ class SizeStandard:
             "threshold": self.threshold,
             "threshold_display": f"${self.threshold}M" if self.standard_type == SizeStandardType.REVENUE else f"{int(self.threshold)} employees",
             "exceptions": self.exceptions,
+            "effective_date": self.effective_date.isoformat() if self.effective_date else None,
         }
 
 
@@ -144,12 +149,25 @@ class SmallBusinessValidator:
     detailed eligibility assessment.
     """
 
-    def __init__(self):
+    def __init__(self, size_table: Optional["SizeStandardTable"] = None):
+        """
+        Initialize the validator.
+
+        Args:
+            size_table: Full SBA size standard table. Defaults to the compiled
+                table installed at SBA_SIZE_STANDARDS_PATH, if any; the common
+                size standards are used for codes the table doesn't cover.
+        """
         self._rules: Dict[SmallBusinessProgram, List[SmallBusinessRule]] = {}
         self._size_standards: Dict[str, SizeStandard] = {}
         self._load_default_rules()
         self._load_common_size_standards()
 
+        if size_table is None:
+            from .size_standard_table import load_size_standard_table
+            size_table = load_size_standard_table()
+        self._size_table = size_table
+
     def _load_default_rules(self) -> None:
         """Load default small business program rules."""
         rules = get_small_business_rules()
@@ -163,8 +181,26 @@ class SmallBusinessValidator:
         for standard in get_common_size_standards():
             self._size_standards[standard.naics_code] = standard
 
-    def get_size_standard(self, naics_code: str) -> Optional[SizeStandard]:
-        """Get size standard for a NAICS code."""
+    def get_size_standard(
+        self,
+        naics_code: str,
+        as_of: Optional[date] = None,
+    ) -> Optional[SizeStandard]:
+        """
+        Get size standard for a NAICS code.
+
+        Args:
+            naics_code: NAICS code to look up
+            as_of: Evaluation date for versioned standards (default: today)
+
+        Returns:
+            SizeStandard if found, None otherwise (including when the table
+            has the code but no version was in effect on as_of)
+        """
+        if self._size_table is not None:
+            standard = self._size_table.lookup(naics_code, as_of)
+            if standard is not None or naics_code in self._size_table:
+                return standard
         return self._size_standards.get(naics_code)
 
     def check_size_status(
@@ -172,6 +208,7 @@ class SmallBusinessValidator:
         naics_code: str,
         annual_revenue: Optional[float] = None,
         employee_count: Optional[int] = None,
+        as_of: Optional[date] = None,
     ) -> Dict[str, Any]:
         """
         Check if company qualifies as small business for a NAICS code.
@@ -180,17 +217,21 @@ class SmallBusinessValidator:
             naics_code: NAICS code to check
             annual_revenue: Average annual receipts (3-year average)
             employee_count: Number of employees
+            as_of: Evaluation date for versioned standards (default: today)
 
         Returns:
             Dictionary with size determination results
         """
-        standard = self._size_standards.get(naics_code)
+        standard = self.get_size_standard(naics_code, as_of)
 
         if standard is None:
+            status = "Unknown - NAICS code not found in database"
+            if self._size_table is not None and naics_code in self._size_table:
+                status = f"Unknown - no size standard in effect on {(as_of or date.today()).isoformat()}"
             return {
                 "naics_code": naics_code,
                 "is_small": None,
-                "status": "Unknown - NAICS code not found in database",
+                "status": status,
                 "recommendation": "Verify size standard with SBA NAICS lookup tool",
             }
 
@@ -242,9 +283,7 @@ class SmallBusinessValidator:
             confidence="Low",
         )
 
-        # Get certifications from profile
-        certifications = company_profile.get("certifications", [])
-        cert_types = {extract_certification_type(c) for c in certifications}
+        profile = ProfileSnapshot.of(company_profile)
 
         # Check for existing certification
         program_cert_mapping = {
@@ -258,7 +297,7 @@ class SmallBusinessValidator:
 
         if program in program_cert_mapping:
             cert_name = program_cert_mapping[program]
-            has_cert = cert_name in cert_types
+            has_cert = cert_name in profile.certification_types
 
             if has_cert:
                 result.certification_status = "Current"
@@ -273,7 +312,7 @@ class SmallBusinessValidator:
         # Check program-specific requirements
         rules = self._rules.get(program, [])
         for rule in rules:
-            self._evaluate_rule(rule, company_profile, result)
+            self._evaluate_rule(rule, profile, result)
 
         # Update confidence based on findings
         if result.missing_requirements:
@@ -285,13 +324,13 @@ class SmallBusinessValidator:
     def _evaluate_rule(
         self,
         rule: SmallBusinessRule,
-        company_profile: Dict[str, Any],
+        profile: ProfileSnapshot,
         result: EligibilityCheckResult,
     ) -> None:
         """Evaluate a single rule against company profile."""
 
         # This is a simplified check - in production, would have more sophisticated logic
-        profile_str = str(company_profile).lower()
+        profile_str = profile.search_text
 
         # Check if any keywords are present
         keyword_found = any(kw.lower() in profile_str for kw in rule.keywords)
@@ -313,10 +352,11 @@ class SmallBusinessValidator:
         Returns:
             Dictionary mapping each program to its eligibility result
         """
+        profile = ProfileSnapshot.of(company_profile)
         results = {}
 
         for program in SmallBusinessProgram:
-            results[program] = self.check_program_eligibility(program, company_profile)
+            results[program] = self.check_program_eligibility(program, profile)
 
         return results
 
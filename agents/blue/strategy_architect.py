@@ -6,15 +6,17 @@ synthesizing company profile, opportunity context, and blue team inputs
 into comprehensive strategy documents.
 """
 
+import asyncio
 import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple, TypeVar
 
 from agents.base import BlueTeamAgent, SwarmContext, AgentOutput
 from agents.config import AgentConfig
 from agents.types import AgentRole, AgentCategory
+from agents.utils.section_resolver import SectionResolver
 
 from .prompts.strategy_architect_prompts import (
     STRATEGY_ARCHITECT_SYSTEM_PROMPT,
@@ -25,6 +27,13 @@ from .prompts.strategy_architect_prompts import (
 from .templates.base import DocumentTemplate, get_template_for_document_type
 
 
+T = TypeVar("T")
+
+# Section LLM calls run at once when revising or drafting several sections.
+# Override per agent with AgentConfig.custom_params["max_concurrent_sections"].
+DEFAULT_MAX_CONCURRENT_SECTIONS = 4
+
+
 @dataclass
 class DraftResult:
     """Result of a drafting operation."""
@@ -216,6 +225,7 @@ class StrategyArchitectAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=STRATEGY_ARCHITECT_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_initial_draft",
         )
 
         if not llm_response.get("success"):
@@ -263,30 +273,32 @@ class StrategyArchitectAgent(BlueTeamAgent):
             return result
 
         # Get critiques grouped by section, with section name normalization
-        available_sections = list(result.sections.keys())
+        resolver = context.get_section_resolver()
+        if not resolver.is_current(result.sections):
+            resolver = SectionResolver(result.sections)
         critiques_by_section = self._group_and_normalize_critiques(
             context.pending_critiques,
-            available_sections
+            resolver,
         )
 
         self.log_info(f"BlueDefense: Normalized critiques by section: {list(critiques_by_section.keys())}")
 
-        for section_name, critiques in critiques_by_section.items():
+        for section_name in critiques_by_section:
             if section_name not in result.sections:
                 self.log_warning(f"BlueDefense: Section '{section_name}' not in available sections")
                 result.warnings.append(
                     f"Critique targets unknown section: {section_name}"
                 )
-                continue
+        to_revise = [name for name in critiques_by_section if name in result.sections]
 
+        async def revise(section_name: str) -> Tuple[Optional[str], List[str]]:
+            critiques = critiques_by_section[section_name]
             self.log_info(f"BlueDefense: Processing {len(critiques)} critiques for section '{section_name}'")
 
-            original_content = result.sections[section_name]
-
             # Build revision prompt
             prompt = get_revision_prompt(
                 section_name=section_name,
-                original_content=original_content,
+                original_content=result.sections[section_name],
                 critiques=critiques,
                 company_profile=context.company_profile,
                 opportunity=context.opportunity,
@@ -296,33 +308,39 @@ class StrategyArchitectAgent(BlueTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=STRATEGY_ARCHITECT_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                stream_callback=self._section_stream_callback(section_name),
+                operation="revise_from_critiques",
             )
 
-            if llm_response.get("success"):
-                content = llm_response.get("content", "")
-                revised = self._extract_section_content(content, section_name)
-                if revised:
-                    result.sections[section_name] = revised
-                    # Generate responses for each addressed critique
-                    for critique in critiques:
-                        responses.append({
-                            "critique_id": critique.get("id", ""),
-                            "message_id": critique.get("message_id", ""),  # Link to critique message
-                            "target_section": section_name,
-                            "action": "revised",
-                            "disposition": "Accept",  # For consensus tracking
-                            "summary": f"Revised {section_name} to address critique",
-                            "original_critique": critique.get("content", critique.get("description", "")),
-                            "changes_made": True,
-                        })
-                else:
-                    result.warnings.append(
-                        f"Could not extract revised content for {section_name}"
-                    )
-            else:
-                result.warnings.append(
-                    f"Failed to revise {section_name}: {llm_response.get('error')}"
-                )
+            if not llm_response.get("success"):
+                return None, [f"Failed to revise {section_name}: {llm_response.get('error')}"]
+            revised = self._extract_section_content(llm_response.get("content", ""), section_name)
+            if not revised:
+                return None, [f"Could not extract revised content for {section_name}"]
+            return revised, []
+
+        template = get_template_for_document_type(context.document_type)
+        revisions = await self._run_per_section(to_revise, template, revise)
+
+        # Collect in critique order so responses don't depend on completion order
+        for section_name in to_revise:
+            revised, warnings = revisions[section_name]
+            result.warnings.extend(warnings)
+            if revised is None:
+                continue
+            result.sections[section_name] = revised
+            # Generate responses for each addressed critique
+            for critique in critiques_by_section[section_name]:
+                responses.append({
+                    "critique_id": critique.get("id", ""),
+                    "message_id": critique.get("message_id", ""),  # Link to critique message
+                    "target_section": section_name,
+                    "action": "revised",
+                    "disposition": "Accept",  # For consensus tracking
+                    "summary": f"Revised {section_name} to address critique",
+                    "original_critique": critique.get("content", critique.get("description", "")),
+                    "changes_made": True,
+                })
 
         # Store responses in result for the caller
         result.responses = responses
@@ -341,45 +359,105 @@ class StrategyArchitectAgent(BlueTeamAgent):
         result = DraftResult()
 
         template = get_template_for_document_type(context.document_type)
+        drafted: Dict[str, str] = {}
 
-        for section_name in context.target_sections:
+        async def draft(section_name: str) -> Tuple[Optional[str], Optional[str]]:
             prompt = get_section_prompt(
                 section_name=section_name,
                 document_type=context.document_type,
                 company_profile=context.company_profile,
                 opportunity=context.opportunity,
-                other_sections=context.section_drafts,
+                # Includes any dependencies drafted earlier in this call
+                other_sections={**context.section_drafts, **drafted},
             )
 
             llm_response = await self._call_llm(
                 system_prompt=STRATEGY_ARCHITECT_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                stream_callback=self._section_stream_callback(section_name),
+                operation="draft_specific_sections",
+            )
+
+            if not llm_response.get("success"):
+                return None, f"Failed to draft {section_name}: {llm_response.get('error')}"
+            section_content = self._extract_section_content(
+                llm_response.get("content", ""), section_name
             )
+            if section_content:
+                drafted[section_name] = section_content
+            return section_content, None
+
+        outcomes = await self._run_per_section(context.target_sections, template, draft)
 
-            if llm_response.get("success"):
-                content = llm_response.get("content", "")
-                section_content = self._extract_section_content(content, section_name)
-                if section_content:
-                    result.sections[section_name] = section_content
-
-                    # Validate against template
-                    if template:
-                        section_errors = template.validate_section_content(
-                            section_name, section_content
-                        )
-                        result.warnings.extend(section_errors)
-                else:
-                    result.warnings.append(
-                        f"Could not extract content for {section_name}"
+        for section_name in context.target_sections:
+            section_content, error = outcomes[section_name]
+            if error:
+                result.errors.append(error)
+            elif section_content:
+                result.sections[section_name] = section_content
+
+                # Validate against template
+                if template:
+                    section_errors = template.validate_section_content(
+                        section_name, section_content
                     )
+                    result.warnings.extend(section_errors)
             else:
-                result.errors.append(
-                    f"Failed to draft {section_name}: {llm_response.get('error')}"
+                result.warnings.append(
+                    f"Could not extract content for {section_name}"
                 )
 
         result.success = len(result.errors) == 0
         return result
 
+    @property
+    def max_concurrent_sections(self) -> int:
+        """Number of section LLM calls run at once."""
+        limit = self._config.custom_params.get(
+            "max_concurrent_sections", DEFAULT_MAX_CONCURRENT_SECTIONS
+        )
+        return max(1, int(limit))
+
+    async def _run_per_section(
+        self,
+        section_names: List[str],
+        template: Optional[DocumentTemplate],
+        run: Callable[[str], Awaitable[T]],
+    ) -> Dict[str, T]:
+        """
+        Run one coroutine per section with bounded concurrency.
+
+        A section whose template dependencies are also in section_names
+        starts only after they finish, so it sees their new content.
+
+        Args:
+            section_names: Sections to process
+            template: Document template defining section dependencies
+            run: Processes one section
+
+        Returns:
+            Result of run() for each section
+        """
+        names = list(dict.fromkeys(section_names))
+        # Only wait on dependencies earlier in drafting order, so cyclic
+        # template dependencies cannot deadlock
+        rank = {name: i for i, name in enumerate(template.get_drafting_order())} if template else {}
+        finished = {name: asyncio.Event() for name in names}
+        semaphore = asyncio.Semaphore(self.max_concurrent_sections)
+
+        async def run_section(name: str) -> T:
+            try:
+                for dep in (template.get_section_dependencies(name) if template else []):
+                    if dep in finished and rank.get(dep, len(rank)) < rank.get(name, len(rank)):
+                        await finished[dep].wait()
+                async with semaphore:
+                    return await run(name)
+            finally:
+                finished[name].set()
+
+        results = await asyncio.gather(*(run_section(name) for name in names))
+        return dict(zip(names, results))
+
     async def draft_section(
         self,
         context: SwarmContext,
@@ -439,6 +517,7 @@ class StrategyArchitectAgent(BlueTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=STRATEGY_ARCHITECT_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="revise_section",
         )
 
         if llm_response.get("success"):
@@ -561,60 +640,6 @@ class StrategyArchitectAgent(BlueTeamAgent):
         # No match - return found name
         return found_name
 
-    def _find_section_in_text(
-        self,
-        text: str,
-        available_sections: List[str],
-    ) -> Optional[str]:
-        """
-        Find a section name mentioned within a text string.
-
-        Handles cases where target_section contains descriptive text
-        like '- Section 2.1: "some content"' instead of just 'Executive Summary'.
-
-        Args:
-            text: The text to search within
-            available_sections: List of available section names
-
-        Returns:
-            The first matching section name found, or None
-        """
-        text_lower = text.lower()
-
-        # Try to find any available section mentioned in the text
-        for section in available_sections:
-            section_lower = section.lower()
-            if section_lower in text_lower:
-                return section
-
-        # Try keyword matching for common section types
-        section_keywords = {
-            "executive summary": ["executive", "summary", "overview"],
-            "main content": ["main", "content", "body", "details"],
-            "recommendations": ["recommend", "suggestion", "action"],
-            "conclusion": ["conclusion", "closing", "final"],
-        }
-
-        for section in available_sections:
-            section_lower = section.lower()
-            if section_lower in section_keywords:
-                for keyword in section_keywords[section_lower]:
-                    if keyword in text_lower:
-                        return section
-
-        # If no match found, default to "Main Content" if available
-        # since most critiques relate to the main body
-        for section in available_sections:
-            if "main" in section.lower() or "content" in section.lower():
-                return section
-
-        # Return first non-title section as fallback
-        for section in available_sections:
-            if section.lower() not in ["title", "header"]:
-                return section
-
-        return None
-
     def _extract_section_content(
         self,
         content: str,
@@ -657,17 +682,18 @@ class StrategyArchitectAgent(BlueTeamAgent):
     def _group_and_normalize_critiques(
         self,
         critiques: List[Dict[str, Any]],
-        available_sections: List[str],
+        resolver: SectionResolver,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Group critiques by section with normalization to available section names.
 
         Handles cases where critique target_section values are descriptive text
-        rather than exact section names.
+        rather than exact section names; critiques matching no section go to
+        the resolver's fallback section.
 
         Args:
             critiques: List of critique dictionaries
-            available_sections: List of actual section names in the document
+            resolver: Section resolver for the document being revised
 
         Returns:
             Dictionary mapping normalized section names to lists of critiques
@@ -676,36 +702,10 @@ class StrategyArchitectAgent(BlueTeamAgent):
 
         for critique in critiques:
             raw_section = critique.get("target_section", "")
-
-            # Try to match/normalize the section name
-            matched_section = self._match_section_name(raw_section, available_sections)
-
-            if matched_section not in available_sections:
-                # Try finding section mentioned in the text
-                matched_section = self._find_section_in_text(raw_section, available_sections)
-
-            if not matched_section or matched_section not in available_sections:
-                # Default to Main Content if available, otherwise first section
-                matched_section = None
-                for section in available_sections:
-                    if "main" in section.lower() or "content" in section.lower():
-                        matched_section = section
-                        break
-                if not matched_section and available_sections:
-                    # Skip company name or title sections
-                    for section in available_sections:
-                        if section.lower() not in ["title", "header"] and not any(
-                            word in section.lower() for word in ["llc", "inc", "corp", "company"]
-                        ):
-                            matched_section = section
-                            break
-                if not matched_section and available_sections:
-                    matched_section = available_sections[0]
+            matched_section = resolver.resolve_or_fallback(raw_section)
 
             if matched_section:
-                if matched_section not in grouped:
-                    grouped[matched_section] = []
-                grouped[matched_section].append(critique)
+                grouped.setdefault(matched_section, []).append(critique)
                 self.log_debug(f"Mapped critique section '{raw_section}' -> '{matched_section}'")
 
         return grouped
@@ -33,7 +33,7 @@ def _load_server_llm_settings() -> dict:
         # Server config not available, use environment variables as fallback
         env_provider = os.getenv("LLM_PROVIDER", "anthropic")
         env_model = os.getenv("LLM_MODEL", "claude-haiku-4-5-20251001")
-        api_key_env_var = "GROQ_API_KEY" if env_provider == "groq" else "ANTHROPIC_API_KEY"
+        api_key_env_var = PROVIDER_API_KEY_ENV_VARS.get(env_provider, "ANTHROPIC_API_KEY")
         _server_llm_settings = {
             "provider": env_provider,
             "model": env_model,
@@ -57,8 +57,74 @@ def configure_llm_settings(provider: str, model: str, api_key_env_var: str) -> N
     }
 
 
-# Provider type
-LLMProvider = Literal["anthropic", "groq"]
+# Provider type ("simulated" generates offline responses; see agents.simulated_llm)
+LLMProvider = Literal["anthropic", "groq", "simulated"]
+
+# API key environment variable per provider (the simulated provider needs none)
+PROVIDER_API_KEY_ENV_VARS: Dict[str, str] = {
+    "anthropic": "ANTHROPIC_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "simulated": "",
+}
+
+# Latency distributions supported by the simulated provider
+LatencyDistribution = Literal["fixed", "uniform", "normal", "lognormal", "exponential"]
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Behavior of the simulated LLM provider.
+
+    Latency is the time to first token, drawn from the configured
+    distribution; output then streams at tokens_per_second. Error rates
+    are per-call probabilities of an injected 429 or 5xx response.
+    """
+
+    latency_distribution: LatencyDistribution = "lognormal"
+    latency_ms: float = 800.0  # Mean
+    latency_jitter_ms: float = 200.0  # Standard deviation, or half-width for uniform
+    latency_max_ms: float = 30000.0  # Cap on sampled latency (0 = uncapped)
+    tokens_per_second: float = 80.0  # 0 = emit all output instantly
+    stream_chunk_tokens: int = 8
+
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+
+    seed: Optional[int] = None  # Fixed seed for reproducible runs
+
+    @classmethod
+    def from_env(cls) -> "SimulationConfig":
+        """Load settings from SIMULATED_LLM_* environment variables."""
+        seed = os.getenv("SIMULATED_LLM_SEED")
+        return cls(
+            latency_distribution=os.getenv("SIMULATED_LLM_LATENCY_DISTRIBUTION", "lognormal"),
+            latency_ms=float(os.getenv("SIMULATED_LLM_LATENCY_MS", "800")),
+            latency_jitter_ms=float(os.getenv("SIMULATED_LLM_LATENCY_JITTER_MS", "200")),
+            latency_max_ms=float(os.getenv("SIMULATED_LLM_LATENCY_MAX_MS", "30000")),
+            tokens_per_second=float(os.getenv("SIMULATED_LLM_TOKENS_PER_SECOND", "80")),
+            stream_chunk_tokens=int(os.getenv("SIMULATED_LLM_STREAM_CHUNK_TOKENS", "8")),
+            rate_limit_rate=float(os.getenv("SIMULATED_LLM_RATE_LIMIT_RATE", "0")),
+            server_error_rate=float(os.getenv("SIMULATED_LLM_SERVER_ERROR_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_distribution": self.latency_distribution,
+            "latency_ms": self.latency_ms,
+            "latency_jitter_ms": self.latency_jitter_ms,
+            "latency_max_ms": self.latency_max_ms,
+            "tokens_per_second": self.tokens_per_second,
+            "stream_chunk_tokens": self.stream_chunk_tokens,
+            "rate_limit_rate": self.rate_limit_rate,
+            "server_error_rate": self.server_error_rate,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimulationConfig":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
 @dataclass
@@ -86,6 +152,9 @@ class LLMConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
 
+    # Simulated provider behavior (used when provider is "simulated")
+    simulation: SimulationConfig = field(default_factory=SimulationConfig.from_env)
+
     def __post_init__(self):
         """Load provider and model from server config at startup."""
         settings = _load_server_llm_settings()
@@ -107,11 +176,15 @@ class LLMConfig:
             "timeout": self.timeout,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
+            "simulation": self.simulation.to_dict(),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "LLMConfig":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        if isinstance(fields.get("simulation"), dict):
+            fields["simulation"] = SimulationConfig.from_dict(fields["simulation"])
+        return cls(**fields)
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
@@ -203,6 +276,7 @@ class AgentConfig:
             timeout=self.llm_config.timeout,
             max_retries=self.llm_config.max_retries,
             retry_delay=self.llm_config.retry_delay,
+            simulation=self.llm_config.simulation,
         )
 
         return AgentConfig(
@@ -343,6 +417,9 @@ def get_default_config(role: AgentRole) -> AgentConfig:
     if role in DEFAULT_AGENT_CONFIGS:
         config = DEFAULT_AGENT_CONFIGS[role]
         # Return a copy to prevent mutation of defaults
-        return AgentConfig.from_dict(config.to_dict())
+        copy = AgentConfig.from_dict(config.to_dict())
+        # Like provider and model, simulation settings follow the current environment
+        copy.llm_config.simulation = SimulationConfig.from_env()
+        return copy
     else:
         return AgentConfig(role=role)
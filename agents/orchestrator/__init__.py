@@ -10,6 +10,24 @@ from .arbiter import (
     DocumentRequest,
     FinalOutput,
 )
+from .analysis_memo import (
+    BlueAnalysisMemo,
+    BLUE_ANALYSIS_INPUTS,
+)
+from .batch import (
+    BatchOutput,
+    BatchProgress,
+    SharedBlueAnalyses,
+    SHARED_BLUE_ANALYSIS_SCOPES,
+)
+from .critique_dedup import (
+    deduplicate_critiques,
+    DEFAULT_SIMILARITY_THRESHOLD,
+)
+from .critique_index import (
+    CritiqueIndex,
+    SectionCritiques,
+)
 from .workflow import (
     DocumentWorkflow,
     WorkflowConfig,
@@ -22,6 +40,9 @@ from .consensus import (
     ConsensusResult,
     ConsensusStatus,
     ConsensusConfig,
+    CycleMetrics,
+    TerminationDecision,
+    revision_delta,
 )
 from .synthesis import (
     DocumentSynthesizer,
@@ -34,6 +55,20 @@ __all__ = [
     "ArbiterAgent",
     "DocumentRequest",
     "FinalOutput",
+    # Analysis memo
+    "BlueAnalysisMemo",
+    "BLUE_ANALYSIS_INPUTS",
+    # Batch
+    "BatchOutput",
+    "BatchProgress",
+    "SharedBlueAnalyses",
+    "SHARED_BLUE_ANALYSIS_SCOPES",
+    # Critique deduplication
+    "deduplicate_critiques",
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    # Critique index
+    "CritiqueIndex",
+    "SectionCritiques",
     # Workflow
     "DocumentWorkflow",
     "WorkflowConfig",
@@ -45,6 +80,9 @@ __all__ = [
     "ConsensusResult",
     "ConsensusStatus",
     "ConsensusConfig",
+    "CycleMetrics",
+    "TerminationDecision",
+    "revision_delta",
     # Synthesis
     "DocumentSynthesizer",
     "SynthesisConfig",
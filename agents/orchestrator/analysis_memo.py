@@ -0,0 +1,144 @@
+"""
+Blue Team Analysis Memo
+
+Caches the analyses that blue agents other than the primary responder
+contribute each adversarial round. Those analyses read only a few context
+fields (profile, opportunity, some custom data), which rarely change
+between rounds, so BlueAnalysisMemo keys each one on a hash of exactly the
+fields its agent reads and it is re-run only when one of them changes.
+"""
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+
+from agents.base import AgentOutput, SwarmContext
+from agents.types import AgentRole
+from models.company_profile import ProfileSnapshot
+
+
+# Context fields each memoizable blue agent reads; "custom_data.<key>" names
+# a single custom data entry. Agents not listed here run every round.
+BLUE_ANALYSIS_INPUTS: Dict[AgentRole, Tuple[str, ...]] = {
+    AgentRole.MARKET_ANALYST: (
+        "company_profile",
+        "opportunity",
+        "custom_data.analysis_type",
+        "custom_data.focus_areas",
+        "custom_data.incumbent_data",
+        "custom_data.market_analytics",
+        "custom_data.market_data",
+        "custom_data.max_opportunities",
+        "custom_data.opportunities",
+        "custom_data.target_agencies",
+    ),
+    AgentRole.CAPTURE_STRATEGIST: (
+        "company_profile",
+        "opportunity",
+        "custom_data.analysis_type",
+        "custom_data.competitor_intel",
+        "custom_data.cost_data",
+    ),
+    AgentRole.COMPLIANCE_NAVIGATOR: (
+        "company_profile",
+        "opportunity",
+        "section_drafts",
+        "current_draft",
+        "custom_data.analysis_type",
+        "custom_data.contract_type",
+        "custom_data.current_contracts",
+        "custom_data.far_parts",
+        "custom_data.staffing_plan",
+        "custom_data.target_setaside",
+    ),
+}
+
+# Inputs the primary responder changes while responding to critiques
+DRAFT_INPUTS = frozenset({"section_drafts", "current_draft"})
+
+
+def _canonical(value: Any) -> str:
+    if isinstance(value, Mapping):
+        value = dict(value)
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+class BlueAnalysisMemo:
+    """
+    Per-request cache of blue agent analyses keyed on the inputs they read.
+
+    Only successful outputs are cached, so a failed analysis is retried the
+    next round.
+    """
+
+    def __init__(self, inputs: Optional[Dict[AgentRole, Tuple[str, ...]]] = None):
+        """
+        Initialize the memo.
+
+        Args:
+            inputs: Memoizable agent roles and the context fields they read
+                (default: BLUE_ANALYSIS_INPUTS)
+        """
+        self.inputs = BLUE_ANALYSIS_INPUTS if inputs is None else inputs
+        self._outputs: Dict[Tuple[str, str], AgentOutput] = {}
+        # Immutable profile snapshots are hashed once: id -> (profile, digest)
+        self._profile_digests: Dict[int, Tuple[Any, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def reads_draft(self, role: AgentRole) -> bool:
+        """Check whether an agent's analysis reads the document draft."""
+        return not DRAFT_INPUTS.isdisjoint(self.inputs.get(role, ()))
+
+    def key_for(self, role: AgentRole, context: SwarmContext) -> Optional[Tuple[str, str]]:
+        """
+        Get the memo key for an agent's analysis, or None if it is not memoized.
+
+        Args:
+            role: Agent role
+            context: Context the agent will process
+
+        Returns:
+            Key of role and a digest of the fields the agent reads
+        """
+        fields = self.inputs.get(role)
+        if fields is None:
+            return None
+
+        digest = hashlib.sha256()
+        for name in fields:
+            if name.startswith("custom_data."):
+                value = (context.custom_data or {}).get(name.split(".", 1)[1])
+            else:
+                value = getattr(context, name, None)
+            digest.update(name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(self._digest(value).encode("utf-8"))
+            digest.update(b"\0")
+        return (role.value, digest.hexdigest())
+
+    def _digest(self, value: Any) -> str:
+        if isinstance(value, ProfileSnapshot):
+            cached = self._profile_digests.get(id(value))
+            if cached is None or cached[0] is not value:
+                cached = (value, hashlib.sha256(_canonical(value).encode("utf-8")).hexdigest())
+                self._profile_digests[id(value)] = cached
+            return cached[1]
+        return hashlib.sha256(_canonical(value).encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[Tuple[str, str]]) -> Optional[AgentOutput]:
+        """Get a memoized output, counting the hit or miss."""
+        if key is None:
+            return None
+        output = self._outputs.get(key)
+        if output is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return output
+
+    def put(self, key: Optional[Tuple[str, str]], output: AgentOutput) -> None:
+        """Memoize a successful output."""
+        if key is not None and output.success:
+            self._outputs[key] = output
@@ -8,30 +8,40 @@ final documents.
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+import time
+import uuid
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Set
+from typing import Callable, Optional, List, Dict, Any, Set, Tuple
 
 from agents.base import OrchestratorAgent, SwarmContext, AgentOutput
 from agents.types import AgentRole, AgentCategory
 from agents.config import AgentConfig, get_default_config
 from agents.registry import AgentRegistry, get_registry
+from agents.usage_ledger import UsageLedger, activate_ledger, deactivate_ledger
+from agents.utils.section_resolver import SectionResolver
 
 from comms.bus import MessageBus
 from comms.history import ConversationHistory
 from comms.round import RoundManager, RoundType, RoundSummary
+from comms.tracing import end_span, span, start_span
 from comms.message import (
     Message, MessageType, MessagePayload,
     create_control_message, create_draft_message, create_status_message
 )
 
+from models.company_profile import ProfileSnapshot
 from models.confidence import (
     ConfidenceScore, SectionConfidence, ConfidenceThresholds, RiskFlag
 )
 
+from .analysis_memo import BlueAnalysisMemo
+from .batch import BatchOutput, BatchProgress, SharedBlueAnalyses
+from .critique_dedup import deduplicate_critiques
+from .critique_index import CritiqueIndex
 from .workflow import DocumentWorkflow, WorkflowConfig
-from .consensus import ConsensusDetector, ConsensusResult
-from .synthesis import DocumentSynthesizer
+from .consensus import ConsensusDetector, ConsensusResult, CycleMetrics, revision_delta
+from .synthesis import DocumentSynthesizer, SectionMetadata
 
 # Import template registry to get section requirements
 try:
@@ -131,6 +141,13 @@ class FinalOutput:
     # Contributing agents (list of agents that provided input)
     contributing_agents: List[str] = field(default_factory=list)
 
+    # LLM usage ledger (every LLM call with tokens, latency and cost)
+    llm_usage: Dict[str, Any] = field(default_factory=dict)
+
+    # Set when the adversarial phase stopped early on marginal value
+    # (see ConsensusDetector.assess_marginal_value): reason and savings
+    early_termination: Optional[Dict[str, Any]] = None
+
     @property
     def duration_seconds(self) -> float:
         if self.started_at and self.completed_at:
@@ -160,6 +177,8 @@ class FinalOutput:
             "duration_seconds": self.duration_seconds,
             "document_versions": self.document_versions,
             "contributing_agents": self.contributing_agents,
+            "llm_usage": self.llm_usage,
+            "early_termination": self.early_termination,
         }
 
 
@@ -192,6 +211,7 @@ class ArbiterAgent(OrchestratorAgent):
         self._message_bus: Optional[MessageBus] = None
         self._history: Optional[ConversationHistory] = None
         self._round_manager: Optional[RoundManager] = None
+        self._round_callbacks: Dict[str, Optional[Callable]] = {}
 
         # Workflow components
         self._workflow: Optional[DocumentWorkflow] = None
@@ -212,6 +232,23 @@ class ArbiterAgent(OrchestratorAgent):
         # Document versioning - tracks document state after each round
         self._document_versions: List[Dict[str, Any]] = []
 
+        # Revision state: critique ids each section has been revised against,
+        # and the sections revised in the current adversarial cycle
+        self._revised_critiques: Dict[str, Set[str]] = {}
+        self._cycle_revised_sections: List[str] = []
+
+        # LLM usage for the current request
+        self._usage_ledger: Optional[UsageLedger] = None
+
+        # BlueBuild analyses shared across a batch (see generate_batch())
+        self._shared_analyses: Optional[SharedBlueAnalyses] = None
+
+        # Blue analyses memoized on their inputs, reused across defense rounds
+        self._analysis_memo = BlueAnalysisMemo()
+
+        # Critiques and responses aggregated once for synthesis and reporting
+        self._critique_index: Optional[CritiqueIndex] = None
+
     @property
     def role(self) -> AgentRole:
         return AgentRole.ARBITER
@@ -234,8 +271,9 @@ class ArbiterAgent(OrchestratorAgent):
         """
         await super().initialize()
 
-        self._registry = registry or get_registry()
-        self._message_bus = message_bus or MessageBus()
+        # An empty registry is falsy (it defines __len__), so test for None
+        self._registry = registry if registry is not None else get_registry()
+        self._message_bus = message_bus if message_bus is not None else MessageBus()
         self._history = ConversationHistory()
         self._round_manager = RoundManager(
             history=self._history,
@@ -249,6 +287,26 @@ class ArbiterAgent(OrchestratorAgent):
 
         self.log_info("Arbiter initialized")
 
+    def set_round_callbacks(
+        self,
+        on_round_start: Optional[Callable[[int, RoundType], None]] = None,
+        on_round_end: Optional[Callable[[RoundSummary], None]] = None,
+        on_consensus: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """
+        Set round event callbacks, applied to the round manager of each request.
+
+        Args:
+            on_round_start: Called with the round number and type when a round starts
+            on_round_end: Called with the RoundSummary when a round ends
+            on_consensus: Called with the round number when consensus is reached
+        """
+        self._round_callbacks = {
+            "on_round_start": on_round_start,
+            "on_round_end": on_round_end,
+            "on_consensus": on_consensus,
+        }
+
     async def cleanup(self) -> None:
         """Clean up resources."""
         if self._message_bus:
@@ -322,6 +380,17 @@ class ArbiterAgent(OrchestratorAgent):
         # Reset error tracking for this request
         self._blue_build_errors: List[str] = []
 
+        # Agents record their LLM calls into the active ledger
+        self._usage_ledger = UsageLedger(request_id=request.id)
+        ledger_token = activate_ledger(self._usage_ledger)
+
+        # Root span; the trace id is the request id used in log records
+        root_span = start_span(
+            "generate_document",
+            trace_id=request.id,
+            document_type=request.document_type,
+        )
+
         try:
             # Initialize for this request
             await self._setup_for_request(request)
@@ -370,16 +439,24 @@ class ArbiterAgent(OrchestratorAgent):
 
             # Phase 2: Adversarial Rounds
             adversarial_round = 0
+            cycles: List[CycleMetrics] = []
             while adversarial_round < request.max_adversarial_rounds:
                 adversarial_round += 1
                 self.log_info(f"Starting adversarial cycle {adversarial_round}")
+                draft_before = dict(self._current_draft)
+                tokens_before, cost_before = self._usage_totals()
 
                 # Red Team Attack
                 critiques = await self._run_red_team_attack()
-                self._all_critiques.extend(critiques)
-
-                if not critiques:
-                    self.log_info("No critiques generated, ending adversarial phase")
+                # Critiques carried forward by delta critique are already recorded
+                recorded = {id(c) for c in self._all_critiques}
+                new_critiques = [c for c in critiques if id(c) not in recorded]
+                self._all_critiques.extend(new_critiques)
+
+                # Carried critiques were already defended; without new ones
+                # another BlueDefense would only repeat the last
+                if not new_critiques:
+                    self.log_info("No new critiques generated, ending adversarial phase")
                     break
 
                 # Blue Team Defense
@@ -401,6 +478,33 @@ class ArbiterAgent(OrchestratorAgent):
                     output.consensus_reached = True
                     break
 
+                # Stop when another cycle is not worth its expected cost
+                tokens_after, cost_after = self._usage_totals()
+                new_by_severity: Dict[str, int] = {}
+                for critique in new_critiques:
+                    severity = critique.get("severity", "minor")
+                    new_by_severity[severity] = new_by_severity.get(severity, 0) + 1
+                cycles.append(CycleMetrics(
+                    cycle=adversarial_round,
+                    new_critiques_by_severity=new_by_severity,
+                    revision_delta=revision_delta(draft_before, self._current_draft),
+                    tokens=tokens_after - tokens_before,
+                    cost_usd=cost_after - cost_before,
+                    resolution_rate=consensus.resolution_rate,
+                ))
+                config = self._workflow_config or WorkflowConfig()
+                if config.enable_early_termination and adversarial_round >= config.min_adversarial_rounds:
+                    decision = self._consensus_detector.assess_marginal_value(
+                        cycles, consensus, request.max_adversarial_rounds - adversarial_round
+                    )
+                    if decision.stop:
+                        self.log_info(
+                            f"Ending adversarial phase after cycle {adversarial_round}: {decision.reason}; "
+                            f"saved {decision.rounds_saved} cycles, ~{decision.tokens_saved} tokens"
+                        )
+                        output.early_termination = decision.to_dict()
+                        break
+
             # Phase 3: Synthesis
             self.log_info("Starting synthesis phase")
             final_document = await self._run_synthesis()
@@ -421,10 +525,9 @@ class ArbiterAgent(OrchestratorAgent):
             output.document_versions = self._document_versions  # Include version history
             output.total_rounds = self._round_manager.current_round
             output.total_critiques = len(self._all_critiques)
-            output.resolved_critiques = len([
-                r for r in self._all_responses
-                if r.get("disposition") in ("Accept", "Partial Accept", "Rebut")
-            ])
+            output.resolved_critiques = self._get_critique_index().response_count(
+                ("Accept", "Partial Accept", "Rebut")
+            )
 
             # Extract and include agent insights from the synthesized document
             output.agent_insights = final_document.get("agent_insights", {})
@@ -461,9 +564,138 @@ class ArbiterAgent(OrchestratorAgent):
             # Cleanup
             await self._message_bus.stop()
             output.completed_at = datetime.now(timezone.utc)
+            output.llm_usage = self._usage_ledger.to_dict()
+            deactivate_ledger(ledger_token)
+            end_span(root_span)
 
         return output
 
+    async def generate_batch(
+        self,
+        requests: List[DocumentRequest],
+        max_concurrency: int = 4,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+        batch_id: Optional[str] = None,
+    ) -> BatchOutput:
+        """
+        Generate a document for each request, e.g. one per forecast opportunity.
+
+        A bounded pool of workers runs the generations, each on its own
+        Arbiter and message bus. BlueBuild analyses that do not depend on
+        the opportunity (see SHARED_BLUE_ANALYSIS_SCOPES) run once per
+        profile and are reused across the batch; everything
+        opportunity-specific runs per request.
+
+        Progress for the whole batch is published to this Arbiter's
+        message bus as "batch_progress" status messages and passed to
+        on_progress.
+
+        Args:
+            requests: Document requests
+            max_concurrency: Maximum generations running at once
+            on_progress: Called with each BatchProgress event
+            batch_id: Batch id (default: random)
+
+        Returns:
+            BatchOutput with a FinalOutput per request, in request order
+        """
+        batch = BatchOutput(
+            batch_id=batch_id or str(uuid.uuid4()),
+            started_at=datetime.now(timezone.utc),
+        )
+        shared = SharedBlueAnalyses()
+        outputs: List[Optional[FinalOutput]] = [None] * len(requests)
+        counts = {"completed": 0, "failed": 0, "running": 0}
+        publishing: Set[asyncio.Task] = set()
+
+        def report(event: str, request_id: Optional[str] = None, **round_info: Any) -> None:
+            progress = BatchProgress(
+                batch_id=batch.batch_id,
+                event=event,
+                total=len(requests),
+                request_id=request_id,
+                **counts,
+                **round_info,
+            )
+            if on_progress:
+                on_progress(progress)
+            msg = create_status_message(
+                sender_role=self.role.value,
+                status_type="batch_progress",
+                data=progress.to_dict(),
+            )
+            task = asyncio.create_task(self._message_bus.publish(msg))
+            publishing.add(task)
+            task.add_done_callback(publishing.discard)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(requests):
+            queue.put_nowait(item)
+
+        async def worker() -> None:
+            while not queue.empty():
+                index, request = queue.get_nowait()
+                counts["running"] += 1
+                report("item_started", request.id)
+
+                arbiter = ArbiterAgent(self.config)
+                try:
+                    await arbiter.initialize(registry=self._registry, message_bus=MessageBus())
+                    arbiter._shared_analyses = shared
+                    arbiter.set_round_callbacks(
+                        on_round_start=lambda rn, rt, rid=request.id: report(
+                            "round_started", rid, round_number=rn, round_type=rt.value
+                        ),
+                        on_round_end=lambda summary, rid=request.id: report(
+                            "round_completed", rid,
+                            round_number=summary.round_number, round_type=summary.round_type.value,
+                        ),
+                        on_consensus=lambda rn, rid=request.id: report(
+                            "consensus_reached", rid, round_number=rn
+                        ),
+                    )
+                    output = await arbiter.generate_document(request)
+                except Exception as e:
+                    self.log_error(f"Batch generation for {request.id} failed: {e}")
+                    output = FinalOutput(
+                        request_id=request.id,
+                        document_type=request.document_type,
+                        success=False,
+                        requires_human_review=True,
+                        review_reasons=[f"Workflow error: {e}"],
+                    )
+                finally:
+                    try:
+                        await arbiter.cleanup()
+                    except Exception as e:
+                        self.log_error(f"Batch cleanup for {request.id} failed: {e}")
+
+                outputs[index] = output
+                counts["running"] -= 1
+                counts["completed" if output.success else "failed"] += 1
+                report("item_completed" if output.success else "item_failed", request.id)
+
+        await self._message_bus.start()
+        try:
+            workers = max(1, min(max_concurrency, len(requests)))
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            report("batch_completed")
+            if publishing:
+                await asyncio.gather(*publishing)
+            await self._message_bus.wait_for_queue_empty(timeout=5.0)
+        finally:
+            await self._message_bus.stop()
+
+        batch.outputs = outputs
+        batch.shared_analyses_run = shared.runs
+        batch.shared_analyses_reused = shared.reuses
+        batch.completed_at = datetime.now(timezone.utc)
+        self.log_info(
+            f"Batch {batch.batch_id} finished: {batch.succeeded}/{len(requests)} succeeded, "
+            f"{shared.reuses} shared analyses reused"
+        )
+        return batch
+
     async def _setup_for_request(self, request: DocumentRequest) -> None:
         """Set up internal state for a new request."""
         self._current_request = request
@@ -474,6 +706,10 @@ class ArbiterAgent(OrchestratorAgent):
         self._all_responses = []
         self._blue_team_contributions = []
         self._document_versions = []  # Reset document version history
+        self._revised_critiques = {}
+        self._cycle_revised_sections = []
+        self._analysis_memo = BlueAnalysisMemo()
+        self._critique_index = None
 
         # Configure round manager
         self._round_manager = RoundManager(
@@ -481,16 +717,60 @@ class ArbiterAgent(OrchestratorAgent):
             max_adversarial_rounds=request.max_adversarial_rounds,
             consensus_threshold=request.consensus_threshold,
         )
+        self._round_manager.set_callbacks(**{
+            **self._round_callbacks,
+            "on_round_start": self._on_round_start,
+        })
 
         # Create context
         self._current_context = SwarmContext(
             request_id=request.id,
             document_type=request.document_type,
-            company_profile=request.company_profile,
+            # Built once; every agent and rule engine reads the same snapshot
+            company_profile=ProfileSnapshot.of(request.company_profile),
             opportunity=request.opportunity,
             target_sections=request.target_sections,
         )
 
+    def _on_round_start(self, round_number: int, round_type: RoundType) -> None:
+        """Attribute subsequent LLM calls to the new round, then notify the caller."""
+        if self._usage_ledger:
+            self._usage_ledger.set_phase(round_type.value, round_number)
+        callback = self._round_callbacks.get("on_round_start")
+        if callback:
+            callback(round_number, round_type)
+
+    def _make_stream_callback(self, agent_role: str, round_number: int) -> Callable[..., None]:
+        """
+        Build a callback that publishes an agent's streamed LLM output.
+
+        Agents that generate several sections concurrently pass the section
+        name with each chunk so the frontend can keep one buffer per section.
+
+        Args:
+            agent_role: Role of the streaming agent
+            round_number: Round the output belongs to
+
+        Returns:
+            Sync callback taking a chunk and optional section name
+        """
+        async def publish(chunk: str, received_at: float, section: Optional[str]) -> None:
+            data = {"chunk": chunk, "received_at": received_at}
+            if section:
+                data["section"] = section
+            stream_msg = create_status_message(
+                sender_role=agent_role,
+                status_type="agent_streaming",
+                data=data,
+                round_number=round_number,
+            )
+            await self._message_bus.publish(stream_msg)
+
+        def callback(chunk: str, section: Optional[str] = None) -> None:
+            asyncio.create_task(publish(chunk, time.time(), section))
+
+        return callback
+
     async def _publish_document_state(
         self,
         round_type: str,
@@ -742,23 +1022,11 @@ class ArbiterAgent(OrchestratorAgent):
                 )
                 await self._message_bus.publish(thinking_msg)
 
-                # Set up streaming callback for real-time output
-                async def stream_handler(chunk: str, agent_role: str = agent.role.value, rn: int = round_num):
-                    stream_msg = create_status_message(
-                        sender_role=agent_role,
-                        status_type="agent_streaming",
-                        data={"chunk": chunk},
-                        round_number=rn,
-                    )
-                    await self._message_bus.publish(stream_msg)
-
-                # Wrap async handler for sync callback
-                def sync_stream_callback(chunk: str, handler=stream_handler):
-                    asyncio.create_task(handler(chunk))
+                # Stream output to the frontend in real time
+                agent.set_stream_callback(self._make_stream_callback(agent.role.value, round_num))
 
-                agent.set_stream_callback(sync_stream_callback)
-
-                output = await agent.process(self._current_context)
+                with span("agent.process", agent=agent.name, role=agent.role.value):
+                    output = await self._process_blue_build_agent(agent)
 
                 # Clear callback after processing
                 agent.set_stream_callback(None)
@@ -840,8 +1108,9 @@ class ArbiterAgent(OrchestratorAgent):
         # Enrich context with collected agent analyses for downstream use
         self._current_context.custom_data["agent_analyses"] = agent_analyses
 
-        # Update context with draft
+        # Update context with draft and index its sections for critique targeting
         self._current_context.section_drafts = sections
+        self._current_context.get_section_resolver()
 
         # End round
         summary = self._round_manager.end_round()
@@ -863,6 +1132,25 @@ class ArbiterAgent(OrchestratorAgent):
 
         return sections
 
+    async def _process_blue_build_agent(self, agent) -> AgentOutput:
+        """
+        Run a BlueBuild agent, reusing a batch-shared analysis when possible.
+
+        The output also seeds the analysis memo, so defense rounds reuse it
+        while the agent's inputs are unchanged.
+        """
+        context = self._current_context
+        memo_key = self._analysis_memo.key_for(agent.role, context)
+        shared = self._shared_analyses
+        key = shared.key_for(agent.role, context) if shared else None
+        if key is None:
+            output = await agent.process(context)
+        else:
+            output = await shared.get_or_run(key, lambda: agent.process(context))
+
+        self._analysis_memo.put(memo_key, output)
+        return output
+
     async def _run_red_team_attack(self) -> List[Dict[str, Any]]:
         """
         Execute the RedAttack phase.
@@ -888,6 +1176,18 @@ class ArbiterAgent(OrchestratorAgent):
         # Get red team agents
         red_agents = self._get_red_team_agents()
 
+        # Later rounds critique only what changed since the last critique
+        delta_sections, carried_critiques = self._plan_red_attack()
+        attack_context = self._current_context
+        if delta_sections is not None:
+            self.log_info(
+                f"RedAttack: Delta critique of {len(delta_sections)} changed sections "
+                f"{delta_sections}, carrying forward {len(carried_critiques)} critiques"
+            )
+            attack_context = self._delta_context(delta_sections)
+            if not delta_sections:
+                red_agents = []
+
         # DEBUG: Log red team agent availability
         self.log_info(f"RedAttack: Found {len(red_agents)} red team agents")
         for agent in red_agents:
@@ -896,9 +1196,9 @@ class ArbiterAgent(OrchestratorAgent):
         all_critiques = []
 
         # DEBUG: Log context state for critique generation
-        self.log_info(f"RedAttack: Context has {len(self._current_context.section_drafts)} section drafts")
-        if self._current_context.section_drafts:
-            for name, content in self._current_context.section_drafts.items():
+        self.log_info(f"RedAttack: Context has {len(attack_context.section_drafts)} section drafts")
+        if attack_context.section_drafts:
+            for name, content in attack_context.section_drafts.items():
                 content_preview = content[:100] + "..." if len(content) > 100 else content
                 self.log_debug(f"  - Section '{name}': {len(content)} chars - {content_preview}")
 
@@ -916,22 +1216,11 @@ class ArbiterAgent(OrchestratorAgent):
                 )
                 await self._message_bus.publish(thinking_msg)
 
-                # Set up streaming callback for real-time output
-                async def stream_handler(chunk: str, agent_role: str = agent.role.value, rn: int = round_num):
-                    stream_msg = create_status_message(
-                        sender_role=agent_role,
-                        status_type="agent_streaming",
-                        data={"chunk": chunk},
-                        round_number=rn,
-                    )
-                    await self._message_bus.publish(stream_msg)
-
-                def sync_stream_callback(chunk: str, handler=stream_handler):
-                    asyncio.create_task(handler(chunk))
+                # Stream output to the frontend in real time
+                agent.set_stream_callback(self._make_stream_callback(agent.role.value, round_num))
 
-                agent.set_stream_callback(sync_stream_callback)
-
-                output = await agent.process(self._current_context)
+                with span("agent.process", agent=agent.name, role=agent.role.value):
+                    output = await agent.process(attack_context)
 
                 agent.set_stream_callback(None)
 
@@ -947,28 +1236,49 @@ class ArbiterAgent(OrchestratorAgent):
                         self.log_warning(f"RedAttack: Agent {agent.name} warning: {warning}")
 
                 if output.success and output.critiques:
-                    # Record critiques in history and track message IDs
                     for critique in output.critiques:
-                        from comms.message import create_critique_message
-                        msg = create_critique_message(
-                            sender_role=agent.role.value,
-                            critique_data=critique,
-                            parent_message_id=self._current_request.id,
-                            round_number=round_num,
-                        )
-                        await self._message_bus.publish(msg)
-                        self._history.record_message(msg)
-
-                        # Store message_id in critique for response linking
-                        critique["message_id"] = msg.id
+                        critique.setdefault("agent", agent.role.value)
+                        critique.setdefault("round_number", round_num)
                         all_critiques.append(critique)
 
             except Exception as e:
                 self.log_error(f"Red team agent {agent.name} failed: {e}", exc_info=True)
 
+        # Merge the same issue raised by several agents into one critique,
+        # before anything is published or recorded
+        config = self._workflow_config or WorkflowConfig()
+        if config.enable_critique_dedup and len(all_critiques) > 1:
+            raised = len(all_critiques)
+            all_critiques = deduplicate_critiques(
+                all_critiques,
+                config.critique_similarity_threshold,
+                resolver=self._current_context.get_section_resolver(),
+            )
+            if len(all_critiques) < raised:
+                self.log_info(f"RedAttack: Merged {raised} critiques into {len(all_critiques)}")
+
+        # Record critiques in history and track message IDs
+        from comms.message import create_critique_message
+        for critique in all_critiques:
+            msg = create_critique_message(
+                sender_role=critique["agent"],
+                critique_data=critique,
+                parent_message_id=self._current_request.id,
+                round_number=round_num,
+            )
+            await self._message_bus.publish(msg)
+            self._history.record_message(msg)
+
+            # Store message_id in critique for response linking
+            critique["message_id"] = msg.id
+
+        new_critique_count = len(all_critiques)
+        all_critiques.extend(carried_critiques)
+        self._current_context.mark_sections_critiqued()
+
         # DEBUG: Log final critique count
         self.log_info(f"RedAttack: Phase complete - total critiques collected: {len(all_critiques)}")
-        if not all_critiques:
+        if not all_critiques and delta_sections is None:
             self.log_warning(
                 "RedAttack: No critiques generated! This could indicate: "
                 "1) LLM API issues, 2) Empty section drafts, 3) Parsing failures, or 4) Disabled agents"
@@ -993,11 +1303,80 @@ class ArbiterAgent(OrchestratorAgent):
             round_type="RedAttack",
             round_number=round_num,
             sections=self._current_draft,
-            changes_summary=f"Red team generated {len(all_critiques)} critiques",
+            changes_summary=(
+                f"Red team generated {new_critique_count} critiques"
+                + (f", {len(carried_critiques)} carried forward" if carried_critiques else "")
+            ),
         )
 
         return all_critiques
 
+    def _plan_red_attack(self) -> Tuple[Optional[List[str]], List[Dict[str, Any]]]:
+        """
+        Decide which sections the red team critiques this round.
+
+        After the first RedAttack, only sections changed since the last
+        critique are re-critiqued, together with template sections that
+        depend on them, and pending critiques on the other sections are
+        carried forward. The whole document is critiqued on the first
+        round, when delta critique is disabled, or when enough changed to
+        warrant cross-section checks.
+
+        Returns:
+            Sections to critique (None for the whole document) and the
+            critiques carried forward
+        """
+        context = self._current_context
+        config = self._workflow_config or WorkflowConfig()
+        if not config.enable_delta_critique or not context.section_fingerprints:
+            return None, []
+
+        changed = set(context.changed_sections())
+        if changed and TEMPLATES_AVAILABLE and get_template_for_document_type:
+            # Sections that build on a changed section may now contradict it
+            template = get_template_for_document_type(context.document_type)
+            if template:
+                for spec in template.sections:
+                    if spec.name in context.section_drafts and changed.intersection(spec.dependencies):
+                        changed.add(spec.name)
+
+        sections = [name for name in context.section_drafts if name in changed]
+        if len(sections) > config.delta_critique_max_changed_ratio * len(context.section_drafts):
+            return None, []
+
+        resolver = context.get_section_resolver()
+        carried = [
+            c for c in context.pending_critiques
+            if resolver.resolve(c.get("target_section", "")) not in changed
+        ]
+        return sections, carried
+
+    def _delta_context(self, sections: List[str]) -> SwarmContext:
+        """
+        Build the context red agents see in a delta critique.
+
+        The red agents read critique_mode and unchanged_sections to tell
+        the model that the sections shown are not the whole document.
+
+        Args:
+            sections: Changed sections to critique
+
+        Returns:
+            Copy of the current context holding only those sections
+        """
+        context = self._current_context
+        return replace(
+            context,
+            section_drafts={name: context.section_drafts[name] for name in sections},
+            custom_data={
+                **context.custom_data,
+                "critique_mode": "delta",
+                "unchanged_sections": [
+                    name for name in context.section_drafts if name not in sections
+                ],
+            },
+        )
+
     async def _run_blue_team_defense(
         self,
         critiques: List[Dict[str, Any]]
@@ -1032,6 +1411,8 @@ class ArbiterAgent(OrchestratorAgent):
 
         all_responses = []
 
+        self._cycle_revised_sections = []
+
         # Primary responder is Strategy Architect
         primary_responder = None
         for agent in blue_agents:
@@ -1039,7 +1420,7 @@ class ArbiterAgent(OrchestratorAgent):
                 primary_responder = agent
                 break
 
-        if primary_responder:
+        async def respond() -> None:
             try:
                 self.log_debug("Strategy Architect responding to critiques")
 
@@ -1052,31 +1433,26 @@ class ArbiterAgent(OrchestratorAgent):
                 )
                 await self._message_bus.publish(thinking_msg)
 
-                # Set up streaming callback for real-time output
-                async def stream_handler(chunk: str, agent_role: str = primary_responder.role.value, rn: int = round_num):
-                    stream_msg = create_status_message(
-                        sender_role=agent_role,
-                        status_type="agent_streaming",
-                        data={"chunk": chunk},
-                        round_number=rn,
-                    )
-                    await self._message_bus.publish(stream_msg)
-
-                def sync_stream_callback(chunk: str, handler=stream_handler):
-                    asyncio.create_task(handler(chunk))
-
-                primary_responder.set_stream_callback(sync_stream_callback)
+                # Stream output to the frontend in real time
+                primary_responder.set_stream_callback(
+                    self._make_stream_callback(primary_responder.role.value, round_num)
+                )
 
-                output = await primary_responder.process(self._current_context)
+                with span("agent.process", agent=primary_responder.name, role=primary_responder.role.value):
+                    output = await primary_responder.process(self._current_context)
 
                 primary_responder.set_stream_callback(None)
 
+                if output.success and output.sections:
+                    self._apply_defense_revisions(output.sections, output.responses)
+
                 if output.success and output.responses:
                     all_responses.extend(output.responses)
 
                     # Record responses in history
                     for response in output.responses:
                         from comms.message import create_response_message
+                        response.setdefault("round_number", round_num)
                         # Use message_id for linking responses to critique messages
                         critique_message_id = response.get("message_id", response.get("critique_id", ""))
                         msg = create_response_message(
@@ -1091,56 +1467,67 @@ class ArbiterAgent(OrchestratorAgent):
             except Exception as e:
                 self.log_error(f"Defense phase failed: {e}")
 
-        # Run all other blue team agents to capture their analysis contributions
-        for agent in blue_agents:
-            if agent.role != AgentRole.STRATEGY_ARCHITECT:
-                try:
-                    self.log_debug(f"Running blue team agent for analysis: {agent.name}")
+        # Other blue agents contribute analyses. Analyses whose inputs are
+        # unchanged since they last ran are reused rather than re-run; the
+        # rest run alongside the primary responder, except those that read
+        # the draft, which wait for its revisions.
+        analysts = [agent for agent in blue_agents if agent.role != AgentRole.STRATEGY_ARCHITECT]
+        contributions: Dict[str, Dict[str, Any]] = {}
 
-                    # Emit agent thinking status
-                    thinking_msg = create_status_message(
-                        sender_role=agent.role.value,
-                        status_type="agent_thinking",
-                        data={"target": "Generating analysis contribution"},
-                        round_number=round_num,
-                    )
-                    await self._message_bus.publish(thinking_msg)
-
-                    # Set up streaming callback for real-time output
-                    async def stream_handler(chunk: str, agent_role: str = agent.role.value, rn: int = round_num):
-                        stream_msg = create_status_message(
-                            sender_role=agent_role,
-                            status_type="agent_streaming",
-                            data={"chunk": chunk},
-                            round_number=rn,
-                        )
-                        await self._message_bus.publish(stream_msg)
+        async def analyze(agent) -> None:
+            try:
+                memo_key = self._analysis_memo.key_for(agent.role, self._current_context)
+                if self._analysis_memo.get(memo_key) is not None:
+                    self.log_debug(f"Inputs unchanged, reusing analysis from {agent.name}")
+                    return
 
-                    def sync_stream_callback(chunk: str, handler=stream_handler):
-                        asyncio.create_task(handler(chunk))
+                self.log_debug(f"Running blue team agent for analysis: {agent.name}")
 
-                    agent.set_stream_callback(sync_stream_callback)
+                # Emit agent thinking status
+                thinking_msg = create_status_message(
+                    sender_role=agent.role.value,
+                    status_type="agent_thinking",
+                    data={"target": "Generating analysis contribution"},
+                    round_number=round_num,
+                )
+                await self._message_bus.publish(thinking_msg)
 
+                # Stream output to the frontend in real time
+                agent.set_stream_callback(self._make_stream_callback(agent.role.value, round_num))
+
+                with span("agent.process", agent=agent.name, role=agent.role.value):
                     output = await agent.process(self._current_context)
 
-                    agent.set_stream_callback(None)
+                agent.set_stream_callback(None)
+                self._analysis_memo.put(memo_key, output)
 
-                    if output.success and output.content:
-                        contribution = {
-                            "agent_role": agent.role.value,
-                            "agent_name": agent.name,
-                            "content": output.content,
-                            "content_type": output.metadata.get("analysis_type", "analysis"),
-                            "metadata": output.metadata,
-                            "round_number": round_num,
-                            "round_type": "BlueDefense",
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                        }
-                        self._blue_team_contributions.append(contribution)
-                        self.log_debug(f"Captured contribution from {agent.name}")
+                if output.success and output.content:
+                    contributions[agent.role.value] = {
+                        "agent_role": agent.role.value,
+                        "agent_name": agent.name,
+                        "content": output.content,
+                        "content_type": output.metadata.get("analysis_type", "analysis"),
+                        "metadata": output.metadata,
+                        "round_number": round_num,
+                        "round_type": "BlueDefense",
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                    }
+                    self.log_debug(f"Captured contribution from {agent.name}")
 
-                except Exception as e:
-                    self.log_error(f"Blue team agent {agent.name} analysis failed: {e}")
+            except Exception as e:
+                self.log_error(f"Blue team agent {agent.name} analysis failed: {e}")
+
+        draft_readers = [a for a in analysts if self._analysis_memo.reads_draft(a.role)]
+        await asyncio.gather(
+            *([respond()] if primary_responder else []),
+            *(analyze(agent) for agent in analysts if agent not in draft_readers),
+        )
+        await asyncio.gather(*(analyze(agent) for agent in draft_readers))
+
+        # Record contributions in team order, whatever order they finished in
+        for agent in analysts:
+            if agent.role.value in contributions:
+                self._blue_team_contributions.append(contributions[agent.role.value])
 
         # Move addressed critiques to resolved
         resolved_ids = {r.get("critique_id") for r in all_responses}
@@ -1177,9 +1564,8 @@ class ArbiterAgent(OrchestratorAgent):
         )
         await self._message_bus.publish(end_msg)
 
-        # Publish document state after BlueDefense round
-        # Note: Document revisions happen in _apply_accepted_changes,
-        # but we publish state here to show defense responses
+        # Publish document state after BlueDefense round, including any
+        # revisions the primary responder made while responding
         accepted_count = len([r for r in all_responses if r.get("disposition") in ("Accept", "Partial Accept")])
         rebutted_count = len([r for r in all_responses if r.get("disposition") == "Rebut"])
         await self._publish_document_state(
@@ -1194,6 +1580,38 @@ class ArbiterAgent(OrchestratorAgent):
 
         return all_responses
 
+    def _apply_defense_revisions(
+        self,
+        sections: Dict[str, str],
+        responses: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Adopt sections the primary responder revised during BlueDefense.
+
+        Records which critiques each section was revised against, so
+        _apply_accepted_changes() does not revise it for them again.
+
+        Args:
+            sections: Sections returned by the responder
+            responses: The responder's critique responses
+        """
+        revised = {
+            name: content
+            for name, content in sections.items()
+            if content and name in self._current_draft and content != self._current_draft[name]
+        }
+        if not revised:
+            return
+
+        self._current_draft = {**self._current_draft, **revised}
+        self._current_context.section_drafts = self._current_draft
+        self._cycle_revised_sections.extend(name for name in revised if name not in self._cycle_revised_sections)
+
+        for response in responses:
+            section = response.get("target_section")
+            if response.get("changes_made") and section in revised:
+                self._revised_critiques.setdefault(section, set()).add(response.get("critique_id", ""))
+
     async def _apply_accepted_changes(
         self,
         current_draft: Dict[str, str],
@@ -1202,6 +1620,10 @@ class ArbiterAgent(OrchestratorAgent):
         """
         Apply accepted critique responses to the draft.
 
+        Sections the primary responder already revised against a critique
+        during BlueDefense are not revised for it again; only accepted
+        critiques no revision has addressed yet are sent to revise_section().
+
         Args:
             current_draft: Current section drafts
             responses: Blue team responses
@@ -1217,32 +1639,31 @@ class ArbiterAgent(OrchestratorAgent):
             if r.get("disposition") in ("Accept", "Partial Accept")
         ]
 
-        if not accepted_responses:
-            return updated_draft
-
-        # Get sections that need revision - only include sections that actually exist in the draft
+        # Group accepted critiques no revision has addressed by the section they target.
         # Critique target_section values can be descriptive text, not actual section names
-        available_sections = set(current_draft.keys())
-        sections_to_revise = set()
+        resolver = self._current_context.get_section_resolver()
+        if not resolver.is_current(current_draft):
+            resolver = SectionResolver(current_draft)
+        critiques_by_id = {c.get("id"): c for c in self._all_critiques}
+        pending: Dict[str, List[Dict[str, Any]]] = {}
 
         for response in accepted_responses:
             critique_id = response.get("critique_id")
-            # Find the corresponding critique
-            for critique in self._all_critiques:
-                if critique.get("id") == critique_id:
-                    target = critique.get("target_section", "")
-                    # Only add if it's an actual section name, not a descriptive critique target
-                    if target in available_sections:
-                        sections_to_revise.add(target)
-                    else:
-                        # Try to find the closest matching section
-                        matched = self._find_matching_section(target, available_sections)
-                        if matched:
-                            sections_to_revise.add(matched)
-                            self.log_debug(f"Mapped critique target '{target}' -> section '{matched}'")
+            critique = critiques_by_id.get(critique_id)
+            if critique is None:
+                continue
+            target = critique.get("target_section", "")
+            section = resolver.resolve(target) or resolver.catch_all
+            if not section:
+                continue
+            if section != target:
+                self.log_debug(f"Mapped critique target '{target}' -> section '{section}'")
+            if critique_id in self._revised_critiques.get(section, ()):
+                continue
+            pending.setdefault(section, []).append(critique)
 
         # Have Strategy Architect revise affected sections
-        if sections_to_revise:
+        if pending:
             blue_agents = self._get_blue_team_agents()
             strategy_architect = None
             for agent in blue_agents:
@@ -1251,25 +1672,7 @@ class ArbiterAgent(OrchestratorAgent):
                     break
 
             if strategy_architect and hasattr(strategy_architect, 'revise_section'):
-                for section in sections_to_revise:
-                    # Only revise sections that exist in the draft
-                    if section not in updated_draft:
-                        self.log_warning(f"Section '{section}' not in draft, skipping revision")
-                        continue
-
-                    # Find critiques for this section using flexible matching
-                    section_critiques = []
-                    for c in self._all_critiques:
-                        target = c.get("target_section", "")
-                        if target == section:
-                            section_critiques.append(c)
-                        elif self._find_matching_section(target, available_sections) == section:
-                            section_critiques.append(c)
-
-                    if not section_critiques:
-                        self.log_debug(f"No critiques found for section '{section}'")
-                        continue
-
+                for section, section_critiques in pending.items():
                     try:
                         revised = await strategy_architect.revise_section(
                             self._current_context,
@@ -1278,6 +1681,11 @@ class ArbiterAgent(OrchestratorAgent):
                         )
                         if revised:  # Only update if we got valid content back
                             updated_draft[section] = revised
+                            self._revised_critiques.setdefault(section, set()).update(
+                                c.get("id", "") for c in section_critiques
+                            )
+                            if section not in self._cycle_revised_sections:
+                                self._cycle_revised_sections.append(section)
                         else:
                             self.log_warning(f"Empty revision returned for section '{section}'")
                     except Exception as e:
@@ -1286,13 +1694,14 @@ class ArbiterAgent(OrchestratorAgent):
         # Update context
         self._current_context.section_drafts = updated_draft
 
-        # Publish document state after revisions are applied
-        if sections_to_revise:
+        # Publish document state after this cycle's revisions
+        revised_sections = self._cycle_revised_sections
+        if revised_sections:
             await self._publish_document_state(
                 round_type="Revision",
                 round_number=self._current_context.round_number,
                 sections=updated_draft,
-                changes_summary=f"Revised {len(sections_to_revise)} section(s) based on accepted critiques: {', '.join(sections_to_revise)}",
+                changes_summary=f"Revised {len(revised_sections)} section(s) based on accepted critiques: {', '.join(revised_sections)}",
             )
 
         return updated_draft
@@ -1344,6 +1753,20 @@ class ArbiterAgent(OrchestratorAgent):
                         "round_number": round_num,
                     })
 
+        # Aggregate the debate once for synthesis, confidence and the reports
+        self._critique_index = None
+        critique_index = self._get_critique_index()
+
+        # Stream each section to subscribers as soon as it is finalized
+        finalized: List[str] = []
+        total_sections = len(self._current_draft)
+
+        async def publish_section(name: str, content: str, metadata: SectionMetadata) -> None:
+            finalized.append(name)
+            await self._publish_finalized_section(
+                name, content, metadata, index=len(finalized) - 1, total=total_sections,
+            )
+
         # Use synthesizer to compile final document
         final_document = await self._synthesizer.synthesize(
             sections=self._current_draft,
@@ -1351,6 +1774,8 @@ class ArbiterAgent(OrchestratorAgent):
             responses=self._all_responses,
             context=self._current_context,
             blue_team_contributions=self._blue_team_contributions,
+            critique_index=critique_index,
+            on_section=publish_section,
         )
 
         # End round
@@ -1367,69 +1792,15 @@ class ArbiterAgent(OrchestratorAgent):
 
         return final_document
 
-    def _find_matching_section(
-        self,
-        target: str,
-        available_sections: set
-    ) -> Optional[str]:
-        """
-        Find the best matching section for a critique target.
-
-        Critique target_section values can be descriptive text like
-        "'Immediate Actions (Months 1-3)' and 'Strategic Positioning (Months 10-12)' sections"
-        instead of actual section names like "Executive Summary".
-
-        Args:
-            target: The critique target_section value
-            available_sections: Set of actual section names
-
-        Returns:
-            The best matching section name, or None if no good match
-        """
-        if not target or not available_sections:
-            return None
-
-        target_lower = target.lower()
-
-        # First, try exact match
-        if target in available_sections:
-            return target
-
-        # Try case-insensitive exact match
-        for section in available_sections:
-            if section.lower() == target_lower:
-                return section
-
-        # Try to find a section name mentioned within the target text
-        for section in available_sections:
-            section_lower = section.lower()
-            if section_lower in target_lower:
-                return section
-
-        # Try partial word matching
-        target_words = set(target_lower.replace("'", "").replace('"', "").split())
-        best_match = None
-        best_score = 0
-
-        for section in available_sections:
-            section_words = set(section.lower().split())
-            # Count overlapping words
-            overlap = len(target_words & section_words)
-            if overlap > best_score:
-                best_score = overlap
-                best_match = section
-
-        # Only return if there's at least 1 word overlap
-        if best_score >= 1:
-            return best_match
-
-        # Default to "Main Content" if available (common catch-all section)
-        for section in available_sections:
-            if "main" in section.lower() or "content" in section.lower():
-                return section
-
-        # No good match found
-        return None
+    def _usage_totals(self) -> Tuple[int, float]:
+        """Tokens and estimated cost of the LLM calls made so far for this request."""
+        if not self._usage_ledger:
+            return 0, 0.0
+        records = self._usage_ledger.records
+        return (
+            sum(r.total_tokens for r in records),
+            sum(r.estimated_cost_usd for r in records),
+        )
 
     def _check_consensus(self) -> ConsensusResult:
         """
@@ -1444,6 +1815,58 @@ class ArbiterAgent(OrchestratorAgent):
             threshold=self._current_request.consensus_threshold,
         )
 
+    async def _publish_finalized_section(
+        self,
+        name: str,
+        content: str,
+        metadata: SectionMetadata,
+        index: int,
+        total: int,
+    ) -> None:
+        """
+        Publish one section of the final document as soon as synthesis finalizes it.
+
+        Args:
+            name: Section name
+            content: Final section content
+            metadata: The section's synthesis metadata
+            index: Position of the section in the final document
+            total: Number of sections in the final document
+        """
+        message = create_status_message(
+            sender_role=self.role.value,
+            status_type="section_finalized",
+            data={
+                "document_id": self._current_request.id if self._current_request else "",
+                "document_type": self._current_request.document_type if self._current_request else "",
+                "section": {"name": name, "content": content, "metadata": metadata.to_dict()},
+                "index": index,
+                "total": total,
+            },
+            round_number=self._current_context.round_number if self._current_context else 0,
+        )
+        await self._message_bus.publish(message)
+
+    def _get_critique_index(self) -> CritiqueIndex:
+        """Get the index of this request's critiques and responses, building it if needed."""
+        index = self._critique_index
+        if (
+            index is None
+            or len(index.critiques) != len(self._all_critiques)
+            or len(index.responses) != len(self._all_responses)
+        ):
+            resolver = self._current_context.get_section_resolver() if self._current_context else None
+            if resolver is None or not resolver.is_current(self._current_draft):
+                resolver = SectionResolver(self._current_draft)
+            index = CritiqueIndex(
+                self._all_critiques,
+                self._all_responses,
+                resolver,
+                literal_targets=getattr(self, "_missing_sections", ()),
+            )
+            self._critique_index = index
+        return index
+
     def _calculate_confidence(
         self,
         final_document: Dict[str, Any]
@@ -1467,6 +1890,8 @@ class ArbiterAgent(OrchestratorAgent):
             thresholds=thresholds,
         )
 
+        critique_index = self._get_critique_index()
+
         # Calculate section-level confidence
         for section_name, content in self._current_draft.items():
             section_conf = SectionConfidence(
@@ -1475,25 +1900,16 @@ class ArbiterAgent(OrchestratorAgent):
             )
 
             # Get critiques for this section
-            section_critiques = [
-                c for c in self._all_critiques
-                if c.get("target_section") == section_name
-            ]
+            section_critiques = critique_index.for_section(section_name).critiques
 
             section_conf.critique_count = len(section_critiques)
 
             # Apply penalties for unresolved critiques
             for critique in section_critiques:
-                critique_id = critique.get("id")
                 severity = critique.get("severity", "minor")
+                response = critique_index.response_for(critique)
 
-                # Check if resolved
-                resolved = any(
-                    r.get("critique_id") == critique_id
-                    for r in self._all_responses
-                )
-
-                if not resolved:
+                if response is None:
                     section_conf.unresolved_critiques += 1
                     if severity == "critical":
                         section_conf.critical_critiques += 1
@@ -1514,32 +1930,25 @@ class ArbiterAgent(OrchestratorAgent):
                             -thresholds.minor_critique_penalty,
                         )
                 else:
-                    # Find the response disposition
-                    for response in self._all_responses:
-                        if response.get("critique_id") == critique_id:
-                            disposition = response.get("disposition", "")
-                            if disposition == "Accept":
-                                section_conf.apply_adjustment(
-                                    "Accepted critique resolved",
-                                    thresholds.accepted_resolution_bonus,
-                                )
-                            elif disposition == "Rebut":
-                                section_conf.apply_adjustment(
-                                    "Critique successfully rebutted",
-                                    thresholds.rebutted_resolution_bonus,
-                                )
-                            break
+                    disposition = response.get("disposition", "")
+                    if disposition == "Accept":
+                        section_conf.apply_adjustment(
+                            "Accepted critique resolved",
+                            thresholds.accepted_resolution_bonus,
+                        )
+                    elif disposition == "Rebut":
+                        section_conf.apply_adjustment(
+                            "Critique successfully rebutted",
+                            thresholds.rebutted_resolution_bonus,
+                        )
 
             section_conf.word_count = len(content.split())
             section_conf.finalize(thresholds)
             confidence.add_section_score(section_conf)
 
         # Calculate aggregate metrics
-        confidence.total_critiques = len(self._all_critiques)
-        confidence.resolved_critiques = len([
-            r for r in self._all_responses
-            if r.get("disposition") in ("Accept", "Partial Accept", "Rebut", "Acknowledge")
-        ])
+        confidence.total_critiques = len(critique_index.critiques)
+        confidence.resolved_critiques = critique_index.response_count()
         confidence.unresolved_critical = sum(
             1 for s in confidence.section_scores
             if s.critical_critiques > 0 and s.unresolved_critiques > 0
@@ -1621,36 +2030,18 @@ class ArbiterAgent(OrchestratorAgent):
         # Get conversation history summary
         history_summary = self._history.get_summary()
 
-        # Organize critiques by section and compute severity counts
-        critiques_by_section: Dict[str, List[Dict]] = {}
-        severity_counts: Dict[str, int] = {"critical": 0, "major": 0, "minor": 0}
-        for critique in self._all_critiques:
-            section = critique.get("target_section", "General")
-            if section not in critiques_by_section:
-                critiques_by_section[section] = []
-            critiques_by_section[section].append(critique)
-
-            # Count by severity
-            severity = critique.get("severity", "minor").lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-
-        # Build response map and compute disposition counts
-        response_map = {
-            r.get("critique_id"): r
-            for r in self._all_responses
+        # Severity, section and disposition counts from the shared index
+        critique_index = self._get_critique_index()
+        disposition_counts: Dict[str, int] = {
+            disposition: critique_index.disposition_counts[disposition]
+            for disposition in ("Accept", "Rebut", "Acknowledge", "Partial Accept")
         }
-        disposition_counts: Dict[str, int] = {"Accept": 0, "Rebut": 0, "Acknowledge": 0, "Partial Accept": 0}
-        for response in self._all_responses:
-            disposition = response.get("disposition", "Acknowledge")
-            if disposition in disposition_counts:
-                disposition_counts[disposition] += 1
 
         # Create detailed exchange records
         exchanges = []
-        for critique in self._all_critiques:
+        for critique in critique_index.critiques:
             critique_id = critique.get("id")
-            response = response_map.get(critique_id)
+            response = critique_index.response_for(critique)
 
             exchanges.append({
                 "critique": {
@@ -1662,6 +2053,7 @@ class ArbiterAgent(OrchestratorAgent):
                     "title": critique.get("title"),
                     "argument": critique.get("argument"),
                     "suggested_remedy": critique.get("suggested_remedy"),
+                    "round_number": critique.get("round_number"),
                 },
                 "response": {
                     "id": response.get("id") if response else None,
@@ -1669,6 +2061,7 @@ class ArbiterAgent(OrchestratorAgent):
                     "disposition": response.get("disposition") if response else "No Response",
                     "summary": response.get("summary") if response else None,
                     "action": response.get("action") if response else None,
+                    "round_number": response.get("round_number") if response else None,
                 } if response else None,
                 "resolved": response is not None,
                 "outcome": response.get("disposition") if response else "Unresolved",
@@ -1684,8 +2077,8 @@ class ArbiterAgent(OrchestratorAgent):
                 "total_rounds": debate_summary.get("total_rounds", 0),
                 "adversarial_cycles": debate_summary.get("adversarial_cycles", 0),
                 "consensus_reached": debate_summary.get("consensus_reached", False),
-                "total_critiques": len(self._all_critiques),
-                "resolved_critiques": len([e for e in exchanges if e["resolved"]]),
+                "total_critiques": len(critique_index.critiques),
+                "resolved_critiques": critique_index.resolved_count,
                 "overall_resolution_rate": debate_summary.get("overall_resolution_rate", 0),
             },
 
@@ -1696,10 +2089,10 @@ class ArbiterAgent(OrchestratorAgent):
             },
 
             # Critique breakdown
-            "critiques_by_severity": severity_counts,
+            "critiques_by_severity": critique_index.reported_severity_counts(),
             "critiques_by_section": {
-                section: len(crits)
-                for section, crits in critiques_by_section.items()
+                section: len(entry.critiques)
+                for section, entry in critique_index.sections.items()
             },
 
             # Response breakdown
@@ -1774,8 +2167,10 @@ class ArbiterAgent(OrchestratorAgent):
                     }
                 })
 
+        critique_index = self._get_critique_index()
+
         # 3. Add critiques (red-attack phase)
-        for critique in self._all_critiques:
+        for critique in critique_index.critiques:
             entries.append({
                 "id": f"critique-{critique.get('id', '')}",
                 "round": critique.get("round_number", 1),
@@ -1794,7 +2189,7 @@ class ArbiterAgent(OrchestratorAgent):
             })
 
         # 4. Add responses (blue-defense phase)
-        for response in self._all_responses:
+        for response in critique_index.responses:
             entries.append({
                 "id": f"response-{response.get('id', '')}",
                 "round": response.get("round_number", 1),
@@ -1877,8 +2272,8 @@ class ArbiterAgent(OrchestratorAgent):
                 "category": "orchestrator",
                 "metadata": {
                     "sections": list(self._current_draft.keys()),
-                    "total_critiques": len(self._all_critiques),
-                    "total_responses": len(self._all_responses),
+                    "total_critiques": len(critique_index.critiques),
+                    "total_responses": len(critique_index.responses),
                 }
             })
 
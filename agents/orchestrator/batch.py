@@ -0,0 +1,203 @@
+"""
+Batch Generation
+
+Supporting types for ArbiterAgent.generate_batch(), which generates one
+document per opportunity for many opportunities at once.
+
+Launching independent generations repeats every blue team analysis per
+opportunity, including analyses that never read the opportunity. The
+batch shares those through SharedBlueAnalyses: each is run once per
+profile (and per the opportunity facts it does read) and its output is
+reused by every generation in the batch that needs it.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+from agents.base import AgentOutput, SwarmContext
+from agents.types import AgentRole
+
+
+# Opportunity fields each shareable BlueBuild analysis reads. An agent's
+# analysis is shared between generations whose profile and scoped fields
+# match; agents not listed here always run per generation.
+SHARED_BLUE_ANALYSIS_SCOPES: Dict[AgentRole, Tuple[str, ...]] = {
+    # Comprehensive market analysis reads only the profile and market data
+    AgentRole.MARKET_ANALYST: (),
+}
+
+
+@dataclass
+class BatchProgress:
+    """A progress event from a batch generation."""
+
+    batch_id: str
+    # item_started, round_started, round_completed, consensus_reached,
+    # item_completed, item_failed, batch_completed
+    event: str
+    total: int
+    completed: int = 0
+    failed: int = 0
+    running: int = 0
+    request_id: Optional[str] = None
+    round_number: Optional[int] = None
+    round_type: Optional[str] = None
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> dict:
+        return {
+            "batch_id": self.batch_id,
+            "event": self.event,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "running": self.running,
+            "request_id": self.request_id,
+            "round_number": self.round_number,
+            "round_type": self.round_type,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+@dataclass
+class BatchOutput:
+    """The outputs of a batch generation, in request order."""
+
+    batch_id: str = ""
+    outputs: List[Any] = field(default_factory=list)  # FinalOutput per request
+
+    # Shared analyses run once and reused by later generations
+    shared_analyses_run: int = 0
+    shared_analyses_reused: int = 0
+
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for output in self.outputs if output.success)
+
+    @property
+    def failed(self) -> int:
+        return len(self.outputs) - self.succeeded
+
+    @property
+    def duration_seconds(self) -> float:
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "batch_id": self.batch_id,
+            "outputs": [output.to_dict() for output in self.outputs],
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "shared_analyses_run": self.shared_analyses_run,
+            "shared_analyses_reused": self.shared_analyses_reused,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+def _profile_key(profile: Optional[Mapping[str, Any]]) -> str:
+    """Content hash of a company profile."""
+    canonical = json.dumps(dict(profile or {}), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SharedBlueAnalyses:
+    """
+    Single-flight cache of BlueBuild agent outputs shared across a batch.
+
+    The first generation to need an analysis runs it; concurrent and later
+    generations with the same key await and reuse its output. Failed
+    analyses are not shared, so the next generation runs its own.
+    """
+
+    def __init__(self, scopes: Optional[Dict[AgentRole, Tuple[str, ...]]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            scopes: Shareable agent roles and the opportunity fields their
+                analyses read (default: SHARED_BLUE_ANALYSIS_SCOPES)
+        """
+        self.scopes = SHARED_BLUE_ANALYSIS_SCOPES if scopes is None else scopes
+        self._results: Dict[tuple, asyncio.Future] = {}
+        self._profile_keys: Dict[int, Tuple[Mapping[str, Any], str]] = {}
+        self.runs = 0
+        self.reuses = 0
+
+    def key_for(self, role: AgentRole, context: SwarmContext) -> Optional[tuple]:
+        """
+        Get the sharing key for an agent's analysis, or None if it is not shared.
+
+        Args:
+            role: Agent role
+            context: Generation context
+
+        Returns:
+            Key of role, profile content and scoped opportunity fields
+        """
+        scope = self.scopes.get(role)
+        if scope is None:
+            return None
+
+        # Generations in a batch usually share one profile object
+        profile = context.company_profile
+        cached = self._profile_keys.get(id(profile))
+        if cached is None or cached[0] is not profile:
+            cached = (profile, _profile_key(profile))
+            self._profile_keys[id(profile)] = cached
+
+        opportunity = context.opportunity or {}
+        scoped = tuple(json.dumps(opportunity.get(name), sort_keys=True, default=str) for name in scope)
+        return (role.value, cached[1], scoped)
+
+    async def get_or_run(
+        self,
+        key: tuple,
+        run: Callable[[], Awaitable[AgentOutput]],
+    ) -> AgentOutput:
+        """
+        Get a shared analysis, running it if no generation has yet.
+
+        Args:
+            key: Key from key_for()
+            run: Runs the analysis for the calling generation
+
+        Returns:
+            The agent output
+        """
+        while True:
+            pending = self._results.get(key)
+            if pending is None:
+                break
+            output = await asyncio.shield(pending)
+            if output is not None:
+                self.reuses += 1
+                return output
+            # The run failed; loop so one waiter takes over
+
+        future = asyncio.get_running_loop().create_future()
+        self._results[key] = future
+        self.runs += 1
+        try:
+            output = await run()
+        except BaseException:
+            self._results.pop(key, None)
+            future.set_result(None)
+            raise
+
+        if not output.success:
+            self._results.pop(key, None)
+            future.set_result(None)
+        else:
+            future.set_result(output)
+        return output
@@ -7,6 +7,7 @@ allowing early termination of the debate cycle.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from difflib import SequenceMatcher
 from enum import Enum
 from typing import List, Dict, Optional, Any, Set
 import logging
@@ -105,6 +106,21 @@ class ConsensusConfig:
     acknowledge_score: float = 0.5
     defer_score: float = 0.3
 
+    # Marginal-value termination. A cycle's value is the severity-weighted
+    # count of new critiques plus revision_weight per fully rewritten
+    # section; another cycle runs only while its projected value per
+    # estimated LLM dollar is at least min_value_per_dollar.
+    min_value_per_dollar: float = 10.0
+    revision_weight: float = 2.0
+    # Assumed cycle-over-cycle value decay when only one cycle has run
+    default_value_decay: float = 0.5
+    # A resolution rate rising toward resolution_threshold means the debate
+    # is converging, so the projected value is scaled by the share of the
+    # gap another equal rise would leave, but by no less than this
+    min_convergence_damping: float = 0.25
+    # Cost of unpriced models (e.g. simulated), so they still terminate
+    unpriced_cost_per_1k_tokens: float = 0.003
+
     def to_dict(self) -> dict:
         return {
             "resolution_threshold": self.resolution_threshold,
@@ -120,9 +136,93 @@ class ConsensusConfig:
             "rebut_score": self.rebut_score,
             "acknowledge_score": self.acknowledge_score,
             "defer_score": self.defer_score,
+            "min_value_per_dollar": self.min_value_per_dollar,
+            "revision_weight": self.revision_weight,
+            "default_value_decay": self.default_value_decay,
+            "min_convergence_damping": self.min_convergence_damping,
+            "unpriced_cost_per_1k_tokens": self.unpriced_cost_per_1k_tokens,
+        }
+
+
+@dataclass
+class CycleMetrics:
+    """What one RedAttack + BlueDefense cycle found, changed and cost."""
+
+    cycle: int = 0
+    new_critiques_by_severity: Dict[str, int] = field(default_factory=dict)
+    revision_delta: float = 0.0  # Sum over sections of the fraction of words changed
+    tokens: int = 0
+    cost_usd: float = 0.0
+    resolution_rate: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "cycle": self.cycle,
+            "new_critiques_by_severity": self.new_critiques_by_severity,
+            "revision_delta": self.revision_delta,
+            "tokens": self.tokens,
+            "cost_usd": self.cost_usd,
+            "resolution_rate": self.resolution_rate,
+        }
+
+
+@dataclass
+class TerminationDecision:
+    """Whether another adversarial cycle is worth its expected cost."""
+
+    stop: bool = False
+    reason: str = ""
+    expected_value: float = 0.0
+    expected_cost_usd: float = 0.0
+    value_per_dollar: Optional[float] = None  # None when the cost is unknown
+    convergence_damping: float = 1.0  # Scale applied for a rising resolution rate
+
+    # Estimated savings from stopping now
+    rounds_saved: int = 0
+    tokens_saved: int = 0
+    cost_saved_usd: float = 0.0
+
+    cycles: List[CycleMetrics] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "stop": self.stop,
+            "reason": self.reason,
+            "expected_value": self.expected_value,
+            "expected_cost_usd": self.expected_cost_usd,
+            "value_per_dollar": self.value_per_dollar,
+            "convergence_damping": self.convergence_damping,
+            "rounds_saved": self.rounds_saved,
+            "tokens_saved": self.tokens_saved,
+            "cost_saved_usd": self.cost_saved_usd,
+            "cycles": [c.to_dict() for c in self.cycles],
         }
 
 
+def revision_delta(before: Dict[str, str], after: Dict[str, str]) -> float:
+    """
+    Measure how much a revision changed a document.
+
+    Args:
+        before: Section content before the revision
+        after: Section content after the revision
+
+    Returns:
+        Sum over sections of the fraction of words changed (word-level
+        edit distance), so each rewritten or added section counts up to 1
+    """
+    delta = 0.0
+    for name, content in after.items():
+        previous = before.get(name)
+        if previous == content:
+            continue
+        if not previous:
+            delta += 1.0
+            continue
+        delta += 1.0 - SequenceMatcher(None, previous.split(), content.split(), autojunk=False).ratio()
+    return delta
+
+
 class ConsensusDetector:
     """
     Detects when the adversarial debate has reached consensus.
@@ -429,6 +529,105 @@ class ConsensusDetector:
         else:
             return "stable"
 
+    def cycle_value(self, metrics: CycleMetrics) -> float:
+        """Severity-weighted new critiques plus weighted revision delta."""
+        critique_value = sum(
+            self._get_severity_weight(severity) * count
+            for severity, count in metrics.new_critiques_by_severity.items()
+        )
+        return critique_value + self._config.revision_weight * metrics.revision_delta
+
+    def assess_marginal_value(
+        self,
+        cycles: List[CycleMetrics],
+        consensus: ConsensusResult,
+        remaining_cycles: int,
+    ) -> TerminationDecision:
+        """
+        Decide whether another adversarial cycle is worth running.
+
+        The next cycle's value is projected from the trajectory of past
+        cycle values (the last value times the last cycle-over-cycle
+        ratio, or default_value_decay after one cycle), damped while the
+        resolution rate is rising toward the consensus threshold, and its
+        cost from the last cycle, which best reflects the current document
+        size.
+
+        Args:
+            cycles: Metrics of each completed cycle, oldest first
+            consensus: Consensus result after the latest cycle
+            remaining_cycles: Cycles still allowed by the request
+
+        Returns:
+            TerminationDecision; stop is True when the projected value per
+            dollar is below min_value_per_dollar
+        """
+        decision = TerminationDecision(cycles=list(cycles))
+        if not cycles or remaining_cycles <= 0:
+            decision.reason = "No cycles to assess"
+            return decision
+        if consensus.has_blocking_issues:
+            decision.reason = "Blocking issues remain unresolved"
+            return decision
+
+        values = [self.cycle_value(c) for c in cycles]
+        if len(values) >= 2 and values[-2] > 0:
+            decay = min(1.0, values[-1] / values[-2])
+        else:
+            decay = self._config.default_value_decay
+        decision.convergence_damping = self._convergence_damping(cycles)
+        decision.expected_value = values[-1] * decay * decision.convergence_damping
+
+        last = cycles[-1]
+        cost = last.cost_usd or last.tokens / 1000 * self._config.unpriced_cost_per_1k_tokens
+        decision.expected_cost_usd = cost
+        if cost <= 0:
+            decision.reason = "Cycle cost unknown"
+            return decision
+
+        decision.value_per_dollar = decision.expected_value / cost
+        if decision.value_per_dollar >= self._config.min_value_per_dollar:
+            decision.reason = (
+                f"Next cycle expected to yield {decision.value_per_dollar:.1f} value per dollar"
+            )
+            return decision
+
+        decision.stop = True
+        decision.rounds_saved = remaining_cycles
+        decision.tokens_saved = last.tokens * remaining_cycles
+        decision.cost_saved_usd = cost * remaining_cycles
+        decision.reason = (
+            f"Next cycle expected to yield {decision.value_per_dollar:.1f} value per dollar, "
+            f"below {self._config.min_value_per_dollar:.1f}"
+        )
+        return decision
+
+    def _convergence_damping(self, cycles: List[CycleMetrics]) -> float:
+        """
+        Scale for the projected value from the resolution-rate trend.
+
+        If the rate rose over the last cycle, another equal rise is assumed
+        and the result is the share of the remaining gap to the threshold
+        it would leave (at least min_convergence_damping).
+
+        Args:
+            cycles: Metrics of each completed cycle, oldest first
+
+        Returns:
+            1.0 when the rate is not rising, else a factor in
+            [min_convergence_damping, 1.0)
+        """
+        if len(cycles) < 2:
+            return 1.0
+        rate = min(1.0, cycles[-1].resolution_rate)
+        rise = rate - min(1.0, cycles[-2].resolution_rate)
+        if rise <= 0:
+            return 1.0
+
+        gap = self._config.resolution_threshold - rate
+        remaining = (gap - rise) / gap if gap > 0 else 0.0
+        return max(self._config.min_convergence_damping, remaining)
+
     def get_blocking_summary(self, result: ConsensusResult) -> str:
         """
         Get a human-readable summary of blocking issues.
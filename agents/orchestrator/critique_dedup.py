@@ -0,0 +1,150 @@
+"""
+Critique Deduplication
+
+Red team agents often raise the same issue against the same section in
+different words. Between RedAttack and BlueDefense the arbiter merges such
+near-duplicates into one canonical critique that lists every agent that
+raised it, so revisions, consensus and the debate log count each issue
+once.
+
+Similarity compares the critiques' content-word sets (title, argument and
+remedy, lowercased, stopwords dropped, common suffixes stripped): it is the
+share of the smaller set's words that the other critique also uses, so a
+terse critique matches a verbose rewording of the same issue. Only
+critiques targeting the same section are compared (free-text targets are
+resolved to section names when a SectionResolver is given), and each section
+rarely gets more than a few dozen critiques per round, so exact pairwise
+comparison is cheap.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from agents.utils.section_resolver import SectionResolver
+
+# Critiques at least this similar are merged
+DEFAULT_SIMILARITY_THRESHOLD = 0.6
+
+# Critiques sharing fewer content words than this are never merged
+MIN_SHARED_TOKENS = 3
+
+_SEVERITY_RANK = {"critical": 3, "major": 2, "minor": 1, "observation": 0}
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+_SUFFIXES = ("ing", "ed", "es", "s", "ly")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be been but by can could does for from has have how in into is it its "
+    "may more must no not of on or our should so such than that the their them then there these "
+    "they this to too was were what when which while who will with would you your section".split()
+)
+
+
+def _stem(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    return word
+
+
+def critique_tokens(critique: Dict[str, Any]) -> FrozenSet[str]:
+    """Content words of a critique's title, argument and remedy."""
+    text = " ".join(
+        str(critique.get(name) or "")
+        for name in ("title", "argument", "content", "description", "suggested_remedy")
+    )
+    return frozenset(
+        _stem(word) for word in _WORD.findall(text.lower())
+        if len(word) > 2 and word not in _STOPWORDS
+    )
+
+
+def token_set_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Share of the smaller token set that the other set contains."""
+    shared = len(a & b)
+    if shared < MIN_SHARED_TOKENS:
+        return 0.0
+    return shared / min(len(a), len(b))
+
+
+def _section_key(critique: Dict[str, Any], resolver: Optional[SectionResolver] = None) -> str:
+    target = str(critique.get("target_section") or "")
+    if resolver is not None:
+        target = resolver.resolve(target) or target
+    return " ".join(target.lower().split())
+
+
+def _rank(critique: Dict[str, Any]) -> tuple:
+    """Canonical critique preference: most severe, then most detailed."""
+    severity = _SEVERITY_RANK.get(str(critique.get("severity", "")).lower(), 1)
+    return (severity, len(str(critique.get("argument") or "")))
+
+
+def deduplicate_critiques(
+    critiques: List[Dict[str, Any]],
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    resolver: Optional[SectionResolver] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Merge near-duplicate critiques of the same section.
+
+    Each cluster of critiques linked by similarity >= threshold is replaced
+    by its most severe (then most detailed) member. The canonical critique
+    keeps its id and gains "sources" (every agent that raised the issue)
+    and the merged ids in "related_critiques".
+
+    Args:
+        critiques: Critique dictionaries from one RedAttack round
+        threshold: Minimum similarity for two critiques to be merged
+        resolver: Maps free-text targets to section names, so critiques
+            of the same section are compared however they name it
+
+    Returns:
+        Deduplicated critiques, in the order their clusters first appear
+    """
+    if len(critiques) < 2:
+        return list(critiques)
+
+    tokens = [critique_tokens(c) for c in critiques]
+    by_section: Dict[str, List[int]] = {}
+    for i, critique in enumerate(critiques):
+        by_section.setdefault(_section_key(critique, resolver), []).append(i)
+
+    # Union-find over critiques linked by similarity
+    parent = list(range(len(critiques)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for members in by_section.values():
+        for x, i in enumerate(members):
+            for j in members[x + 1:]:
+                if find(i) != find(j) and token_set_similarity(tokens[i], tokens[j]) >= threshold:
+                    parent[find(j)] = find(i)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(critiques)):
+        clusters.setdefault(find(i), []).append(i)
+
+    result = []
+    for members in clusters.values():
+        if len(members) == 1:
+            result.append(critiques[members[0]])
+            continue
+
+        group = [critiques[i] for i in members]
+        canonical = max(group, key=_rank)
+        merged = dict(canonical)
+        merged["sources"] = list(dict.fromkeys(
+            source for c in group for source in (c.get("sources") or [c.get("agent", "")]) if source
+        ))
+        merged["related_critiques"] = list(dict.fromkeys(
+            list(canonical.get("related_critiques") or [])
+            + [c.get("id") for c in group if c is not canonical and c.get("id")]
+        ))
+        result.append(merged)
+    return result
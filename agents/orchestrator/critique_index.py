@@ -0,0 +1,146 @@
+"""
+Critique Index
+
+After the adversarial cycles the arbiter reports on the same critiques and
+responses several times: synthesis metadata, confidence scoring, the Red
+Team Report and the debate log. CritiqueIndex aggregates them in one pass
+over each list: critiques grouped by resolved section, each critique's
+response, and severity and disposition counters. Every report reads the
+one index instead of re-filtering the full lists per section or scanning
+responses per critique.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from agents.utils.section_resolver import SectionResolver
+
+# Dispositions that count a critique as addressed
+RESOLVING_DISPOSITIONS = ("Accept", "Partial Accept", "Rebut", "Acknowledge")
+ACCEPTING_DISPOSITIONS = ("Accept", "Partial Accept")
+
+REPORTED_SEVERITIES = ("critical", "major", "minor")
+
+
+@dataclass
+class SectionCritiques:
+    """The critiques of one section and how they were resolved."""
+
+    section: str
+    critiques: List[Dict[str, Any]] = field(default_factory=list)
+    unresolved: List[Dict[str, Any]] = field(default_factory=list)
+    resolved: int = 0
+    accepted: int = 0
+    rebutted: int = 0
+    unresolved_by_severity: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict:
+        return {
+            "section": self.section,
+            "total": len(self.critiques),
+            "unresolved": len(self.unresolved),
+            "resolved": self.resolved,
+            "accepted": self.accepted,
+            "rebutted": self.rebutted,
+            "unresolved_by_severity": dict(self.unresolved_by_severity),
+        }
+
+
+def _severity(critique: Dict[str, Any]) -> str:
+    return str(critique.get("severity") or "minor").lower()
+
+
+class CritiqueIndex:
+    """
+    Single-pass aggregate of a debate's critiques and responses.
+
+    When a critique has several responses, the latest one is its
+    resolution.
+    """
+
+    def __init__(
+        self,
+        critiques: Iterable[Dict[str, Any]],
+        responses: Iterable[Dict[str, Any]],
+        resolver: Optional[SectionResolver] = None,
+        literal_targets: Iterable[str] = (),
+    ):
+        """
+        Build the index.
+
+        Args:
+            critiques: All critiques raised
+            responses: All blue team responses
+            resolver: Resolves critique targets to section names; without
+                one, critiques are grouped by their raw target_section
+            literal_targets: Targets kept as-is rather than resolved, such as
+                required sections missing from the draft
+        """
+        self.critiques: List[Dict[str, Any]] = list(critiques)
+        self.responses: List[Dict[str, Any]] = list(responses)
+
+        self._responses_by_critique: Dict[Any, Dict[str, Any]] = {}
+        self.disposition_counts: Counter = Counter()
+        for response in self.responses:
+            critique_id = response.get("critique_id")
+            if critique_id:
+                self._responses_by_critique[critique_id] = response
+            self.disposition_counts[response.get("disposition")] += 1
+
+        literal_targets = frozenset(literal_targets)
+        self.severity_counts: Counter = Counter()
+        self.sections: Dict[str, SectionCritiques] = {}
+        self._section_of: Dict[int, str] = {}
+        for critique in self.critiques:
+            severity = _severity(critique)
+            self.severity_counts[severity] += 1
+
+            target = critique.get("target_section") or ""
+            section = None
+            if resolver is not None and target not in literal_targets:
+                section = resolver.resolve(target)
+            section = section or target or "General"
+            self._section_of[id(critique)] = section
+
+            entry = self.sections.get(section)
+            if entry is None:
+                entry = self.sections[section] = SectionCritiques(section=section)
+            entry.critiques.append(critique)
+
+            response = self._responses_by_critique.get(critique.get("id"))
+            if response is None:
+                entry.unresolved.append(critique)
+                entry.unresolved_by_severity[severity] += 1
+                continue
+            entry.resolved += 1
+            disposition = response.get("disposition", "")
+            if disposition in ACCEPTING_DISPOSITIONS:
+                entry.accepted += 1
+            elif disposition == "Rebut":
+                entry.rebutted += 1
+
+    def response_for(self, critique: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The response resolving a critique, if any."""
+        return self._responses_by_critique.get(critique.get("id"))
+
+    def section_of(self, critique: Dict[str, Any]) -> str:
+        """The section an indexed critique was attributed to."""
+        return self._section_of.get(id(critique), critique.get("target_section") or "General")
+
+    def for_section(self, section: str) -> SectionCritiques:
+        """A section's critiques (empty if it has none)."""
+        return self.sections.get(section) or SectionCritiques(section=section)
+
+    def response_count(self, dispositions: Iterable[str] = RESOLVING_DISPOSITIONS) -> int:
+        """Number of responses with any of the given dispositions."""
+        return sum(self.disposition_counts[d] for d in dispositions)
+
+    @property
+    def resolved_count(self) -> int:
+        """Number of critiques with a response."""
+        return sum(entry.resolved for entry in self.sections.values())
+
+    def reported_severity_counts(self) -> Dict[str, int]:
+        """Critique counts for the reported severities."""
+        return {severity: self.severity_counts[severity] for severity in REPORTED_SEVERITIES}
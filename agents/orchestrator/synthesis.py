@@ -7,15 +7,21 @@ resolved critiques and producing a polished output.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 import logging
 import json
 
 from agents.base import SwarmContext
+from agents.utils.section_resolver import SectionResolver
+
+from .critique_index import CritiqueIndex, SectionCritiques
 
 
 logger = logging.getLogger(__name__)
 
+# Called with each section's name, final content and metadata as it is finalized
+SectionCallback = Callable[[str, str, "SectionMetadata"], Awaitable[None]]
+
 
 @dataclass
 class SynthesisConfig:
@@ -114,6 +120,8 @@ class DocumentSynthesizer:
         responses: List[Dict[str, Any]],
         context: SwarmContext,
         blue_team_contributions: List[Dict[str, Any]] = None,
+        critique_index: Optional[CritiqueIndex] = None,
+        on_section: Optional[SectionCallback] = None,
     ) -> Dict[str, Any]:
         """
         Synthesize the final document.
@@ -124,6 +132,10 @@ class DocumentSynthesizer:
             responses: List of all responses
             context: The swarm context
             blue_team_contributions: Optional list of blue team agent contributions
+            critique_index: Index of the critiques and responses, if the caller
+                already built one
+            on_section: Awaited with each section as it is finalized, in
+                document order, so callers can stream the final document
 
         Returns:
             Final document as a dictionary
@@ -131,30 +143,26 @@ class DocumentSynthesizer:
         self._logger.info(f"Synthesizing document with {len(sections)} sections")
         blue_team_contributions = blue_team_contributions or []
 
-        # Build response lookup
-        response_map = {
-            r.get("critique_id"): r
-            for r in responses
-            if r.get("critique_id")
-        }
+        # Index critiques by the section they target, reusing the draft's resolver
+        if critique_index is None:
+            resolver = context.section_resolver if context else None
+            if resolver is None or not resolver.is_current(sections):
+                resolver = SectionResolver(sections)
+            critique_index = CritiqueIndex(critiques, responses, resolver)
 
         # Process each section
         section_metadata: Dict[str, SectionMetadata] = {}
         final_sections: Dict[str, str] = {}
 
-        for section_name, content in sections.items():
-            # Get critiques for this section
-            section_critiques = [
-                c for c in critiques
-                if c.get("target_section") == section_name
-            ]
+        for section_name in self._determine_section_order(sections.keys()):
+            content = sections[section_name]
+            section_critiques = critique_index.for_section(section_name)
 
             # Calculate section metadata
             metadata = self._calculate_section_metadata(
                 section_name=section_name,
                 content=content,
                 critiques=section_critiques,
-                response_map=response_map,
             )
             section_metadata[section_name] = metadata
 
@@ -162,17 +170,18 @@ class DocumentSynthesizer:
             final_content = self._process_section(
                 content=content,
                 critiques=section_critiques,
-                response_map=response_map,
             )
             final_sections[section_name] = final_content
 
+            if on_section:
+                await on_section(section_name, final_content, metadata)
+
         # Build final document structure
         document = self._build_document_structure(
             sections=final_sections,
             metadata=section_metadata,
             context=context,
-            critiques=critiques,
-            responses=responses,
+            critique_index=critique_index,
             blue_team_contributions=blue_team_contributions,
         )
 
@@ -182,32 +191,20 @@ class DocumentSynthesizer:
         self,
         section_name: str,
         content: str,
-        critiques: List[Dict[str, Any]],
-        response_map: Dict[str, Dict[str, Any]],
+        critiques: SectionCritiques,
     ) -> SectionMetadata:
         """Calculate metadata for a section."""
         metadata = SectionMetadata(
             section_name=section_name,
             word_count=len(content.split()),
-            total_critiques=len(critiques),
+            total_critiques=len(critiques.critiques),
+            resolved_critiques=critiques.resolved,
+            accepted_changes=critiques.accepted,
+            revision_count=critiques.accepted,
+            rebutted_critiques=critiques.rebutted,
             created_at=datetime.now(timezone.utc),
         )
 
-        # Count resolutions
-        for critique in critiques:
-            critique_id = critique.get("id")
-            response = response_map.get(critique_id)
-
-            if response:
-                metadata.resolved_critiques += 1
-                disposition = response.get("disposition", "")
-
-                if disposition in ("Accept", "Partial Accept"):
-                    metadata.accepted_changes += 1
-                    metadata.revision_count += 1
-                elif disposition == "Rebut":
-                    metadata.rebutted_critiques += 1
-
         # Calculate confidence (simplified)
         if metadata.total_critiques > 0:
             resolution_rate = metadata.resolved_critiques / metadata.total_critiques
@@ -220,8 +217,7 @@ class DocumentSynthesizer:
     def _process_section(
         self,
         content: str,
-        critiques: List[Dict[str, Any]],
-        response_map: Dict[str, Dict[str, Any]],
+        critiques: SectionCritiques,
     ) -> str:
         """
         Process a section's content.
@@ -238,19 +234,13 @@ class DocumentSynthesizer:
         # Add confidence annotations if configured
         if self._config.include_confidence_annotations:
             # Add subtle markers for sections with unresolved issues
-            unresolved = [
-                c for c in critiques
-                if c.get("id") not in response_map
-            ]
+            critical = critiques.unresolved_by_severity["critical"]
+            major = critiques.unresolved_by_severity["major"]
 
-            if unresolved:
-                critical = [c for c in unresolved if c.get("severity") == "critical"]
-                major = [c for c in unresolved if c.get("severity") == "major"]
-
-                if critical:
-                    processed = f"<!-- ATTENTION: {len(critical)} unresolved critical issue(s) -->\n\n{processed}"
-                elif major:
-                    processed = f"<!-- NOTE: {len(major)} unresolved major issue(s) -->\n\n{processed}"
+            if critical:
+                processed = f"<!-- ATTENTION: {critical} unresolved critical issue(s) -->\n\n{processed}"
+            elif major:
+                processed = f"<!-- NOTE: {major} unresolved major issue(s) -->\n\n{processed}"
 
         return processed
 
@@ -259,8 +249,7 @@ class DocumentSynthesizer:
         sections: Dict[str, str],
         metadata: Dict[str, SectionMetadata],
         context: SwarmContext,
-        critiques: List[Dict[str, Any]],
-        responses: List[Dict[str, Any]],
+        critique_index: CritiqueIndex,
         blue_team_contributions: List[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Build the final document structure."""
@@ -268,11 +257,8 @@ class DocumentSynthesizer:
         section_order = self._determine_section_order(sections.keys())
 
         # Calculate document-level stats
-        total_critiques = len(critiques)
-        resolved_critiques = len([
-            r for r in responses
-            if r.get("disposition") in ("Accept", "Partial Accept", "Rebut", "Acknowledge")
-        ])
+        total_critiques = len(critique_index.critiques)
+        resolved_critiques = critique_index.response_count()
         resolution_rate = (
             resolved_critiques / total_critiques * 100
             if total_critiques > 0 else 100.0
@@ -342,7 +328,7 @@ class DocumentSynthesizer:
         # Add revision notes if configured
         if self._config.include_revision_notes:
             document["revision_notes"] = self._generate_revision_notes(
-                critiques, responses, metadata
+                critique_index, metadata
             )
 
         return document
@@ -556,26 +542,18 @@ class DocumentSynthesizer:
 
     def _generate_revision_notes(
         self,
-        critiques: List[Dict[str, Any]],
-        responses: List[Dict[str, Any]],
+        critique_index: CritiqueIndex,
         metadata: Dict[str, SectionMetadata],
     ) -> List[Dict[str, Any]]:
         """Generate revision notes documenting changes made."""
         notes = []
 
-        # Build response lookup
-        response_map = {
-            r.get("critique_id"): r
-            for r in responses
-        }
-
         # Group by section
         sections_with_changes: Set[str] = set()
 
-        for critique in critiques:
-            section = critique.get("target_section", "General")
-            critique_id = critique.get("id")
-            response = response_map.get(critique_id)
+        for critique in critique_index.critiques:
+            section = critique_index.section_of(critique)
+            response = critique_index.response_for(critique)
 
             if response and response.get("disposition") in ("Accept", "Partial Accept"):
                 sections_with_changes.add(section)
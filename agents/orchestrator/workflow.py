@@ -18,6 +18,7 @@ from agents.base import SwarmContext, AbstractAgent
 from comms.bus import MessageBus
 from comms.history import ConversationHistory
 from comms.round import RoundManager, RoundType, RoundSummary
+from comms.tracing import span
 
 
 logger = logging.getLogger(__name__)
@@ -86,6 +87,17 @@ class WorkflowConfig:
     enable_early_termination: bool = True
     enable_human_escalation: bool = True
 
+    # Delta critique: after the first RedAttack, red agents critique only the
+    # sections changed since their last critique. The whole document is
+    # critiqued again when more than this fraction of sections changed.
+    enable_delta_critique: bool = True
+    delta_critique_max_changed_ratio: float = 0.5
+
+    # Near-duplicate critiques of a section from different red agents are
+    # merged when their token-set similarity reaches this threshold
+    enable_critique_dedup: bool = True
+    critique_similarity_threshold: float = 0.6
+
     def to_dict(self) -> dict:
         return {
             "document_type": self.document_type,
@@ -105,6 +117,10 @@ class WorkflowConfig:
             "enable_parallel_agents": self.enable_parallel_agents,
             "enable_early_termination": self.enable_early_termination,
             "enable_human_escalation": self.enable_human_escalation,
+            "enable_delta_critique": self.enable_delta_critique,
+            "delta_critique_max_changed_ratio": self.delta_critique_max_changed_ratio,
+            "enable_critique_dedup": self.enable_critique_dedup,
+            "critique_similarity_threshold": self.critique_similarity_threshold,
         }
 
 
@@ -395,7 +411,8 @@ class DocumentWorkflow:
         # Run agents
         for agent in blue_agents:
             try:
-                output = await agent.process(context)
+                with span("agent.process", agent=agent.name, role=agent.role.value):
+                    output = await agent.process(context)
                 state.agent_call_counts[agent.role.value] = (
                     state.agent_call_counts.get(agent.role.value, 0) + 1
                 )
@@ -435,7 +452,8 @@ class DocumentWorkflow:
         # Run agents
         for agent in red_agents:
             try:
-                output = await agent.process(context)
+                with span("agent.process", agent=agent.name, role=agent.role.value):
+                    output = await agent.process(context)
                 state.agent_call_counts[agent.role.value] = (
                     state.agent_call_counts.get(agent.role.value, 0) + 1
                 )
@@ -479,7 +497,8 @@ class DocumentWorkflow:
         for agent in blue_agents:
             if agent.role == AgentRole.STRATEGY_ARCHITECT:
                 try:
-                    output = await agent.process(context)
+                    with span("agent.process", agent=agent.name, role=agent.role.value):
+                        output = await agent.process(context)
                     state.agent_call_counts[agent.role.value] = (
                         state.agent_call_counts.get(agent.role.value, 0) + 1
                     )
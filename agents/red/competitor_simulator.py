@@ -18,6 +18,7 @@ from agents.types import AgentRole, AgentCategory
 
 from models.critique import Critique, ChallengeType, Severity, CritiqueSummary
 
+from .prompts.delta_prompts import get_delta_critique_note
 from .prompts.competitor_simulator_prompts import (
     COMPETITOR_SIMULATOR_SYSTEM_PROMPT,
     get_competitor_simulation_prompt,
@@ -484,7 +485,7 @@ class CompetitorSimulatorAgent(RedTeamAgent):
             return result
 
         # Generate simulation prompt
-        prompt = get_competitor_simulation_prompt(
+        prompt = get_delta_critique_note(context.custom_data) + get_competitor_simulation_prompt(
             document_type=context.document_type or "Strategy Document",
             document_content=document_content,
             competitors=competitors_to_simulate,
@@ -495,6 +496,7 @@ class CompetitorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPETITOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="simulate_all_competitors",
         )
 
         if not llm_response.get("success"):
@@ -582,6 +584,7 @@ class CompetitorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPETITOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="simulate_single_competitor",
         )
 
         if not llm_response.get("success"):
@@ -650,6 +653,7 @@ class CompetitorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPETITOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="simulate_incumbent_defense",
         )
 
         if not llm_response.get("success"):
@@ -717,6 +721,7 @@ class CompetitorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=COMPETITOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_claim_counter",
         )
 
         if not llm_response.get("success"):
@@ -18,6 +18,7 @@ from agents.types import AgentRole, AgentCategory
 
 from models.critique import Critique, ChallengeType, Severity, CritiqueSummary
 
+from .prompts.delta_prompts import get_delta_critique_note
 from .prompts.devils_advocate_prompts import (
     DEVILS_ADVOCATE_SYSTEM_PROMPT,
     get_critique_generation_prompt,
@@ -398,7 +399,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
         # Generate critique prompt
         focus_areas = context.custom_data.get("focus_areas", [])
 
-        prompt = get_critique_generation_prompt(
+        prompt = get_delta_critique_note(context.custom_data) + get_critique_generation_prompt(
             document_type=context.document_type or "Strategy Document",
             document_content=document_content,
             company_profile=context.company_profile,
@@ -409,6 +410,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_full_critique",
         )
 
         if not llm_response.get("success"):
@@ -487,6 +489,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="critique_section",
             )
 
             if llm_response.get("success"):
@@ -545,6 +548,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="challenge_assumptions",
         )
 
         if not llm_response.get("success"):
@@ -610,6 +614,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_counterarguments",
         )
 
         if not llm_response.get("success"):
@@ -669,6 +674,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="analyze_logic",
             )
 
             if llm_response.get("success"):
@@ -739,6 +745,7 @@ class DevilsAdvocateAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=DEVILS_ADVOCATE_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="evaluate_responses",
             )
 
             if llm_response.get("success"):
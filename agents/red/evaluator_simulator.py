@@ -15,6 +15,7 @@ import uuid
 from agents.base import RedTeamAgent, SwarmContext, AgentOutput
 from agents.config import AgentConfig
 from agents.types import AgentRole, AgentCategory
+from agents.utils.profile_formatter import relevant_past_performance
 
 from models.critique import Critique, ChallengeType, Severity, CritiqueSummary
 
@@ -34,6 +35,7 @@ from .evaluation_criteria import (
     COMMON_COST_FACTORS,
 )
 
+from .prompts.delta_prompts import get_delta_critique_note
 from .prompts.evaluator_simulator_prompts import (
     EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
     get_evaluation_prompt,
@@ -43,6 +45,9 @@ from .prompts.evaluator_simulator_prompts import (
     get_mock_evaluation_prompt,
 )
 
+# Past performance references cited from the profile (most relevant first)
+MAX_PAST_PERFORMANCE_REFS = 5
+
 
 @dataclass
 class EvaluatorFinding:
@@ -498,7 +503,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         evaluation_factors = self._get_evaluation_factors(context)
 
         # Generate evaluation prompt
-        prompt = get_evaluation_prompt(
+        prompt = get_delta_critique_note(context.custom_data) + get_evaluation_prompt(
             document_type=context.document_type or "Proposal Strategy",
             document_content=document_content,
             evaluation_type=evaluation_type,
@@ -510,6 +515,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="full_evaluation",
         )
 
         if not llm_response.get("success"):
@@ -584,6 +590,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="evaluate_section",
         )
 
         if not llm_response.get("success"):
@@ -642,6 +649,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="check_compliance",
         )
 
         if not llm_response.get("success"):
@@ -684,7 +692,13 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
 
         past_perf_refs = context.custom_data.get("past_performance_refs", [])
         if not past_perf_refs and context.company_profile:
-            past_perf_refs = context.company_profile.get("past_performance", [])
+            # Evaluators weigh a handful of recent, relevant references,
+            # so cite the most relevant rather than the full history
+            past_perf_refs = relevant_past_performance(
+                context.company_profile,
+                context.opportunity,
+                k=MAX_PAST_PERFORMANCE_REFS,
+            )
 
         if not past_perf_refs:
             result.past_performance_confidence = ConfidenceLevel.NEUTRAL_CONFIDENCE
@@ -702,6 +716,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="evaluate_past_performance",
         )
 
         if not llm_response.get("success"):
@@ -744,6 +759,7 @@ class EvaluatorSimulatorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=EVALUATOR_SIMULATOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="mock_evaluation",
         )
 
         if not llm_response.get("success"):
@@ -8,7 +8,7 @@ team's strategy from a competitive perspective.
 
 from typing import Dict, Any, List, Optional
 
-from agents.utils.profile_formatter import extract_certification_types
+from agents.utils.profile_formatter import profile_certification_types
 
 
 COMPETITOR_SIMULATOR_SYSTEM_PROMPT = """You are the Competitor Simulator, an adversarial agent that role-plays as the client's competitors to expose strategic vulnerabilities.
@@ -216,7 +216,7 @@ def get_competitor_simulation_prompt(
         # Certifications
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         # Past performance count
@@ -0,0 +1,55 @@
+"""
+Delta Critique Prompts
+
+Prompt text shared by the red team agents when the arbiter re-critiques only
+the sections that changed since the last RedAttack round.
+"""
+
+from typing import Dict, Any
+
+
+def get_delta_critique_note(custom_data: Dict[str, Any]) -> str:
+    """
+    Generate the scope note for a delta critique.
+
+    In a delta critique the red agents see only the changed sections. The
+    note tells the model so, and lists the unchanged sections so their
+    absence is not mistaken for missing content.
+
+    Args:
+        custom_data: Context custom data set by the arbiter
+
+    Returns:
+        Prompt text to place before the task, or an empty string outside
+        delta mode
+    """
+    if custom_data.get("critique_mode") != "delta":
+        return ""
+
+    prompt_parts = [
+        "## Critique Scope: Changed Sections Only",
+        "",
+        "This is a follow-up review. Only the sections revised since the last",
+        "critique round are shown below; the rest of the document was already",
+        "critiqued and its open critiques are still being tracked.",
+    ]
+
+    unchanged = custom_data.get("unchanged_sections") or []
+    if unchanged:
+        prompt_parts.extend([
+            "",
+            "These sections are part of the document but are not shown:",
+        ])
+        prompt_parts.extend(f"- {name}" for name in unchanged)
+
+    prompt_parts.extend([
+        "",
+        "Do not report the sections above as missing, and do not penalize the",
+        "document for content they may contain. Critique and score only the",
+        "sections shown.",
+        "",
+        "---",
+        "",
+        "",
+    ])
+    return "\n".join(prompt_parts)
@@ -8,7 +8,7 @@ assumptions, and alternative interpretations.
 
 from typing import Dict, Any, List, Optional
 
-from agents.utils.profile_formatter import extract_certification_types
+from agents.utils.profile_formatter import profile_certification_types
 
 
 DEVILS_ADVOCATE_SYSTEM_PROMPT = """You are the Devil's Advocate, a systematic contrarian whose role is to strengthen strategy documents by identifying weaknesses before they become vulnerabilities.
@@ -299,7 +299,7 @@ def get_section_critique_prompt(
         # Certifications
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         # Past performance
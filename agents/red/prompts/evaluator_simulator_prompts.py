@@ -8,7 +8,7 @@ Board (SSEB) to identify weaknesses, deficiencies, and compliance gaps.
 
 from typing import Dict, Any, List, Optional
 
-from agents.utils.profile_formatter import extract_certification_types
+from agents.utils.profile_formatter import profile_certification_types
 
 
 EVALUATOR_SIMULATOR_SYSTEM_PROMPT = """You are the Evaluator Simulator, an adversarial agent that simulates the perspective of a government Source Selection Evaluation Board (SSEB) member.
@@ -215,7 +215,7 @@ def get_evaluation_prompt(
 
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         past_perf = company_profile.get('past_performance', [])
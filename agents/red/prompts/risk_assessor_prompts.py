@@ -7,7 +7,7 @@ failure modes, stress-testing assumptions, and developing worst-case scenarios.
 
 from typing import Dict, Any, List, Optional
 
-from agents.utils.profile_formatter import extract_certification_types
+from agents.utils.profile_formatter import profile_certification_types
 
 
 RISK_ASSESSOR_SYSTEM_PROMPT = """You are the Risk Assessor, a meticulous analyst who identifies potential failure modes in GovCon strategy documents before they become real problems.
@@ -192,7 +192,7 @@ def get_risk_assessment_prompt(
         # Certifications (potential eligibility risks)
         certs = company_profile.get('certifications', [])
         if certs:
-            cert_types = extract_certification_types(certs)
+            cert_types = profile_certification_types(company_profile)
             prompt_parts.append(f"**Certifications**: {', '.join(cert_types)}")
 
         # Past performance (execution risk indicators)
@@ -30,6 +30,7 @@ from .risk_taxonomy import (
     identify_risk_category,
 )
 
+from .prompts.delta_prompts import get_delta_critique_note
 from .prompts.risk_assessor_prompts import (
     RISK_ASSESSOR_SYSTEM_PROMPT,
     get_risk_assessment_prompt,
@@ -371,7 +372,7 @@ class RiskAssessorAgent(RedTeamAgent):
         # Get focus categories if specified
         focus_categories = context.custom_data.get("focus_categories", [])
 
-        prompt = get_risk_assessment_prompt(
+        prompt = get_delta_critique_note(context.custom_data) + get_risk_assessment_prompt(
             document_type=context.document_type or "Strategy Document",
             document_content=document_content,
             company_profile=context.company_profile,
@@ -382,6 +383,7 @@ class RiskAssessorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="perform_full_assessment",
         )
 
         if not llm_response.get("success"):
@@ -447,6 +449,7 @@ class RiskAssessorAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="assess_section_risks",
             )
 
             if llm_response.get("success"):
@@ -524,6 +527,7 @@ class RiskAssessorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="generate_worst_case_scenarios",
         )
 
         if not llm_response.get("success"):
@@ -571,6 +575,7 @@ class RiskAssessorAgent(RedTeamAgent):
         llm_response = await self._call_llm(
             system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
             user_prompt=prompt,
+            operation="stress_test_assumptions",
         )
 
         if not llm_response.get("success"):
@@ -638,6 +643,7 @@ class RiskAssessorAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="evaluate_mitigations",
             )
 
             if llm_response.get("success"):
@@ -690,6 +696,7 @@ class RiskAssessorAgent(RedTeamAgent):
             llm_response = await self._call_llm(
                 system_prompt=RISK_ASSESSOR_SYSTEM_PROMPT,
                 user_prompt=prompt,
+                operation="evaluate_responses",
             )
 
             if llm_response.get("success"):
@@ -0,0 +1,193 @@
+"""
+Simulated LLM Provider
+
+Offline stand-in for the Anthropic and Groq clients. Responses come from
+each agent's _generate_mock_content(), delivered with a sampled
+time-to-first-token latency and a fixed streaming rate. Rate limit (429)
+and server (5xx) errors are injected at configurable rates and raised as
+the Anthropic SDK's own exception types, so the normal retry logic in
+AbstractAgent._call_llm handles them exactly as it would in production.
+
+This lets the full swarm run with no network or API key, and separates
+orchestration overhead from model latency when load testing.
+"""
+
+import asyncio
+import math
+import random
+from typing import Callable, Dict, Any, List
+
+import anthropic
+import httpx
+
+from .config import SimulationConfig
+
+
+# Rough characters-per-token ratio used for simulated usage accounting
+CHARS_PER_TOKEN = 4
+
+# Status codes drawn for injected server errors
+SERVER_ERROR_CODES = (500, 502, 503, 529)
+
+_SIMULATED_REQUEST = httpx.Request("POST", "https://simulated.local/v1/messages")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN)) if text else 0
+
+
+class SimulatedLLMClient:
+    """
+    Generates LLM responses locally with emulated latency and failures.
+
+    One client is created per agent. Given a seed, the sequence of
+    latencies and injected errors is reproducible for that agent.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig,
+        content_generator: Callable[[str], str],
+        name: str = "",
+    ):
+        """
+        Initialize the simulated client.
+
+        Args:
+            config: Latency, streaming and error injection settings
+            content_generator: Function mapping a user prompt to response text
+            name: Client name, mixed into the seed so agents differ
+        """
+        self._config = config
+        self._generate = content_generator
+        self._random = random.Random(f"{config.seed}:{name}" if config.seed is not None else None)
+        self._call_count = 0
+        self._error_count = 0
+
+    @property
+    def config(self) -> SimulationConfig:
+        return self._config
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get call and injected error counts."""
+        return {"call_count": self._call_count, "error_count": self._error_count}
+
+    async def create(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """
+        Generate a complete response.
+
+        Args:
+            system_prompt: System prompt (counted toward input tokens)
+            user_prompt: User prompt passed to the content generator
+
+        Returns:
+            Dictionary with content and usage
+
+        Raises:
+            anthropic.RateLimitError: Injected 429
+            anthropic.InternalServerError: Injected 5xx
+        """
+        content = await self._begin(user_prompt)
+        output_tokens = estimate_tokens(content)
+        if self._config.tokens_per_second > 0:
+            await asyncio.sleep(output_tokens / self._config.tokens_per_second)
+        return self._response(system_prompt, user_prompt, content)
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        stream_callback: Callable[[str], None],
+    ) -> Dict[str, Any]:
+        """
+        Generate a response, delivering it in chunks at the streaming rate.
+
+        Args:
+            system_prompt: System prompt (counted toward input tokens)
+            user_prompt: User prompt passed to the content generator
+            stream_callback: Callback invoked with each text chunk
+
+        Returns:
+            Dictionary with content and usage
+        """
+        content = await self._begin(user_prompt)
+        chunk_chars = max(1, self._config.stream_chunk_tokens) * CHARS_PER_TOKEN
+        for chunk in _chunks(content, chunk_chars):
+            if self._config.tokens_per_second > 0:
+                await asyncio.sleep(estimate_tokens(chunk) / self._config.tokens_per_second)
+            stream_callback(chunk)
+        return self._response(system_prompt, user_prompt, content)
+
+    async def _begin(self, user_prompt: str) -> str:
+        """Wait out the time to first token, inject errors, and generate content."""
+        self._call_count += 1
+        await asyncio.sleep(self.sample_latency_ms() / 1000)
+
+        roll = self._random.random()
+        if roll < self._config.rate_limit_rate:
+            self._error_count += 1
+            raise anthropic.RateLimitError(
+                "Simulated rate limit",
+                response=httpx.Response(429, request=_SIMULATED_REQUEST),
+                body=None,
+            )
+        if roll < self._config.rate_limit_rate + self._config.server_error_rate:
+            self._error_count += 1
+            status_code = self._random.choice(SERVER_ERROR_CODES)
+            raise anthropic.InternalServerError(
+                f"Simulated server error ({status_code})",
+                response=httpx.Response(status_code, request=_SIMULATED_REQUEST),
+                body=None,
+            )
+
+        return self._generate(user_prompt)
+
+    def sample_latency_ms(self) -> float:
+        """Draw a time-to-first-token latency in milliseconds."""
+        mean = self._config.latency_ms
+        jitter = self._config.latency_jitter_ms
+        distribution = self._config.latency_distribution
+
+        if distribution == "fixed" or mean <= 0:
+            latency = mean
+        elif distribution == "uniform":
+            latency = self._random.uniform(mean - jitter, mean + jitter)
+        elif distribution == "normal":
+            latency = self._random.gauss(mean, jitter)
+        elif distribution == "exponential":
+            latency = self._random.expovariate(1 / mean)
+        elif distribution == "lognormal":
+            # Parameters matching the configured mean and standard deviation
+            sigma = math.sqrt(math.log(1 + (jitter / mean) ** 2))
+            latency = self._random.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+        else:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+
+        if self._config.latency_max_ms > 0:
+            latency = min(latency, self._config.latency_max_ms)
+        return max(0.0, latency)
+
+    def _response(self, system_prompt: str, user_prompt: str, content: str) -> Dict[str, Any]:
+        return {
+            "content": content,
+            "usage": {
+                "input_tokens": estimate_tokens(system_prompt) + estimate_tokens(user_prompt),
+                "output_tokens": estimate_tokens(content),
+            },
+        }
+
+
+def _chunks(text: str, size: int) -> List[str]:
+    """Split text into chunks of about size characters, breaking after whitespace."""
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + size)
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > start:
+                end = space + 1
+        chunks.append(text[start:end])
+        start = end
+    return chunks
@@ -0,0 +1,364 @@
+"""
+LLM Usage Ledger
+
+Per-generation record of every LLM call: which agent made it, in which
+phase and round, token counts (including prompt cache tokens), streaming
+telemetry (time to first token, inter-chunk gaps, tokens per second),
+end-to-end latency, retries and estimated cost.
+
+Agents are created per phase and discarded, so the ledger is not owned by
+any agent. The Arbiter activates a ledger for the duration of a request
+and AbstractAgent._call_llm records into whichever ledger is active. The
+active ledger is held in a context variable, so concurrent agent tasks
+record into their own request's ledger and concurrent requests stay apart.
+"""
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+
+# USD per million tokens: (input, output, cache write, cache read).
+# List prices; used for relative cost estimates, not billing.
+MODEL_PRICING: Dict[str, Tuple[float, float, float, float]] = {
+    "claude-sonnet-4-5-20250929": (3.00, 15.00, 3.75, 0.30),
+    "claude-haiku-4-5-20251001": (1.00, 5.00, 1.25, 0.10),
+    "claude-opus-4-5-20251101": (5.00, 25.00, 6.25, 0.50),
+    "llama-3.3-70b-versatile": (0.59, 0.79, 0.59, 0.59),
+    "llama-3.1-70b-versatile": (0.59, 0.79, 0.59, 0.59),
+    "llama-3.1-8b-instant": (0.05, 0.08, 0.05, 0.05),
+    "llama3-groq-70b-8192-tool-use-preview": (0.89, 0.89, 0.89, 0.89),
+    "llama3-groq-8b-8192-tool-use-preview": (0.19, 0.19, 0.19, 0.19),
+}
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_creation_input_tokens: int = 0,
+    cache_read_input_tokens: int = 0,
+) -> float:
+    """
+    Estimate the cost of an LLM call in USD.
+
+    Args:
+        model: Model identifier
+        input_tokens: Uncached prompt tokens
+        output_tokens: Completion tokens
+        cache_creation_input_tokens: Prompt tokens written to the cache
+        cache_read_input_tokens: Prompt tokens read from the cache
+
+    Returns:
+        Estimated cost, or 0.0 for models without pricing (e.g. simulated)
+    """
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        return 0.0
+    input_price, output_price, cache_write_price, cache_read_price = pricing
+    return (
+        input_tokens * input_price
+        + output_tokens * output_price
+        + cache_creation_input_tokens * cache_write_price
+        + cache_read_input_tokens * cache_read_price
+    ) / 1_000_000
+
+
+@dataclass
+class LLMCallRecord:
+    """A single LLM call, including any retries."""
+
+    agent_name: str
+    agent_role: str
+    provider: str
+    model: str
+
+    # Where in the workflow the call was made
+    phase: Optional[str] = None
+    round_number: int = 0
+    operation: str = ""  # Calling method, e.g. "comprehensive_analysis"
+
+    # Tokens
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    # Timing
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    latency_ms: float = 0.0
+    streamed: bool = False
+
+    # Streaming telemetry (streaming calls only, from the final attempt)
+    time_to_first_token_ms: Optional[float] = None
+    chunk_count: int = 0
+    mean_inter_chunk_ms: Optional[float] = None
+    max_inter_chunk_ms: Optional[float] = None
+    output_tokens_per_second: Optional[float] = None  # After the first token
+
+    # Outcome
+    retries: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    estimated_cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return (
+            self.input_tokens
+            + self.output_tokens
+            + self.cache_creation_input_tokens
+            + self.cache_read_input_tokens
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "agent_name": self.agent_name,
+            "agent_role": self.agent_role,
+            "provider": self.provider,
+            "model": self.model,
+            "phase": self.phase,
+            "round_number": self.round_number,
+            "operation": self.operation,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "started_at": self.started_at.isoformat(),
+            "latency_ms": self.latency_ms,
+            "streamed": self.streamed,
+            "time_to_first_token_ms": self.time_to_first_token_ms,
+            "chunk_count": self.chunk_count,
+            "mean_inter_chunk_ms": self.mean_inter_chunk_ms,
+            "max_inter_chunk_ms": self.max_inter_chunk_ms,
+            "output_tokens_per_second": self.output_tokens_per_second,
+            "retries": self.retries,
+            "success": self.success,
+            "error": self.error,
+            "estimated_cost_usd": self.estimated_cost_usd,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LLMCallRecord":
+        data = dict(data)
+        if isinstance(data.get("started_at"), str):
+            data["started_at"] = datetime.fromisoformat(data["started_at"])
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+class StreamTimer:
+    """
+    Wraps a stream callback to time the chunks of one streaming response.
+
+    Times are measured from when the request is sent, so time to first
+    token is the provider's, not including our retries or backoff.
+    """
+
+    def __init__(self, callback: Callable[[str], None]):
+        """
+        Initialize the timer and start the clock.
+
+        Args:
+            callback: Callback to forward each chunk to
+        """
+        self._callback = callback
+        self._started = time.perf_counter()
+        self._first_chunk_at: Optional[float] = None
+        self._last_chunk_at: Optional[float] = None
+        self._max_gap = 0.0
+        self.chunk_count = 0
+
+    def __call__(self, chunk: str) -> None:
+        now = time.perf_counter()
+        if self._first_chunk_at is None:
+            self._first_chunk_at = now
+        else:
+            self._max_gap = max(self._max_gap, now - self._last_chunk_at)
+        self._last_chunk_at = now
+        self.chunk_count += 1
+        self._callback(chunk)
+
+    def summary(self, output_tokens: int) -> Dict[str, Any]:
+        """
+        Summarize the stream.
+
+        Args:
+            output_tokens: Completion tokens reported by the provider
+
+        Returns:
+            Dictionary with time_to_first_token_ms, chunk_count,
+            mean/max_inter_chunk_ms and output_tokens_per_second
+            (None where there were too few chunks to measure)
+        """
+        summary: Dict[str, Any] = {
+            "time_to_first_token_ms": None,
+            "chunk_count": self.chunk_count,
+            "mean_inter_chunk_ms": None,
+            "max_inter_chunk_ms": None,
+            "output_tokens_per_second": None,
+        }
+        if self._first_chunk_at is None:
+            return summary
+
+        summary["time_to_first_token_ms"] = (self._first_chunk_at - self._started) * 1000
+        generation_seconds = self._last_chunk_at - self._first_chunk_at
+        if self.chunk_count > 1:
+            summary["mean_inter_chunk_ms"] = generation_seconds * 1000 / (self.chunk_count - 1)
+            summary["max_inter_chunk_ms"] = self._max_gap * 1000
+        if generation_seconds > 0 and output_tokens:
+            summary["output_tokens_per_second"] = output_tokens / generation_seconds
+        return summary
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def _totals(records: List[LLMCallRecord]) -> Dict[str, Any]:
+    """Aggregate a group of call records."""
+    latencies = [r.latency_ms for r in records]
+    ttfts = [r.time_to_first_token_ms for r in records if r.time_to_first_token_ms is not None]
+    gaps = [r.max_inter_chunk_ms for r in records if r.max_inter_chunk_ms is not None]
+    rates = [r.output_tokens_per_second for r in records if r.output_tokens_per_second is not None]
+    return {
+        "calls": len(records),
+        "failed_calls": sum(1 for r in records if not r.success),
+        "retries": sum(r.retries for r in records),
+        "input_tokens": sum(r.input_tokens for r in records),
+        "output_tokens": sum(r.output_tokens for r in records),
+        "cache_creation_input_tokens": sum(r.cache_creation_input_tokens for r in records),
+        "cache_read_input_tokens": sum(r.cache_read_input_tokens for r in records),
+        "total_latency_ms": sum(latencies),
+        "max_latency_ms": max(latencies, default=0.0),
+        "mean_time_to_first_token_ms": _mean(ttfts),
+        "max_time_to_first_token_ms": max(ttfts, default=None),
+        "max_inter_chunk_ms": max(gaps, default=None),
+        "mean_output_tokens_per_second": _mean(rates),
+        "estimated_cost_usd": sum(r.estimated_cost_usd for r in records),
+    }
+
+
+class UsageLedger:
+    """
+    Collects LLM call records for one generation request.
+
+    The Arbiter advances the current phase and round as the workflow
+    progresses; calls are stamped with the phase in effect when they start.
+    """
+
+    def __init__(self, request_id: str = ""):
+        """
+        Initialize the ledger.
+
+        Args:
+            request_id: The generation request this ledger belongs to
+        """
+        self.request_id = request_id
+        self._records: List[LLMCallRecord] = []
+        self._phase: Optional[str] = None
+        self._round_number = 0
+
+    @property
+    def records(self) -> List[LLMCallRecord]:
+        return list(self._records)
+
+    @property
+    def current_phase(self) -> Optional[str]:
+        return self._phase
+
+    @property
+    def current_round(self) -> int:
+        return self._round_number
+
+    def set_phase(self, phase: Optional[str], round_number: int) -> None:
+        """Set the phase and round that subsequent calls are attributed to."""
+        self._phase = phase
+        self._round_number = round_number
+
+    def record(self, record: LLMCallRecord) -> None:
+        """
+        Add a call record, estimating its cost if not already set.
+
+        Args:
+            record: The completed call
+        """
+        if not record.estimated_cost_usd:
+            record.estimated_cost_usd = estimate_cost(
+                record.model,
+                record.input_tokens,
+                record.output_tokens,
+                record.cache_creation_input_tokens,
+                record.cache_read_input_tokens,
+            )
+        self._records.append(record)
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Aggregate calls overall and by agent, model, phase and operation.
+
+        Returns:
+            Dictionary with totals, by_agent, by_model, by_phase and by_operation
+        """
+        by_agent: Dict[str, List[LLMCallRecord]] = {}
+        by_model: Dict[str, List[LLMCallRecord]] = {}
+        by_phase: Dict[str, List[LLMCallRecord]] = {}
+        by_operation: Dict[str, List[LLMCallRecord]] = {}
+        for record in self._records:
+            by_agent.setdefault(record.agent_name, []).append(record)
+            by_model.setdefault(record.model, []).append(record)
+            by_phase.setdefault(record.phase or "unassigned", []).append(record)
+            key = f"{record.agent_name}.{record.operation}" if record.operation else record.agent_name
+            by_operation.setdefault(key, []).append(record)
+
+        return {
+            "totals": _totals(self._records),
+            "by_agent": {name: _totals(group) for name, group in by_agent.items()},
+            "by_model": {model: _totals(group) for model, group in by_model.items()},
+            "by_phase": {phase: _totals(group) for phase, group in by_phase.items()},
+            "by_operation": {key: _totals(group) for key, group in by_operation.items()},
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "request_id": self.request_id,
+            "calls": [r.to_dict() for r in self._records],
+            "summary": self.summarize(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UsageLedger":
+        ledger = cls(request_id=data.get("request_id", ""))
+        ledger._records = [LLMCallRecord.from_dict(r) for r in data.get("calls", [])]
+        return ledger
+
+
+# ============================================================================
+# Active Ledger
+# ============================================================================
+
+_active_ledger: ContextVar[Optional[UsageLedger]] = ContextVar("usage_ledger", default=None)
+
+
+def get_active_ledger() -> Optional[UsageLedger]:
+    """Get the ledger for the current generation, if any."""
+    return _active_ledger.get()
+
+
+def activate_ledger(ledger: UsageLedger) -> Token:
+    """
+    Make a ledger active for the current task and tasks it creates.
+
+    Args:
+        ledger: The ledger to record into
+
+    Returns:
+        Token to pass to deactivate_ledger()
+    """
+    return _active_ledger.set(ledger)
+
+
+def deactivate_ledger(token: Token) -> None:
+    """Restore the ledger that was active before activate_ledger()."""
+    _active_ledger.reset(token)
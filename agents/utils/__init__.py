@@ -16,6 +16,7 @@ from .profile_formatter import (
     format_geographic_coverage,
     format_full_company_profile,
 )
+from .section_resolver import SectionResolver, normalize_section_name
 from .section_formatter import (
     SectionFormatter,
     format_section_header,
@@ -56,6 +57,9 @@ __all__ = [
     "format_teaming_relationships",
     "format_geographic_coverage",
     "format_full_company_profile",
+    # Section resolution
+    "SectionResolver",
+    "normalize_section_name",
     # Section formatters
     "SectionFormatter",
     "format_section_header",
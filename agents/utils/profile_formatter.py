@@ -6,7 +6,10 @@ These functions convert company profile dictionary data into formatted
 strings suitable for inclusion in LLM prompts.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Union
+
+from models.company_profile import ProfileSnapshot
+from models.past_performance_index import PastPerformanceIndex
 
 
 def extract_certification_type(cert: Union[str, Dict[str, Any]]) -> str:
@@ -40,6 +43,59 @@ def extract_certification_types(certs: List[Union[str, Dict[str, Any]]]) -> List
     return [extract_certification_type(c) for c in certs if extract_certification_type(c)]
 
 
+def profile_certification_types(profile: Mapping[str, Any]) -> List[str]:
+    """
+    Get a profile's certification types, precomputed if it is a ProfileSnapshot.
+
+    Args:
+        profile: Company profile dictionary or ProfileSnapshot
+
+    Returns:
+        List of certification type strings
+    """
+    if isinstance(profile, ProfileSnapshot):
+        return list(profile.certification_types)
+    return extract_certification_types(profile.get('certifications', []))
+
+
+def relevant_past_performance(
+    profile: Mapping[str, Any],
+    opportunity: Optional[Mapping[str, Any]] = None,
+    k: int = 5,
+) -> List[Union[str, Dict[str, Any]]]:
+    """
+    Select the profile's past performance most relevant to an opportunity.
+
+    Uses the ProfileSnapshot's cached index when available. Without an
+    opportunity, records are ranked by recency.
+
+    Args:
+        profile: Company profile dictionary or ProfileSnapshot
+        opportunity: Opportunity dictionary (naics_code, agency, estimated_value)
+        k: Maximum number of records to return
+
+    Returns:
+        Up to k past performance records, most relevant first
+    """
+    if isinstance(profile, ProfileSnapshot):
+        index = profile.past_performance_index
+    else:
+        index = PastPerformanceIndex(profile.get('past_performance') or [])
+
+    opportunity = opportunity or {}
+    agency = opportunity.get('agency')
+    if isinstance(agency, Mapping):
+        agency = agency.get('name')
+    naics_code = opportunity.get('naics_code')
+
+    return index.most_relevant(
+        k,
+        naics_codes=[naics_code] if naics_code else None,
+        agency=agency,
+        value=opportunity.get('estimated_value'),
+    )
+
+
 def extract_past_performance_name(pp: Union[str, Dict[str, Any]]) -> str:
     """
     Extract past performance name/description from either a string or dict format.
@@ -0,0 +1,189 @@
+"""
+Section Resolver
+
+Critique target_section values are free text: an exact section name, a
+differently cased one, or a description such as "'Immediate Actions
+(Months 1-3)' in the Executive Summary". SectionResolver maps those
+strings onto a document's actual section names.
+
+A resolver is built once per set of section names. It holds hash maps of
+normalized names and aliases, an inverted index from words to the
+sections that use them, and a memo of every target string already
+resolved, so each distinct target is matched once per document rather
+than scanned against every section at every call site.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Extra words that identify common generic sections
+DEFAULT_SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "executive summary": ("overview",),
+    "main content": ("body", "details"),
+    "recommendations": ("recommend", "recommendation", "suggestion", "action"),
+    "conclusion": ("closing", "final"),
+}
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Words too common to link a target to a section
+_STOPWORDS = frozenset(
+    "a an and as at by for from in of on or per the to with section sections".split()
+)
+
+# Sections never chosen as a fallback target
+_TITLE_SECTIONS = frozenset({"title", "header"})
+_COMPANY_NAME_WORDS = ("llc", "inc", "corp", "company")
+
+
+def normalize_section_name(name: str) -> str:
+    """Normalize a section name or target for matching."""
+    return " ".join(_WORD.findall((name or "").lower()))
+
+
+class SectionResolver:
+    """
+    Resolves free-text critique targets to one document's section names.
+
+    Resolution tries, in order: an exact name; a normalized name or alias;
+    the longest section name the target mentions; an alias word the target
+    uses; and the section sharing the most words with the target. Ties go
+    to the section that comes first in the document.
+    """
+
+    def __init__(
+        self,
+        section_names: Iterable[str],
+        aliases: Optional[Dict[str, Iterable[str]]] = None,
+    ):
+        """
+        Build the resolver.
+
+        Args:
+            section_names: Section names in document order
+            aliases: Extra words per normalized section name
+                (default: DEFAULT_SECTION_ALIASES)
+        """
+        self.sections: Tuple[str, ...] = tuple(dict.fromkeys(section_names))
+        self._order = {name: i for i, name in enumerate(self.sections)}
+        aliases = DEFAULT_SECTION_ALIASES if aliases is None else aliases
+
+        self._by_name: Dict[str, str] = {}
+        self._by_alias: Dict[str, str] = {}
+        self._words: Dict[str, List[str]] = {}
+        self._phrases: Dict[str, str] = {}
+
+        for name in self.sections:
+            normalized = normalize_section_name(name)
+            self._by_name.setdefault(normalized, name)
+            if normalized:
+                self._phrases.setdefault(name, f" {normalized} ")
+            for word in set(normalized.split()) - _STOPWORDS:
+                self._words.setdefault(word, []).append(name)
+            for alias in aliases.get(normalized, ()):
+                self._by_alias.setdefault(normalize_section_name(alias), name)
+
+        self._resolved: Dict[str, Optional[str]] = {}
+        self.catch_all = next(
+            (name for name in self.sections if "main" in name.lower() or "content" in name.lower()),
+            None,
+        )
+
+    def is_current(self, section_names: Iterable[str]) -> bool:
+        """Check whether the resolver was built for these section names."""
+        return tuple(dict.fromkeys(section_names)) == self.sections
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._order
+
+    @property
+    def fallback(self) -> Optional[str]:
+        """
+        Section to attribute an unresolvable target to.
+
+        The catch-all main content section if there is one, otherwise the
+        first section that is not a title or company name.
+        """
+        if self.catch_all:
+            return self.catch_all
+        for name in self.sections:
+            lower = name.lower()
+            if lower not in _TITLE_SECTIONS and not any(word in lower for word in _COMPANY_NAME_WORDS):
+                return name
+        return self.sections[0] if self.sections else None
+
+    def resolve(self, target: str) -> Optional[str]:
+        """
+        Resolve a critique target to a section name.
+
+        Args:
+            target: The critique target_section value
+
+        Returns:
+            The matching section name, or None if no section matches
+        """
+        if not target:
+            return None
+        if target in self._order:
+            return target
+        try:
+            return self._resolved[target]
+        except KeyError:
+            section = self._resolve(target)
+            self._resolved[target] = section
+            return section
+
+    def resolve_or_fallback(self, target: str) -> Optional[str]:
+        """Resolve a target, attributing unmatched targets to the fallback section."""
+        return self.resolve(target) or self.fallback
+
+    def _resolve(self, target: str) -> Optional[str]:
+        normalized = normalize_section_name(target)
+        section = self._by_name.get(normalized) or self._by_alias.get(normalized)
+        if section:
+            return section
+
+        words = set(normalized.split()) - _STOPWORDS
+        candidates = self._candidates(words)
+
+        # Section names mentioned in the target, longest first
+        padded = f" {normalized} "
+        mentioned = [name for name in candidates if self._phrases.get(name, "\0") in padded]
+        if mentioned:
+            return max(mentioned, key=lambda name: (len(self._phrases[name]), -self._order[name]))
+
+        for word in normalized.split():
+            if word in self._by_alias:
+                return self._by_alias[word]
+
+        # Most shared words; ties keep document order
+        if candidates:
+            return max(candidates, key=lambda name: (candidates[name], -self._order[name]))
+        return None
+
+    def _candidates(self, words: Iterable[str]) -> Dict[str, int]:
+        """Sections sharing at least one word with the target, with the shared count."""
+        counts: Dict[str, int] = {}
+        for word in words:
+            for name in self._words.get(word, ()):
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+    def group(self, critiques: Sequence[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Group critiques by resolved section, in first-appearance order.
+
+        Critiques whose target resolves to no section are left out.
+
+        Args:
+            critiques: Critique dictionaries with a target_section
+
+        Returns:
+            Section name to its critiques
+        """
+        grouped: Dict[str, List[Dict]] = {}
+        for critique in critiques:
+            section = self.resolve(critique.get("target_section", ""))
+            if section:
+                grouped.setdefault(section, []).append(critique)
+        return grouped
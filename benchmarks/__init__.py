@@ -0,0 +1,7 @@
+"""
+Benchmarks
+
+End-to-end performance benchmarks for the adversarial swarm, run against
+the simulated LLM provider so results reflect orchestration cost rather
+than model latency. See swarm_benchmark.py.
+"""
@@ -0,0 +1,550 @@
+#!/usr/bin/env python
+"""
+Swarm Benchmark
+
+Runs concurrent ArbiterAgent.generate_document calls for each document
+type on the simulated LLM provider and reports:
+
+- p50/p95/p99 latency per phase (BlueBuild, RedAttack, ...) and end to end
+- MessageBus messages and WebSocket events per second; events are routed
+  through the server's bus-to-WebSocket bridge and serialized, not sent
+- Peak RSS, and traced allocations per round with --trace-allocations
+
+Results are written as JSON; pass --compare to check them against an
+earlier run and exit non-zero on p95 regressions.
+
+Usage:
+    python -m benchmarks.swarm_benchmark --concurrency 8 --iterations 2 --output bench.json
+    python -m benchmarks.swarm_benchmark --output new.json --compare bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from math import floor, ceil
+from pathlib import Path
+from typing import List, Optional, Dict, Any
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    resource = None
+    RESOURCE_AVAILABLE = False
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from agents.config import configure_llm_settings
+from agents.registration import ensure_agents_registered
+from agents.registry import get_registry
+from agents.orchestrator.arbiter import ArbiterAgent, DocumentRequest
+from comms.bus import MessageBus
+from comms.message import MessageType
+from comms.round import RoundSummary, RoundType
+from models.document_types import DocumentType
+from server.models.schemas import SwarmConfigSchema
+from server.services.orchestrator import GenerationContext, OrchestratorService
+from server.websocket.events import ServerEventType, create_server_message
+from server.websocket.manager import ConnectionManager
+
+
+# Percentiles reported for every latency series
+PERCENTILES = (50, 95, 99)
+
+# Profile used for every benchmark request
+BENCHMARK_PROFILE: Dict[str, Any] = {
+    "name": "Benchmark Federal Solutions",
+    "description": "IT modernization and cybersecurity services for civilian and defense agencies",
+    "annual_revenue": 18_500_000,
+    "employee_count": 95,
+    "years_in_business": 12,
+    "naics_codes": [
+        {"code": "541512", "description": "Computer Systems Design Services", "is_primary": True},
+        {"code": "541519", "description": "Other Computer Related Services"},
+    ],
+    "certifications": [{"cert_type": "8(a)"}, {"cert_type": "SDVOSB"}],
+    "core_capabilities": [
+        {"name": "Cloud Migration", "description": "FedRAMP cloud migration and operations"},
+        {"name": "Zero Trust Security", "description": "Zero trust architecture and continuous monitoring"},
+    ],
+    "past_performance": [
+        {"contract_name": "VA Cloud Operations", "agency": "Department of Veterans Affairs", "contract_value": 12_000_000},
+        {"contract_name": "DHS Security Operations", "agency": "Department of Homeland Security", "contract_value": 7_500_000},
+    ],
+    "target_agencies": ["Department of Veterans Affairs", "Department of Homeland Security"],
+}
+
+# Opportunity used for every benchmark request; Competitive Analysis and
+# Proposal Strategy fail in BlueBuild without one
+BENCHMARK_OPPORTUNITY: Dict[str, Any] = {
+    "id": "BENCH-OPP-001",
+    "title": "Enterprise Cloud Operations and Cybersecurity Support",
+    "solicitation_number": "36C10B-26-R-0001",
+    "agency": {"name": "Department of Veterans Affairs", "abbreviation": "VA"},
+    "naics_code": "541512",
+    "set_aside": "8(a)",
+    "contract_type": "IDIQ",
+    "estimated_value": 25_000_000,
+    "period_of_performance": "1 Base + 4 Option Years",
+    "evaluation_type": "Best Value Tradeoff",
+    "evaluation_factors": [
+        {"name": "Technical Approach", "weight": 40},
+        {"name": "Past Performance", "weight": 30},
+        {"name": "Price", "weight": 30},
+    ],
+    "key_requirements": [
+        "FedRAMP High cloud operations",
+        "Zero trust architecture implementation",
+        "24x7 security operations center",
+    ],
+    "scope_summary": "Operate and secure the agency's hybrid cloud environment.",
+    "is_recompete": True,
+    "incumbent": "Legacy Systems Inc.",
+}
+
+# Bus message types bridged to WebSocket events by the server
+_BRIDGED_MESSAGE_TYPES = [
+    MessageType.DRAFT,
+    MessageType.CRITIQUE,
+    MessageType.RESPONSE,
+    MessageType.ROUND_START,
+    MessageType.ROUND_END,
+    MessageType.STATUS,
+]
+
+
+class CountingConnectionManager(ConnectionManager):
+    """Connection manager that serializes and counts events instead of sending them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events_by_request: Counter = Counter()
+        self.bytes_by_request: Counter = Counter()
+
+    async def broadcast(
+        self,
+        request_id: str,
+        event_type: ServerEventType,
+        payload: Dict[str, Any],
+    ) -> int:
+        message = create_server_message(event_type, payload, request_id)
+        self.events_by_request[request_id] += 1
+        self.bytes_by_request[request_id] += len(json.dumps(message, default=str))
+        return 1
+
+
+@dataclass
+class PhaseSample:
+    """Timing and allocation for one round of one generation."""
+
+    phase: str
+    seconds: float
+    alloc_bytes: Optional[int] = None
+
+
+@dataclass
+class RunRecord:
+    """Measurements for one generate_document call."""
+
+    document_type: str
+    success: bool
+    seconds: float
+    phases: List[PhaseSample] = field(default_factory=list)
+    bus_messages: int = 0
+    ws_events: int = 0
+    ws_bytes: int = 0
+    error: Optional[str] = None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linearly interpolated percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower, upper = floor(position), ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Percentiles, mean and max of a series."""
+    summary = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+    summary["mean"] = sum(values) / len(values) if values else 0.0
+    summary["max"] = max(values) if values else 0.0
+    summary["count"] = len(values)
+    return summary
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, where available."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+async def run_generation(
+    service: OrchestratorService,
+    document_type: str,
+    rounds: int,
+    trace_allocations: bool,
+) -> RunRecord:
+    """
+    Run one generation with the server's WebSocket bridge attached.
+
+    Args:
+        service: Orchestrator service whose bridge converts bus messages
+        document_type: Document type to generate
+        rounds: Maximum adversarial rounds
+        trace_allocations: Record traced memory growth per round
+
+    Returns:
+        RunRecord for the generation
+    """
+    request_id = str(uuid.uuid4())
+    bus = MessageBus()
+    context = GenerationContext(
+        request_id=request_id,
+        document_id=str(uuid.uuid4()),
+        company_profile_id="benchmark",
+        config=SwarmConfigSchema(rounds=rounds),
+        message_bus=bus,
+        total_rounds=rounds,
+    )
+    service.active_requests[request_id] = context
+    await bus.subscribe(
+        agent_role="websocket_bridge",
+        message_types=_BRIDGED_MESSAGE_TYPES,
+        handler=lambda msg: service._on_message_bus_event(msg, request_id),
+    )
+
+    arbiter = ArbiterAgent()
+    await arbiter.initialize(registry=get_registry(), message_bus=bus)
+
+    record = RunRecord(document_type=document_type, success=False, seconds=0.0)
+    round_starts: Dict[int, tuple] = {}
+
+    def on_round_start(round_number: int, round_type: RoundType) -> None:
+        traced = tracemalloc.get_traced_memory()[0] if trace_allocations else None
+        round_starts[round_number] = (time.perf_counter(), traced)
+
+    def on_round_end(summary: RoundSummary) -> None:
+        started, traced = round_starts.pop(summary.round_number, (time.perf_counter(), None))
+        alloc = tracemalloc.get_traced_memory()[0] - traced if traced is not None else None
+        record.phases.append(PhaseSample(summary.round_type.value, time.perf_counter() - started, alloc))
+
+    arbiter.set_round_callbacks(on_round_start=on_round_start, on_round_end=on_round_end)
+
+    start = time.perf_counter()
+    try:
+        output = await arbiter.generate_document(DocumentRequest(
+            id=request_id,
+            document_type=document_type,
+            company_profile=BENCHMARK_PROFILE,
+            opportunity=BENCHMARK_OPPORTUNITY,
+            max_adversarial_rounds=rounds,
+        ))
+        record.success = output.success
+        if not output.success:
+            record.error = "; ".join(output.review_reasons) or "Generation failed"
+    except Exception as e:
+        record.error = str(e)
+    finally:
+        record.seconds = time.perf_counter() - start
+        record.bus_messages = bus.get_stats()["messages_published"]
+        await arbiter.cleanup()
+        service.active_requests.pop(request_id, None)
+
+    record.ws_events = service.ws_manager.events_by_request.pop(request_id, 0)
+    record.ws_bytes = service.ws_manager.bytes_by_request.pop(request_id, 0)
+    return record
+
+
+async def benchmark_document_type(
+    service: OrchestratorService,
+    document_type: str,
+    concurrency: int,
+    iterations: int,
+    rounds: int,
+    trace_allocations: bool,
+) -> Dict[str, Any]:
+    """
+    Run batches of concurrent generations for one document type.
+
+    Returns:
+        Aggregated results for the document type
+    """
+    records: List[RunRecord] = []
+    wall_seconds = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        batch = await asyncio.gather(*(
+            run_generation(service, document_type, rounds, trace_allocations)
+            for _ in range(concurrency)
+        ))
+        wall_seconds += time.perf_counter() - start
+        records.extend(batch)
+
+    phase_seconds: Dict[str, List[float]] = {}
+    phase_allocs: Dict[str, List[float]] = {}
+    for record in records:
+        for sample in record.phases:
+            phase_seconds.setdefault(sample.phase, []).append(sample.seconds * 1000)
+            if sample.alloc_bytes is not None:
+                phase_allocs.setdefault(sample.phase, []).append(sample.alloc_bytes)
+
+    bus_messages = sum(r.bus_messages for r in records)
+    ws_events = sum(r.ws_events for r in records)
+
+    result: Dict[str, Any] = {
+        "runs": len(records),
+        "failures": sum(1 for r in records if not r.success),
+        "errors": sorted({r.error for r in records if r.error}),
+        "wall_seconds": wall_seconds,
+        "latency_ms": {
+            "total": summarize([r.seconds * 1000 for r in records]),
+            "phases": {phase: summarize(values) for phase, values in phase_seconds.items()},
+        },
+        "bus_messages": bus_messages,
+        "bus_messages_per_second": bus_messages / wall_seconds if wall_seconds else 0.0,
+        "ws_events": ws_events,
+        "ws_events_per_second": ws_events / wall_seconds if wall_seconds else 0.0,
+        "ws_bytes": sum(r.ws_bytes for r in records),
+    }
+    if trace_allocations:
+        result["alloc_bytes_per_round"] = {
+            phase: summarize(values) for phase, values in phase_allocs.items()
+        }
+    return result
+
+
+async def run_benchmark(
+    document_types: List[str],
+    concurrency: int = 4,
+    iterations: int = 1,
+    rounds: int = 2,
+    trace_allocations: bool = False,
+) -> Dict[str, Any]:
+    """
+    Benchmark the swarm across document types.
+
+    The simulated provider must already be configured (see main()).
+
+    Args:
+        document_types: Document types to generate
+        concurrency: Concurrent generations per batch
+        iterations: Batches per document type
+        rounds: Maximum adversarial rounds per generation
+        trace_allocations: Trace memory growth per round (slower)
+
+    Returns:
+        JSON-serializable results
+    """
+    ensure_agents_registered()
+    service = OrchestratorService(CountingConnectionManager())
+
+    if trace_allocations:
+        tracemalloc.start()
+
+    results: Dict[str, Any] = {}
+    try:
+        for document_type in document_types:
+            results[document_type] = await benchmark_document_type(
+                service, document_type, concurrency, iterations, rounds, trace_allocations
+            )
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "concurrency": concurrency,
+            "iterations": iterations,
+            "rounds": rounds,
+            "trace_allocations": trace_allocations,
+            "simulation": {
+                key[len("SIMULATED_LLM_"):].lower(): value
+                for key, value in sorted(os.environ.items())
+                if key.startswith("SIMULATED_LLM_")
+            },
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "document_types": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold_percent: float = 10.0,
+) -> List[str]:
+    """
+    Compare p95 latencies against a baseline run.
+
+    Latencies of a document type with failed runs time the failure path,
+    so such a type is reported as a regression instead of compared; one
+    that failed only in the baseline is skipped.
+
+    Args:
+        baseline: Earlier benchmark results
+        current: New benchmark results
+        threshold_percent: Slowdown that counts as a regression
+
+    Returns:
+        Descriptions of regressions (empty if none)
+    """
+    regressions = []
+    for document_type, result in current.get("document_types", {}).items():
+        if result.get("failures"):
+            regressions.append(
+                f"{document_type}: {result['failures']}/{result['runs']} runs failed, latency not compared"
+            )
+            continue
+
+        base = baseline.get("document_types", {}).get(document_type)
+        if not base or base.get("failures"):
+            continue
+
+        series = {"total": (base["latency_ms"]["total"], result["latency_ms"]["total"])}
+        for phase, stats in result["latency_ms"]["phases"].items():
+            if phase in base["latency_ms"]["phases"]:
+                series[phase] = (base["latency_ms"]["phases"][phase], stats)
+
+        for name, (before, after) in series.items():
+            if before["p95"] <= 0:
+                continue
+            change = (after["p95"] - before["p95"]) / before["p95"] * 100
+            if change > threshold_percent:
+                regressions.append(
+                    f"{document_type} / {name}: p95 {before['p95']:.1f}ms -> {after['p95']:.1f}ms ({change:+.1f}%)"
+                )
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_summary(results: Dict[str, Any]) -> None:
+    print(f"{'Document type':<26} {'runs':>5} {'fail':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'bus/s':>9} {'ws/s':>9}")
+    for document_type, result in results["document_types"].items():
+        total = result["latency_ms"]["total"]
+        print(
+            f"{document_type:<26} {result['runs']:>5} {result['failures']:>5} "
+            f"{total['p50']:>9.1f} {total['p95']:>9.1f} {total['p99']:>9.1f} "
+            f"{result['bus_messages_per_second']:>9.1f} {result['ws_events_per_second']:>9.1f}"
+        )
+    if results.get("peak_rss_mb") is not None:
+        print(f"Peak RSS: {results['peak_rss_mb']:.1f} MB")
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="End-to-end swarm benchmark on the simulated LLM provider")
+    parser.add_argument("--document-types", nargs="+", default=[t.value for t in DocumentType],
+                        help="Document types to run (default: all)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent generations per batch")
+    parser.add_argument("--iterations", type=int, default=1, help="Batches per document type")
+    parser.add_argument("--rounds", type=int, default=2, help="Maximum adversarial rounds")
+    parser.add_argument("--latency-ms", type=float, help="Simulated mean time to first token")
+    parser.add_argument("--latency-jitter-ms", type=float,
+                        help="Simulated latency standard deviation (default: a quarter of --latency-ms)")
+    parser.add_argument("--tokens-per-second", type=float, help="Simulated streaming rate (0 = instant)")
+    parser.add_argument("--error-rate", type=float, help="Injected 429 and 5xx rate, each")
+    parser.add_argument("--seed", type=int, default=0, help="Simulation seed")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="Trace memory growth per round with tracemalloc (slower; exact only at concurrency 1)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare p95 latencies against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    parser.add_argument("--verbose", action="store_true", help="Show agent logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    # Simulation settings are read from the environment when agents are created
+    jitter = args.latency_jitter_ms
+    if jitter is None and args.latency_ms is not None:
+        jitter = args.latency_ms / 4
+    overrides = {
+        "SIMULATED_LLM_LATENCY_MS": args.latency_ms,
+        "SIMULATED_LLM_LATENCY_JITTER_MS": jitter,
+        "SIMULATED_LLM_TOKENS_PER_SECOND": args.tokens_per_second,
+        "SIMULATED_LLM_RATE_LIMIT_RATE": args.error_rate,
+        "SIMULATED_LLM_SERVER_ERROR_RATE": args.error_rate,
+        "SIMULATED_LLM_SEED": args.seed,
+    }
+    for key, value in overrides.items():
+        if value is not None:
+            os.environ[key] = str(value)
+    configure_llm_settings(provider="simulated", model="simulated", api_key_env_var="")
+
+    results = asyncio.run(run_benchmark(
+        document_types=args.document_types,
+        concurrency=args.concurrency,
+        iterations=args.iterations,
+        rounds=args.rounds,
+        trace_allocations=args.trace_allocations,
+    ))
+
+    _print_summary(results)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(json.loads(args.compare.read_text()), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) (p95 over {args.threshold:.0f}% or failed runs):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo p95 regressions over {args.threshold:.0f}% against {args.compare}")
+
+    # Latencies of failed runs are not benchmark data
+    failed = {
+        document_type: result
+        for document_type, result in results["document_types"].items()
+        if result["failures"]
+    }
+    if failed:
+        print(f"\nGenerations failed for {len(failed)} document type(s):", file=sys.stderr)
+        for document_type, result in failed.items():
+            print(f"  {document_type}: {result['failures']}/{result['runs']} runs failed", file=sys.stderr)
+            for error in result["errors"]:
+                print(f"    {error}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
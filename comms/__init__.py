@@ -9,6 +9,7 @@ Main components:
 - MessageBus: Async pub/sub message bus
 - ConversationHistory: Queryable history of the debate
 - RoundManager: Manages debate round lifecycle
+- Tracing: Spans across rounds, agents, LLM calls and message delivery
 
 Usage:
     from comms import MessageBus, Message, MessageType, RoundManager
@@ -72,6 +73,16 @@ from .round import (
     RoundConfig,
 )
 
+from .tracing import (
+    Span,
+    configure_tracing,
+    tracing_enabled,
+    current_span,
+    start_span,
+    end_span,
+    span,
+)
+
 __all__ = [
     # Message types
     "Message",
@@ -99,4 +110,12 @@ __all__ = [
     "RoundPhase",
     "RoundSummary",
     "RoundConfig",
+    # Tracing
+    "Span",
+    "configure_tracing",
+    "tracing_enabled",
+    "current_span",
+    "start_span",
+    "end_span",
+    "span",
 ]
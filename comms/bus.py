@@ -11,9 +11,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Dict, Set, Optional, Callable, Awaitable, Any, TYPE_CHECKING
 import logging
+import time
 import uuid
 
 from .message import Message, MessageType, MessagePriority, DeliveryStatus
+from .tracing import Span, current_span, span, tracing_enabled
 
 if TYPE_CHECKING:
     from agents.base import AbstractAgent
@@ -113,6 +115,9 @@ class MessageBus:
         self._processing = False
         self._process_task: Optional[asyncio.Task] = None
 
+        # Publishing span and time per queued message (only while tracing)
+        self._publish_spans: Dict[str, tuple[Optional[Span], float]] = {}
+
         # Synchronization
         self._lock = asyncio.Lock()
 
@@ -241,6 +246,10 @@ class MessageBus:
 
             self._stats["messages_published"] += 1
 
+        # Remember the publishing span so delivery can be traced back to it
+        if tracing_enabled():
+            self._publish_spans[message.id] = (current_span(), time.time())
+
         # Queue for delivery
         await self._queue.put(message)
 
@@ -279,6 +288,23 @@ class MessageBus:
                 self._logger.error(f"Error processing message: {e}")
 
     async def _deliver_message(self, message: Message) -> None:
+        """Deliver a message, traced from publish to delivery when tracing is on."""
+        published = self._publish_spans.pop(message.id, None)
+        if published is None:
+            await self._deliver_to_subscribers(message)
+            return
+
+        publisher_span, published_at = published
+        with span(
+            "bus.deliver",
+            parent=publisher_span,
+            start_time=published_at,
+            message_type=message.message_type.value,
+            sender=message.sender_role,
+        ):
+            await self._deliver_to_subscribers(message)
+
+    async def _deliver_to_subscribers(self, message: Message) -> None:
         """Deliver a message to all matching subscribers."""
         if message.is_expired:
             message.delivery_status = DeliveryStatus.EXPIRED
@@ -14,6 +14,7 @@ import uuid
 
 from .message import Message, MessageType, create_control_message
 from .history import ConversationHistory, RoundRecord
+from .tracing import Span, start_span, end_span
 
 
 class RoundType(str, Enum):
@@ -176,6 +177,7 @@ class RoundManager:
         # Timing
         self._round_start_time: Optional[datetime] = None
         self._round_deadline: Optional[datetime] = None
+        self._round_span: Optional[Span] = None
 
         # Callbacks
         self._on_round_start: Optional[Callable[[int, RoundType], None]] = None
@@ -264,6 +266,9 @@ class RoundManager:
         self._current_type = round_type
         self._current_phase = RoundPhase.ACTIVE
         self._round_start_time = datetime.now(timezone.utc)
+        self._round_span = start_span(
+            "round", round_number=self._current_round, round_type=round_type.value
+        )
 
         # Apply configuration
         if config:
@@ -330,6 +335,8 @@ class RoundManager:
 
         # Update state
         self._current_phase = RoundPhase.COMPLETE
+        end_span(self._round_span)
+        self._round_span = None
 
         # Invoke callback
         if self._on_round_end:
@@ -0,0 +1,293 @@
+"""
+Lightweight Tracing
+
+Dependency-free spans for following a generation through the swarm:
+the Arbiter's generate_document, each round, each agent.process, each LLM
+call attempt, message bus publish-to-deliver and WebSocket sends.
+
+The current span is held in a context variable, so child spans find their
+parent automatically, including inside tasks created with asyncio.gather
+(tasks copy the context they were created in). A generation's trace id is
+its request id, matching the request_id the server puts in log records.
+
+Finished spans are appended to a JSONL file, one span per line. Tracing is
+off unless a file is configured, via configure_tracing() or the TRACE_FILE
+environment variable, and spans cost almost nothing when it is off.
+
+Convert a trace file into a timeline for chrome://tracing or Perfetto:
+
+    python scripts/trace_timeline.py traces.jsonl --output timeline.json
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)  # Epoch seconds
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    # Set while the span is the current span
+    _token: Optional[Token] = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) * 1000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class JsonlSpanExporter:
+    """Appends finished spans to a JSONL file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File to append spans to (parent directories are created)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: TextIO = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+# ============================================================================
+# Span API
+# ============================================================================
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter: Optional[JsonlSpanExporter] = (
+    JsonlSpanExporter(os.environ["TRACE_FILE"]) if os.getenv("TRACE_FILE") else None
+)
+
+
+def configure_tracing(path: Optional[str]) -> None:
+    """
+    Enable tracing to a JSONL file, or disable it with None.
+
+    Args:
+        path: Trace file path
+    """
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+    _exporter = JsonlSpanExporter(path) if path else None
+
+
+def tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _exporter is not None
+
+
+def current_span() -> Optional[Span]:
+    """Get the span active in the current context."""
+    return _current_span.get()
+
+
+def start_span(
+    name: str,
+    parent: Optional[Span] = None,
+    trace_id: Optional[str] = None,
+    start_time: Optional[float] = None,
+    activate: bool = True,
+    **attributes: Any,
+) -> Optional[Span]:
+    """
+    Start a span. Pair with end_span().
+
+    Args:
+        name: Span name, e.g. "agent.process"
+        parent: Parent span (default: the current span)
+        trace_id: Trace id for a new root span (default: random)
+        start_time: Epoch start time (default: now)
+        activate: Make this the current span until it ends
+        **attributes: Span attributes
+
+    Returns:
+        The span, or None if tracing is disabled
+    """
+    if _exporter is None:
+        return None
+
+    parent = parent or _current_span.get()
+    span = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else (trace_id or uuid.uuid4().hex),
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    if start_time is not None:
+        span.start_time = start_time
+    if activate:
+        span._token = _current_span.set(span)
+    return span
+
+
+def end_span(span: Optional[Span], error: Optional[BaseException] = None) -> None:
+    """
+    End a span started with start_span() and export it.
+
+    Args:
+        span: The span (None is ignored, for when tracing is disabled)
+        error: Exception that ended the span, if any
+    """
+    if span is None or span.end_time is not None:
+        return
+    span.end_time = time.time()
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+
+    if span._token is not None:
+        try:
+            _current_span.reset(span._token)
+        except ValueError:
+            # Ended in a different context than it started in
+            pass
+        span._token = None
+
+    exporter = _exporter
+    if exporter is not None:
+        exporter.export(span)
+
+
+@contextmanager
+def span(name: str, **kwargs: Any) -> Iterator[Optional[Span]]:
+    """
+    Trace a block as a span, recording any exception that escapes it.
+
+    Usage:
+        with span("agent.process", agent=agent.name):
+            output = await agent.process(context)
+
+    Args:
+        name: Span name
+        **kwargs: Arguments and attributes passed to start_span()
+
+    Yields:
+        The span, or None if tracing is disabled
+    """
+    active = start_span(name, **kwargs)
+    try:
+        yield active
+    except BaseException as e:
+        end_span(active, error=e)
+        raise
+    else:
+        end_span(active)
+
+
+# ============================================================================
+# Timeline Export
+# ============================================================================
+
+
+def load_spans(path: str, trace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Read spans from a JSONL trace file.
+
+    Args:
+        path: Trace file
+        trace_id: Only return spans from this trace
+
+    Returns:
+        Span dictionaries in file order
+    """
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if trace_id is None or record["trace_id"] == trace_id:
+                spans.append(record)
+    return spans
+
+
+def to_chrome_trace(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert spans to the Chrome trace event format.
+
+    Each trace becomes a process and each agent (or span kind, for spans
+    outside an agent) a thread, so concurrent agents get separate lanes.
+
+    Args:
+        spans: Span dictionaries from load_spans()
+
+    Returns:
+        JSON-serializable trace for chrome://tracing or Perfetto
+    """
+    pids: Dict[str, int] = {}
+    tids: Dict[str, int] = {}
+    events: List[Dict[str, Any]] = []
+
+    for record in spans:
+        pid = pids.setdefault(record["trace_id"], len(pids) + 1)
+        lane = record["attributes"].get("agent") or record["name"].split(".")[0]
+        tid = tids.setdefault(lane, len(tids) + 1)
+        args = dict(record["attributes"], span_id=record["span_id"], parent_id=record["parent_id"])
+        if record.get("error"):
+            args["error"] = record["error"]
+        events.append({
+            "name": record["name"],
+            "cat": record["name"].split(".")[0],
+            "ph": "X",
+            "ts": record["start_time"] * 1_000_000,
+            "dur": (record["duration_ms"] or 0) * 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+
+    for trace_id, pid in pids.items():
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": trace_id}})
+    for lane, tid in tids.items():
+        for pid in pids.values():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}})
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
@@ -164,6 +164,7 @@ export function useSwarmWebSocket(
         state: 'thinking',
         target: payload.target ?? null,
         currentContent: null,
+        sectionContent: {},
       });
     },
     [updateAgent]
@@ -172,8 +173,22 @@ export function useSwarmWebSocket(
   const handleAgentStreaming = useCallback(
     (payload: AgentStreamingPayload) => {
       const currentAgent = useSwarmStore.getState().agents[payload.agentId];
-      const currentContent = currentAgent?.currentContent ?? '';
 
+      if (payload.section) {
+        // Concurrent section output arrives interleaved; buffer per section
+        const sectionContent = { ...currentAgent?.sectionContent };
+        sectionContent[payload.section] = (sectionContent[payload.section] ?? '') + payload.chunk;
+        updateAgent(payload.agentId, {
+          state: 'typing',
+          sectionContent,
+          currentContent: Object.entries(sectionContent)
+            .map(([section, content]) => `## ${section}\n\n${content}`)
+            .join('\n\n'),
+        });
+        return;
+      }
+
+      const currentContent = currentAgent?.currentContent ?? '';
       updateAgent(payload.agentId, {
         state: 'typing',
         currentContent: currentContent + payload.chunk,
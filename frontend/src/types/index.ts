@@ -36,6 +36,8 @@ export interface AgentInfo {
 export interface AgentRuntimeState extends AgentInfo {
   state: AgentState;
   currentContent: string | null;
+  // Streamed output per section, when the agent works on sections concurrently
+  sectionContent?: Record<string, string>;
   target: string | null;
 }
 
@@ -91,6 +91,7 @@ export interface AgentThinkingPayload {
 export interface AgentStreamingPayload {
   agentId: string;
   chunk: string;
+  section?: string;
 }
 
 export interface AgentCompletePayload {
@@ -102,6 +103,8 @@ export interface AgentCompletePayload {
 export interface DraftUpdatePayload {
   draft: DocumentDraft;
   changedSections: string[];
+  /** Sections of the final document synthesized so far */
+  finalizedSections?: string[];
 }
 
 export interface ConfidenceUpdatePayload {
@@ -14,6 +14,11 @@ from .company_profile import (
     PerformanceRating,
     TeamMember,
     CoreCapability,
+    ProfileSnapshot,
+)
+from .past_performance_index import (
+    PastPerformanceIndex,
+    ScoredPastPerformance,
 )
 from .opportunity import (
     Opportunity,
@@ -55,6 +60,16 @@ from .market_data import (
     MarketOpportunityStatus,
     MarketAnalysis,
 )
+from .market_index import (
+    MarketDataIndex,
+    load_contract_awards,
+)
+from .market_analytics import (
+    MarketAnalytics,
+    ValueDistribution,
+    compute_market_analytics,
+    analyze_market_data,
+)
 
 __all__ = [
     # Company Profile
@@ -66,6 +81,9 @@ __all__ = [
     "PerformanceRating",
     "TeamMember",
     "CoreCapability",
+    "ProfileSnapshot",
+    "PastPerformanceIndex",
+    "ScoredPastPerformance",
     # Opportunity
     "Opportunity",
     "Agency",
@@ -100,4 +118,10 @@ __all__ = [
     "PerformanceRatingLevel",
     "MarketOpportunityStatus",
     "MarketAnalysis",
+    "MarketDataIndex",
+    "load_contract_awards",
+    "MarketAnalytics",
+    "ValueDistribution",
+    "compute_market_analytics",
+    "analyze_market_data",
 ]
@@ -6,13 +6,17 @@ GovCon strategy development, including NAICS codes, certifications,
 past performance, and core capabilities.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Union
 import json
 import uuid
 
+from .past_performance_index import PastPerformanceIndex
+
 
 class BusinessStatus(str, Enum):
     """Business operational status."""
@@ -612,6 +616,11 @@ class CompanyProfile:
     existing_sub_relationships: List[str] = field(default_factory=list)
     teaming_preferences: str = ""
 
+    # Lazily built relevance index (see past_performance_index())
+    _past_performance_index: Optional[PastPerformanceIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def primary_naics(self) -> Optional[NAICSCode]:
         """Get the primary NAICS code."""
@@ -646,6 +655,24 @@ class CompanyProfile:
             for cert in self.certifications
         )
 
+    def past_performance_index(self) -> PastPerformanceIndex:
+        """
+        Get the relevance index over past performance.
+
+        Built on first use and rebuilt when the list is replaced or changes
+        length. Call invalidate_past_performance_index() after editing
+        entries in place.
+        """
+        if self._past_performance_index is None or not self._past_performance_index.is_current(
+            self.past_performance
+        ):
+            self._past_performance_index = PastPerformanceIndex(self.past_performance)
+        return self._past_performance_index
+
+    def invalidate_past_performance_index(self) -> None:
+        """Discard the past performance index so it is rebuilt on next use."""
+        self._past_performance_index = None
+
     def get_relevant_past_performance(
         self,
         naics_codes: Optional[List[str]] = None,
@@ -653,27 +680,19 @@ class CompanyProfile:
         min_value: Optional[float] = None,
     ) -> List[PastPerformance]:
         """Filter past performance by relevance criteria."""
-        relevant = self.past_performance
-
-        if naics_codes:
-            relevant = [
-                pp for pp in relevant
-                if any(code in pp.naics_codes for code in naics_codes)
-            ]
+        return self.past_performance_index().filter(naics_codes, agency, min_value)
 
-        if agency:
-            relevant = [
-                pp for pp in relevant
-                if agency.lower() in pp.agency.lower()
-            ]
-
-        if min_value:
-            relevant = [
-                pp for pp in relevant
-                if pp.contract_value >= min_value
-            ]
-
-        return relevant
+    def get_most_relevant_past_performance(
+        self,
+        k: int = 5,
+        naics_codes: Optional[List[str]] = None,
+        agency: Optional[str] = None,
+        value: Optional[float] = None,
+    ) -> List[PastPerformance]:
+        """Get the k past performance records most relevant to an opportunity."""
+        return self.past_performance_index().most_relevant(
+            k, naics_codes=naics_codes, agency=agency, value=value
+        )
 
     @property
     def veteran_ownership_percentage(self) -> float:
@@ -804,3 +823,187 @@ class CompanyProfile:
     @classmethod
     def from_json(cls, json_str: str) -> "CompanyProfile":
         return cls.from_dict(json.loads(json_str))
+
+
+# ============================================================================
+# Profile Snapshot
+# ============================================================================
+
+# Ownership flags summed into ProfileSnapshot.ownership_percentages
+OWNERSHIP_FLAGS: Dict[str, str] = {
+    "veteran": "is_veteran",
+    "service_disabled_veteran": "is_service_disabled_veteran",
+    "woman": "is_woman",
+    "disadvantaged": "is_disadvantaged",
+}
+
+
+def _certification_type(cert: Union[str, Dict[str, Any]]) -> str:
+    """Get the type of a certification stored as a string or dict."""
+    if isinstance(cert, str):
+        return cert
+    return cert.get("cert_type", "") if isinstance(cert, dict) else str(cert)
+
+
+def _certification_expiration(cert: Union[str, Dict[str, Any]]) -> Optional[date]:
+    """Get a certification's expiration date, or None if unknown."""
+    if not isinstance(cert, dict):
+        return None
+    exp_date = cert.get("expiration_date")
+    if isinstance(exp_date, str):
+        try:
+            return date.fromisoformat(exp_date)
+        except ValueError:
+            return None
+    return exp_date or None
+
+
+class ProfileSnapshot(Mapping):
+    """
+    Immutable, read-only view of a company profile dict for one generation.
+
+    Agents, prompt builders and rule engines read the profile many times
+    per generation. The snapshot is built once and precomputes the facts
+    they would otherwise re-derive: certification types and validity,
+    ownership percentages, NAICS codes and (lazily) the past performance
+    index. It is a Mapping, so code that reads the profile with get() or []
+    works unchanged.
+
+    The snapshot cannot be modified; nested values are shared with the
+    source dict and must be treated as read-only.
+    """
+
+    __slots__ = (
+        "_data",
+        "_cert_matches",
+        "_search_text",
+        "_past_performance_index",
+        "as_of",
+        "certifications",
+        "certification_types",
+        "valid_certification_types",
+        "ownership_percentages",
+        "naics_codes",
+        "naics_set",
+        "primary_naics",
+    )
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None, as_of: Optional[date] = None):
+        """
+        Build the snapshot.
+
+        Args:
+            data: Company profile data (snake_case keys)
+            as_of: Date used to evaluate certification validity (default: today)
+        """
+        data = dict(data or {})
+        as_of = as_of or date.today()
+
+        certifications = tuple(data.get("certifications") or ())
+        cert_types: List[str] = []
+        valid_types: List[str] = []
+        cert_matches: Dict[str, Any] = {}
+        for cert in certifications:
+            cert_type = _certification_type(cert)
+            if not cert_type:
+                continue
+            cert_types.append(cert_type)
+            expiration = _certification_expiration(cert)
+            if expiration is None or expiration >= as_of:
+                valid_types.append(cert_type)
+            cert_matches.setdefault(cert_type, cert)
+            # An SDVOSB certification also satisfies a VOSB requirement
+            if cert_type == "SDVOSB":
+                cert_matches.setdefault("VOSB", cert)
+
+        ownership = dict.fromkeys(OWNERSHIP_FLAGS, 0.0)
+        for stake in data.get("ownership_structure") or ():
+            pct = stake.get("percentage", 0) or 0
+            for column, flag in OWNERSHIP_FLAGS.items():
+                if stake.get(flag):
+                    ownership[column] += pct
+
+        naics_codes: List[str] = []
+        primary_naics: Optional[str] = None
+        for naics in data.get("naics_codes") or ():
+            code = naics.get("code", "") if isinstance(naics, dict) else str(naics)
+            naics_codes.append(code)
+            if primary_naics is None and isinstance(naics, dict) and naics.get("is_primary"):
+                primary_naics = code
+
+        init = object.__setattr__
+        init(self, "_data", data)
+        init(self, "_cert_matches", cert_matches)
+        init(self, "_search_text", None)
+        init(self, "_past_performance_index", None)
+        init(self, "as_of", as_of)
+        init(self, "certifications", certifications)
+        init(self, "certification_types", tuple(cert_types))
+        init(self, "valid_certification_types", frozenset(valid_types))
+        init(self, "ownership_percentages", MappingProxyType(ownership))
+        init(self, "naics_codes", tuple(naics_codes))
+        init(self, "naics_set", frozenset(naics_codes))
+        init(self, "primary_naics", primary_naics or (naics_codes[0] if naics_codes else None))
+
+    @classmethod
+    def of(cls, profile: Optional[Mapping[str, Any]]) -> "ProfileSnapshot":
+        """Get a snapshot of a profile, reusing it if it already is one."""
+        if isinstance(profile, cls):
+            return profile
+        return cls(profile)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ProfileSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ProfileSnapshot is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (self._data, self.as_of))
+
+    def __repr__(self) -> str:
+        # Matches the dict's repr, which keyword-matching rules search
+        return repr(self._data)
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased text of the whole profile, for keyword checks."""
+        if self._search_text is None:
+            object.__setattr__(self, "_search_text", repr(self._data).lower())
+        return self._search_text
+
+    @property
+    def past_performance_index(self) -> PastPerformanceIndex:
+        """Relevance index over the profile's past performance, built on first use."""
+        if self._past_performance_index is None:
+            records = tuple(self._data.get("past_performance") or ())
+            object.__setattr__(self, "_past_performance_index", PastPerformanceIndex(records, self.as_of))
+        return self._past_performance_index
+
+    def has_certification(self, cert_type: str) -> bool:
+        """Check for a certification (SDVOSB counts as VOSB)."""
+        return cert_type in self._cert_matches
+
+    def find_certification(self, cert_type: str) -> Optional[Union[str, Dict[str, Any]]]:
+        """
+        Find the first certification satisfying a certification type.
+
+        Args:
+            cert_type: Certification type, e.g. "8(a)" (SDVOSB satisfies "VOSB")
+
+        Returns:
+            The certification as stored (string or dict), or None
+        """
+        return self._cert_matches.get(cert_type)
+
+    def to_dict(self) -> dict:
+        return dict(self._data)
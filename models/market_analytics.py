@@ -0,0 +1,441 @@
+"""
+Market Analytics
+
+Columnar aggregation over contract awards and agency budgets for market
+sizing. Award fields are extracted once into parallel columns and reduced
+in bulk: award dollars by NAICS code and agency (TAM), the award-value
+distribution, awardee concentration (incumbent share and HHI) and budget
+trend slopes.
+
+The results are deterministic for a given input, so the Market Analyst
+can put a compact precomputed summary in its prompt instead of raw award
+rows and get repeatable numbers back.
+
+NumPy is used for the reductions when installed; otherwise the same
+computation runs over plain Python lists.
+"""
+
+from dataclasses import dataclass, field, replace
+from math import floor, ceil
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from .market_data import MarketData, ContractAward, BudgetInfo
+from .market_index import normalize_contractor
+
+
+# Percentiles reported in the award-value distribution
+DISTRIBUTION_PERCENTILES: Tuple[int, ...] = (25, 50, 75, 90)
+
+
+@dataclass
+class ValueDistribution:
+    """Summary statistics of award values, in dollars."""
+
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+    percentiles: Dict[int, float] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return self.percentiles.get(50, 0.0)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "percentiles": {str(p): v for p, v in self.percentiles.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ValueDistribution":
+        return cls(
+            count=data.get("count", 0),
+            total=data.get("total", 0.0),
+            mean=data.get("mean", 0.0),
+            minimum=data.get("minimum", 0.0),
+            maximum=data.get("maximum", 0.0),
+            percentiles={int(p): v for p, v in data.get("percentiles", {}).items()},
+        )
+
+
+@dataclass
+class MarketAnalytics:
+    """
+    Precomputed market sizing figures.
+
+    Dollar figures are in dollars except budget slopes, which follow
+    BudgetInfo and are in millions per fiscal year. Mappings are ordered
+    largest first (ties by key) so the summary renders identically for
+    identical data.
+    """
+
+    award_count: int = 0
+    total_award_value: float = 0.0
+
+    # TAM: award dollars by NAICS code and by agency
+    tam_by_naics: Dict[str, float] = field(default_factory=dict)
+    tam_by_agency: Dict[str, float] = field(default_factory=dict)
+
+    # Award dollars in the company's NAICS codes, when requested
+    company_naics_tam: Optional[float] = None
+
+    # Award-value distribution
+    award_values: ValueDistribution = field(default_factory=ValueDistribution)
+
+    # Share of award dollars held by the largest awardees (0-1)
+    incumbent_share: Dict[str, float] = field(default_factory=dict)
+    awardee_count: int = 0
+    concentration_hhi: float = 0.0  # Herfindahl-Hirschman Index, 0-10,000
+
+    # Award dollars by award year
+    annual_award_totals: Dict[int, float] = field(default_factory=dict)
+
+    # Budget trend: slope of total budget in $M per fiscal year
+    budget_slopes: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def top_awardee_share(self) -> float:
+        """Combined share of the awardees listed in incumbent_share."""
+        return sum(self.incumbent_share.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "award_count": self.award_count,
+            "total_award_value": self.total_award_value,
+            "tam_by_naics": self.tam_by_naics,
+            "tam_by_agency": self.tam_by_agency,
+            "company_naics_tam": self.company_naics_tam,
+            "award_values": self.award_values.to_dict(),
+            "incumbent_share": self.incumbent_share,
+            "awardee_count": self.awardee_count,
+            "concentration_hhi": self.concentration_hhi,
+            "annual_award_totals": {str(y): v for y, v in self.annual_award_totals.items()},
+            "budget_slopes": self.budget_slopes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MarketAnalytics":
+        return cls(
+            award_count=data.get("award_count", 0),
+            total_award_value=data.get("total_award_value", 0.0),
+            tam_by_naics=data.get("tam_by_naics", {}),
+            tam_by_agency=data.get("tam_by_agency", {}),
+            company_naics_tam=data.get("company_naics_tam"),
+            award_values=ValueDistribution.from_dict(data.get("award_values", {})),
+            incumbent_share=data.get("incumbent_share", {}),
+            awardee_count=data.get("awardee_count", 0),
+            concentration_hhi=data.get("concentration_hhi", 0.0),
+            annual_award_totals={int(y): v for y, v in data.get("annual_award_totals", {}).items()},
+            budget_slopes=data.get("budget_slopes", {}),
+        )
+
+
+def compute_market_analytics(
+    awards: Iterable[ContractAward],
+    budgets: Optional[Iterable[BudgetInfo]] = None,
+    naics_codes: Optional[Iterable[str]] = None,
+    top_n: int = 10,
+    use_numpy: bool = True,
+) -> MarketAnalytics:
+    """
+    Aggregate awards and budgets into market sizing figures.
+
+    Args:
+        awards: Contract awards to aggregate
+        budgets: Agency budgets; several fiscal years per agency give a
+            fitted trend, a single year falls back to its YoY change
+        naics_codes: Company NAICS codes to total as company_naics_tam
+        top_n: Number of NAICS codes, agencies and awardees to keep
+        use_numpy: Use NumPy reductions when available
+
+    Returns:
+        MarketAnalytics for the inputs
+    """
+    columns = _AwardColumns.from_awards(awards)
+    reduce = _NumpyReducer() if use_numpy and NUMPY_AVAILABLE else _PythonReducer()
+
+    analytics = MarketAnalytics(
+        award_count=len(columns),
+        total_award_value=reduce.total(columns.amounts),
+    )
+
+    naics_totals = reduce.group_sums(columns.naics, columns.amounts, len(columns.naics_keys))
+    agency_totals = reduce.group_sums(columns.agency, columns.amounts, len(columns.agency_keys))
+    awardee_totals = reduce.group_sums(columns.awardee, columns.amounts, len(columns.awardee_keys))
+    year_totals = reduce.group_sums(columns.year, columns.amounts, len(columns.year_keys))
+
+    analytics.tam_by_naics = _top(columns.naics_keys, naics_totals, top_n)
+    analytics.tam_by_agency = _top(columns.agency_labels, agency_totals, top_n)
+    analytics.annual_award_totals = {
+        year: year_totals[i]
+        for year, i in sorted(
+            (year, i) for i, year in enumerate(columns.year_keys) if year is not None
+        )
+    }
+
+    if naics_codes is not None:
+        positions = {code: i for i, code in enumerate(columns.naics_keys)}
+        analytics.company_naics_tam = sum(
+            naics_totals[positions[code]] for code in sorted(set(naics_codes)) if code in positions
+        )
+
+    analytics.award_values = reduce.distribution(columns.amounts)
+
+    # Awardee concentration over positive dollars only
+    total = analytics.total_award_value
+    if total > 0:
+        shares = [amount / total for amount in awardee_totals if amount > 0]
+        analytics.awardee_count = len(shares)
+        analytics.concentration_hhi = sum((share * 100) ** 2 for share in shares)
+        analytics.incumbent_share = {
+            name: amount / total
+            for name, amount in _top(columns.awardee_labels, awardee_totals, top_n).items()
+            if amount > 0
+        }
+
+    if budgets is not None:
+        analytics.budget_slopes = budget_trend_slopes(budgets, use_numpy=use_numpy)
+
+    return analytics
+
+
+def analyze_market_data(
+    market_data: Union[MarketData, Dict[str, Any]],
+    naics_codes: Optional[Iterable[str]] = None,
+    top_n: int = 10,
+) -> MarketAnalytics:
+    """
+    Compute analytics for a MarketData instance or its to_dict() form.
+
+    Args:
+        market_data: Market data, as a dataclass or serialized dict
+        naics_codes: Company NAICS codes to total as company_naics_tam
+        top_n: Number of NAICS codes, agencies and awardees to keep
+
+    Returns:
+        MarketAnalytics for the awards and agency budgets
+    """
+    if isinstance(market_data, dict):
+        market_data = MarketData.from_dict(market_data)
+
+    # Budgets keyed by agency may leave BudgetInfo.agency blank
+    budgets = [
+        budget if budget.agency else replace(budget, agency=agency)
+        for agency, budget in market_data.agency_budgets.items()
+    ]
+
+    return compute_market_analytics(
+        market_data.recent_awards,
+        budgets=budgets,
+        naics_codes=naics_codes,
+        top_n=top_n,
+    )
+
+
+def budget_trend_slopes(
+    budgets: Iterable[BudgetInfo],
+    use_numpy: bool = True,
+) -> Dict[str, float]:
+    """
+    Fit a linear trend to each agency's total budget.
+
+    Agencies with two or more fiscal years get a least-squares slope; a
+    single year with a YoY change uses the implied change from the prior
+    year. Agencies with neither are omitted.
+
+    Args:
+        budgets: Agency budgets, any number of fiscal years each
+        use_numpy: Use NumPy least squares when available
+
+    Returns:
+        Agency -> slope in $M per fiscal year, steepest growth first
+    """
+    reduce = _NumpyReducer() if use_numpy and NUMPY_AVAILABLE else _PythonReducer()
+
+    by_agency: Dict[str, Dict[int, float]] = {}
+    yoy: Dict[str, BudgetInfo] = {}
+    for budget in budgets:
+        by_agency.setdefault(budget.agency, {})[budget.fiscal_year] = budget.total_budget
+        if budget.yoy_change_percent is not None:
+            latest = yoy.get(budget.agency)
+            if latest is None or budget.fiscal_year >= latest.fiscal_year:
+                yoy[budget.agency] = budget
+
+    slopes: Dict[str, float] = {}
+    for agency, series in by_agency.items():
+        if len(series) >= 2:
+            years = sorted(series)
+            slopes[agency] = reduce.slope(years, [series[y] for y in years])
+        elif agency in yoy:
+            budget = yoy[agency]
+            prior = budget.total_budget / (1 + budget.yoy_change_percent / 100)
+            slopes[agency] = budget.total_budget - prior
+
+    return dict(sorted(slopes.items(), key=lambda item: (-item[1], item[0])))
+
+
+# =============================================================================
+# Columns and Reductions
+# =============================================================================
+
+class _AwardColumns:
+    """Awards as parallel columns, with categorical fields as integer codes."""
+
+    def __init__(self) -> None:
+        self.amounts: List[float] = []
+        self.naics: List[int] = []
+        self.agency: List[int] = []
+        self.awardee: List[int] = []
+        self.year: List[int] = []
+
+        self.naics_keys: List[str] = []
+        self.agency_keys: List[str] = []
+        self.agency_labels: List[str] = []
+        self.awardee_keys: List[str] = []
+        self.awardee_labels: List[str] = []
+        self.year_keys: List[Optional[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @classmethod
+    def from_awards(cls, awards: Iterable[ContractAward]) -> "_AwardColumns":
+        columns = cls()
+        naics_codes: Dict[str, int] = {}
+        agency_codes: Dict[str, int] = {}
+        awardee_codes: Dict[str, int] = {}
+        year_codes: Dict[Optional[int], int] = {}
+
+        for award in awards:
+            columns.amounts.append(float(award.award_amount or 0.0))
+            columns.naics.append(
+                _code(naics_codes, award.naics_code, columns.naics_keys)
+            )
+            columns.agency.append(
+                _code(agency_codes, award.agency.lower(), columns.agency_keys, columns.agency_labels, award.agency)
+            )
+            columns.awardee.append(
+                _code(
+                    awardee_codes,
+                    normalize_contractor(award.awardee_name),
+                    columns.awardee_keys,
+                    columns.awardee_labels,
+                    award.awardee_name,
+                )
+            )
+            columns.year.append(
+                _code(year_codes, award.award_date.year if award.award_date else None, columns.year_keys)
+            )
+
+        return columns
+
+
+def _code(
+    codes: Dict[Any, int],
+    key: Any,
+    keys: List[Any],
+    labels: Optional[List[str]] = None,
+    label: Optional[str] = None,
+) -> int:
+    """Integer code for a categorical value, assigned in first-seen order."""
+    code = codes.get(key)
+    if code is None:
+        code = codes[key] = len(keys)
+        keys.append(key)
+        if labels is not None:
+            labels.append(label)
+    return code
+
+
+def _top(labels: List[str], totals: List[float], top_n: int) -> Dict[str, float]:
+    """Largest totals by label, ties broken by label."""
+    ranked = sorted(zip(labels, totals), key=lambda item: (-item[1], item[0]))
+    return dict(ranked[:top_n])
+
+
+class _PythonReducer:
+    """Reductions over plain lists."""
+
+    def total(self, values: List[float]) -> float:
+        return float(sum(values))
+
+    def group_sums(self, codes: List[int], values: List[float], groups: int) -> List[float]:
+        sums = [0.0] * groups
+        for code, value in zip(codes, values):
+            sums[code] += value
+        return sums
+
+    def distribution(self, values: List[float]) -> ValueDistribution:
+        if not values:
+            return ValueDistribution()
+        ordered = sorted(values)
+        return ValueDistribution(
+            count=len(ordered),
+            total=float(sum(ordered)),
+            mean=sum(ordered) / len(ordered),
+            minimum=ordered[0],
+            maximum=ordered[-1],
+            percentiles={p: _percentile(ordered, p) for p in DISTRIBUTION_PERCENTILES},
+        )
+
+    def slope(self, xs: List[int], ys: List[float]) -> float:
+        n = len(xs)
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        return covariance / variance if variance else 0.0
+
+
+class _NumpyReducer(_PythonReducer):
+    """The same reductions vectorized with NumPy."""
+
+    def total(self, values: List[float]) -> float:
+        return float(np.sum(np.asarray(values, dtype=np.float64)))
+
+    def group_sums(self, codes: List[int], values: List[float], groups: int) -> List[float]:
+        if not codes:
+            return [0.0] * groups
+        sums = np.bincount(
+            np.asarray(codes, dtype=np.intp),
+            weights=np.asarray(values, dtype=np.float64),
+            minlength=groups,
+        )
+        return sums.tolist()
+
+    def distribution(self, values: List[float]) -> ValueDistribution:
+        if not values:
+            return ValueDistribution()
+        array = np.asarray(values, dtype=np.float64)
+        percentiles = np.percentile(array, DISTRIBUTION_PERCENTILES)
+        return ValueDistribution(
+            count=int(array.size),
+            total=float(array.sum()),
+            mean=float(array.mean()),
+            minimum=float(array.min()),
+            maximum=float(array.max()),
+            percentiles={p: float(v) for p, v in zip(DISTRIBUTION_PERCENTILES, percentiles)},
+        )
+
+    def slope(self, xs: List[int], ys: List[float]) -> float:
+        return float(np.polyfit(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64), 1)[0])
+
+
+def _percentile(ordered: List[float], percentile: int) -> float:
+    """Linearly interpolated percentile of a sorted list (NumPy's default method)."""
+    position = (len(ordered) - 1) * percentile / 100
+    lower, upper = floor(position), ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -9,10 +9,13 @@ incumbent performance data used by the Market Analyst agent.
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, TYPE_CHECKING
 import json
 import uuid
 
+if TYPE_CHECKING:
+    from .market_index import MarketDataIndex
+
 
 class BudgetTrend(str, Enum):
     """Agency budget trend indicators."""
@@ -467,35 +470,66 @@ class MarketData:
     data_as_of: Optional[date] = None
     sources: List[str] = field(default_factory=list)
 
+    # Lazily built query index (see index())
+    _index: Optional["MarketDataIndex"] = field(default=None, init=False, repr=False, compare=False)
+
     def get_budget_for_agency(self, agency: str) -> Optional[BudgetInfo]:
         """Get budget info for a specific agency."""
         return self.agency_budgets.get(agency)
 
+    def index(self) -> "MarketDataIndex":
+        """
+        Get the query index over recent awards and forecasts.
+
+        Built on first use and rebuilt when either list is replaced or
+        changes length. Call invalidate_index() after editing entries in place.
+        """
+        from .market_index import MarketDataIndex
+
+        if self._index is None or not self._index.is_current(
+            self.recent_awards, self.forecast_opportunities
+        ):
+            self._index = MarketDataIndex(self.recent_awards, self.forecast_opportunities)
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Discard the query index so it is rebuilt on next use."""
+        self._index = None
+
     def get_awards_by_naics(self, naics_code: str) -> List[ContractAward]:
         """Filter awards by NAICS code."""
-        return [a for a in self.recent_awards if a.naics_code == naics_code]
+        return self.index().awards_by_naics(naics_code)
 
     def get_awards_by_agency(self, agency: str) -> List[ContractAward]:
         """Filter awards by agency."""
-        return [a for a in self.recent_awards if agency.lower() in a.agency.lower()]
+        return self.index().awards_by_agency(agency)
+
+    def get_awards_by_contractor(self, contractor: str) -> List[ContractAward]:
+        """Filter awards by awardee name or UEI."""
+        return self.index().awards_by_contractor(contractor)
 
     def get_forecasts_by_naics(self, naics_code: str) -> List[ForecastOpportunity]:
         """Filter forecasts by NAICS code."""
-        return [f for f in self.forecast_opportunities if f.naics_code == naics_code]
+        return self.index().forecasts_by_naics(naics_code)
 
     def get_forecasts_by_agency(self, agency: str) -> List[ForecastOpportunity]:
         """Filter forecasts by agency."""
-        return [f for f in self.forecast_opportunities if agency.lower() in f.agency.lower()]
+        return self.index().forecasts_by_agency(agency)
 
     def get_upcoming_forecasts(self, days: int = 180) -> List[ForecastOpportunity]:
         """Get forecasts with estimated solicitation within the specified days."""
         from datetime import timedelta
 
         cutoff = date.today() + timedelta(days=days)
-        return [
-            f for f in self.forecast_opportunities
-            if f.estimated_solicitation_date and f.estimated_solicitation_date <= cutoff
-        ]
+        return self.index().forecasts_between(end=cutoff)
+
+    def get_forecasts_between(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[ForecastOpportunity]:
+        """Get forecasts with estimated solicitation within a date range."""
+        return self.index().forecasts_between(start, end)
 
     def get_incumbent_performance(self, contractor: str) -> Optional[IncumbentPerformance]:
         """Get performance data for a specific incumbent."""
@@ -0,0 +1,315 @@
+"""
+Market Data Index
+
+Indexed query layer over contract awards and forecast opportunities.
+Builds hash indexes on NAICS code, lowercase agency and contractor, and
+sorted date indexes for range queries, so Market Analyst lookups stay
+fast over tens of thousands of FPDS/USASpending award rows.
+
+Query results preserve the order of the underlying lists, matching the
+linear-scan behavior of the MarketData filter methods.
+"""
+
+import csv
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+from .market_data import ContractAward, ForecastOpportunity
+
+
+def normalize_contractor(name: Optional[str]) -> str:
+    """Normalize a contractor name for exact-match lookups."""
+    return " ".join((name or "").lower().replace(",", " ").replace(".", " ").split())
+
+
+class MarketDataIndex:
+    """
+    Hash and sorted indexes over award and forecast lists.
+
+    The index holds positions into the lists it was built from; rebuild
+    it (or call MarketData.invalidate_index()) after mutating them.
+    """
+
+    def __init__(
+        self,
+        awards: List[ContractAward],
+        forecasts: List[ForecastOpportunity],
+    ):
+        self._awards = awards
+        self._forecasts = forecasts
+        self._award_count = len(awards)
+        self._forecast_count = len(forecasts)
+
+        # Awards
+        self._award_naics: Dict[str, List[int]] = {}
+        self._award_agency: Dict[str, List[int]] = {}
+        self._award_contractor: Dict[str, List[int]] = {}
+        self._award_dates: List[Tuple[date, int]] = []
+
+        for i, award in enumerate(awards):
+            self._award_naics.setdefault(award.naics_code, []).append(i)
+            self._award_agency.setdefault(award.agency.lower(), []).append(i)
+            contractor_keys = {normalize_contractor(award.awardee_name)}
+            if award.awardee_uei:
+                contractor_keys.add(normalize_contractor(award.awardee_uei))
+            for key in contractor_keys:
+                self._award_contractor.setdefault(key, []).append(i)
+            if award.award_date:
+                self._award_dates.append((award.award_date, i))
+        self._award_dates.sort()
+        self._award_date_keys = [d for d, _ in self._award_dates]
+
+        # Forecasts
+        self._forecast_naics: Dict[Optional[str], List[int]] = {}
+        self._forecast_agency: Dict[str, List[int]] = {}
+        self._forecast_incumbent: Dict[str, List[int]] = {}
+        self._solicitation_dates: List[Tuple[date, int]] = []
+
+        for i, forecast in enumerate(forecasts):
+            self._forecast_naics.setdefault(forecast.naics_code, []).append(i)
+            self._forecast_agency.setdefault(forecast.agency.lower(), []).append(i)
+            if forecast.incumbent:
+                self._forecast_incumbent.setdefault(normalize_contractor(forecast.incumbent), []).append(i)
+            if forecast.estimated_solicitation_date:
+                self._solicitation_dates.append((forecast.estimated_solicitation_date, i))
+        self._solicitation_dates.sort()
+        self._solicitation_date_keys = [d for d, _ in self._solicitation_dates]
+
+        # Memoized agency substring queries: lowercase query -> positions
+        self._award_agency_queries: Dict[str, Tuple[int, ...]] = {}
+        self._forecast_agency_queries: Dict[str, Tuple[int, ...]] = {}
+
+    @property
+    def award_count(self) -> int:
+        return self._award_count
+
+    @property
+    def forecast_count(self) -> int:
+        return self._forecast_count
+
+    def is_current(
+        self,
+        awards: List[ContractAward],
+        forecasts: List[ForecastOpportunity],
+    ) -> bool:
+        """Check whether the index was built from these lists at their current size."""
+        return (
+            awards is self._awards
+            and forecasts is self._forecasts
+            and len(awards) == self.award_count
+            and len(forecasts) == self.forecast_count
+        )
+
+    # =========================================================================
+    # Award Queries
+    # =========================================================================
+
+    def awards_by_naics(self, naics_code: str) -> List[ContractAward]:
+        """Awards with an exact NAICS code match."""
+        return [self._awards[i] for i in self._award_naics.get(naics_code, ())]
+
+    def awards_by_agency(self, agency: str) -> List[ContractAward]:
+        """Awards whose agency contains the query (case-insensitive)."""
+        positions = _agency_positions(agency, self._award_agency, self._award_agency_queries)
+        return [self._awards[i] for i in positions]
+
+    def awards_by_contractor(self, contractor: str) -> List[ContractAward]:
+        """Awards to a contractor, matched by normalized name or UEI."""
+        return [
+            self._awards[i]
+            for i in self._award_contractor.get(normalize_contractor(contractor), ())
+        ]
+
+    def awards_between(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[ContractAward]:
+        """Awards dated within [start, end], in list order."""
+        positions = _range_positions(self._award_dates, self._award_date_keys, start, end)
+        return [self._awards[i] for i in positions]
+
+    # =========================================================================
+    # Forecast Queries
+    # =========================================================================
+
+    def forecasts_by_naics(self, naics_code: str) -> List[ForecastOpportunity]:
+        """Forecasts with an exact NAICS code match."""
+        return [self._forecasts[i] for i in self._forecast_naics.get(naics_code, ())]
+
+    def forecasts_by_agency(self, agency: str) -> List[ForecastOpportunity]:
+        """Forecasts whose agency contains the query (case-insensitive)."""
+        positions = _agency_positions(agency, self._forecast_agency, self._forecast_agency_queries)
+        return [self._forecasts[i] for i in positions]
+
+    def forecasts_by_incumbent(self, contractor: str) -> List[ForecastOpportunity]:
+        """Forecasts where the contractor is the incumbent."""
+        return [
+            self._forecasts[i]
+            for i in self._forecast_incumbent.get(normalize_contractor(contractor), ())
+        ]
+
+    def forecasts_between(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> List[ForecastOpportunity]:
+        """Forecasts with estimated solicitation within [start, end], in list order."""
+        positions = _range_positions(
+            self._solicitation_dates, self._solicitation_date_keys, start, end
+        )
+        return [self._forecasts[i] for i in positions]
+
+
+def _agency_positions(
+    agency: str,
+    postings: Dict[str, List[int]],
+    memo: Dict[str, Tuple[int, ...]],
+) -> Tuple[int, ...]:
+    """
+    Resolve a substring agency query against the distinct agency keys.
+
+    There are far fewer distinct agencies than rows, so scanning keys and
+    merging their postings is much cheaper than scanning every row.
+    """
+    query = agency.lower()
+    positions = memo.get(query)
+    if positions is None:
+        matched: List[int] = []
+        for key, rows in postings.items():
+            if query in key:
+                matched.extend(rows)
+        positions = tuple(sorted(matched))
+        memo[query] = positions
+    return positions
+
+
+def _range_positions(
+    dated: List[Tuple[date, int]],
+    keys: List[date],
+    start: Optional[date],
+    end: Optional[date],
+) -> List[int]:
+    """Positions of rows dated within [start, end], in list order."""
+    lo = bisect_left(keys, start) if start else 0
+    hi = bisect_right(keys, end) if end else len(keys)
+    return sorted(i for _, i in dated[lo:hi])
+
+
+# =============================================================================
+# Bulk Loading
+# =============================================================================
+
+# Field aliases for FPDS / USASpending award exports
+_AWARD_COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "contract_number": ("contract_number", "award_id_piid", "piid", "award_id"),
+    "title": ("title", "award_description", "description_of_requirement"),
+    "award_date": ("award_date", "action_date", "date_signed", "period_of_performance_start_date"),
+    "award_amount": ("award_amount", "total_dollars_obligated", "federal_action_obligation", "dollars_obligated"),
+    "ceiling_amount": ("ceiling_amount", "potential_total_value_of_award", "base_and_all_options_value"),
+    "contract_type": ("contract_type", "type_of_contract_pricing", "type_of_contract_pricing_code"),
+    "agency": ("agency", "awarding_agency_name", "contracting_agency_name"),
+    "sub_agency": ("sub_agency", "awarding_sub_agency_name"),
+    "contracting_office": ("contracting_office", "awarding_office_name"),
+    "awardee_name": ("awardee_name", "recipient_name", "vendor_name"),
+    "awardee_uei": ("awardee_uei", "recipient_uei", "vendor_uei"),
+    "awardee_cage": ("awardee_cage", "cage_code"),
+    "naics_code": ("naics_code", "naics"),
+    "psc_code": ("psc_code", "product_or_service_code"),
+    "set_aside": ("set_aside", "type_of_set_aside"),
+    "place_of_performance": ("place_of_performance", "primary_place_of_performance_state_code"),
+    "period_of_performance": ("period_of_performance", "period_of_performance_current_end_date"),
+}
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        pass
+    for fmt in ("%m/%d/%Y", "%m/%d/%y"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _parse_amount(value: Any) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    try:
+        return float(str(value).replace("$", "").replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _award_from_row(row: Dict[str, Any]) -> ContractAward:
+    """Build a ContractAward from an export row, whatever its column naming."""
+    fields: Dict[str, Any] = {}
+    for name, aliases in _AWARD_COLUMN_ALIASES.items():
+        for alias in aliases:
+            value = row.get(alias)
+            if value not in (None, ""):
+                fields[name] = value
+                break
+
+    award = ContractAward(
+        contract_number=str(fields.get("contract_number", "")),
+        title=str(fields.get("title", "")),
+        award_date=_parse_date(fields.get("award_date")),
+        award_amount=_parse_amount(fields.get("award_amount")) or 0.0,
+        ceiling_amount=_parse_amount(fields.get("ceiling_amount")),
+        contract_type=str(fields.get("contract_type", "")),
+        agency=str(fields.get("agency", "")),
+        sub_agency=fields.get("sub_agency"),
+        contracting_office=fields.get("contracting_office"),
+        awardee_name=str(fields.get("awardee_name", "")),
+        awardee_uei=fields.get("awardee_uei"),
+        awardee_cage=fields.get("awardee_cage"),
+        naics_code=str(fields.get("naics_code", "")),
+        psc_code=fields.get("psc_code"),
+        set_aside=fields.get("set_aside"),
+        place_of_performance=fields.get("place_of_performance"),
+        period_of_performance=fields.get("period_of_performance"),
+    )
+    if row.get("id"):
+        award.id = str(row["id"])
+    return award
+
+
+def load_contract_awards(path: Union[str, Path]) -> List[ContractAward]:
+    """
+    Load contract awards from a local bulk export.
+
+    Supports CSV with FPDS/USASpending or ContractAward column names,
+    JSON Lines (one award per line), and JSON arrays.
+
+    Args:
+        path: Path to a .csv, .jsonl or .json file
+
+    Returns:
+        List of ContractAward in file order
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return [_award_from_row(row) for row in csv.DictReader(f)]
+
+    with open(path, encoding="utf-8") as f:
+        if suffix == ".jsonl":
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = json.load(f)
+
+    return [_award_from_row(row) for row in rows]
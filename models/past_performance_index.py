@@ -0,0 +1,368 @@
+"""
+Past Performance Index
+
+Per-profile index over past performance records. Builds hash indexes on
+NAICS code and normalized agency and a value-sorted array, so relevance
+filters only touch the records that can match, and scores the records
+reached through those indexes to pick the most relevant citations for an
+opportunity.
+
+Records may be PastPerformance dataclasses, past performance dicts as
+stored on profiles, or plain strings (which can only be matched by
+recency padding). Filter results preserve the order of the source list.
+"""
+
+import heapq
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+# Relevance weights, summing to 1.0
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "naics": 0.4,
+    "agency": 0.3,
+    "recency": 0.2,
+    "value": 0.1,
+}
+
+# Completed contracts lose half their recency score every this many years
+RECENCY_HALF_LIFE_YEARS = 3.0
+
+
+def normalize_agency(name: Optional[str]) -> str:
+    """Normalize an agency name for matching."""
+    return " ".join((name or "").lower().replace(",", " ").replace(".", " ").split())
+
+
+def _field(record: Any, *names: str) -> Any:
+    """Get the first non-empty field of a dataclass or dict record."""
+    for name in names:
+        value = record.get(name) if isinstance(record, dict) else getattr(record, name, None)
+        if value not in (None, "", [], ()):
+            return value
+    return None
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _as_amount(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace("$", "").replace(",", ""))
+        except ValueError:
+            return None
+    return None
+
+
+def _naics_codes(record: Any) -> Set[str]:
+    codes = _field(record, "naics_codes") or ()
+    if isinstance(codes, str):
+        codes = (codes,)
+    result = {code.get("code", "") if isinstance(code, dict) else str(code) for code in codes}
+    single = _field(record, "naics_code")
+    if single:
+        result.add(str(single))
+    result.discard("")
+    return result
+
+
+@dataclass
+class ScoredPastPerformance:
+    """A past performance record with its relevance score and components."""
+
+    record: Any
+    position: int  # Position in the source list
+    score: float
+    naics_overlap: float = 0.0
+    agency_match: float = 0.0
+    recency: float = 0.0
+    value_similarity: float = 0.0
+
+    def to_dict(self) -> dict:
+        record = self.record
+        return {
+            "record": record.to_dict() if hasattr(record, "to_dict") else record,
+            "position": self.position,
+            "score": self.score,
+            "naics_overlap": self.naics_overlap,
+            "agency_match": self.agency_match,
+            "recency": self.recency,
+            "value_similarity": self.value_similarity,
+        }
+
+
+@dataclass
+class _Entry:
+    """Fields of one record, extracted once at build time."""
+
+    naics: Set[str] = field(default_factory=set)
+    agency: str = ""
+    value: Optional[float] = None
+    recency: float = 0.0
+
+
+class PastPerformanceIndex:
+    """
+    Hash and sorted indexes over one profile's past performance records.
+
+    The index holds positions into the list it was built from; rebuild it
+    after mutating the list.
+    """
+
+    def __init__(self, records: Sequence[Any], as_of: Optional[date] = None):
+        """
+        Build the index.
+
+        Args:
+            records: PastPerformance objects, dicts or strings
+            as_of: Date recency is measured from (default: today)
+        """
+        self._records = records
+        self._count = len(records)
+        self.as_of = as_of or date.today()
+
+        self._entries: List[_Entry] = []
+        self._naics: Dict[str, List[int]] = {}
+        self._agency: Dict[str, List[int]] = {}
+        self._values: List[Tuple[float, int]] = []
+
+        for i, record in enumerate(records):
+            entry = _Entry()
+            if not isinstance(record, str):
+                entry.naics = _naics_codes(record)
+                entry.agency = normalize_agency(_field(record, "agency", "client"))
+                entry.value = _as_amount(_field(record, "contract_value", "value"))
+                entry.recency = self._recency(
+                    _as_date(_field(record, "period_of_performance_start", "start_date")),
+                    _as_date(_field(record, "period_of_performance_end", "end_date")),
+                )
+            self._entries.append(entry)
+
+            for code in entry.naics:
+                self._naics.setdefault(code, []).append(i)
+            if entry.agency:
+                self._agency.setdefault(entry.agency, []).append(i)
+            if entry.value is not None:
+                self._values.append((entry.value, i))
+
+        self._values.sort()
+        self._value_keys = [v for v, _ in self._values]
+        # Positions ordered most recent first, for padding and unscored queries
+        self._by_recency = sorted(range(self._count), key=lambda i: -self._entries[i].recency)
+        # Memoized agency queries: (normalized query, either direction) -> positions
+        self._agency_queries: Dict[Tuple[str, bool], Tuple[int, ...]] = {}
+
+    def _recency(self, start: Optional[date], end: Optional[date]) -> float:
+        """1.0 for ongoing work, halving every RECENCY_HALF_LIFE_YEARS after completion."""
+        if end is None:
+            return 1.0 if start is not None else 0.0
+        years_since = (self.as_of - end).days / 365.25
+        if years_since <= 0:
+            return 1.0
+        return 0.5 ** (years_since / RECENCY_HALF_LIFE_YEARS)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def is_current(self, records: Sequence[Any]) -> bool:
+        """Check whether the index was built from this list at its current size."""
+        return records is self._records and len(records) == self._count
+
+    # =========================================================================
+    # Filters
+    # =========================================================================
+
+    def by_naics(self, naics_codes: Iterable[str]) -> List[Any]:
+        """Records sharing any of the NAICS codes, in list order."""
+        return [self._records[i] for i in self._naics_positions(naics_codes)]
+
+    def by_agency(self, agency: str) -> List[Any]:
+        """Records whose agency contains the query (normalized), in list order."""
+        return [self._records[i] for i in self._agency_positions(agency)]
+
+    def with_min_value(self, min_value: float) -> List[Any]:
+        """Records worth at least min_value, in list order."""
+        return [self._records[i] for i in self._min_value_positions(min_value)]
+
+    def filter(
+        self,
+        naics_codes: Optional[Iterable[str]] = None,
+        agency: Optional[str] = None,
+        min_value: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Records matching every given criterion, in list order.
+
+        Args:
+            naics_codes: Keep records sharing any of these codes
+            agency: Keep records whose agency contains this name
+            min_value: Keep records worth at least this much
+
+        Returns:
+            Matching records
+        """
+        naics_codes = list(naics_codes or ())
+        criteria: List[Iterable[int]] = []
+        if naics_codes:
+            criteria.append(self._naics_positions(naics_codes))
+        if agency:
+            criteria.append(self._agency_positions(agency))
+        if min_value:
+            criteria.append(self._min_value_positions(min_value))
+        if not criteria:
+            return list(self._records)
+
+        # Intersect starting from the smallest candidate set
+        criteria.sort(key=len)
+        positions = set(criteria[0])
+        for other in criteria[1:]:
+            positions.intersection_update(other)
+        return [self._records[i] for i in sorted(positions)]
+
+    def _naics_positions(self, naics_codes: Iterable[str]) -> List[int]:
+        positions: Set[int] = set()
+        for code in naics_codes:
+            positions.update(self._naics.get(code, ()))
+        return sorted(positions)
+
+    def _agency_positions(self, agency: str, either_direction: bool = False) -> Tuple[int, ...]:
+        """
+        Resolve an agency query against the distinct agency keys.
+
+        Args:
+            agency: Agency name
+            either_direction: Also match records whose agency is contained
+                in the query (e.g. "Veterans Affairs" for "Department of
+                Veterans Affairs")
+        """
+        query = normalize_agency(agency)
+        if not query:
+            return ()
+        memo_key = (query, either_direction)
+        positions = self._agency_queries.get(memo_key)
+        if positions is None:
+            matched: List[int] = []
+            for key, rows in self._agency.items():
+                if query in key or (either_direction and key in query):
+                    matched.extend(rows)
+            positions = tuple(sorted(matched))
+            self._agency_queries[memo_key] = positions
+        return positions
+
+    def _min_value_positions(self, min_value: float) -> List[int]:
+        lo = bisect_left(self._value_keys, min_value)
+        return sorted(i for _, i in self._values[lo:])
+
+    def _nearest_value_positions(self, value: float, count: int) -> List[int]:
+        """Positions of the count records closest in value, by ratio."""
+        keys = self._value_keys
+        hi = bisect_left(keys, value)
+        lo = hi - 1
+        positions: List[int] = []
+        while len(positions) < count and (lo >= 0 or hi < len(keys)):
+            below = keys[lo] if lo >= 0 else None
+            above = keys[hi] if hi < len(keys) else None
+            if above is None or (below is not None and below > 0 and value / below <= above / value):
+                positions.append(self._values[lo][1])
+                lo -= 1
+            else:
+                positions.append(self._values[hi][1])
+                hi += 1
+        return positions
+
+    # =========================================================================
+    # Relevance Scoring
+    # =========================================================================
+
+    def top_k(
+        self,
+        k: int = 5,
+        naics_codes: Optional[Iterable[str]] = None,
+        agency: Optional[str] = None,
+        value: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> List[ScoredPastPerformance]:
+        """
+        Score records against an opportunity and return the k most relevant.
+
+        Only records reached through the NAICS and agency indexes and the
+        k nearest by value are scored; when fewer than k of those exist the
+        result is padded with the most recent remaining records, so callers
+        always get up to k citations.
+
+        Args:
+            k: Number of records to return
+            naics_codes: Opportunity NAICS codes
+            agency: Opportunity agency name
+            value: Opportunity estimated value
+            weights: Overrides for DEFAULT_WEIGHTS
+
+        Returns:
+            Scored records, most relevant first
+        """
+        if k <= 0 or not self._count:
+            return []
+
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        query_naics = {code for code in (naics_codes or ()) if code}
+        has_value = bool(value and value > 0)
+
+        candidates: Set[int] = set(self._naics_positions(query_naics))
+        agency_hits = set(self._agency_positions(agency, either_direction=True)) if agency else set()
+        candidates.update(agency_hits)
+        if has_value:
+            candidates.update(self._nearest_value_positions(value, k))
+        if len(candidates) < k:
+            for i in self._by_recency:
+                if len(candidates) >= k:
+                    break
+                candidates.add(i)
+
+        scored = []
+        for i in candidates:
+            entry = self._entries[i]
+            naics_overlap = (
+                len(entry.naics & query_naics) / len(query_naics) if query_naics else 0.0
+            )
+            agency_match = 1.0 if i in agency_hits else 0.0
+            value_similarity = 0.0
+            if has_value and entry.value and entry.value > 0:
+                value_similarity = max(0.0, 1.0 - abs(math.log10(entry.value / value)))
+            score = (
+                weights["naics"] * naics_overlap
+                + weights["agency"] * agency_match
+                + weights["recency"] * entry.recency
+                + weights["value"] * value_similarity
+            )
+            scored.append(ScoredPastPerformance(
+                record=self._records[i],
+                position=i,
+                score=score,
+                naics_overlap=naics_overlap,
+                agency_match=agency_match,
+                recency=entry.recency,
+                value_similarity=value_similarity,
+            ))
+
+        # Ties keep list order
+        return heapq.nlargest(k, scored, key=lambda s: (s.score, -s.position))
+
+    def most_relevant(self, k: int = 5, **query: Any) -> List[Any]:
+        """The records of top_k(), most relevant first."""
+        return [s.record for s in self.top_k(k, **query)]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Compile an SBA size standards CSV into the memory-mapped lookup table."""
+
+import argparse
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from agents.blue.rules.size_standard_table import (
+    DEFAULT_SIZE_TABLE_PATH,
+    SizeStandardTable,
+)
+
+
+def main():
+    """Compile the size standards table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "csv_paths",
+        nargs="+",
+        help="SBA table(s) of size standards exported as CSV; include one per table version",
+    )
+    parser.add_argument(
+        "--output",
+        default=os.getenv("SBA_SIZE_STANDARDS_PATH", DEFAULT_SIZE_TABLE_PATH),
+        help="Compiled table path (default: SBA_SIZE_STANDARDS_PATH or %(default)s)",
+    )
+    parser.add_argument(
+        "--effective-date",
+        type=date.fromisoformat,
+        default=None,
+        help="Effective date (YYYY-MM-DD) for rows without an effective_date column",
+    )
+    args = parser.parse_args()
+
+    print(f"Compiling {', '.join(args.csv_paths)} -> {args.output}")
+    count = SizeStandardTable.compile(args.csv_paths, args.output, args.effective_date)
+    print(f"Wrote {count} size standard records")
+
+
+if __name__ == "__main__":
+    main()
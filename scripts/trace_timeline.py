@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""Convert a JSONL trace file into a timeline for chrome://tracing or Perfetto."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from comms.tracing import load_spans, to_chrome_trace
+
+
+def main():
+    """Write the timeline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace_file", help="JSONL file written by the tracer (TRACE_FILE)")
+    parser.add_argument("--output", "-o", default="timeline.json", help="Timeline JSON to write")
+    parser.add_argument("--trace-id", help="Only include this trace (a generation request id)")
+    args = parser.parse_args()
+
+    spans = load_spans(args.trace_file, args.trace_id)
+    if not spans:
+        print(f"No spans found in {args.trace_file}")
+        sys.exit(1)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(to_chrome_trace(spans), f)
+    print(f"Wrote {len(spans)} spans to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,14 +10,17 @@ from server.models.schemas import (
     AgentInsightsSchema,
     AgentInsightsSummarySchema,
     ConfidenceReportSchema,
+    DebateLogResponse,
     DocumentContentSchema,
     DocumentDuplicateRequest,
     DocumentListItemSchema,
     DocumentListResponse,
     DocumentResponse,
     DocumentStatusUpdate,
+    DocumentVersionsResponse,
     ExportRequest,
     GenerationMetricsSchema,
+    LLMUsageResponse,
     RedTeamReportSchema,
     ShareLinkAccessRequest,
     ShareLinkCreateRequest,
@@ -30,14 +33,24 @@ from server.services.export import ExportService, ShareLinkService
 router = APIRouter()
 
 
-def _build_document_response(document) -> DocumentResponse:
-    """Build a full DocumentResponse from a database Document model."""
+def _build_document_response(
+    document,
+    stored_content: Optional[dict],
+    stored_report: Optional[dict],
+    debate_log: list[dict],
+) -> DocumentResponse:
+    """
+    Build a full DocumentResponse from a database Document model.
+
+    stored_content and stored_report are the document's content and red
+    team report with their sections and exchanges (see DocumentsService).
+    """
     # Parse content if available
     content = None
-    if document.content:
+    if stored_content:
         # Transform sections from stored format to API schema format
         # Stored format uses "name" field, API schema expects "id" and "title"
-        raw_sections = document.content.get("sections", [])
+        raw_sections = stored_content.get("sections", [])
         transformed_sections = []
         for idx, section in enumerate(raw_sections):
             # Use name as title, generate id from index if not present
@@ -61,7 +74,7 @@ def _build_document_response(document) -> DocumentResponse:
         content = DocumentContentSchema(
             id=document.id,
             sections=transformed_sections,
-            overallConfidence=document.content.get("overallConfidence", 0.0),
+            overallConfidence=stored_content.get("overallConfidence", 0.0),
             updatedAt=document.updated_at,
         )
 
@@ -103,9 +116,9 @@ def _build_document_response(document) -> DocumentResponse:
 
     # Parse red team report if available
     red_team_report = None
-    if document.red_team_report:
+    if stored_report:
         # Handle summary - it can be a string or a dict with statistics
-        raw_summary = document.red_team_report.get("summary", "")
+        raw_summary = stored_report.get("summary", "")
         if isinstance(raw_summary, dict):
             # Convert summary dict to a readable string
             total_critiques = raw_summary.get("total_critiques", 0)
@@ -120,7 +133,7 @@ def _build_document_response(document) -> DocumentResponse:
             summary_text = raw_summary
 
         # Build entries from exchanges (critique/response pairs)
-        exchanges = document.red_team_report.get("exchanges", [])
+        exchanges = stored_report.get("exchanges", [])
         entries = []
         for exchange in exchanges:
             critique = exchange.get("critique", {})
@@ -128,7 +141,7 @@ def _build_document_response(document) -> DocumentResponse:
             if critique:
                 entries.append({
                     "id": critique.get("id", ""),
-                    "round": critique.get("round_number", 1),
+                    "round": critique.get("round_number") or 1,
                     "phase": "red-attack",
                     "agentId": critique.get("agent", "Unknown"),
                     "type": "critique",
@@ -138,24 +151,24 @@ def _build_document_response(document) -> DocumentResponse:
                              else "acknowledged" if response and response.get("disposition") == "Acknowledge"
                              else "pending",
                     "content": f"[{critique.get('severity', 'minor').upper()}] {critique.get('title', '')}: {critique.get('argument', '')}",
-                    "timestamp": document.red_team_report.get("generated_at", document.updated_at.isoformat() if document.updated_at else ""),
+                    "timestamp": stored_report.get("generated_at", document.updated_at.isoformat() if document.updated_at else ""),
                 })
                 if response:
                     entries.append({
                         "id": response.get("id", ""),
-                        "round": 1,
+                        "round": response.get("round_number") or 1,
                         "phase": "blue-defense",
                         "agentId": response.get("agent", "Unknown"),
                         "type": "response",
                         "content": f"[{response.get('disposition', 'Acknowledge')}] {response.get('summary', '')}",
-                        "timestamp": document.red_team_report.get("generated_at", document.updated_at.isoformat() if document.updated_at else ""),
+                        "timestamp": stored_report.get("generated_at", document.updated_at.isoformat() if document.updated_at else ""),
                     })
 
         red_team_report = RedTeamReportSchema(
             entries=entries,
             summary=summary_text,
-            critiques_by_severity=document.red_team_report.get("critiques_by_severity", {}),
-            responses_by_disposition=document.red_team_report.get("responses_by_disposition", {}),
+            critiques_by_severity=stored_report.get("critiques_by_severity", {}),
+            responses_by_disposition=stored_report.get("responses_by_disposition", {}),
         )
 
     # Parse metrics if available
@@ -165,8 +178,8 @@ def _build_document_response(document) -> DocumentResponse:
 
     # Parse agent insights if available (stored in document.content by synthesizer)
     agent_insights = None
-    if document.content and "agent_insights" in document.content:
-        raw_insights = document.content["agent_insights"]
+    if stored_content and "agent_insights" in stored_content:
+        raw_insights = stored_content["agent_insights"]
         if raw_insights:
             # Build the summary schema
             raw_summary = raw_insights.get("summary", {})
@@ -186,7 +199,7 @@ def _build_document_response(document) -> DocumentResponse:
         content=content,
         confidence=confidence,
         redTeamReport=red_team_report,
-        debateLog=document.debate_log or [],
+        debateLog=debate_log,
         metrics=metrics,
         requiresHumanReview=document.requires_human_review,
         agentInsights=agent_insights,
@@ -229,6 +242,66 @@ async def get_document(
 ) -> DocumentResponse:
     """Get a document by ID with full output data."""
     service = DocumentsService(db)
+    document = await service.get_by_id(document_id, details=True)
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "DOCUMENT_NOT_FOUND",
+                "message": f"Document not found: {document_id}",
+                "details": {"documentId": document_id},
+            },
+        )
+
+    debate_log, _ = await service.get_debate_log(document_id)
+
+    return _build_document_response(
+        document,
+        await service.get_content(document),
+        await service.get_red_team_report(document),
+        debate_log,
+    )
+
+
+@router.get("/{document_id}/llm-usage", response_model=LLMUsageResponse)
+async def get_document_llm_usage(
+    document_id: str,
+    db: DbSession,
+) -> LLMUsageResponse:
+    """Get every LLM call made while generating a document, with cost and latency totals."""
+    service = DocumentsService(db)
+    document = await service.get_by_id(document_id, details=True)
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "DOCUMENT_NOT_FOUND",
+                "message": f"Document not found: {document_id}",
+                "details": {"documentId": document_id},
+            },
+        )
+
+    # Documents generated before the ledger existed have no usage recorded
+    ledger = (document.metrics or {}).get("llm_usage") or {}
+    return LLMUsageResponse(
+        document_id=document.id,
+        calls=ledger.get("calls", []),
+        summary=ledger.get("summary", {}),
+    )
+
+
+@router.get("/{document_id}/debate-log", response_model=DebateLogResponse)
+async def get_document_debate_log(
+    document_id: str,
+    db: DbSession,
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum number of entries"),
+    offset: int = Query(default=0, ge=0, description="Pagination offset"),
+    round: Optional[int] = Query(default=None, ge=0, description="Only entries from this round"),
+) -> DebateLogResponse:
+    """Get a page of a document's debate log, in log order."""
+    service = DocumentsService(db)
     document = await service.get_by_id(document_id)
 
     if not document:
@@ -241,7 +314,44 @@ async def get_document(
             },
         )
 
-    return _build_document_response(document)
+    entries, total = await service.get_debate_log(
+        document_id, limit=limit, offset=offset, round_number=round
+    )
+    return DebateLogResponse(
+        documentId=document_id,
+        entries=entries,
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("/{document_id}/versions", response_model=DocumentVersionsResponse)
+async def get_document_versions(
+    document_id: str,
+    db: DbSession,
+    round: Optional[int] = Query(default=None, ge=0, description="Only versions from this round"),
+) -> DocumentVersionsResponse:
+    """Get the snapshots of a document's sections recorded after each round."""
+    service = DocumentsService(db)
+    document = await service.get_by_id(document_id)
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "code": "DOCUMENT_NOT_FOUND",
+                "message": f"Document not found: {document_id}",
+                "details": {"documentId": document_id},
+            },
+        )
+
+    versions = await service.get_versions(document_id, round_number=round)
+    return DocumentVersionsResponse(
+        documentId=document_id,
+        versions=versions,
+        total=len(versions),
+    )
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -354,7 +464,7 @@ async def export_document(
     """
     # Get the document
     documents_service = DocumentsService(db)
-    document = await documents_service.get_by_id(document_id)
+    document = await documents_service.get_by_id(document_id, details=True)
 
     if not document:
         raise HTTPException(
@@ -557,7 +667,7 @@ async def get_shared_document(
 
     # Get the document
     documents_service = DocumentsService(db)
-    document = await documents_service.get_by_id(share_link.document_id)
+    document = await documents_service.get_by_id(share_link.document_id, details=True)
 
     if not document:
         raise HTTPException(
@@ -569,4 +679,11 @@ async def get_shared_document(
             },
         )
 
-    return _build_document_response(document)
+    debate_log, _ = await documents_service.get_debate_log(document.id)
+
+    return _build_document_response(
+        document,
+        await documents_service.get_content(document),
+        await documents_service.get_red_team_report(document),
+        debate_log,
+    )
@@ -6,7 +6,8 @@ from typing import Literal
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
-from server.config import settings, ANTHROPIC_MODELS, GROQ_MODELS
+from agents.config import PROVIDER_API_KEY_ENV_VARS
+from server.config import settings, ANTHROPIC_MODELS, GROQ_MODELS, SIMULATED_MODELS
 
 # Import configure_llm_settings to update agent system when settings change
 try:
@@ -19,10 +20,16 @@ except ImportError:
 
 router = APIRouter()
 
+PROVIDER_MODELS = {
+    "anthropic": ANTHROPIC_MODELS,
+    "groq": GROQ_MODELS,
+    "simulated": SIMULATED_MODELS,
+}
+
 
 class LLMSettingsResponse(BaseModel):
     """Response model for LLM settings."""
-    provider: Literal["anthropic", "groq"]
+    provider: Literal["anthropic", "groq", "simulated"]
     model: str
     available_providers: list[dict]
     anthropic_configured: bool
@@ -31,7 +38,7 @@ class LLMSettingsResponse(BaseModel):
 
 class LLMSettingsUpdate(BaseModel):
     """Request model for updating LLM settings."""
-    provider: Literal["anthropic", "groq"]
+    provider: Literal["anthropic", "groq", "simulated"]
     model: str
 
 
@@ -39,6 +46,7 @@ class ModelsResponse(BaseModel):
     """Response model for available models."""
     anthropic: list[str]
     groq: list[str]
+    simulated: list[str]
 
 
 @router.get("", response_model=LLMSettingsResponse)
@@ -65,6 +73,12 @@ async def get_llm_settings() -> LLMSettingsResponse:
             "configured": groq_configured,
             "models": GROQ_MODELS,
         },
+        {
+            "id": "simulated",
+            "name": "Simulated (offline)",
+            "configured": True,
+            "models": SIMULATED_MODELS,
+        },
     ]
 
     return LLMSettingsResponse(
@@ -85,17 +99,17 @@ async def update_llm_settings(data: LLMSettingsUpdate) -> LLMSettingsResponse:
     For persistent changes, update the .env file.
     """
     # Validate provider
-    if data.provider not in ("anthropic", "groq"):
+    if data.provider not in PROVIDER_MODELS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "code": "INVALID_PROVIDER",
-                "message": f"Invalid provider: {data.provider}. Must be 'anthropic' or 'groq'.",
+                "message": f"Invalid provider: {data.provider}. Must be 'anthropic', 'groq' or 'simulated'.",
             },
         )
 
     # Validate model for the selected provider
-    valid_models = ANTHROPIC_MODELS if data.provider == "anthropic" else GROQ_MODELS
+    valid_models = PROVIDER_MODELS[data.provider]
     if data.model not in valid_models:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -107,8 +121,8 @@ async def update_llm_settings(data: LLMSettingsUpdate) -> LLMSettingsResponse:
         )
 
     # Check if API key is configured for the selected provider
-    api_key_var = "ANTHROPIC_API_KEY" if data.provider == "anthropic" else "GROQ_API_KEY"
-    if not os.getenv(api_key_var):
+    api_key_var = PROVIDER_API_KEY_ENV_VARS[data.provider]
+    if api_key_var and not os.getenv(api_key_var):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -123,11 +137,10 @@ async def update_llm_settings(data: LLMSettingsUpdate) -> LLMSettingsResponse:
 
     # Update agent system's LLM settings cache so agents use the new provider/model
     if AGENTS_AVAILABLE and configure_llm_settings:
-        api_key_env_var = "ANTHROPIC_API_KEY" if data.provider == "anthropic" else "GROQ_API_KEY"
         configure_llm_settings(
             provider=data.provider,
             model=data.model,
-            api_key_env_var=api_key_env_var,
+            api_key_env_var=api_key_var,
         )
 
     # Return updated settings
@@ -140,4 +153,5 @@ async def get_available_models() -> ModelsResponse:
     return ModelsResponse(
         anthropic=ANTHROPIC_MODELS,
         groq=GROQ_MODELS,
+        simulated=SIMULATED_MODELS,
     )
@@ -22,6 +22,11 @@ GROQ_MODELS = [
     "gemma2-9b-it",
 ]
 
+# The simulated provider serves each agent's mock responses offline
+SIMULATED_MODELS = [
+    "simulated",
+]
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -38,7 +43,7 @@ class Settings(BaseSettings):
     groq_api_key: str | None = None
 
     # LLM Provider Selection
-    llm_provider: Literal["anthropic", "groq"] = "anthropic"
+    llm_provider: Literal["anthropic", "groq", "simulated"] = "anthropic"
     llm_model: str = "claude-haiku-4-5-20251001"
 
     # Database
@@ -52,6 +57,9 @@ class Settings(BaseSettings):
     max_concurrent_generations: int = 5
     generation_timeout_seconds: int = 600
 
+    # Tracing (JSONL span file; disabled when unset)
+    trace_file: str | None = None
+
     # Export
     export_temp_dir: str = "./data/exports"
     max_export_size_mb: int = 50
@@ -71,9 +79,10 @@ def get_llm_settings() -> dict:
 
     Returns a dictionary with provider, model, and API key env var.
     """
-    api_key_env_var = (
-        "GROQ_API_KEY" if settings.llm_provider == "groq" else "ANTHROPIC_API_KEY"
-    )
+    api_key_env_var = {
+        "groq": "GROQ_API_KEY",
+        "simulated": "",
+    }.get(settings.llm_provider, "ANTHROPIC_API_KEY")
     return {
         "provider": settings.llm_provider,
         "model": settings.llm_model,
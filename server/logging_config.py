@@ -12,6 +12,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 import json
 
+from comms.tracing import current_span
 from server.config import settings
 
 
@@ -51,6 +52,12 @@ class StructuredFormatter(logging.Formatter):
         if connection_id:
             log_data["connection_id"] = connection_id
 
+        # Correlate with the active trace span
+        active_span = current_span()
+        if active_span is not None:
+            log_data["trace_id"] = active_span.trace_id
+            log_data["span_id"] = active_span.span_id
+
         # Add location info for errors
         if record.levelno >= logging.ERROR:
             log_data["location"] = {
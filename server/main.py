@@ -28,6 +28,7 @@ from server.websocket.handler import (
 
 # Import agent registration
 from agents.registration import register_all_agents
+from comms.tracing import configure_tracing
 
 # Setup structured logging
 setup_logging(
@@ -35,6 +36,10 @@ setup_logging(
     json_output=not settings.debug,  # JSON in production, human-readable in dev
 )
 
+# Record generation spans (view with: python scripts/trace_timeline.py <file>)
+if settings.trace_file:
+    configure_tracing(settings.trace_file)
+
 logger = logging.getLogger(__name__)
 
 # Create WebSocket handler with the global connection manager
@@ -5,17 +5,20 @@ Provides:
 - Request timing
 - Request ID tracking
 - Error rate monitoring
+- Latency histograms and Prometheus export
 """
 
 import logging
+import math
 import time
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Callable, Literal, Optional
 
 from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
@@ -24,6 +27,8 @@ from server.logging_config import set_request_context, clear_request_context
 
 logger = logging.getLogger(__name__)
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 # ============================================================================
 # Request ID Middleware
@@ -151,20 +156,164 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         return request.client.host if request.client else "unknown"
 
 
+# ============================================================================
+# Histograms
+# ============================================================================
+
+
+class LatencyHistogram:
+    """
+    Fixed-memory streaming histogram of durations in milliseconds.
+
+    Durations are counted in log-spaced buckets (HDR-style): bucket i
+    covers [MIN_MS * GROWTH**i, MIN_MS * GROWTH**(i + 1)). Quantiles are
+    reported at the geometric midpoint of their bucket, which bounds the
+    relative error at about 4.5%. Count, sum, min and max are exact.
+    """
+
+    MIN_MS = 0.01
+    MAX_MS = 600_000.0  # 10 minutes
+    GROWTH = 2 ** (1 / 8)
+
+    _LOG_GROWTH = math.log(GROWTH)
+    NUM_BUCKETS = math.ceil(math.log(MAX_MS / MIN_MS) / _LOG_GROWTH) + 1
+
+    def __init__(self) -> None:
+        self._counts = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        """Add a duration."""
+        self._counts[self._bucket_index(duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated duration in milliseconds (0.0 if empty)
+        """
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min_ms
+        rank = max(1, math.ceil(q * self.count))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts[:-1]):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                midpoint = self.MIN_MS * self.GROWTH ** (index + 0.5)
+                return min(max(midpoint, self.min_ms), self.max_ms)
+        # The last bucket is open-ended, so report the exact maximum
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.sum_ms / self.count if self.count else 0.0
+
+    def _bucket_index(self, duration_ms: float) -> int:
+        if duration_ms <= self.MIN_MS:
+            return 0
+        index = int(math.log(duration_ms / self.MIN_MS) / self._LOG_GROWTH)
+        return min(index, self.NUM_BUCKETS - 1)
+
+
+class RateWindow:
+    """
+    Event rate over a sliding window, in fixed memory.
+
+    Events are counted in a ring of one-second slots; slots older than the
+    window are ignored when reading and overwritten when reused.
+    """
+
+    def __init__(self, window_seconds: int = 60) -> None:
+        self.window_seconds = window_seconds
+        self._seconds = [-1] * window_seconds
+        self._counts = [0] * window_seconds
+
+    def record(self, now: Optional[float] = None) -> None:
+        """Count an event at the given monotonic time (default: now)."""
+        second = int(time.monotonic() if now is None else now)
+        slot = second % self.window_seconds
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += 1
+
+    def rate(self, now: Optional[float] = None) -> float:
+        """Events per second over the window."""
+        second = int(time.monotonic() if now is None else now)
+        oldest = second - self.window_seconds
+        total = sum(
+            count for slot_second, count in zip(self._seconds, self._counts)
+            if slot_second > oldest
+        )
+        return total / self.window_seconds
+
+
+@dataclass
+class TimingSeries:
+    """Latency histogram and request rate for one endpoint or event type."""
+
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    rate_window: RateWindow = field(default_factory=RateWindow)
+
+    def record(self, duration_ms: float) -> None:
+        self.histogram.record(duration_ms)
+        self.rate_window.record()
+
+    def get_stats(self) -> dict:
+        histogram = self.histogram
+        return {
+            "count": histogram.count,
+            "avg_ms": histogram.mean_ms,
+            "min_ms": histogram.min_ms if histogram.count else 0.0,
+            "max_ms": histogram.max_ms,
+            "p50_ms": histogram.quantile(0.50),
+            "p90_ms": histogram.quantile(0.90),
+            "p99_ms": histogram.quantile(0.99),
+            "rate_per_second_1m": self.rate_window.rate(),
+        }
+
+
 # ============================================================================
 # Metrics Middleware
 # ============================================================================
 
+# Endpoint label for requests that matched no route, so arbitrary paths
+# cannot grow the metrics without bound
+UNMATCHED_ENDPOINT = "<unmatched>"
+
+# Quantiles exported to Prometheus
+PROMETHEUS_QUANTILES = (0.5, 0.9, 0.99)
+
 
 @dataclass
 class RequestMetrics:
-    """Container for request metrics."""
+    """
+    Container for request metrics.
+
+    Endpoints are keyed by route template (e.g. /api/documents/{document_id})
+    and WebSocket events by event type, so memory stays bounded for the
+    life of the server.
+    """
 
     total_requests: int = 0
     total_errors: int = 0
     status_codes: dict = field(default_factory=lambda: defaultdict(int))
-    endpoint_counts: dict = field(default_factory=lambda: defaultdict(int))
-    endpoint_durations: dict = field(default_factory=lambda: defaultdict(list))
+    endpoints: dict = field(default_factory=lambda: defaultdict(TimingSeries))
+    ws_events: dict = field(default_factory=lambda: defaultdict(TimingSeries))
+    stream_latency: dict = field(default_factory=lambda: defaultdict(TimingSeries))
     last_reset: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def record_request(
@@ -178,17 +327,32 @@ class RequestMetrics:
         if status_code >= 400:
             self.total_errors += 1
         self.status_codes[status_code] += 1
-        self.endpoint_counts[path] += 1
+        self.endpoints[path].record(duration_ms)
 
-        # Keep last 100 durations per endpoint
-        durations = self.endpoint_durations[path]
-        durations.append(duration_ms)
-        if len(durations) > 100:
-            self.endpoint_durations[path] = durations[-100:]
+    def record_ws_event(self, event_type: str, duration_ms: float) -> None:
+        """Record a WebSocket event broadcast and how long delivery took."""
+        self.ws_events[event_type].record(duration_ms)
+
+    def record_stream_chunk(self, received_at: float, bridged_at: float, sent_at: float) -> None:
+        """
+        Record how long an LLM stream chunk took to reach WebSocket clients.
+
+        Latency is split by stage: "bus" from the chunk arriving from the
+        provider to the WebSocket bridge receiving it off the message bus,
+        "websocket" from there to the frames being sent, and "total".
+
+        Args:
+            received_at: Epoch time the agent received the chunk
+            bridged_at: Epoch time the bridge received the bus message
+            sent_at: Epoch time the WebSocket broadcast completed
+        """
+        self.stream_latency["bus"].record((bridged_at - received_at) * 1000)
+        self.stream_latency["websocket"].record((sent_at - bridged_at) * 1000)
+        self.stream_latency["total"].record((sent_at - received_at) * 1000)
 
     def get_stats(self) -> dict:
         """Get current metrics as a dictionary."""
-        stats = {
+        return {
             "total_requests": self.total_requests,
             "total_errors": self.total_errors,
             "error_rate": (
@@ -197,32 +361,75 @@ class RequestMetrics:
                 else 0
             ),
             "status_codes": dict(self.status_codes),
-            "endpoints": {},
+            "endpoints": {path: series.get_stats() for path, series in self.endpoints.items()},
+            "websocket_events": {
+                event_type: series.get_stats() for event_type, series in self.ws_events.items()
+            },
+            "stream_chunk_latency": {
+                stage: series.get_stats() for stage, series in self.stream_latency.items()
+            },
             "since": self.last_reset.isoformat(),
         }
 
-        # Calculate endpoint stats
-        for path, durations in self.endpoint_durations.items():
-            if durations:
-                stats["endpoints"][path] = {
-                    "count": self.endpoint_counts[path],
-                    "avg_ms": sum(durations) / len(durations),
-                    "min_ms": min(durations),
-                    "max_ms": max(durations),
-                }
-
-        return stats
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_requests_total Total HTTP requests by status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for status_code, count in sorted(self.status_codes.items()):
+            lines.append(f'http_requests_total{{status="{status_code}"}} {count}')
+
+        lines.extend(_prometheus_summary(
+            "http_request_duration_seconds",
+            "HTTP request duration by endpoint.",
+            "endpoint",
+            self.endpoints,
+        ))
+        lines.extend(_prometheus_summary(
+            "websocket_broadcast_duration_seconds",
+            "WebSocket event broadcast duration by event type.",
+            "event_type",
+            self.ws_events,
+        ))
+        lines.extend(_prometheus_summary(
+            "llm_stream_chunk_latency_seconds",
+            "Latency from an LLM stream chunk arriving to its WebSocket frame being sent, by stage.",
+            "stage",
+            self.stream_latency,
+        ))
+        return "\n".join(lines) + "\n"
 
     def reset(self) -> None:
         """Reset all metrics."""
         self.total_requests = 0
         self.total_errors = 0
         self.status_codes.clear()
-        self.endpoint_counts.clear()
-        self.endpoint_durations.clear()
+        self.endpoints.clear()
+        self.ws_events.clear()
+        self.stream_latency.clear()
         self.last_reset = datetime.now(timezone.utc)
 
 
+def _prometheus_summary(name: str, help_text: str, label: str, series: dict) -> list:
+    """Render timing series as a Prometheus summary, in seconds."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+    for key, timing in sorted(series.items()):
+        label_value = _escape_label(key)
+        histogram = timing.histogram
+        for q in PROMETHEUS_QUANTILES:
+            lines.append(
+                f'{name}{{{label}="{label_value}",quantile="{q}"}} {histogram.quantile(q) / 1000:.6g}'
+            )
+        lines.append(f'{name}_sum{{{label}="{label_value}"}} {histogram.sum_ms / 1000:.6g}')
+        lines.append(f'{name}_count{{{label}="{label_value}"}} {histogram.count}')
+    return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
 # Global metrics instance
 _metrics = RequestMetrics()
 
@@ -257,13 +464,32 @@ class MetricsMiddleware(BaseHTTPMiddleware):
 
         # Record metrics
         _metrics.record_request(
-            path=request.url.path,
+            path=self._endpoint_label(request),
             status_code=response.status_code,
             duration_ms=duration_ms,
         )
 
         return response
 
+    def _endpoint_label(self, request: Request) -> str:
+        """
+        Get the route template for a request, e.g. /api/documents/{document_id}.
+
+        Each route is one series, whatever its path parameter values;
+        requests that matched no route share a single label.
+        """
+        route = request.scope.get("route")
+        if route is None:
+            return UNMATCHED_ENDPOINT
+        # Routes reached through include_router only know the path relative
+        # to their own router; FastAPI keeps the full template alongside.
+        context = request.scope.get("fastapi", {}).get("effective_route_context")
+        return (
+            getattr(context, "path_format", None)
+            or getattr(route, "path", None)
+            or request.url.path
+        )
+
 
 # ============================================================================
 # Middleware Registration
@@ -287,7 +513,10 @@ def add_metrics_endpoint(app: FastAPI) -> None:
     """Add a metrics endpoint to the FastAPI app."""
 
     @app.get("/metrics", tags=["monitoring"])
-    async def get_request_metrics() -> dict:
+    async def get_request_metrics(
+        request: Request,
+        format: Optional[Literal["json", "prometheus"]] = None,
+    ) -> Response:
         """
         Get request metrics.
 
@@ -295,9 +524,20 @@ def add_metrics_endpoint(app: FastAPI) -> None:
         - Total request and error counts
         - Error rate percentage
         - Status code distribution
-        - Per-endpoint statistics (count, avg/min/max response time)
+        - Per-endpoint and per-WebSocket-event statistics (count,
+          avg/min/max, p50/p90/p99 and 1-minute rate)
+
+        Prometheus text format is returned for format=prometheus, or when
+        the Accept header asks for text/plain or OpenMetrics (as scrapers do).
         """
-        return _metrics.get_stats()
+        if format is None:
+            accept = request.headers.get("accept", "")
+            wants_text = "text/plain" in accept or "application/openmetrics-text" in accept
+            format = "prometheus" if wants_text and "application/json" not in accept else "json"
+
+        if format == "prometheus":
+            return PlainTextResponse(_metrics.to_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+        return JSONResponse(_metrics.get_stats())
 
     @app.post("/metrics/reset", tags=["monitoring"])
     async def reset_request_metrics() -> dict:
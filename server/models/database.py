@@ -4,10 +4,10 @@ import uuid
 from datetime import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.orm import DeclarativeBase, deferred, relationship
 
 from server.config import settings
 
@@ -37,7 +37,18 @@ class CompanyProfile(Base):
 
 
 class Document(Base):
-    """Generated document model."""
+    """
+    Generated document model.
+
+    The JSON content and report columns are deferred (group "details") so
+    that listing, approving or sharing a document does not decode them;
+    load them with undefer_group("details"). Sections, critiques,
+    responses, debate entries and round versions live in their own tables,
+    keyed by document and round: content then holds only document-level
+    fields and red_team_report only the summary and counts. Documents
+    generated before those tables existed keep their sections, exchanges
+    and debate_log in the JSON columns.
+    """
 
     __tablename__ = "documents"
 
@@ -50,12 +61,12 @@ class Document(Base):
     company_profile_id = Column(String, ForeignKey("company_profiles.id"))
     company_profile = relationship("CompanyProfile", back_populates="documents")
 
-    content = Column(JSON)
-    confidence_report = Column(JSON)
-    red_team_report = Column(JSON)
-    debate_log = Column(JSON)
-    metrics = Column(JSON)
-    generation_config = Column(JSON)
+    content = deferred(Column(JSON), group="details")
+    confidence_report = deferred(Column(JSON), group="details")
+    red_team_report = deferred(Column(JSON), group="details")
+    debate_log = deferred(Column(JSON))
+    metrics = deferred(Column(JSON), group="details")
+    generation_config = deferred(Column(JSON), group="details")
 
     requires_human_review = Column(Boolean, default=False)
     review_notes = Column(Text)
@@ -64,6 +75,101 @@ class Document(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    sections = relationship(
+        "DocumentSection", order_by="DocumentSection.position", cascade="all, delete-orphan"
+    )
+    critiques = relationship(
+        "DocumentCritique", order_by="DocumentCritique.id", cascade="all, delete-orphan"
+    )
+    responses = relationship(
+        "CritiqueResponse", order_by="CritiqueResponse.id", cascade="all, delete-orphan"
+    )
+    debate_entries = relationship(
+        "DebateEntry", order_by="DebateEntry.position", cascade="all, delete-orphan"
+    )
+    versions = relationship(
+        "DocumentVersion", order_by="DocumentVersion.version", cascade="all, delete-orphan"
+    )
+
+
+class DocumentSection(Base):
+    """A section of a generated document's final content."""
+
+    __tablename__ = "document_sections"
+    __table_args__ = (Index("ix_document_sections_document_position", "document_id", "position"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(String, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)
+    name = Column(String, nullable=False)
+    content = Column(Text)
+    section_metadata = Column("metadata", JSON)
+
+
+class DocumentCritique(Base):
+    """A red team critique raised while generating a document."""
+
+    __tablename__ = "document_critiques"
+    __table_args__ = (Index("ix_document_critiques_document_round", "document_id", "round"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(String, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    critique_id = Column(String)
+    round = Column(Integer, nullable=False, default=0)
+    agent = Column(String)
+    section = Column(String)
+    severity = Column(String)
+    title = Column(String)
+    data = Column(JSON)
+
+
+class CritiqueResponse(Base):
+    """A blue team response to a critique."""
+
+    __tablename__ = "critique_responses"
+    __table_args__ = (Index("ix_critique_responses_document_round", "document_id", "round"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(String, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    response_id = Column(String)
+    critique_id = Column(String)
+    round = Column(Integer, nullable=False, default=0)
+    agent = Column(String)
+    disposition = Column(String)
+    data = Column(JSON)
+
+
+class DebateEntry(Base):
+    """One debate log entry, in log order (position)."""
+
+    __tablename__ = "debate_entries"
+    __table_args__ = (
+        Index("ix_debate_entries_document_round", "document_id", "round"),
+        Index("ix_debate_entries_document_position", "document_id", "position"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(String, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)
+    round = Column(Integer, nullable=False, default=0)
+    phase = Column(String)
+    entry_type = Column(String)
+    data = Column(JSON)
+
+
+class DocumentVersion(Base):
+    """Snapshot of a document's sections after a round."""
+
+    __tablename__ = "document_versions"
+    __table_args__ = (Index("ix_document_versions_document_round", "document_id", "round"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    document_id = Column(String, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    round = Column(Integer, nullable=False, default=0)
+    round_type = Column(String)
+    data = Column(JSON)
+
 
 class GenerationRequest(Base):
     """Tracks active and completed generation requests."""
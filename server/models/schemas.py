@@ -147,6 +147,118 @@ class GenerationMetricsSchema(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class LLMCallSchema(BaseModel):
+    """Schema for a single LLM call in a generation's usage ledger."""
+
+    agent_name: str = Field(alias="agentName")
+    agent_role: str = Field(alias="agentRole")
+    provider: str
+    model: str
+    phase: Optional[str] = None
+    round_number: int = Field(default=0, alias="roundNumber")
+    operation: str = ""
+    input_tokens: int = Field(default=0, alias="inputTokens")
+    output_tokens: int = Field(default=0, alias="outputTokens")
+    cache_creation_input_tokens: int = Field(default=0, alias="cacheCreationInputTokens")
+    cache_read_input_tokens: int = Field(default=0, alias="cacheReadInputTokens")
+    started_at: Optional[datetime] = Field(None, alias="startedAt")
+    latency_ms: float = Field(default=0.0, alias="latencyMs")
+    streamed: bool = False
+    time_to_first_token_ms: Optional[float] = Field(None, alias="timeToFirstTokenMs")
+    chunk_count: int = Field(default=0, alias="chunkCount")
+    mean_inter_chunk_ms: Optional[float] = Field(None, alias="meanInterChunkMs")
+    max_inter_chunk_ms: Optional[float] = Field(None, alias="maxInterChunkMs")
+    output_tokens_per_second: Optional[float] = Field(None, alias="outputTokensPerSecond")
+    retries: int = 0
+    success: bool = True
+    error: Optional[str] = None
+    estimated_cost_usd: float = Field(default=0.0, alias="estimatedCostUsd")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class LLMUsageTotalsSchema(BaseModel):
+    """Schema for aggregated LLM usage over a group of calls."""
+
+    calls: int = 0
+    failed_calls: int = Field(default=0, alias="failedCalls")
+    retries: int = 0
+    input_tokens: int = Field(default=0, alias="inputTokens")
+    output_tokens: int = Field(default=0, alias="outputTokens")
+    cache_creation_input_tokens: int = Field(default=0, alias="cacheCreationInputTokens")
+    cache_read_input_tokens: int = Field(default=0, alias="cacheReadInputTokens")
+    total_latency_ms: float = Field(default=0.0, alias="totalLatencyMs")
+    max_latency_ms: float = Field(default=0.0, alias="maxLatencyMs")
+    mean_time_to_first_token_ms: Optional[float] = Field(None, alias="meanTimeToFirstTokenMs")
+    max_time_to_first_token_ms: Optional[float] = Field(None, alias="maxTimeToFirstTokenMs")
+    max_inter_chunk_ms: Optional[float] = Field(None, alias="maxInterChunkMs")
+    mean_output_tokens_per_second: Optional[float] = Field(None, alias="meanOutputTokensPerSecond")
+    estimated_cost_usd: float = Field(default=0.0, alias="estimatedCostUsd")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class LLMUsageSummarySchema(BaseModel):
+    """Schema for LLM usage totals, overall and broken down."""
+
+    totals: LLMUsageTotalsSchema = Field(default_factory=LLMUsageTotalsSchema)
+    by_agent: dict[str, LLMUsageTotalsSchema] = Field(default_factory=dict, alias="byAgent")
+    by_model: dict[str, LLMUsageTotalsSchema] = Field(default_factory=dict, alias="byModel")
+    by_phase: dict[str, LLMUsageTotalsSchema] = Field(default_factory=dict, alias="byPhase")
+    by_operation: dict[str, LLMUsageTotalsSchema] = Field(default_factory=dict, alias="byOperation")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class LLMUsageResponse(BaseModel):
+    """Schema for a document's LLM usage ledger."""
+
+    document_id: str = Field(alias="documentId")
+    calls: list[LLMCallSchema] = Field(default_factory=list)
+    summary: LLMUsageSummarySchema = Field(default_factory=LLMUsageSummarySchema)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DebateLogResponse(BaseModel):
+    """Schema for a page of a document's debate log."""
+
+    document_id: str = Field(alias="documentId")
+    entries: list[DebateEntrySchema] = Field(default_factory=list)
+    total: int = 0
+    limit: int
+    offset: int = 0
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DocumentVersionSchema(BaseModel):
+    """Schema for a snapshot of a document's sections after a round."""
+
+    version: int
+    round_type: Optional[str] = Field(None, alias="roundType")
+    round_number: Optional[int] = Field(None, alias="roundNumber")
+    timestamp: Optional[datetime | str] = None
+    sections: dict[str, str] = Field(default_factory=dict)
+    section_count: int = Field(default=0, alias="sectionCount")
+    total_words: int = Field(default=0, alias="totalWords")
+    changes_summary: Optional[str] = Field(None, alias="changesSummary")
+    critiques_pending: int = Field(default=0, alias="critiquesPending")
+    critiques_resolved: int = Field(default=0, alias="critiquesResolved")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class DocumentVersionsResponse(BaseModel):
+    """Schema for the versions of a document recorded after each round."""
+
+    document_id: str = Field(alias="documentId")
+    versions: list[DocumentVersionSchema] = Field(default_factory=list)
+    total: int = 0
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class DocumentBase(BaseModel):
     """Base schema for document data."""
 
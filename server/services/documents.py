@@ -2,12 +2,20 @@
 
 import uuid
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from server.models.database import Document
+from sqlalchemy.orm import undefer_group
+
+from server.models.database import (
+    CritiqueResponse,
+    DebateEntry,
+    Document,
+    DocumentCritique,
+    DocumentSection,
+    DocumentVersion,
+)
 from server.models.schemas import DocumentDuplicateRequest, DocumentStatusUpdate
 
 
@@ -85,12 +93,303 @@ class DocumentsService:
 
         return documents, total
 
-    async def get_by_id(self, document_id: str) -> Optional[Document]:
-        """Get a document by ID."""
+    async def get_by_id(self, document_id: str, details: bool = False) -> Optional[Document]:
+        """
+        Get a document by ID.
+
+        Args:
+            document_id: Document ID
+            details: Also load the content and report columns; without
+                them only the summary columns are read
+
+        Returns:
+            The document or None if not found
+        """
         stmt = select(Document).where(Document.id == document_id)
+        if details:
+            stmt = stmt.options(undefer_group("details"))
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_sections(self, document: Document) -> list[dict[str, Any]]:
+        """
+        Get a document's sections in document order.
+
+        Documents generated before sections had their own table keep them in
+        the content column. The document's details must be loaded.
+
+        Args:
+            document: The document
+
+        Returns:
+            Sections ({"name", "content", "metadata"})
+        """
+        result = await self.db.execute(
+            select(DocumentSection)
+            .where(DocumentSection.document_id == document.id)
+            .order_by(DocumentSection.position)
+        )
+        rows = result.scalars().all()
+        if not rows:
+            return list((document.content or {}).get("sections", []))
+        return [
+            {"name": row.name, "content": row.content or "", "metadata": row.section_metadata or {}}
+            for row in rows
+        ]
+
+    async def get_content(self, document: Document) -> Optional[dict[str, Any]]:
+        """
+        Get a document's content with its sections.
+
+        A document still being generated has no content yet, only the
+        sections finalized so far; its content is marked partial.
+
+        Args:
+            document: The document, with details loaded
+
+        Returns:
+            The content dictionary, or None if nothing has been saved
+        """
+        sections = await self.get_sections(document)
+        if document.content is None and not sections:
+            return None
+        content = {"partial": True} if document.content is None else dict(document.content)
+        content["sections"] = sections
+        return content
+
+    async def get_exchanges(self, document: Document) -> list[dict[str, Any]]:
+        """
+        Get a document's critiques, each paired with its response.
+
+        Documents generated before critiques had their own table keep the
+        exchanges in the red_team_report column. The document's details
+        must be loaded.
+
+        Args:
+            document: The document
+
+        Returns:
+            Exchanges ({"critique", "response", "resolved", "outcome"}) in
+            the order the critiques were raised
+        """
+        critique_result = await self.db.execute(
+            select(DocumentCritique)
+            .where(DocumentCritique.document_id == document.id)
+            .order_by(DocumentCritique.id)
+        )
+        critiques = critique_result.scalars().all()
+        if not critiques:
+            return list((document.red_team_report or {}).get("exchanges", []))
+
+        response_result = await self.db.execute(
+            select(CritiqueResponse).where(CritiqueResponse.document_id == document.id)
+        )
+        responses = {row.critique_id: row.data for row in response_result.scalars().all()}
+
+        exchanges = []
+        for row in critiques:
+            response = responses.get(row.critique_id) if row.critique_id else None
+            exchanges.append({
+                "critique": row.data,
+                "response": response,
+                "resolved": response is not None,
+                "outcome": response.get("disposition") if response else "Unresolved",
+            })
+        return exchanges
+
+    async def get_red_team_report(self, document: Document) -> Optional[dict[str, Any]]:
+        """
+        Get a document's red team report with its exchanges.
+
+        Args:
+            document: The document, with details loaded
+
+        Returns:
+            The report dictionary, or None if the document has no report
+        """
+        if document.red_team_report is None:
+            return None
+        report = dict(document.red_team_report)
+        report["exchanges"] = await self.get_exchanges(document)
+        return report
+
+    async def get_versions(
+        self, document_id: str, round_number: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Get the versions of a document recorded after each round.
+
+        Args:
+            document_id: Document ID
+            round_number: Only versions recorded after this round
+
+        Returns:
+            Versions in version order
+        """
+        stmt = select(DocumentVersion.data).where(DocumentVersion.document_id == document_id)
+        if round_number is not None:
+            stmt = stmt.where(DocumentVersion.round == round_number)
+        result = await self.db.execute(stmt.order_by(DocumentVersion.version))
+        return list(result.scalars().all())
+
+    async def get_debate_log(
+        self,
+        document_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        round_number: Optional[int] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        Get a page of a document's debate log.
+
+        Documents generated before debate entries had their own table keep
+        the log in the legacy debate_log column, which is paged in memory.
+
+        Args:
+            document_id: Document ID
+            limit: Maximum number of entries (default: all)
+            offset: Pagination offset
+            round_number: Only entries from this round
+
+        Returns:
+            Tuple of (entries in log order, total matching entries)
+        """
+        conditions = [DebateEntry.document_id == document_id]
+        if round_number is not None:
+            conditions.append(DebateEntry.round == round_number)
+
+        total_result = await self.db.execute(
+            select(func.count()).select_from(DebateEntry).where(*conditions)
+        )
+        total = total_result.scalar() or 0
+
+        if total:
+            stmt = select(DebateEntry.data).where(*conditions).order_by(DebateEntry.position)
+            stmt = stmt.offset(offset)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all()), total
+
+        legacy_result = await self.db.execute(
+            select(Document.debate_log).where(Document.id == document_id)
+        )
+        entries = legacy_result.scalar() or []
+        if round_number is not None:
+            entries = [e for e in entries if e.get("round") == round_number]
+        end = None if limit is None else offset + limit
+        return entries[offset:end], len(entries)
+
+    async def save_sections(self, document_id: str, sections: list[dict[str, Any]]) -> None:
+        """
+        Replace a document's sections.
+
+        Args:
+            document_id: Document ID
+            sections: Sections ({"name", "content", "metadata"}) in document order
+        """
+        await self.db.execute(delete(DocumentSection).where(DocumentSection.document_id == document_id))
+
+        for position, section in enumerate(sections):
+            self.db.add(DocumentSection(
+                document_id=document_id,
+                position=position,
+                name=section.get("name") or section.get("title") or f"Section {position + 1}",
+                content=section.get("content", ""),
+                section_metadata=section.get("metadata", {}),
+            ))
+
+        await self.db.flush()
+
+    async def save_generation_records(
+        self,
+        document_id: str,
+        sections: list[dict[str, Any]],
+        debate_log: list[dict[str, Any]],
+        exchanges: list[dict[str, Any]],
+        versions: list[dict[str, Any]],
+    ) -> None:
+        """
+        Replace a document's section, critique, response, debate and version rows.
+
+        Args:
+            document_id: Document ID
+            sections: Final document sections ({"name", "content", "metadata"})
+            debate_log: Debate log entries in log order
+            exchanges: Red team report exchanges ({"critique", "response"})
+            versions: Document versions recorded after each round
+        """
+        for model in (DocumentCritique, CritiqueResponse, DocumentVersion):
+            await self.db.execute(delete(model).where(model.document_id == document_id))
+
+        for exchange in exchanges:
+            critique = exchange.get("critique") or {}
+            self.db.add(DocumentCritique(
+                document_id=document_id,
+                critique_id=critique.get("id"),
+                round=critique.get("round_number") or 0,
+                agent=critique.get("agent"),
+                section=critique.get("section"),
+                severity=critique.get("severity"),
+                title=critique.get("title"),
+                data=critique,
+            ))
+            response = exchange.get("response")
+            if response:
+                self.db.add(CritiqueResponse(
+                    document_id=document_id,
+                    response_id=response.get("id"),
+                    critique_id=critique.get("id"),
+                    round=response.get("round_number") or 0,
+                    agent=response.get("agent"),
+                    disposition=response.get("disposition"),
+                    data=response,
+                ))
+
+        for version in versions:
+            self.db.add(DocumentVersion(
+                document_id=document_id,
+                version=version.get("version", 0),
+                round=version.get("round_number") or 0,
+                round_type=version.get("round_type"),
+                data=version,
+            ))
+
+        await self.save_sections(document_id, sections)
+        await self.save_debate_log(document_id, debate_log)
+
+    async def _copy_records(self, source_id: str, target_id: str) -> None:
+        """Copy a document's section, critique, response and version rows."""
+        for model in (DocumentSection, DocumentCritique, CritiqueResponse, DocumentVersion):
+            keys = [attr.key for attr in model.__mapper__.column_attrs if attr.key not in ("id", "document_id")]
+            result = await self.db.execute(
+                select(model).where(model.document_id == source_id).order_by(model.id)
+            )
+            for row in result.scalars().all():
+                self.db.add(model(document_id=target_id, **{key: getattr(row, key) for key in keys}))
+
+    async def save_debate_log(self, document_id: str, debate_log: list[dict[str, Any]]) -> None:
+        """
+        Replace a document's debate entries.
+
+        Args:
+            document_id: Document ID
+            debate_log: Debate log entries in log order
+        """
+        await self.db.execute(delete(DebateEntry).where(DebateEntry.document_id == document_id))
+
+        for position, entry in enumerate(debate_log):
+            self.db.add(DebateEntry(
+                document_id=document_id,
+                position=position,
+                round=entry.get("round") or 0,
+                phase=entry.get("phase"),
+                entry_type=entry.get("type"),
+                data=entry,
+            ))
+
+        await self.db.flush()
+
     async def delete(self, document_id: str) -> bool:
         """
         Delete a document.
@@ -119,7 +418,7 @@ class DocumentsService:
         Returns:
             New duplicated document or None if source not found
         """
-        source = await self.get_by_id(document_id)
+        source = await self.get_by_id(document_id, details=True)
         if not source:
             return None
 
@@ -135,7 +434,6 @@ class DocumentsService:
             content=source.content,
             confidence_report=source.confidence_report,
             red_team_report=source.red_team_report,
-            debate_log=source.debate_log,
             metrics=source.metrics,
             generation_config=source.generation_config,
             requires_human_review=False,  # Reset review status
@@ -145,6 +443,12 @@ class DocumentsService:
 
         self.db.add(new_document)
         await self.db.flush()
+        await self._copy_records(source.id, new_document.id)
+
+        # Legacy debate_log columns are copied into debate entries too
+        debate_log, _ = await self.get_debate_log(source.id)
+        await self.save_debate_log(new_document.id, debate_log)
+
         await self.db.refresh(new_document)
         return new_document
 
@@ -31,6 +31,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.config import settings
 from server.models.database import Document, ShareLink
+from server.services.documents import DocumentsService
 
 ExportFormat = Literal["word", "pdf", "markdown"]
 
@@ -198,7 +199,7 @@ class ExportService:
         Export a document to the specified format.
 
         Args:
-            document: Document model to export
+            document: Document model to export, with details loaded
             format: Export format (word, pdf, markdown)
 
         Returns:
@@ -206,16 +207,20 @@ class ExportService:
         """
         await self._ensure_export_dir()
 
+        sections = await DocumentsService(self.db).get_sections(document)
+
         if format == "word":
-            return await self._export_to_word(document)
+            return await self._export_to_word(document, sections)
         elif format == "pdf":
-            return await self._export_to_pdf(document)
+            return await self._export_to_pdf(document, sections)
         elif format == "markdown":
-            return await self._export_to_markdown(document)
+            return await self._export_to_markdown(document, sections)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
-    async def _export_to_word(self, document: Document) -> tuple[bytes, str, str]:
+    async def _export_to_word(
+        self, document: Document, sections: list[dict]
+    ) -> tuple[bytes, str, str]:
         """Export document to Word format (.docx)."""
         doc = DocxDocument()
 
@@ -237,8 +242,8 @@ class ExportService:
         doc.add_paragraph()  # Spacer
 
         # Add sections from content
-        if document.content and "sections" in document.content:
-            for section in document.content["sections"]:
+        if sections:
+            for section in sections:
                 # Section title (check both 'title' and 'name' keys for compatibility)
                 section_title = section.get("title") or section.get("name") or "Untitled Section"
                 doc.add_heading(section_title, level=1)
@@ -300,7 +305,9 @@ class ExportService:
 
         return buffer.getvalue(), filename, content_type
 
-    async def _export_to_pdf(self, document: Document) -> tuple[bytes, str, str]:
+    async def _export_to_pdf(
+        self, document: Document, sections: list[dict]
+    ) -> tuple[bytes, str, str]:
         """Export document to PDF format."""
         buffer = BytesIO()
         doc = SimpleDocTemplate(
@@ -392,8 +399,8 @@ class ExportService:
         story.append(Paragraph(meta_text, meta_style))
 
         # Sections
-        if document.content and "sections" in document.content:
-            for section in document.content["sections"]:
+        if sections:
+            for section in sections:
                 # Section title (check both 'title' and 'name' keys for compatibility)
                 section_title = section.get("title") or section.get("name") or "Untitled Section"
                 story.append(Paragraph(section_title, section_title_style))
@@ -485,7 +492,9 @@ class ExportService:
 
         return buffer.getvalue(), filename, content_type
 
-    async def _export_to_markdown(self, document: Document) -> tuple[bytes, str, str]:
+    async def _export_to_markdown(
+        self, document: Document, sections: list[dict]
+    ) -> tuple[bytes, str, str]:
         """Export document to Markdown format."""
         lines = []
 
@@ -504,8 +513,8 @@ class ExportService:
         lines.append("")
 
         # Sections
-        if document.content and "sections" in document.content:
-            for section in document.content["sections"]:
+        if sections:
+            for section in sections:
                 # Section title (check both 'title' and 'name' keys for compatibility)
                 section_title = section.get("title") or section.get("name") or "Untitled Section"
                 lines.append(f"## {section_title}")
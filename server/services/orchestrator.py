@@ -6,43 +6,23 @@ and translating agent messages to real-time client events.
 
 import asyncio
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any, Callable, Optional
 
-import re
-
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.models.database import CompanyProfile, Document, GenerationRequest
-
-
-def camel_to_snake(name: str) -> str:
-    """Convert camelCase to snake_case."""
-    # Handle acronyms and standard camelCase
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-
-
-def convert_keys_to_snake_case(data: Any) -> Any:
-    """
-    Recursively convert all dictionary keys from camelCase to snake_case.
-
-    This is necessary because the frontend sends profile data in camelCase,
-    but the agents expect snake_case keys.
-    """
-    if isinstance(data, dict):
-        return {camel_to_snake(k): convert_keys_to_snake_case(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [convert_keys_to_snake_case(item) for item in data]
-    else:
-        return data
-
+from server.services.documents import DocumentsService
+from server.services.profiles import normalized_profiles
 
 from server.config import get_llm_settings
+from server.logging_config import set_request_context
+from server.middleware import get_metrics
 from server.models.schemas import DocumentGenerationRequest, SwarmConfigSchema
 from server.websocket.events import (
     AgentCompletePayload,
@@ -134,6 +114,14 @@ class GenerationContext:
     current_sections: dict = field(default_factory=dict)  # section_name -> {id, title, content, confidence}
     draft_version: int = 0  # Increments with each update
 
+    # Final document sections streamed from synthesis, in stored format ({name, content, metadata})
+    finalized_sections: list = field(default_factory=list)
+
+    # Database session of the generation; the message bus handler writes
+    # finalized sections concurrently with the workflow, so writes hold db_lock
+    db: Optional[AsyncSession] = None
+    db_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
     # Pause/resume support
     pause_event: asyncio.Event = field(default_factory=asyncio.Event)
     cancel_requested: bool = False
@@ -279,7 +267,11 @@ class OrchestratorService:
             request: Original generation request
             db: Database session
         """
+        # Tag this task's log records; the generation's trace id is the same id
+        set_request_context(request_id=context.request_id)
+
         try:
+            context.db = db
             context.started_at = datetime.now(timezone.utc)
             context.status = GenerationStatus.RUNNING
 
@@ -323,47 +315,22 @@ class OrchestratorService:
             await self._broadcast_registered_agents(context)
 
             # Create DocumentRequest for arbiter
-            # Build fallback profile from database columns if full_profile is not available
-            fallback_profile = {
-                "name": profile.name,
-                "description": profile.description,
-                "naics_codes": profile.naics_codes or [],
-                "certifications": profile.certifications or [],
-                "past_performance": profile.past_performance or [],
-            }
+            # Normalized (snake_case) profile, computed when the profile was saved
+            company_profile_data = normalized_profiles.get(profile)
 
-            # Use full_profile if available (contains all 40+ fields), otherwise use fallback
-            # Convert camelCase keys to snake_case since frontend sends camelCase
-            # but agents/formatters expect snake_case
-            if profile.full_profile:
-                company_profile_data = convert_keys_to_snake_case(profile.full_profile)
-                # Merge in root-level fields that are stored separately in the DB
-                # These are not part of full_profile but are needed by agents
-                company_profile_data["name"] = profile.name
-                if profile.description:
-                    company_profile_data["description"] = profile.description
-                if profile.naics_codes:
-                    company_profile_data["naics_codes"] = profile.naics_codes
-                if profile.certifications:
-                    company_profile_data["certifications"] = profile.certifications
-                if profile.past_performance:
-                    company_profile_data["past_performance"] = profile.past_performance
-
-                # Calculate years_in_business from formation_date if not already present
-                if "years_in_business" not in company_profile_data and company_profile_data.get("formation_date"):
-                    try:
-                        formation_str = company_profile_data["formation_date"]
-                        formation_date = date.fromisoformat(formation_str)
-                        today = date.today()
-                        years = today.year - formation_date.year
-                        # Adjust if birthday hasn't occurred yet this year
-                        if (today.month, today.day) < (formation_date.month, formation_date.day):
-                            years -= 1
-                        company_profile_data["years_in_business"] = max(0, years)
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"Could not calculate years_in_business from formation_date: {e}")
-            else:
-                company_profile_data = fallback_profile
+            # Calculate years_in_business from formation_date if not already present
+            if "years_in_business" not in company_profile_data and company_profile_data.get("formation_date"):
+                try:
+                    formation_str = company_profile_data["formation_date"]
+                    formation_date = date.fromisoformat(formation_str)
+                    today = date.today()
+                    years = today.year - formation_date.year
+                    # Adjust if birthday hasn't occurred yet this year
+                    if (today.month, today.day) < (formation_date.month, formation_date.day):
+                        years -= 1
+                    company_profile_data["years_in_business"] = max(0, years)
+                except (ValueError, TypeError) as e:
+                    logger.debug(f"Could not calculate years_in_business from formation_date: {e}")
 
             # Log warning if using incomplete fallback
             if not profile.full_profile:
@@ -394,8 +361,9 @@ class OrchestratorService:
                     {"requestId": context.request_id},
                 )
             elif result:
-                # Save result to database
-                await self._save_generation_result(context, result, db)
+                # Save result to database; finalized sections may still be being written
+                async with context.db_lock:
+                    await self._save_generation_result(context, result, db)
 
                 # If human review is required, send escalation event first
                 if result.requires_human_review:
@@ -736,14 +704,19 @@ class OrchestratorService:
                         ).model_dump(by_alias=True),
                     )
                 elif status_type == "agent_streaming":
+                    bridged_at = time.time()
                     await self._broadcast_event(
                         request_id,
                         ServerEventType.AGENT_STREAMING,
                         AgentStreamingPayload(
                             agent_id=data.get("agent_id", message.sender_role.lower().replace(" ", "_")),
                             chunk=data.get("chunk", ""),
+                            section=data.get("section"),
                         ).model_dump(by_alias=True),
                     )
+                    received_at = data.get("received_at")
+                    if received_at is not None:
+                        get_metrics().record_stream_chunk(received_at, bridged_at, time.time())
                 elif status_type == "confidence_update":
                     await self._broadcast_event(
                         request_id,
@@ -773,33 +746,27 @@ class OrchestratorService:
                         }
 
                     # Emit draft:update with all sections
-                    if context.current_sections:
-                        context.draft_version += 1
-                        sections_list = [
-                            {
-                                "id": sec_data["id"],
-                                "title": sec_data["title"],
-                                "content": sec_data["content"],
-                                "confidence": sec_data["confidence"],
-                                "unresolvedCritiques": sec_data["unresolvedCritiques"],
-                            }
-                            for sec_data in context.current_sections.values()
-                        ]
-                        full_draft = {
-                            "id": f"draft-{context.document_id}",
-                            "sections": sections_list,
-                            "overallConfidence": min(s["confidence"] for s in sections_list) if sections_list else 0,
-                            "updatedAt": datetime.now(timezone.utc).isoformat(),
-                            "version": context.draft_version,
-                        }
-                        await self._broadcast_event(
-                            request_id,
-                            ServerEventType.DRAFT_UPDATE,
-                            DraftUpdatePayload(
-                                draft=full_draft,
-                                changed_sections=[sec.get("name", "") for sec in sections_data],
-                            ).model_dump(by_alias=True),
-                        )
+                    await self._broadcast_draft(
+                        context, [sec.get("name", "") for sec in sections_data]
+                    )
+                elif status_type == "section_finalized":
+                    # A section of the final document, streamed from synthesis
+                    section = data.get("section", {})
+                    section_name = section.get("name", "unknown")
+                    metadata = section.get("metadata", {})
+                    context.current_sections[section_name] = {
+                        "id": f"sec-{section_name.lower().replace(' ', '-').replace('_', '-')}",
+                        "title": section_name,
+                        "content": section.get("content", ""),
+                        "confidence": round(metadata.get("confidence_score", 0.0) * 100, 2),
+                        "unresolvedCritiques": max(
+                            0, metadata.get("total_critiques", 0) - metadata.get("resolved_critiques", 0)
+                        ),
+                    }
+                    context.finalized_sections.append(section)
+
+                    await self._broadcast_draft(context, [section_name])
+                    await self._save_finalized_sections(context)
                 elif status_type == "agent_contribution":
                     # Handle agent contribution events (for Agent Insights panel)
                     # This forwards analysis data from blue team agents to the frontend
@@ -817,6 +784,39 @@ class OrchestratorService:
         except Exception as e:
             logger.error(f"Error handling message bus event: {e}", exc_info=True)
 
+    async def _broadcast_draft(self, context: GenerationContext, changed_sections: list[str]) -> None:
+        """Emit draft:update with every section of the current draft."""
+        if not context.current_sections:
+            return
+
+        context.draft_version += 1
+        sections_list = [
+            {
+                "id": sec_data["id"],
+                "title": sec_data["title"],
+                "content": sec_data["content"],
+                "confidence": sec_data["confidence"],
+                "unresolvedCritiques": sec_data["unresolvedCritiques"],
+            }
+            for sec_data in context.current_sections.values()
+        ]
+        full_draft = {
+            "id": f"draft-{context.document_id}",
+            "sections": sections_list,
+            "overallConfidence": min(s["confidence"] for s in sections_list) if sections_list else 0,
+            "updatedAt": datetime.now(timezone.utc).isoformat(),
+            "version": context.draft_version,
+        }
+        await self._broadcast_event(
+            context.request_id,
+            ServerEventType.DRAFT_UPDATE,
+            DraftUpdatePayload(
+                draft=full_draft,
+                changed_sections=changed_sections,
+                finalized_sections=[sec.get("name", "") for sec in context.finalized_sections],
+            ).model_dump(by_alias=True),
+        )
+
     async def _broadcast_registered_agents(self, context: GenerationContext) -> None:
         """Broadcast the list of registered agents."""
         agents = []
@@ -1034,11 +1034,24 @@ class OrchestratorService:
             )
             document = doc_result.scalar_one_or_none()
             if document:
-                document.content = result.document
+                # Sections, critiques, responses, the debate log and versions
+                # are stored as rows, not in the document's JSON columns
+                content = dict(result.document or {})
+                sections = content.pop("sections", [])
+                red_team_report = dict(result.red_team_report) if result.red_team_report else None
+                exchanges = red_team_report.pop("exchanges", []) if red_team_report else []
+                document.content = content
                 document.confidence = result.confidence.overall_score if result.confidence else 0
                 document.confidence_report = result.confidence.to_dict() if result.confidence else None
-                document.red_team_report = result.red_team_report
-                document.debate_log = result.debate_log if hasattr(result, 'debate_log') else []
+                document.red_team_report = red_team_report
+                document.debate_log = None
+                await DocumentsService(db).save_generation_records(
+                    document.id,
+                    sections=sections,
+                    debate_log=getattr(result, "debate_log", []),
+                    exchanges=exchanges,
+                    versions=getattr(result, "document_versions", []),
+                )
                 document.requires_human_review = result.requires_human_review
                 # Calculate severity counts from red_team_report
                 critiques_by_severity = result.red_team_report.get("critiques_by_severity", {}) if result.red_team_report else {}
@@ -1054,6 +1067,8 @@ class OrchestratorService:
                     "rebutted_count": responses_by_disposition.get("Rebut", 0),
                     "acknowledged_count": responses_by_disposition.get("Acknowledge", 0),
                     "time_elapsed_ms": int(result.duration_seconds * 1000),
+                    "llm_usage": result.llm_usage,
+                    "early_termination": result.early_termination,
                 }
                 # Update timestamp to indicate generation completed
                 document.updated_at = datetime.now(timezone.utc)
@@ -1073,10 +1088,46 @@ class OrchestratorService:
         except Exception as e:
             logger.error(f"Failed to save generation result: {e}")
 
+    async def _save_finalized_sections(self, context: GenerationContext) -> None:
+        """
+        Save the final document sections synthesized so far.
+
+        Written as each section is finalized, so the sections survive a failure
+        while the reports are built; _save_generation_result() then saves the
+        full document, whose content marks the sections final.
+        """
+        if context.db is None:
+            return
+
+        async with context.db_lock:
+            try:
+                # Select the deferred column itself: the Document created by
+                # start_generation() may be in this session with content unloaded
+                doc_result = await context.db.execute(
+                    select(Document.content).where(Document.id == context.document_id)
+                )
+                row = doc_result.one_or_none()
+                # Never overwrite the full document once it has been saved
+                if row is None or row.content is not None:
+                    return
+
+                await DocumentsService(context.db).save_sections(
+                    context.document_id, list(context.finalized_sections)
+                )
+                await context.db.execute(
+                    update(Document)
+                    .where(Document.id == context.document_id)
+                    .values(updated_at=datetime.now(timezone.utc))
+                )
+                await context.db.commit()
+            except Exception as e:
+                logger.error(f"Failed to save finalized sections: {e}")
+
     async def _cleanup_generation(self, context: GenerationContext, db: AsyncSession) -> None:
         """Clean up resources after generation completes."""
         # Update database
-        await self._update_db_status(context, db)
+        async with context.db_lock:
+            await self._update_db_status(context, db)
 
         # Stop message bus
         if context.message_bus:
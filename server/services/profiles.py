@@ -1,6 +1,10 @@
 """Company profile management service."""
 
-from typing import Optional
+import re
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +13,133 @@ from server.models.database import CompanyProfile
 from server.models.schemas import CompanyProfileCreate, CompanyProfileUpdate
 
 
+# ============================================================================
+# Profile Normalization
+# ============================================================================
+
+_ACRONYM_BOUNDARY = re.compile(r"(.)([A-Z][a-z]+)")
+_WORD_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=4096)
+def camel_to_snake(name: str) -> str:
+    """Convert camelCase to snake_case (memoized; profiles reuse a small set of keys)."""
+    # Handle acronyms and standard camelCase
+    s1 = _ACRONYM_BOUNDARY.sub(r"\1_\2", name)
+    return _WORD_BOUNDARY.sub(r"\1_\2", s1).lower()
+
+
+def convert_keys_to_snake_case(data: Any) -> Any:
+    """
+    Recursively convert all dictionary keys from camelCase to snake_case.
+
+    This is necessary because the frontend sends profile data in camelCase,
+    but the agents expect snake_case keys.
+    """
+    if isinstance(data, dict):
+        return {
+            (camel_to_snake(k) if isinstance(k, str) else k): convert_keys_to_snake_case(v)
+            for k, v in data.items()
+        }
+    elif isinstance(data, list):
+        return [convert_keys_to_snake_case(item) for item in data]
+    else:
+        return data
+
+
+def normalize_profile(profile: CompanyProfile) -> dict:
+    """
+    Build the snake_case profile dictionary agents receive.
+
+    Uses full_profile when available (all 40+ fields), merging in the
+    root-level fields stored in their own columns; otherwise falls back to
+    those columns alone.
+
+    Args:
+        profile: The stored company profile
+
+    Returns:
+        Profile dictionary with snake_case keys
+    """
+    if not profile.full_profile:
+        return {
+            "name": profile.name,
+            "description": profile.description,
+            "naics_codes": profile.naics_codes or [],
+            "certifications": profile.certifications or [],
+            "past_performance": profile.past_performance or [],
+        }
+
+    normalized = convert_keys_to_snake_case(profile.full_profile)
+    # Root-level fields are stored separately in the DB, not in full_profile
+    normalized["name"] = profile.name
+    if profile.description:
+        normalized["description"] = profile.description
+    if profile.naics_codes:
+        normalized["naics_codes"] = profile.naics_codes
+    if profile.certifications:
+        normalized["certifications"] = profile.certifications
+    if profile.past_performance:
+        normalized["past_performance"] = profile.past_performance
+    return normalized
+
+
+class NormalizedProfileCache:
+    """
+    Normalized profiles keyed by profile id and updated_at.
+
+    Profiles are normalized when saved, so generations reuse the result
+    instead of re-walking the whole profile. A changed updated_at means the
+    profile was edited (possibly by another process) and misses the cache.
+    """
+
+    def __init__(self, max_profiles: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_profiles: Least recently used profiles beyond this are evicted
+        """
+        self._max_profiles = max_profiles
+        self._entries: OrderedDict[str, tuple[Optional[datetime], dict]] = OrderedDict()
+
+    def store(self, profile: CompanyProfile) -> dict:
+        """Normalize a profile and cache the result."""
+        normalized = normalize_profile(profile)
+        self._entries[profile.id] = (profile.updated_at, normalized)
+        self._entries.move_to_end(profile.id)
+        while len(self._entries) > self._max_profiles:
+            self._entries.popitem(last=False)
+        return normalized
+
+    def get(self, profile: CompanyProfile) -> dict:
+        """
+        Get a profile's normalized form, normalizing it on a cache miss.
+
+        Returns:
+            A shallow copy, so callers may add top-level fields
+        """
+        entry = self._entries.get(profile.id)
+        if entry is not None and entry[0] == profile.updated_at:
+            self._entries.move_to_end(profile.id)
+            return dict(entry[1])
+        return dict(self.store(profile))
+
+    def discard(self, profile_id: str) -> None:
+        self._entries.pop(profile_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+normalized_profiles = NormalizedProfileCache()
+
+
+# ============================================================================
+# Profiles Service
+# ============================================================================
+
+
 class ProfilesService:
     """Service for managing company profiles."""
 
@@ -58,6 +189,7 @@ class ProfilesService:
         self.db.add(profile)
         await self.db.flush()
         await self.db.refresh(profile)
+        normalized_profiles.store(profile)
         return profile
 
     async def update(self, profile_id: str, data: CompanyProfileUpdate) -> Optional[CompanyProfile]:
@@ -78,6 +210,7 @@ class ProfilesService:
 
         await self.db.flush()
         await self.db.refresh(profile)
+        normalized_profiles.store(profile)
         return profile
 
     async def delete(self, profile_id: str) -> bool:
@@ -93,4 +226,5 @@ class ProfilesService:
 
         await self.db.delete(profile)
         await self.db.flush()
+        normalized_profiles.discard(profile_id)
         return True
@@ -190,6 +190,7 @@ class AgentStreamingPayload(BaseModel):
 
     agent_id: str = Field(alias="agentId")
     chunk: str
+    section: Optional[str] = None  # Set when sections stream concurrently
 
     class Config:
         populate_by_name = True
@@ -248,6 +249,8 @@ class DraftUpdatePayload(BaseModel):
 
     draft: dict[str, Any]
     changed_sections: list[str] = Field(default_factory=list, alias="changedSections")
+    # Sections of the final document synthesized so far
+    finalized_sections: list[str] = Field(default_factory=list, alias="finalizedSections")
 
     class Config:
         populate_by_name = True
@@ -5,6 +5,7 @@ Manages WebSocket connections, including lifecycle, broadcasting, and cleanup.
 
 import asyncio
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,7 +13,9 @@ from typing import Any, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from comms.tracing import span
 from server.config import settings
+from server.middleware import get_metrics
 from server.websocket.events import (
     ConnectedPayload,
     ServerEventType,
@@ -284,7 +287,8 @@ class ConnectionManager:
             return False
 
         try:
-            await connection.websocket.send_json(message)
+            with span("ws.send", connection_id=connection_id, event_type=message.get("type")):
+                await connection.websocket.send_json(message)
             # Refresh ping timestamp on successful send to keep connection alive
             connection.last_ping = datetime.utcnow()
             return True
@@ -335,6 +339,7 @@ class ConnectionManager:
         Returns:
             Number of connections that received the message
         """
+        start_time = time.perf_counter()
         message = create_server_message(event_type, payload, request_id)
 
         async with self._lock:
@@ -345,6 +350,7 @@ class ConnectionManager:
             if await self._send_to_connection(conn_id, message):
                 sent_count += 1
 
+        get_metrics().record_ws_event(event_type.value, (time.perf_counter() - start_time) * 1000)
         return sent_count
 
     async def broadcast_to_all(
@@ -362,6 +368,7 @@ class ConnectionManager:
         Returns:
             Number of connections that received the message
         """
+        start_time = time.perf_counter()
         message = create_server_message(event_type, payload, None)
 
         async with self._lock:
@@ -372,6 +379,7 @@ class ConnectionManager:
             if await self._send_to_connection(conn_id, message):
                 sent_count += 1
 
+        get_metrics().record_ws_event(event_type.value, (time.perf_counter() - start_time) * 1000)
         return sent_count
 
     async def send_error(
@@ -226,7 +226,10 @@ async def db_document(
     )
     db_session.add(document)
     await db_session.commit()
-    await db_session.refresh(document)
+    # The report columns are deferred; load them for tests that read them
+    await db_session.refresh(
+        document, ["content", "confidence_report", "red_team_report", "metrics"]
+    )
     return document
 
 
@@ -21,6 +21,17 @@ from agents.config import (
     DEFAULT_AGENT_CONFIGS,
     get_default_config,
     configure_llm_settings,
+    SimulationConfig,
+)
+import agents.config as agents_config
+from agents.simulated_llm import SimulatedLLMClient
+from agents.usage_ledger import (
+    LLMCallRecord,
+    StreamTimer,
+    UsageLedger,
+    activate_ledger,
+    deactivate_ledger,
+    estimate_cost,
 )
 from agents.base import (
     AbstractAgent,
@@ -30,6 +41,7 @@ from agents.base import (
     AgentOutput,
     SwarmContext,
 )
+from agents.utils.section_resolver import SectionResolver
 from agents.registry import (
     AgentRegistry,
     AgentRegistrationError,
@@ -452,6 +464,68 @@ class TestSwarmContext:
         theme_critiques = context.get_critiques_for_section("Win Themes")
         assert len(theme_critiques) == 1
 
+    def test_changed_sections(self):
+        """Test that only sections edited since the last critique are reported as changed."""
+        context = SwarmContext(section_drafts={"Executive Summary": "Summary", "Win Themes": "Themes"})
+        assert context.changed_sections() == ["Executive Summary", "Win Themes"]
+
+        context.mark_sections_critiqued()
+        assert context.changed_sections() == []
+
+        context.section_drafts["Win Themes"] = "Revised themes"
+        context.section_drafts["Pricing Strategy"] = "New section"
+        assert context.changed_sections() == ["Win Themes", "Pricing Strategy"]
+
+    def test_section_resolver_shared_until_sections_change(self):
+        """Test that the section resolver is reused until the section names change."""
+        context = SwarmContext(section_drafts={"Executive Summary": "Summary"})
+        resolver = context.get_section_resolver()
+
+        context.section_drafts["Executive Summary"] = "Revised summary"
+        assert context.get_section_resolver() is resolver
+
+        context.section_drafts["Win Themes"] = "Themes"
+        assert context.get_section_resolver() is not resolver
+        assert "Win Themes" in context.get_section_resolver()
+
+
+class TestSectionResolver:
+    """Tests for resolving critique targets to section names."""
+
+    SECTIONS = ["Executive Summary", "Main Content", "Past Performance", "Recommendations"]
+
+    def test_resolves_descriptive_targets(self):
+        """Test exact, case-insensitive, mentioned, alias and word-overlap targets."""
+        resolver = SectionResolver(self.SECTIONS)
+
+        assert resolver.resolve("Past Performance") == "Past Performance"
+        assert resolver.resolve("executive SUMMARY") == "Executive Summary"
+        assert resolver.resolve("'Immediate Actions (Months 1-3)' in the Executive Summary") == "Executive Summary"
+        assert resolver.resolve("Overview") == "Executive Summary"
+        assert resolver.resolve("Suggestion list for teaming") == "Recommendations"
+        assert resolver.resolve("Performance record citations") == "Past Performance"
+        assert resolver.resolve("Pricing") is None
+
+    def test_prefers_longest_mentioned_section(self):
+        """Test that the most specific section named in a target wins."""
+        resolver = SectionResolver(["Approach", "Technical Approach"])
+        assert resolver.resolve("Weak staffing in the Technical Approach") == "Technical Approach"
+
+    def test_memoizes_and_falls_back(self):
+        """Test that targets are resolved once and unmatched ones use the fallback."""
+        resolver = SectionResolver(["Acme Corp", "Capabilities", "Pricing"])
+        assert resolver.resolve("unrelated target") is None
+        assert resolver._resolved["unrelated target"] is None
+        assert resolver.resolve_or_fallback("unrelated target") == "Capabilities"
+
+        grouped = resolver.group([
+            {"id": "C1", "target_section": "pricing"},
+            {"id": "C2", "target_section": "Pricing assumptions"},
+            {"id": "C3", "target_section": "unrelated target"},
+        ])
+        assert [c["id"] for c in grouped["Pricing"]] == ["C1", "C2"]
+        assert "Capabilities" not in grouped
+
 
 # ============================================================================
 # Agent Output Tests
@@ -661,6 +735,230 @@ class TestAgentDecorator:
         registry.unregister(AgentRole.ARBITER)
 
 
+# ============================================================================
+# Simulated Provider Tests
+# ============================================================================
+
+class TestSimulatedProvider:
+    """Tests for the offline simulated LLM provider."""
+
+    def setup_method(self):
+        """Route agents to the simulated provider."""
+        self._saved_settings = agents_config._server_llm_settings
+        configure_llm_settings(provider="simulated", model="simulated", api_key_env_var="")
+
+    def teardown_method(self):
+        agents_config._server_llm_settings = self._saved_settings
+
+    def _agent(self, **simulation: Any) -> MockBlueAgent:
+        llm_config = LLMConfig(
+            max_retries=2,
+            retry_delay=0.0,
+            simulation=SimulationConfig(**{"latency_ms": 0, "tokens_per_second": 0, "seed": 7, **simulation}),
+        )
+        return MockBlueAgent(AgentConfig(role=AgentRole.STRATEGY_ARCHITECT, llm_config=llm_config))
+
+    @pytest.mark.asyncio
+    async def test_call_llm_returns_mock_content(self):
+        """Test that the simulated provider serves _generate_mock_content without an API key."""
+        agent = self._agent()
+        assert isinstance(agent._llm_client, SimulatedLLMClient)
+
+        response = await agent._call_llm("System prompt", "Draft the executive summary")
+
+        assert response["success"] is True
+        assert response["content"] == agent._generate_mock_content("Draft the executive summary")
+        assert response["usage"]["output_tokens"] > 0
+        assert agent.get_stats()["call_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_streaming_delivers_content_in_chunks(self):
+        """Test that streamed chunks reassemble to the full response."""
+        agent = self._agent(stream_chunk_tokens=2)
+        chunks: List[str] = []
+
+        response = await agent._call_llm("System", "Prompt", stream_callback=chunks.append)
+
+        assert response["success"] is True
+        assert len(chunks) > 1
+        assert "".join(chunks) == response["content"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("simulation, message", [
+        ({"rate_limit_rate": 1.0}, "Simulated rate limit"),
+        ({"server_error_rate": 1.0}, "Simulated server error"),
+    ])
+    async def test_injected_errors_are_retried(self, simulation, message):
+        """Test that injected 429/5xx errors go through the retry path."""
+        agent = self._agent(**simulation)
+
+        response = await agent._call_llm("System", "Prompt")
+
+        assert response["success"] is False
+        assert message in response["error"]
+        assert agent._llm_client.get_stats() == {"call_count": 2, "error_count": 2}
+
+    @pytest.mark.parametrize("distribution", ["fixed", "uniform", "normal", "lognormal", "exponential"])
+    def test_latency_sampling_is_seeded(self, distribution):
+        """Test latency distributions are non-negative and reproducible per seed."""
+        config = SimulationConfig(latency_distribution=distribution, latency_ms=500, latency_jitter_ms=100, seed=1)
+        first = SimulatedLLMClient(config, str, name="agent")
+        second = SimulatedLLMClient(config, str, name="agent")
+
+        samples = [first.sample_latency_ms() for _ in range(50)]
+
+        assert samples == [second.sample_latency_ms() for _ in range(50)]
+        assert all(sample >= 0 for sample in samples)
+        if distribution == "fixed":
+            assert set(samples) == {500}
+
+    def test_config_serialization(self):
+        """Test that simulation settings round-trip through LLMConfig."""
+        config = LLMConfig(simulation=SimulationConfig(latency_ms=50, rate_limit_rate=0.1))
+
+        restored = LLMConfig.from_json(config.to_json())
+
+        assert restored.provider == "simulated"
+        assert restored.simulation == config.simulation
+
+
+class TestUsageLedger:
+    """Tests for the per-generation LLM usage ledger."""
+
+    def setup_method(self):
+        """Route agents to the simulated provider."""
+        self._saved_settings = agents_config._server_llm_settings
+        configure_llm_settings(provider="simulated", model="simulated", api_key_env_var="")
+
+    def teardown_method(self):
+        agents_config._server_llm_settings = self._saved_settings
+
+    def _agent(self, **simulation: Any) -> MockBlueAgent:
+        llm_config = LLMConfig(
+            max_retries=2,
+            retry_delay=0.0,
+            simulation=SimulationConfig(**{"latency_ms": 0, "tokens_per_second": 0, "seed": 7, **simulation}),
+        )
+        return MockBlueAgent(AgentConfig(role=AgentRole.STRATEGY_ARCHITECT, llm_config=llm_config))
+
+    def test_estimate_cost(self):
+        """Test cost estimates from list prices, including cache tokens."""
+        cost = estimate_cost(
+            "claude-haiku-4-5-20251001",
+            input_tokens=1_000_000,
+            output_tokens=1_000_000,
+            cache_read_input_tokens=1_000_000,
+        )
+
+        assert cost == pytest.approx(1.00 + 5.00 + 0.10)
+        assert estimate_cost("simulated", input_tokens=1000) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_calls_recorded_with_phase_and_operation(self):
+        """Test that calls are recorded into the active ledger with workflow attribution."""
+        agent = self._agent()
+        ledger = UsageLedger(request_id="REQ-1")
+        ledger.set_phase("RedAttack", 2)
+        chunks: List[str] = []
+
+        token = activate_ledger(ledger)
+        try:
+            await agent._call_llm("System", "Prompt", operation="critique_section")
+            await agent._call_llm("System", "Prompt", stream_callback=chunks.append)
+        finally:
+            deactivate_ledger(token)
+        await agent._call_llm("System", "Not recorded")
+
+        plain, streamed = ledger.records
+        assert len(ledger.records) == 2
+        assert plain.agent_name == agent.name
+        assert plain.phase == "RedAttack" and plain.round_number == 2
+        assert plain.operation == "critique_section"
+        assert plain.output_tokens > 0
+        assert plain.time_to_first_token_ms is None
+        assert streamed.streamed and streamed.time_to_first_token_ms is not None
+        assert streamed.chunk_count == len(chunks) > 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_telemetry(self):
+        """Test that streaming calls record chunk timing and throughput."""
+        agent = self._agent(latency_distribution="fixed", latency_ms=20, tokens_per_second=2000, stream_chunk_tokens=4)
+        ledger = UsageLedger()
+        chunks: List[str] = []
+
+        token = activate_ledger(ledger)
+        try:
+            response = await agent._call_llm("System", "Prompt", stream_callback=chunks.append)
+        finally:
+            deactivate_ledger(token)
+
+        record = ledger.records[0]
+        assert response["streaming"]["chunk_count"] == len(chunks) > 1
+        assert record.time_to_first_token_ms >= 15
+        assert record.max_inter_chunk_ms >= record.mean_inter_chunk_ms > 0
+        assert record.output_tokens_per_second > 0
+
+        by_model = ledger.summarize()["by_model"][record.model]
+        assert by_model["mean_output_tokens_per_second"] == record.output_tokens_per_second
+        assert by_model["max_inter_chunk_ms"] == record.max_inter_chunk_ms
+
+    def test_stream_timer_single_chunk(self):
+        """Test that a one-chunk stream reports no gaps or rate."""
+        received: List[str] = []
+        timer = StreamTimer(received.append)
+        timer("all at once")
+
+        summary = timer.summary(output_tokens=3)
+
+        assert received == ["all at once"]
+        assert summary["chunk_count"] == 1
+        assert summary["time_to_first_token_ms"] is not None
+        assert summary["max_inter_chunk_ms"] is None
+        assert summary["output_tokens_per_second"] is None
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_record_retries(self):
+        """Test that exhausted retries are recorded as a failed call."""
+        agent = self._agent(rate_limit_rate=1.0)
+        ledger = UsageLedger()
+
+        token = activate_ledger(ledger)
+        try:
+            await agent._call_llm("System", "Prompt")
+        finally:
+            deactivate_ledger(token)
+
+        record = ledger.records[0]
+        assert record.success is False
+        assert record.retries == 1
+        assert "Simulated rate limit" in record.error
+
+    def test_summary_and_serialization(self):
+        """Test aggregation by agent and phase, and round-tripping through dicts."""
+        ledger = UsageLedger(request_id="REQ-1")
+        ledger.record(LLMCallRecord("Strategy Architect", "Strategy Architect", "anthropic",
+                                    "claude-haiku-4-5-20251001", phase="BlueBuild",
+                                    input_tokens=1000, output_tokens=500, latency_ms=900))
+        ledger.record(LLMCallRecord("Devil's Advocate", "Devil's Advocate", "anthropic",
+                                    "claude-haiku-4-5-20251001", phase="RedAttack",
+                                    input_tokens=2000, output_tokens=100, latency_ms=400,
+                                    time_to_first_token_ms=150))
+
+        summary = ledger.summarize()
+
+        assert summary["totals"]["calls"] == 2
+        assert summary["totals"]["input_tokens"] == 3000
+        assert summary["totals"]["max_latency_ms"] == 900
+        assert summary["totals"]["mean_time_to_first_token_ms"] == 150
+        assert summary["by_phase"]["BlueBuild"]["estimated_cost_usd"] == pytest.approx(0.0035)
+        assert set(summary["by_agent"]) == {"Strategy Architect", "Devil's Advocate"}
+        assert summary["by_model"]["claude-haiku-4-5-20251001"]["calls"] == 2
+
+        restored = UsageLedger.from_dict(ledger.to_dict())
+        assert restored.request_id == "REQ-1"
+        assert [r.to_dict() for r in restored.records] == [r.to_dict() for r in ledger.records]
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -5,6 +5,7 @@ Comprehensive tests for Chunk 12: Arbiter Agent & Debate Loop
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -12,6 +13,11 @@ from typing import Dict, List, Any
 
 # Import the components we're testing
 from agents.orchestrator import (
+    BlueAnalysisMemo,
+    CycleMetrics,
+    revision_delta,
+    deduplicate_critiques,
+    CritiqueIndex,
     ArbiterAgent,
     DocumentRequest,
     FinalOutput,
@@ -25,6 +31,8 @@ from agents.orchestrator import (
     ConsensusConfig,
     DocumentSynthesizer,
     SynthesisConfig,
+    BatchProgress,
+    SharedBlueAnalyses,
 )
 
 from agents.base import SwarmContext, AgentOutput
@@ -256,6 +264,22 @@ class TestArbiterAgent:
         await arbiter.cleanup()
         mock_message_bus.stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_round_callbacks_attached_per_request(self, mock_registry, mock_message_bus, document_request):
+        """Test that round callbacks survive the per-request round manager reset."""
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(
+            registry=mock_registry,
+            message_bus=mock_message_bus,
+        )
+
+        on_round_start = MagicMock()
+        arbiter.set_round_callbacks(on_round_start=on_round_start)
+        await arbiter._setup_for_request(document_request)
+
+        arbiter._round_manager.start_round(RoundType.BLUE_BUILD)
+        on_round_start.assert_called_once_with(1, RoundType.BLUE_BUILD)
+
 
 # ============================================================================
 # Document Request Tests
@@ -463,6 +487,76 @@ class TestConsensusDetector:
         suggestion = detector.suggest_next_action(result)
         assert suggestion["action"] == "address_blocking_issues"
 
+    def test_revision_delta(self):
+        """Test that revision delta is the fraction of words changed per section."""
+        before = {"A": "one two three four", "B": "unchanged text"}
+        after = {"A": "one two three five", "B": "unchanged text", "C": "new section"}
+
+        assert revision_delta(before, before) == 0.0
+        assert revision_delta(before, after) == pytest.approx(1.25)
+
+    def test_marginal_value_stops_on_minor_cycle(self):
+        """Test that a cycle yielding only minor critiques ends the debate."""
+        detector = ConsensusDetector()
+        cycles = [
+            CycleMetrics(cycle=1, new_critiques_by_severity={"major": 3}, revision_delta=1.0,
+                         tokens=40000, cost_usd=0.30),
+            CycleMetrics(cycle=2, new_critiques_by_severity={"minor": 1}, revision_delta=0.1,
+                         tokens=20000, cost_usd=0.20),
+        ]
+
+        decision = detector.assess_marginal_value(cycles, ConsensusResult(), remaining_cycles=2)
+
+        assert decision.stop is True
+        assert decision.value_per_dollar < detector.config.min_value_per_dollar
+        assert decision.rounds_saved == 2
+        assert decision.tokens_saved == 40000
+        assert decision.cost_saved_usd == pytest.approx(0.40)
+
+    def test_marginal_value_damped_by_rising_resolution_rate(self):
+        """Test that a resolution rate rising toward the threshold lowers the projected value."""
+        detector = ConsensusDetector()
+
+        def cycles(first_rate, second_rate):
+            return [
+                CycleMetrics(cycle=1, new_critiques_by_severity={"major": 4}, tokens=20000,
+                             cost_usd=0.20, resolution_rate=first_rate),
+                CycleMetrics(cycle=2, new_critiques_by_severity={"major": 3}, tokens=20000,
+                             cost_usd=0.20, resolution_rate=second_rate),
+            ]
+
+        flat = detector.assess_marginal_value(cycles(0.5, 0.5), ConsensusResult(), 2)
+        rising = detector.assess_marginal_value(cycles(0.5, 0.6), ConsensusResult(), 2)
+        converging = detector.assess_marginal_value(cycles(0.4, 0.7), ConsensusResult(), 2)
+
+        assert flat.convergence_damping == 1.0
+        assert flat.stop is False
+        # Another 0.1 rise would leave half of the 0.2 gap to the 0.8 threshold
+        assert rising.convergence_damping == pytest.approx(0.5)
+        assert rising.expected_value == pytest.approx(flat.expected_value * 0.5)
+        assert converging.convergence_damping == detector.config.min_convergence_damping
+        assert converging.stop is True
+
+    def test_marginal_value_continues(self):
+        """Test that productive cycles, blocking issues and unknown costs continue the debate."""
+        detector = ConsensusDetector()
+        productive = [CycleMetrics(cycle=1, new_critiques_by_severity={"critical": 2, "major": 2},
+                                   revision_delta=2.0, tokens=30000, cost_usd=0.25)]
+        minor = [CycleMetrics(cycle=1, new_critiques_by_severity={"minor": 1}, tokens=30000)]
+
+        assert detector.assess_marginal_value(productive, ConsensusResult(), 2).stop is False
+        assert detector.assess_marginal_value(
+            minor, ConsensusResult(has_blocking_issues=True), 2
+        ).stop is False
+        assert detector.assess_marginal_value(
+            [CycleMetrics(cycle=1, new_critiques_by_severity={"minor": 1})], ConsensusResult(), 2
+        ).stop is False
+        # Unpriced models fall back to a per-token cost estimate
+        unpriced = detector.assess_marginal_value(minor, ConsensusResult(), 2)
+        assert unpriced.stop is True
+        assert unpriced.cost_saved_usd == pytest.approx(unpriced.expected_cost_usd * 2)
+        assert unpriced.cost_saved_usd > 0
+
 
 # ============================================================================
 # Document Synthesis Tests
@@ -541,6 +635,30 @@ class TestDocumentSynthesizer:
         assert "metadata" in result
         assert result["metadata"]["total_critiques"] == 1
 
+    @pytest.mark.asyncio
+    async def test_synthesize_streams_sections_in_document_order(self):
+        """Test that each section is handed to on_section as it is finalized."""
+        synthesizer = DocumentSynthesizer()
+        sections = {"Conclusion": "Wrap up.", "Executive Summary": "Summary."}
+        critiques = [{"id": "C1", "target_section": "Executive Summary", "severity": "major"}]
+        streamed = []
+
+        async def on_section(name, content, metadata):
+            streamed.append((name, content, metadata.total_critiques))
+
+        result = await synthesizer.synthesize(
+            sections=sections,
+            critiques=critiques,
+            responses=[],
+            context=SwarmContext(request_id="TEST-001"),
+            on_section=on_section,
+        )
+
+        assert [name for name, _, _ in streamed] == [s["name"] for s in result["sections"]]
+        assert streamed[0][0] == "Executive Summary"
+        assert streamed[0][1].startswith("<!-- NOTE: 1 unresolved major issue(s) -->")
+        assert streamed[0][2] == 1
+
     def test_format_as_markdown(self):
         """Test formatting document as Markdown."""
         synthesizer = DocumentSynthesizer()
@@ -807,6 +925,28 @@ class TestArbiterIntegration:
             # Should complete quickly with no adversarial rounds
             assert output.success
 
+    @pytest.mark.asyncio
+    async def test_carried_critiques_alone_end_adversarial_phase(
+        self, mock_registry, mock_message_bus, document_request
+    ):
+        """Test that a round raising only carried-forward critiques ends the cycles."""
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+
+        # An unresolvable critique the red team carries forward every round
+        stuck = {"id": "CRIT-001", "target_section": "Nowhere", "severity": "major"}
+        defense = AsyncMock(return_value=[])
+        with patch.object(arbiter, "_run_red_team_attack", AsyncMock(return_value=[stuck])), \
+                patch.object(arbiter, "_run_blue_team_defense", defense), \
+                patch.object(arbiter, "_check_consensus", return_value=MagicMock(reached=False)), \
+                patch.object(arbiter._consensus_detector, "assess_marginal_value",
+                             return_value=MagicMock(stop=False)), \
+                patch.object(arbiter, "_run_synthesis", new_callable=AsyncMock):
+            await arbiter.generate_document(document_request)
+
+        assert defense.await_count == 1
+        assert arbiter._all_critiques == [stuck]
+
     @pytest.mark.asyncio
     async def test_human_escalation_on_low_confidence(self):
         """Test that low confidence triggers human escalation flag."""
@@ -844,6 +984,492 @@ class TestArbiterIntegration:
         assert len(score.review_reasons) > 0
 
 
+class TestRevisionPipeline:
+    """Tests that each section is revised once per critique."""
+
+    @pytest_asyncio.fixture
+    async def arbiter(self, mock_registry, mock_message_bus, document_request):
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        await arbiter._setup_for_request(document_request)
+        arbiter._workflow_config = arbiter._get_workflow_config(document_request)
+        arbiter._current_draft = {"Executive Summary": "Original summary."}
+        arbiter._current_context.section_drafts = dict(arbiter._current_draft)
+        arbiter._all_critiques = [{"id": "CRIT-001", "target_section": "Executive Summary"}]
+        return arbiter
+
+    @pytest.mark.asyncio
+    async def test_defense_revision_not_repeated(self, arbiter, mock_registry):
+        """Test that sections revised during BlueDefense are not revised again."""
+        responder = mock_registry.create(AgentRole.STRATEGY_ARCHITECT)
+        responder.process = AsyncMock(return_value=AgentOutput(
+            agent_role=AgentRole.STRATEGY_ARCHITECT,
+            sections={"Executive Summary": "Revised summary."},
+            responses=[{
+                "critique_id": "CRIT-001",
+                "target_section": "Executive Summary",
+                "disposition": "Accept",
+                "changes_made": True,
+            }],
+            success=True,
+        ))
+
+        responses = await arbiter._run_blue_team_defense(arbiter._all_critiques)
+        draft = await arbiter._apply_accepted_changes(arbiter._current_draft, responses)
+
+        assert draft["Executive Summary"] == "Revised summary."
+        responder.revise_section.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_accepted_critique_revised_once(self, arbiter, mock_registry):
+        """Test that an accepted critique is sent to revise_section only once."""
+        reviser = mock_registry.create(AgentRole.STRATEGY_ARCHITECT)
+        reviser.revise_section = AsyncMock(return_value="Revised summary.")
+        responses = [{"critique_id": "CRIT-001", "disposition": "Accept"}]
+
+        draft = await arbiter._apply_accepted_changes(arbiter._current_draft, responses)
+        draft = await arbiter._apply_accepted_changes(draft, responses)
+
+        assert draft["Executive Summary"] == "Revised summary."
+        reviser.revise_section.assert_awaited_once()
+        assert reviser.revise_section.call_args.args[2] == arbiter._all_critiques
+
+
+class TestDeltaCritique:
+    """Tests that later red rounds critique only changed sections."""
+
+    SECTIONS = {
+        "Executive Summary": "Summary.",
+        "Win Themes": "Themes.",
+        "Discriminators": "Discriminators.",
+        "Risk Mitigation": "Risks.",
+        "Compliance Checklist": "Checklist.",
+    }
+
+    @pytest_asyncio.fixture
+    async def arbiter(self, mock_registry, mock_message_bus, document_request):
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        await arbiter._setup_for_request(document_request)
+        arbiter._workflow_config = arbiter._get_workflow_config(document_request)
+        arbiter._current_draft = dict(self.SECTIONS)
+        arbiter._current_context.section_drafts = arbiter._current_draft
+        return arbiter
+
+    @pytest.mark.asyncio
+    async def test_second_round_critiques_changed_sections(self, arbiter, mock_registry):
+        """Test that unchanged sections are not resent and their critiques carry forward."""
+        red_agent = mock_registry.create(AgentRole.DEVILS_ADVOCATE)
+
+        first = await arbiter._run_red_team_attack()
+        assert set(red_agent.process.call_args.args[0].section_drafts) == set(self.SECTIONS)
+
+        pending = {"id": "CRIT-002", "target_section": "Compliance Checklist"}
+        stale = {"id": "CRIT-003", "target_section": "Win Themes"}
+        arbiter._current_context.pending_critiques = [pending, stale]
+        arbiter._current_draft["Win Themes"] = "Revised themes."
+
+        second = await arbiter._run_red_team_attack()
+
+        # Discriminators builds on Win Themes, so it is re-checked with it
+        context = red_agent.process.call_args.args[0]
+        assert list(context.section_drafts) == ["Win Themes", "Discriminators"]
+        assert context.custom_data["critique_mode"] == "delta"
+        assert second == first + [pending]
+
+    @pytest.mark.asyncio
+    async def test_wide_changes_critique_whole_document(self, arbiter, mock_registry):
+        """Test that the whole document is critiqued when most sections changed."""
+        red_agent = mock_registry.create(AgentRole.DEVILS_ADVOCATE)
+        await arbiter._run_red_team_attack()
+
+        arbiter._current_draft["Executive Summary"] = "Revised summary."
+
+        await arbiter._run_red_team_attack()
+
+        context = red_agent.process.call_args.args[0]
+        assert context is arbiter._current_context
+        assert "critique_mode" not in context.custom_data
+
+    @pytest.mark.asyncio
+    async def test_unchanged_document_skips_red_agents(self, arbiter, mock_registry):
+        """Test that no red agent runs when nothing changed."""
+        red_agent = mock_registry.create(AgentRole.DEVILS_ADVOCATE)
+        await arbiter._run_red_team_attack()
+        arbiter._current_context.pending_critiques = []
+
+        critiques = await arbiter._run_red_team_attack()
+
+        assert critiques == []
+        assert red_agent.process.await_count == 1
+
+
+class TestDefenseAnalysisMemo:
+    """Tests that non-responder blue analyses re-run only when their inputs change."""
+
+    @staticmethod
+    def make_analyst(role: AgentRole, delay: float = 0.0, events: List[str] = None) -> MagicMock:
+        async def process(context):
+            if events is not None:
+                events.append(f"{role.value} start")
+            await asyncio.sleep(delay)
+            if events is not None:
+                events.append(f"{role.value} end")
+            return AgentOutput(agent_role=role, content=f"{role.value} analysis", success=True)
+
+        agent = MagicMock()
+        agent.role = role
+        agent.name = role.value
+        agent.process = AsyncMock(side_effect=process)
+        return agent
+
+    @pytest_asyncio.fixture
+    async def arbiter(self, mock_registry, mock_message_bus, document_request):
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        await arbiter._setup_for_request(document_request)
+        arbiter._current_draft = {"Executive Summary": "Summary."}
+        arbiter._current_context.section_drafts = arbiter._current_draft
+        return arbiter
+
+    def test_key_covers_only_inputs_read(self):
+        """Test that the memo key changes only when a field the agent reads changes."""
+        memo = BlueAnalysisMemo()
+        context = SwarmContext(company_profile={"name": "Test"}, opportunity={"title": "A"})
+        key = memo.key_for(AgentRole.MARKET_ANALYST, context)
+
+        context.custom_data["agent_analyses"] = {"market_analyst": "..."}
+        context.section_drafts = {"Executive Summary": "Summary."}
+        assert memo.key_for(AgentRole.MARKET_ANALYST, context) == key
+        assert memo.key_for(AgentRole.STRATEGY_ARCHITECT, context) is None
+
+        context.opportunity = {"title": "B"}
+        assert memo.key_for(AgentRole.MARKET_ANALYST, context) != key
+
+    @pytest.mark.asyncio
+    async def test_unchanged_analyses_not_rerun(self, arbiter, mock_registry):
+        """Test that analyses with unchanged inputs are reused across defense rounds."""
+        responder = mock_registry.create(AgentRole.STRATEGY_ARCHITECT)
+        responder.process = AsyncMock(return_value=AgentOutput(
+            agent_role=AgentRole.STRATEGY_ARCHITECT, success=True,
+        ))
+        market_analyst = self.make_analyst(AgentRole.MARKET_ANALYST)
+        navigator = self.make_analyst(AgentRole.COMPLIANCE_NAVIGATOR)
+        mock_registry.create_blue_team = MagicMock(return_value=[responder, market_analyst, navigator])
+
+        # BlueBuild output seeds the memo
+        await arbiter._process_blue_build_agent(market_analyst)
+        await arbiter._run_blue_team_defense([])
+        await arbiter._run_blue_team_defense([])
+
+        assert market_analyst.process.await_count == 1
+        assert navigator.process.await_count == 1
+
+        # The navigator reads the draft, so a revision re-runs it
+        arbiter._current_draft["Executive Summary"] = "Revised summary."
+        await arbiter._run_blue_team_defense([])
+
+        assert market_analyst.process.await_count == 1
+        assert navigator.process.await_count == 2
+        roles = [c["agent_role"] for c in arbiter._blue_team_contributions]
+        assert roles == [AgentRole.COMPLIANCE_NAVIGATOR.value] * 2
+
+    @pytest.mark.asyncio
+    async def test_analyses_run_alongside_responder(self, arbiter, mock_registry):
+        """Test that analyses not reading the draft run concurrently with the responder."""
+        events: List[str] = []
+
+        async def respond(context):
+            events.append("responder start")
+            await asyncio.sleep(0.02)
+            events.append("responder end")
+            return AgentOutput(agent_role=AgentRole.STRATEGY_ARCHITECT, success=True)
+
+        responder = mock_registry.create(AgentRole.STRATEGY_ARCHITECT)
+        responder.process = AsyncMock(side_effect=respond)
+        market_analyst = self.make_analyst(AgentRole.MARKET_ANALYST, 0.01, events)
+        navigator = self.make_analyst(AgentRole.COMPLIANCE_NAVIGATOR, 0.01, events)
+        mock_registry.create_blue_team = MagicMock(return_value=[responder, market_analyst, navigator])
+
+        await arbiter._run_blue_team_defense([])
+
+        assert events.index("Market Analyst start") < events.index("responder end")
+        assert events.index("Compliance Navigator start") > events.index("responder end")
+
+
+class TestCritiqueDeduplication:
+    """Tests for merging near-duplicate critiques across red agents."""
+
+    UPTIME = {
+        "id": "CRIT-DA",
+        "agent": "Devil's Advocate",
+        "target_section": "Executive Summary",
+        "severity": "major",
+        "title": "Unsupported uptime claim",
+        "argument": "The executive summary claims 99.9% uptime without citing past performance evidence.",
+        "suggested_remedy": "Cite past performance metrics supporting the uptime claim.",
+    }
+    UPTIME_REWORDED = {
+        "id": "CRIT-EV",
+        "agent": "Evaluator Simulator",
+        "target_section": "executive summary",
+        "severity": "critical",
+        "title": "Uptime claim lacks evidence",
+        "argument": "No past performance evidence supports the 99.9% uptime claim.",
+        "suggested_remedy": "Add past performance evidence for the uptime claim.",
+    }
+    PRICING = {
+        "id": "CRIT-CS",
+        "agent": "Competitor Simulator",
+        "target_section": "Executive Summary",
+        "severity": "major",
+        "title": "Pricing too aggressive",
+        "argument": "The price-to-win analysis ignores incumbent labor rates.",
+        "suggested_remedy": "Benchmark labor rates against the incumbent.",
+    }
+
+    def test_rewordings_merged_with_sources(self):
+        """Test that the same issue from two agents becomes one critique."""
+        merged = deduplicate_critiques([self.UPTIME, self.PRICING, self.UPTIME_REWORDED])
+
+        assert [c["id"] for c in merged] == ["CRIT-EV", "CRIT-CS"]
+        assert merged[0]["severity"] == "critical"
+        assert merged[0]["sources"] == ["Devil's Advocate", "Evaluator Simulator"]
+        assert merged[0]["related_critiques"] == ["CRIT-DA"]
+        assert "sources" not in self.UPTIME_REWORDED
+
+    def test_other_sections_and_threshold(self):
+        """Test that critiques of different sections, or below threshold, are kept."""
+        other_section = {**self.UPTIME_REWORDED, "target_section": "Win Themes"}
+
+        assert len(deduplicate_critiques([self.UPTIME, other_section])) == 2
+        assert len(deduplicate_critiques([self.UPTIME, self.UPTIME_REWORDED], threshold=1.0)) == 2
+
+    def test_free_text_targets_resolved_to_section(self):
+        """Test that targets naming the same section differently are compared."""
+        from agents.utils.section_resolver import SectionResolver
+
+        described = {**self.UPTIME_REWORDED, "target_section": "the executive summary's uptime claim"}
+        resolver = SectionResolver(["Executive Summary", "Win Themes"])
+
+        assert len(deduplicate_critiques([self.UPTIME, described])) == 2
+        assert [c["id"] for c in deduplicate_critiques([self.UPTIME, described], resolver=resolver)] == ["CRIT-EV"]
+
+    @pytest.mark.asyncio
+    async def test_red_attack_merges_duplicates(self, mock_registry, mock_message_bus, document_request):
+        """Test that RedAttack publishes and hands BlueDefense one critique per issue."""
+        agents = []
+        for critique in (self.UPTIME, self.UPTIME_REWORDED):
+            agent = MagicMock()
+            agent.role = AgentRole.DEVILS_ADVOCATE
+            agent.name = critique["agent"]
+            agent.process = AsyncMock(return_value=AgentOutput(
+                agent_role=AgentRole.DEVILS_ADVOCATE, critiques=[dict(critique)], success=True,
+            ))
+            agents.append(agent)
+        mock_registry.create_red_team = MagicMock(return_value=agents)
+
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        await arbiter._setup_for_request(document_request)
+        arbiter._current_context.section_drafts = {"Executive Summary": "Summary."}
+
+        critiques = await arbiter._run_red_team_attack()
+
+        assert [c["id"] for c in critiques] == ["CRIT-EV"]
+        assert arbiter._current_context.pending_critiques == critiques
+
+        published = [
+            call.args[0] for call in mock_message_bus.publish.call_args_list
+            if call.args[0].message_type == MessageType.CRITIQUE
+        ]
+        assert [m.payload.structured_data["id"] for m in published] == ["CRIT-EV"]
+        assert published[0].sender_role == "Evaluator Simulator"
+        assert published[0].payload.structured_data["sources"] == ["Devil's Advocate", "Evaluator Simulator"]
+        assert published[0].payload.structured_data["related_critiques"] == ["CRIT-DA"]
+        assert critiques[0]["message_id"] == published[0].id
+
+
+class TestCritiqueIndex:
+    """Tests for the single-pass critique and response aggregate."""
+
+    CRITIQUES = [
+        {"id": "C1", "target_section": "Executive Summary", "severity": "critical", "title": "Vague"},
+        {"id": "C2", "target_section": "Pricing assumptions in the Executive Summary", "severity": "major"},
+        {"id": "C3", "target_section": "Past Performance", "severity": "minor"},
+        {"id": "C4", "target_section": "Past Performance", "severity": "Major"},
+    ]
+    RESPONSES = [
+        {"critique_id": "C1", "disposition": "Rebut"},
+        {"critique_id": "C1", "disposition": "Accept"},
+        {"critique_id": "C3", "disposition": "Acknowledge"},
+    ]
+
+    def test_aggregates_by_resolved_section(self):
+        """Test per-section, severity and disposition counts from one pass."""
+        from agents.utils.section_resolver import SectionResolver
+
+        index = CritiqueIndex(
+            self.CRITIQUES, self.RESPONSES,
+            SectionResolver(["Executive Summary", "Past Performance"]),
+        )
+
+        summary = index.for_section("Executive Summary")
+        assert [c["id"] for c in summary.critiques] == ["C1", "C2"]
+        assert summary.resolved == 1 and summary.accepted == 1
+        assert summary.unresolved_by_severity["major"] == 1
+
+        performance = index.for_section("Past Performance")
+        assert performance.resolved == 1 and performance.unresolved_by_severity["major"] == 1
+        assert index.for_section("Win Themes").critiques == []
+
+        assert index.response_for(self.CRITIQUES[0])["disposition"] == "Accept"
+        assert index.section_of(self.CRITIQUES[1]) == "Executive Summary"
+        assert index.reported_severity_counts() == {"critical": 1, "major": 2, "minor": 1}
+        assert index.response_count() == 3
+        assert index.response_count(("Accept", "Partial Accept", "Rebut")) == 2
+        assert index.resolved_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reports_share_index(self, mock_registry, mock_message_bus, document_request):
+        """Test that confidence and the red team report read the same index."""
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        await arbiter._setup_for_request(document_request)
+        arbiter._current_draft = {"Executive Summary": "Summary.", "Past Performance": "Record."}
+        arbiter._current_context.section_drafts = arbiter._current_draft
+        arbiter._all_critiques = [dict(c) for c in self.CRITIQUES]
+        arbiter._all_responses = [dict(r) for r in self.RESPONSES]
+
+        index = arbiter._get_critique_index()
+        confidence = arbiter._calculate_confidence({})
+        report = arbiter._generate_red_team_report()
+
+        assert arbiter._get_critique_index() is index
+        by_name = {s.section_name: s for s in confidence.section_scores}
+        assert by_name["Executive Summary"].critique_count == 2
+        assert by_name["Executive Summary"].unresolved_critiques == 1
+        assert report["critiques_by_section"] == {"Executive Summary": 2, "Past Performance": 2}
+        assert report["summary"]["resolved_critiques"] == 2
+        assert report["responses_by_disposition"]["Accept"] == 1
+
+        arbiter._all_responses.append({"critique_id": "C2", "disposition": "Accept"})
+        assert arbiter._get_critique_index() is not index
+
+
+class TestBatchGeneration:
+    """Tests for batch generation across opportunities."""
+
+    @pytest.mark.asyncio
+    async def test_shared_analysis_runs_once(self):
+        """Test that concurrent requests for a shared analysis run it once."""
+        shared = SharedBlueAnalyses()
+        context = SwarmContext(company_profile={"name": "Test"}, opportunity={"title": "A"})
+        other = SwarmContext(company_profile={"name": "Test"}, opportunity={"title": "B"})
+        key = shared.key_for(AgentRole.MARKET_ANALYST, context)
+
+        assert key == shared.key_for(AgentRole.MARKET_ANALYST, other)
+        assert shared.key_for(AgentRole.STRATEGY_ARCHITECT, context) is None
+
+        async def run():
+            await asyncio.sleep(0.01)
+            return AgentOutput(agent_role=AgentRole.MARKET_ANALYST, content="Market", success=True)
+
+        run_mock = AsyncMock(side_effect=run)
+        outputs = await asyncio.gather(*(shared.get_or_run(key, run_mock) for _ in range(3)))
+
+        assert run_mock.await_count == 1
+        assert all(output is outputs[0] for output in outputs)
+        assert (shared.runs, shared.reuses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_not_shared(self):
+        """Test that a failed analysis is rerun by the next request."""
+        shared = SharedBlueAnalyses()
+        key = shared.key_for(AgentRole.MARKET_ANALYST, SwarmContext(company_profile={"name": "Test"}))
+        failed = AgentOutput(agent_role=AgentRole.MARKET_ANALYST, success=False)
+        succeeded = AgentOutput(agent_role=AgentRole.MARKET_ANALYST, success=True)
+
+        assert await shared.get_or_run(key, AsyncMock(return_value=failed)) is failed
+        assert await shared.get_or_run(key, AsyncMock(return_value=succeeded)) is succeeded
+        assert shared.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_generate_batch(self, mock_registry, mock_message_bus, sample_company_profile):
+        """Test that a batch shares profile-level analyses and reports progress."""
+        market_analyst = MagicMock()
+        market_analyst.role = AgentRole.MARKET_ANALYST
+        market_analyst.name = "Market Analyst"
+        market_analyst.process = AsyncMock(return_value=AgentOutput(
+            agent_role=AgentRole.MARKET_ANALYST,
+            agent_name="Market Analyst",
+            content="Market analysis",
+            success=True,
+        ))
+        strategy_architect = mock_registry.create(AgentRole.STRATEGY_ARCHITECT)
+        mock_registry.create_blue_team = MagicMock(return_value=[strategy_architect, market_analyst])
+
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+
+        requests = [
+            DocumentRequest(
+                id=f"REQ-{i}",
+                document_type="Simple",
+                company_profile=sample_company_profile,
+                opportunity={"title": f"Opportunity {i}"},
+                max_adversarial_rounds=0,
+            )
+            for i in range(3)
+        ]
+        events: List[BatchProgress] = []
+
+        with patch.object(ArbiterAgent, '_run_synthesis', new_callable=AsyncMock) as mock_synthesis:
+            mock_synthesis.return_value = {"sections": [], "metadata": {}}
+            batch = await arbiter.generate_batch(requests, max_concurrency=2, on_progress=events.append)
+
+        assert [output.request_id for output in batch.outputs] == ["REQ-0", "REQ-1", "REQ-2"]
+        assert batch.succeeded == 3
+        assert market_analyst.process.await_count == 1
+        assert strategy_architect.process.await_count == 3
+        assert batch.shared_analyses_reused == 2
+
+        assert events[-1].event == "batch_completed"
+        assert events[-1].completed == 3
+        assert max(event.running for event in events) <= 2
+        round_events = [event for event in events if event.event in ("round_started", "round_completed")]
+        assert {event.event for event in round_events} == {"round_started", "round_completed"}
+        assert all(event.request_id for event in round_events)
+        published = [call.args[0] for call in mock_message_bus.publish.call_args_list]
+        assert any(msg.payload.structured_data["type"] == "batch_progress" for msg in published)
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_survives_cleanup_failure(
+        self, mock_registry, mock_message_bus, sample_company_profile
+    ):
+        """Test that one generation failing to clean up does not abort the batch."""
+        arbiter = ArbiterAgent()
+        await arbiter.initialize(registry=mock_registry, message_bus=mock_message_bus)
+        requests = [
+            DocumentRequest(
+                id=f"REQ-{i}",
+                document_type="Simple",
+                company_profile=sample_company_profile,
+                max_adversarial_rounds=0,
+            )
+            for i in range(2)
+        ]
+
+        with patch.object(ArbiterAgent, '_run_synthesis', new_callable=AsyncMock) as mock_synthesis, \
+                patch.object(ArbiterAgent, 'cleanup', new_callable=AsyncMock) as mock_cleanup:
+            mock_synthesis.return_value = {"sections": [], "metadata": {}}
+            mock_cleanup.side_effect = RuntimeError("bus already stopped")
+            batch = await arbiter.generate_batch(requests)
+
+        assert [output.request_id for output in batch.outputs] == ["REQ-0", "REQ-1"]
+        assert batch.succeeded == 2
+
+
 # ============================================================================
 # Edge Case Tests
 # ============================================================================
@@ -33,7 +33,12 @@ from comms import (
     RoundPhase,
     RoundSummary,
     RoundConfig,
+    # Tracing
+    configure_tracing,
+    current_span,
+    span,
 )
+from comms.tracing import load_spans, to_chrome_trace
 
 
 # =============================================================================
@@ -786,5 +791,104 @@ class TestCommsIntegration:
         assert round_record.critique_count == 1
 
 
+# =============================================================================
+# Tracing Tests
+# =============================================================================
+
+class TestTracing:
+    """Tests for tracing spans."""
+
+    @pytest.fixture
+    def trace_file(self, tmp_path):
+        """Enable tracing to a temporary file for the test."""
+        path = tmp_path / "traces.jsonl"
+        configure_tracing(str(path))
+        yield path
+        configure_tracing(None)
+
+    def test_disabled_by_default(self):
+        """Spans should be no-ops without a trace file."""
+        with span("noop") as active:
+            assert active is None
+            assert current_span() is None
+
+    def test_nested_spans(self, trace_file):
+        """Child spans should inherit the trace id and point at their parent."""
+        with span("generate_document", trace_id="req-1") as root:
+            with span("agent.process", agent="Strategy Architect") as child:
+                assert current_span() is child
+            assert current_span() is root
+        assert current_span() is None
+
+        spans = {s["name"]: s for s in load_spans(str(trace_file))}
+        assert spans["generate_document"]["trace_id"] == "req-1"
+        assert spans["agent.process"]["trace_id"] == "req-1"
+        assert spans["agent.process"]["parent_id"] == spans["generate_document"]["span_id"]
+        assert spans["agent.process"]["attributes"] == {"agent": "Strategy Architect"}
+
+    def test_span_records_error(self, trace_file):
+        """An exception escaping a span should be recorded on it."""
+        with pytest.raises(ValueError):
+            with span("llm.attempt"):
+                raise ValueError("boom")
+
+        [record] = load_spans(str(trace_file))
+        assert record["error"] == "ValueError: boom"
+
+    def test_round_spans(self, trace_file):
+        """Each round should be traced from start to end."""
+        manager = RoundManager()
+        with span("generate_document", trace_id="req-2"):
+            manager.start_round(RoundType.BLUE_BUILD)
+            manager.end_round()
+
+        spans = load_spans(str(trace_file), trace_id="req-2")
+        rounds = [s for s in spans if s["name"] == "round"]
+        assert len(rounds) == 1
+        assert rounds[0]["attributes"]["round_type"] == RoundType.BLUE_BUILD.value
+
+    @pytest.mark.asyncio
+    async def test_bus_delivery_span(self, trace_file):
+        """Delivery should be traced from publish, under the publisher's span."""
+        bus = MessageBus()
+
+        async def handler(msg):
+            pass
+
+        await bus.start()
+        try:
+            await bus.subscribe(
+                agent_role="Test Agent",
+                message_types=[MessageType.DRAFT],
+                handler=handler,
+            )
+            with span("agent.process", trace_id="req-3") as publisher:
+                await bus.publish(
+                    Message(message_type=MessageType.DRAFT, sender_role="Sender"),
+                    wait_for_delivery=True,
+                )
+            await bus.wait_for_queue_empty(timeout=5.0)
+        finally:
+            await bus.stop()
+
+        spans = load_spans(str(trace_file), trace_id="req-3")
+        [deliver] = [s for s in spans if s["name"] == "bus.deliver"]
+        assert deliver["parent_id"] == publisher.span_id
+        assert deliver["attributes"]["message_type"] == MessageType.DRAFT.value
+        assert not bus._publish_spans
+
+    def test_chrome_trace_export(self, trace_file):
+        """Spans should convert to complete events on per-agent lanes."""
+        with span("generate_document", trace_id="req-4"):
+            with span("agent.process", agent="Red Team"):
+                pass
+
+        timeline = to_chrome_trace(load_spans(str(trace_file)))
+        events = [e for e in timeline["traceEvents"] if e["ph"] == "X"]
+        assert {e["name"] for e in events} == {"generate_document", "agent.process"}
+        assert len({e["tid"] for e in events}) == 2
+        json.dumps(timeline)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -36,6 +36,7 @@ from agents.blue.rules.small_business_rules import (
     get_size_standard,
     get_common_size_standards,
 )
+from agents.blue.rules.size_standard_table import SizeStandardTable
 from agents.blue.rules.setaside_rules import (
     SetAsideType,
     SetAsideValidator,
@@ -43,6 +44,10 @@ from agents.blue.rules.setaside_rules import (
     EligibilityStatus,
     check_setaside_eligibility,
 )
+from agents.blue.rules.eligibility_batch import (
+    BatchEligibilityEngine,
+    ProfileFeatureTable,
+)
 from agents.base import SwarmContext, AgentOutput
 from agents.config import AgentConfig, LLMConfig
 from agents.types import AgentRole, AgentCategory
@@ -204,6 +209,48 @@ class TestFARComplianceChecker:
         rule_ids = [r.id for r in rules]
         assert any("DFARS" in rid for rid in rule_ids)
 
+    def test_get_applicable_rules_memoized(self):
+        """Test that repeated applicability queries are served from cache."""
+        checker = FARComplianceChecker()
+
+        first = checker.get_applicable_rules(set_aside="HUBZone", contract_value=1_000_000)
+        second = checker.get_applicable_rules(set_aside="HUBZone", contract_value=5_000_000)
+
+        # Same value band, so same rules in the same order
+        assert [r.id for r in first] == [r.id for r in second]
+        # Callers get their own list
+        first.clear()
+        assert len(checker.get_applicable_rules(set_aside="HUBZone", contract_value=1_000_000)) > 0
+
+    def test_add_rule_updates_applicability_index(self):
+        """Test that custom rules are indexed and invalidate cached lookups."""
+        checker = FARComplianceChecker()
+        before = checker.get_applicable_rules(contract_type="IDIQ")
+        assert "AGENCY-IDIQ-001" not in [r.id for r in before]
+
+        checker.add_rule(FARRule(
+            id="AGENCY-IDIQ-001",
+            subpart=FARSubpart.FAR_16,
+            title="Agency IDIQ Ordering Procedures",
+            description="Agency-specific fair opportunity procedures",
+            requirement="Task orders must follow agency fair opportunity procedures.",
+            applicability="IDIQ task order competitions",
+        ))
+
+        after = checker.get_applicable_rules(contract_type="IDIQ")
+        assert "AGENCY-IDIQ-001" in [r.id for r in after]
+
+        # Replacing the rule re-indexes it under its new applicability
+        checker.add_rule(FARRule(
+            id="AGENCY-IDIQ-001",
+            subpart=FARSubpart.FAR_16,
+            title="Agency IDIQ Ordering Procedures",
+            description="Agency-specific fair opportunity procedures",
+            requirement="Task orders must follow agency fair opportunity procedures.",
+            applicability="BPA orders only",
+        ))
+        assert "AGENCY-IDIQ-001" not in [r.id for r in checker.get_applicable_rules(contract_type="IDIQ")]
+
     def test_check_compliance_with_content(self):
         """Test compliance checking against document content."""
         checker = FARComplianceChecker()
@@ -318,6 +365,104 @@ class TestSmallBusinessValidator:
         assert "HUBZone" in str(result.missing_requirements)
 
 
+# =============================================================================
+# Size Standard Table Tests
+# =============================================================================
+
+class TestSizeStandardTable:
+    """Tests for the compiled, memory-mapped size standard table."""
+
+    @pytest.fixture
+    def compiled_table(self, tmp_path):
+        """Compile a small two-version table in SBA export layout."""
+        csv_path = tmp_path / "size_standards.csv"
+        csv_path.write_text(
+            "NAICS Codes,NAICS U.S. Industry Title,Size Standards in millions of dollars,"
+            "Size standards in number of employees,Effective Date\n"
+            "Subsector 541,Professional Services,,,\n"
+            "541512,Computer Systems Design Services,$30.0,,2019-08-19\n"
+            "541512,Computer Systems Design Services,$34.0,,2023-03-17\n"
+            "336411,Aircraft Manufacturing,,\"1,500\",2023-03-17\n"
+            "811111,General Automotive Repair,$9.0,,2023-03-17\n"
+        )
+        output = tmp_path / "size_standards.bin"
+        count = SizeStandardTable.compile(csv_path, output)
+        assert count == 4
+
+        table = SizeStandardTable.open(output)
+        yield table
+        table.close()
+
+    def test_lookup_current_standard(self, compiled_table):
+        """Test looking up the standard in effect today."""
+        standard = compiled_table.lookup("541512")
+
+        assert standard.threshold == 34.0
+        assert standard.standard_type == SizeStandardType.REVENUE
+        assert standard.naics_description == "Computer Systems Design Services"
+        assert standard.effective_date == date(2023, 3, 17)
+
+    def test_lookup_historical_standard(self, compiled_table):
+        """Test that historical evaluations use the table version in effect."""
+        assert compiled_table.lookup("541512", as_of=date(2021, 1, 1)).threshold == 30.0
+        assert compiled_table.lookup("541512", as_of=date(2018, 1, 1)) is None
+        assert [s.threshold for s in compiled_table.versions("541512")] == [30.0, 34.0]
+
+    def test_lookup_employee_standard_and_misses(self, compiled_table):
+        """Test employee-based rows and codes outside the table."""
+        standard = compiled_table.lookup("336411")
+        assert standard.standard_type == SizeStandardType.EMPLOYEES
+        assert standard.threshold == 1500
+
+        assert compiled_table.lookup("541511") is None
+        assert compiled_table.lookup("811112") is None
+        assert compiled_table.lookup("not-a-code") is None
+
+    def test_validator_uses_table(self, compiled_table):
+        """Test that the validator prefers the table and falls back to common standards."""
+        validator = SmallBusinessValidator(size_table=compiled_table)
+
+        result = validator.check_size_status("811111", annual_revenue=5_000_000)
+        assert result["is_small"] is True
+        assert result["naics_description"] == "General Automotive Repair"
+
+        historical = validator.check_size_status(
+            "541512", annual_revenue=32_000_000, as_of=date(2021, 1, 1)
+        )
+        assert historical["is_small"] is False
+
+        # Not in the compiled table, still covered by common standards
+        assert validator.get_size_standard("541611").threshold == 19.5
+
+    def test_validator_no_fallback_before_first_version(self, compiled_table):
+        """Test that a date before every table version finds no standard."""
+        validator = SmallBusinessValidator(size_table=compiled_table)
+
+        assert validator.get_size_standard("541512", as_of=date(2018, 1, 1)) is None
+        result = validator.check_size_status(
+            "541512", annual_revenue=32_000_000, as_of=date(2018, 1, 1)
+        )
+        assert result["is_small"] is None
+        assert "2018-01-01" in result["status"]
+
+    def test_full_dollar_revenue_scaled_to_millions(self, tmp_path):
+        """Test that full-dollar cells in the millions column are scaled."""
+        csv_path = tmp_path / "full_dollars.csv"
+        csv_path.write_text(
+            "NAICS Codes,NAICS U.S. Industry Title,Size Standards in millions of dollars\n"
+            "541512,Computer Systems Design Services,\"$34,000,000\"\n"
+            "111110,Soybean Farming,\"$750,000\"\n"
+            "522110,Commercial Banking,$850 million\n"
+        )
+        output = tmp_path / "full_dollars.bin"
+        SizeStandardTable.compile(csv_path, output)
+
+        with SizeStandardTable.open(output) as table:
+            assert table.lookup("541512").threshold == 34.0
+            assert table.lookup("111110").threshold == 0.75
+            assert table.lookup("522110").threshold == 850.0
+
+
 # =============================================================================
 # Set-Aside Validator Tests
 # =============================================================================
@@ -426,6 +571,113 @@ class TestSetAsideValidator:
         assert result.is_eligible is False
 
 
+# =============================================================================
+# Batch Eligibility Tests
+# =============================================================================
+
+class TestBatchEligibilityEngine:
+    """Tests for batch profile x opportunity eligibility screening."""
+
+    @pytest.fixture
+    def partner_profiles(self, sample_company_profile) -> list:
+        """Several teaming partner profiles with different certifications."""
+        return [
+            sample_company_profile,
+            {
+                "name": "Large Partner",
+                "annual_revenue": 90_000_000,
+                "certifications": [],
+            },
+            {
+                "name": "Expired HUBZone Co",
+                "annual_revenue": 5_000_000,
+                "certifications": [
+                    {
+                        "cert_type": "HUBZone",
+                        "expiration_date": (date.today() - timedelta(days=10)).isoformat(),
+                    },
+                ],
+                "ownership_structure": [
+                    {"name": "A", "percentage": 60, "is_woman": True},
+                    {"name": "B", "percentage": 40, "is_veteran": True},
+                ],
+            },
+        ]
+
+    @pytest.fixture
+    def forecast_opportunities(self, sample_opportunity) -> list:
+        """Opportunities spanning several set-aside types and NAICS codes."""
+        return [
+            sample_opportunity,
+            {"solicitation_number": "OPP-2", "set_aside": "HUBZone", "naics_code": "541512"},
+            {"solicitation_number": "OPP-3", "set_aside": "VOSB", "naics_code": "541330"},
+            {"solicitation_number": "OPP-4", "set_aside": "Full and Open", "naics_code": "541512"},
+            {"solicitation_number": "OPP-5", "set_aside": "Small Business Set-Aside", "naics_code": "999999"},
+        ]
+
+    def test_feature_table_extraction(self, partner_profiles):
+        """Test that profile features are extracted into columns."""
+        table = ProfileFeatureTable.from_profiles(partner_profiles)
+
+        assert len(table) == 3
+        assert table.profile_ids[0] == "TechSolutions Inc."
+        assert table.has_certification["8(a)"] == [True, False, False]
+        # SDVOSB satisfies VOSB
+        assert table.has_certification["VOSB"] == [True, False, False]
+        assert table.days_until_expiry["HUBZone"][2] < 0
+        assert table.naics_codes[0] == ["541512", "541511"]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matrix_matches_single_validators(self, partner_profiles, forecast_opportunities, use_numpy):
+        """Test that batch results agree with the per-profile validators."""
+        engine = BatchEligibilityEngine(use_numpy=use_numpy)
+        matrix = engine.evaluate(partner_profiles, forecast_opportunities)
+
+        assert matrix.shape == (3, 5)
+
+        setaside_validator = SetAsideValidator()
+        sb_validator = SmallBusinessValidator()
+        for p, profile in enumerate(partner_profiles):
+            for o, opp in enumerate(forecast_opportunities):
+                expected = setaside_validator.check_eligibility(
+                    matrix.setaside_types[o], profile, opp
+                )
+                assert matrix.status(p, o) == expected.status
+
+                size = sb_validator.check_size_status(
+                    opp["naics_code"], profile.get("annual_revenue"), profile.get("employee_count")
+                )
+                is_open = matrix.setaside_types[o] == SetAsideType.FULL_AND_OPEN
+                assert matrix.is_eligible(p, o) == (
+                    expected.is_eligible and (is_open or size["is_small"] is not False)
+                )
+
+    def test_matrix_queries(self, partner_profiles, forecast_opportunities):
+        """Test row/column queries and serialization."""
+        engine = BatchEligibilityEngine()
+        matrix = engine.evaluate(partner_profiles, forecast_opportunities)
+
+        # Large partner only qualifies for full and open and unknown-size SB
+        assert matrix.eligible_opportunities(1) == ["OPP-4", "OPP-5"]
+        # Expired HUBZone cert is not eligible for the HUBZone opportunity
+        assert matrix.status(2, 1) == EligibilityStatus.EXPIRED
+        assert "TechSolutions Inc." in matrix.eligible_profiles(0)
+
+        data = matrix.to_dict()
+        assert data["opportunity_ids"][1] == "OPP-2"
+        assert data["setaside_status"][2][1] == "Expired"
+        assert data["size_status"][0][4] == -1
+
+    def test_explain_cell(self, sample_company_profile, sample_opportunity):
+        """Test that explain returns the full set-aside determination."""
+        engine = BatchEligibilityEngine()
+        result = engine.explain(sample_company_profile, sample_opportunity)
+
+        assert isinstance(result, SetAsideEligibility)
+        assert result.set_aside_type == SetAsideType.SBA_8A
+        assert result.is_eligible is True
+
+
 # =============================================================================
 # Compliance Navigator Agent Tests
 # =============================================================================
@@ -10,6 +10,7 @@ Tests the Devil's Advocate agent's ability to:
 
 import pytest
 from datetime import date
+from unittest.mock import AsyncMock
 from typing import Dict, Any, List
 
 from agents.red.devils_advocate import (
@@ -41,6 +42,7 @@ from agents.red.prompts.devils_advocate_prompts import (
     get_logic_analysis_prompt,
     get_response_evaluation_prompt,
 )
+from agents.red.prompts.delta_prompts import get_delta_critique_note
 
 
 # ============================================================================
@@ -524,6 +526,25 @@ class TestDevilsAdvocateAgent:
             critical_ratio = severity_counts["critical"] / total
             assert critical_ratio < 0.8, "Too many critiques rated as Critical"
 
+    @pytest.mark.asyncio
+    async def test_delta_critique_prompt_lists_unchanged_sections(
+        self,
+        devils_advocate: DevilsAdvocateAgent,
+        sample_context: SwarmContext,
+    ):
+        """Test that a delta critique tells the model which sections are not shown."""
+        sample_context.custom_data["critique_mode"] = "delta"
+        sample_context.custom_data["unchanged_sections"] = ["Risk Mitigation", "Compliance Checklist"]
+        devils_advocate._call_llm = AsyncMock(return_value={"success": False, "error": "stop"})
+
+        await devils_advocate.process(sample_context)
+
+        prompt = devils_advocate._call_llm.call_args.kwargs["user_prompt"]
+        assert prompt.startswith("## Critique Scope: Changed Sections Only")
+        assert "- Risk Mitigation" in prompt
+        assert "- Compliance Checklist" in prompt
+        assert get_delta_critique_note({}) == ""
+
     @pytest.mark.asyncio
     async def test_section_critique_mode(
         self,
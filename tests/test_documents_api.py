@@ -3,8 +3,12 @@
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from agents.usage_ledger import LLMCallRecord, UsageLedger
 from server.models.database import Document
+from server.services.documents import DocumentsService
 
 pytestmark = pytest.mark.asyncio(loop_scope="function")
 
@@ -192,6 +196,239 @@ class TestGetDocument:
         assert "timeElapsedMs" in metrics
 
 
+class TestDocumentLLMUsage:
+    """Tests for GET /api/documents/{id}/llm-usage."""
+
+    async def test_get_llm_usage(
+        self, client: AsyncClient, db_session: AsyncSession, db_document: Document
+    ):
+        """Should return the ledger stored with the generation metrics."""
+        ledger = UsageLedger(request_id="REQ-1")
+        ledger.record(LLMCallRecord(
+            agent_name="Market Analyst",
+            agent_role="Market Analyst",
+            provider="anthropic",
+            model="claude-haiku-4-5-20251001",
+            phase="BlueBuild",
+            round_number=1,
+            operation="comprehensive_analysis",
+            input_tokens=4000,
+            output_tokens=800,
+            latency_ms=5200,
+        ))
+        db_document.metrics = {**db_document.metrics, "llm_usage": ledger.to_dict()}
+        await db_session.commit()
+
+        response = await client.get(f"/api/documents/{db_document.id}/llm-usage")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["documentId"] == db_document.id
+        assert len(data["calls"]) == 1
+        assert data["calls"][0]["operation"] == "comprehensive_analysis"
+        assert data["calls"][0]["inputTokens"] == 4000
+        assert data["summary"]["totals"]["calls"] == 1
+        assert data["summary"]["byAgent"]["Market Analyst"]["estimatedCostUsd"] > 0
+
+    async def test_get_llm_usage_without_ledger(
+        self, client: AsyncClient, db_document: Document
+    ):
+        """Should return an empty ledger for documents generated without one."""
+        response = await client.get(f"/api/documents/{db_document.id}/llm-usage")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["calls"] == []
+        assert data["summary"]["totals"]["calls"] == 0
+
+    async def test_get_llm_usage_not_found(self, client: AsyncClient):
+        """Should return 404 for non-existent document."""
+        response = await client.get("/api/documents/nonexistent-id/llm-usage")
+        assert response.status_code == 404
+
+
+def _debate_entry(i: int, round_number: int) -> dict:
+    return {
+        "id": f"entry-{i}",
+        "round": round_number,
+        "phase": "red-attack",
+        "agentId": "Devil's Advocate",
+        "type": "critique",
+        "content": f"Critique {i}",
+        "timestamp": f"2026-01-01T00:00:0{i}+00:00",
+    }
+
+
+class TestDocumentDebateLog:
+    """Tests for GET /api/documents/{id}/debate-log and deferred document columns."""
+
+    async def test_debate_log_paginated(
+        self, client: AsyncClient, db_session: AsyncSession, db_document: Document
+    ):
+        """Should page debate entries in log order and filter them by round."""
+        entries = [_debate_entry(i, 1 if i < 3 else 2) for i in range(5)]
+        await DocumentsService(db_session).save_debate_log(db_document.id, entries)
+        await db_session.commit()
+
+        response = await client.get(
+            f"/api/documents/{db_document.id}/debate-log", params={"limit": 2, "offset": 1}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert [e["id"] for e in data["entries"]] == ["entry-1", "entry-2"]
+
+        response = await client.get(
+            f"/api/documents/{db_document.id}/debate-log", params={"round": 2}
+        )
+        assert [e["id"] for e in response.json()["entries"]] == ["entry-3", "entry-4"]
+
+        # The full document still carries the whole log
+        response = await client.get(f"/api/documents/{db_document.id}")
+        assert len(response.json()["debateLog"]) == 5
+
+    async def test_debate_log_falls_back_to_legacy_column(
+        self, client: AsyncClient, db_session: AsyncSession, db_document: Document
+    ):
+        """Should page the debate_log column of documents without debate entries."""
+        db_document.debate_log = [_debate_entry(i, 1) for i in range(3)]
+        await db_session.commit()
+
+        response = await client.get(
+            f"/api/documents/{db_document.id}/debate-log", params={"limit": 2}
+        )
+        data = response.json()
+        assert data["total"] == 3
+        assert [e["id"] for e in data["entries"]] == ["entry-0", "entry-1"]
+
+    async def test_get_by_id_defers_reports(
+        self, db_session: AsyncSession, db_document: Document
+    ):
+        """Should load the report columns only when details are requested."""
+        service = DocumentsService(db_session)
+        db_session.expunge_all()
+
+        document = await service.get_by_id(db_document.id)
+        assert {"content", "red_team_report", "debate_log"} <= inspect(document).unloaded
+
+        db_session.expunge_all()
+        document = await service.get_by_id(db_document.id, details=True)
+        assert document.content is not None
+        assert "debate_log" in inspect(document).unloaded
+
+    async def test_duplicate_copies_records(
+        self, client: AsyncClient, db_session: AsyncSession, db_document: Document
+    ):
+        """Should copy the section rows and debate entries to the duplicated document."""
+        await DocumentsService(db_session).save_generation_records(
+            db_document.id,
+            sections=[{"name": "Executive Summary", "content": "Summary.", "metadata": {}}],
+            debate_log=[_debate_entry(0, 1)],
+            exchanges=[],
+            versions=[],
+        )
+        await db_session.commit()
+
+        response = await client.post(f"/api/documents/{db_document.id}/duplicate")
+        assert response.status_code == 201
+
+        entries, total = await DocumentsService(db_session).get_debate_log(response.json()["id"])
+        assert total == 1
+        assert entries[0]["id"] == "entry-0"
+
+        response = await client.get(f"/api/documents/{response.json()['id']}")
+        assert [s["title"] for s in response.json()["content"]["sections"]] == ["Executive Summary"]
+
+
+class TestDocumentRecords:
+    """Tests for documents whose sections, critiques and versions are stored as rows."""
+
+    @pytest_asyncio.fixture
+    async def generated_document(self, db_session: AsyncSession, db_document: Document) -> Document:
+        """A document saved the way a generation result is: records as rows."""
+        db_document.content = {"overallConfidence": 80.0}
+        db_document.red_team_report = {
+            "summary": "Two rounds.",
+            "critiques_by_severity": {"major": 1},
+            "responses_by_disposition": {"Accept": 1},
+        }
+        await DocumentsService(db_session).save_generation_records(
+            db_document.id,
+            sections=[
+                {"name": "Executive Summary", "content": "Summary.", "metadata": {"confidence_score": 0.9}},
+                {"name": "Past Performance", "content": "Contracts.", "metadata": {}},
+            ],
+            debate_log=[],
+            exchanges=[
+                {
+                    "critique": {
+                        "id": "c1", "agent": "Devil's Advocate", "severity": "major",
+                        "title": "Vague", "argument": "Too vague.", "round_number": 2,
+                    },
+                    "response": {"id": "r1", "agent": "Strategy Architect", "disposition": "Accept",
+                                 "summary": "Added detail.", "round_number": 2},
+                },
+                {"critique": {"id": "c2", "severity": "minor", "title": "Typo", "round_number": 2}, "response": None},
+            ],
+            versions=[
+                {"version": 1, "round_type": "BlueBuild", "round_number": 1,
+                 "sections": {"Executive Summary": "Draft."}},
+                {"version": 2, "round_type": "BlueDefense", "round_number": 3,
+                 "sections": {"Executive Summary": "Summary."}},
+            ],
+        )
+        await db_session.commit()
+        return db_document
+
+    async def test_document_response_reads_rows(
+        self, client: AsyncClient, generated_document: Document
+    ):
+        """Should build the content and red team report from the section and critique rows."""
+        response = await client.get(f"/api/documents/{generated_document.id}")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [s["title"] for s in data["content"]["sections"]] == ["Executive Summary", "Past Performance"]
+        assert data["content"]["sections"][0]["confidence"] == 90.0
+        assert data["content"]["overallConfidence"] == 80.0
+
+        entries = data["redTeamReport"]["entries"]
+        assert [(e["id"], e["type"], e["round"]) for e in entries] == [
+            ("c1", "critique", 2), ("r1", "response", 2), ("c2", "critique", 2),
+        ]
+        assert entries[0]["status"] == "accepted"
+        assert entries[2]["status"] == "pending"
+
+    async def test_export_reads_section_rows(
+        self, client: AsyncClient, generated_document: Document
+    ):
+        """Should export the sections stored as rows."""
+        response = await client.get(
+            f"/api/documents/{generated_document.id}/export", params={"format": "markdown"}
+        )
+        assert response.status_code == 200
+        assert "## Past Performance" in response.text
+        assert "Contracts." in response.text
+
+    async def test_versions(self, client: AsyncClient, generated_document: Document):
+        """Should list the versions recorded after each round, optionally for one round."""
+        response = await client.get(f"/api/documents/{generated_document.id}/versions")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        assert [v["roundType"] for v in data["versions"]] == ["BlueBuild", "BlueDefense"]
+
+        response = await client.get(
+            f"/api/documents/{generated_document.id}/versions", params={"round": 3}
+        )
+        assert [v["version"] for v in response.json()["versions"]] == [2]
+
+    async def test_versions_not_found(self, client: AsyncClient):
+        """Should return 404 for non-existent document."""
+        response = await client.get("/api/documents/nonexistent-id/versions")
+        assert response.status_code == 404
+
+
 class TestDeleteDocument:
     """Tests for DELETE /api/documents/{id}."""
 
@@ -7,6 +7,7 @@ import pytest_asyncio
 from httpx import AsyncClient
 
 from server.models.database import CompanyProfile
+from server.services.documents import DocumentsService
 from server.services.orchestrator import GenerationContext, GenerationStatus, WorkflowPhase
 
 pytestmark = pytest.mark.asyncio(loop_scope="function")
@@ -197,6 +198,139 @@ class TestOrchestratorService:
         context.pause_event.set()
         assert context.pause_event.is_set()
 
+    async def test_section_finalized_streams_and_saves(self, db_session, db_document):
+        """Should broadcast each finalized section and save it to the document as it arrives."""
+        from comms.message import create_status_message
+        from server.models.schemas import SwarmConfigSchema
+        from server.services.orchestrator import OrchestratorService
+        from server.websocket.events import ServerEventType
+
+        ws_manager = MagicMock()
+        ws_manager.broadcast = AsyncMock()
+        service = OrchestratorService(ws_manager)
+        context = GenerationContext(
+            request_id="req_123",
+            document_id=db_document.id,
+            company_profile_id=db_document.company_profile_id,
+            config=SwarmConfigSchema(),
+            db=db_session,
+        )
+        service.active_requests[context.request_id] = context
+
+        db_document.content = None
+        await db_session.commit()
+
+        for name in ("Executive Summary", "Past Performance"):
+            message = create_status_message(
+                sender_role="Arbiter",
+                status_type="section_finalized",
+                data={
+                    "section": {
+                        "name": name,
+                        "content": f"Final {name}.",
+                        "metadata": {"confidence_score": 0.9, "total_critiques": 2, "resolved_critiques": 1},
+                    },
+                },
+            )
+            await service._on_message_bus_event(message, context.request_id)
+
+        event_type, payload = ws_manager.broadcast.call_args.args[1:]
+        assert event_type == ServerEventType.DRAFT_UPDATE
+        assert payload["finalizedSections"] == ["Executive Summary", "Past Performance"]
+        assert payload["draft"]["sections"][1]["confidence"] == 90.0
+        assert payload["draft"]["sections"][1]["unresolvedCritiques"] == 1
+
+        documents = DocumentsService(db_session)
+        content = await documents.get_content(db_document)
+        assert content["partial"] is True
+        assert [s["name"] for s in content["sections"]] == ["Executive Summary", "Past Performance"]
+
+        # The full document, once saved, is never replaced by partial content
+        await documents.save_sections(db_document.id, [{"name": "Executive Summary", "content": "Full."}])
+        db_document.content = {"overallConfidence": 0.9}
+        await db_session.commit()
+        await service._save_finalized_sections(context)
+        content = await documents.get_content(db_document)
+        assert "partial" not in content
+        assert [s["content"] for s in content["sections"]] == ["Full."]
+
+    async def test_generation_result_saved_as_rows(self, db_session, db_document):
+        """Should store sections, exchanges and versions as rows, not in the JSON columns."""
+        from types import SimpleNamespace
+
+        from server.models.schemas import SwarmConfigSchema
+        from server.services.orchestrator import OrchestratorService
+
+        service = OrchestratorService(MagicMock())
+        context = GenerationContext(
+            request_id="req_123",
+            document_id=db_document.id,
+            company_profile_id=db_document.company_profile_id,
+            config=SwarmConfigSchema(),
+        )
+        exchange = {"critique": {"id": "c1", "severity": "major", "round_number": 2}, "response": None}
+        result = SimpleNamespace(
+            success=True,
+            sections=[{"name": "Executive Summary"}],
+            document={"overallConfidence": 0.8, "sections": [{"name": "Executive Summary", "content": "Final."}]},
+            confidence=None,
+            red_team_report={"summary": "One round.", "exchanges": [exchange]},
+            debate_log=[],
+            document_versions=[{"version": 1, "round_type": "BlueBuild", "round_number": 1, "sections": {}}],
+            requires_human_review=False,
+            total_rounds=1,
+            total_critiques=1,
+            resolved_critiques=0,
+            consensus_reached=False,
+            duration_seconds=1.0,
+            llm_usage={},
+            early_termination=None,
+        )
+
+        await service._save_generation_result(context, result, db_session)
+
+        await db_session.refresh(db_document, ["content", "red_team_report"])
+        assert "sections" not in db_document.content
+        assert "exchanges" not in db_document.red_team_report
+        documents = DocumentsService(db_session)
+        assert [s["content"] for s in (await documents.get_content(db_document))["sections"]] == ["Final."]
+        assert (await documents.get_red_team_report(db_document))["exchanges"][0]["critique"]["id"] == "c1"
+        assert len(await documents.get_versions(db_document.id)) == 1
+        # The in-memory result is left whole for the completion event
+        assert result.red_team_report["exchanges"] == [exchange]
+
+    async def test_section_finalized_saves_new_document(self, db_session, db_profile):
+        """Should save finalized sections to a document created by start_generation."""
+        from sqlalchemy import select
+        from sqlalchemy.orm import undefer_group
+
+        from server.models.database import Document, async_session_maker
+        from server.models.schemas import DocumentGenerationRequest
+        from server.services.orchestrator import OrchestratorService
+
+        ws_manager = MagicMock()
+        ws_manager.subscribe_to_request = AsyncMock()
+        service = OrchestratorService(ws_manager)
+        request = DocumentGenerationRequest(
+            document_type="capability-statement", company_profile_id=db_profile.id
+        )
+
+        # The document stays in the session with its deferred content unloaded
+        with patch.object(OrchestratorService, "_run_generation", new_callable=AsyncMock):
+            context = await service.start_generation("req_new", request, db_session, "conn_1")
+        context.db = db_session
+        context.finalized_sections.append({"name": "Executive Summary", "content": "Final."})
+
+        await service._save_finalized_sections(context)
+
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(Document).options(undefer_group("details")).where(Document.id == context.document_id)
+            )
+            content = await DocumentsService(session).get_content(result.scalar_one())
+        assert content["partial"] is True
+        assert [s["name"] for s in content["sections"]] == ["Executive Summary"]
+
 
 class TestGenerationRequestSchema:
     """Tests for generation request schema validation."""
@@ -22,6 +22,8 @@ from models.market_data import (
     MarketOpportunityStatus,
     MarketAnalysis,
 )
+from models.market_index import load_contract_awards
+from models.market_analytics import MarketAnalytics, compute_market_analytics, analyze_market_data
 
 # Agent
 from agents.blue.market_analyst import MarketAnalystAgent, MarketAnalysisResult
@@ -36,6 +38,7 @@ from agents.blue.prompts.market_analyst_prompts import (
     get_opportunity_ranking_prompt,
     get_incumbent_analysis_prompt,
     get_timing_analysis_prompt,
+    format_market_analytics,
 )
 
 
@@ -321,6 +324,191 @@ class TestMarketData:
         assert len(restored.recent_awards) == 1
 
 
+class TestMarketDataIndex:
+    """Tests for the indexed market data query layer."""
+
+    @pytest.fixture
+    def bulk_market_data(self) -> MarketData:
+        """Market data with many awards and forecasts across agencies."""
+        agencies = ["Department of Defense", "Defense Logistics Agency", "Department of Veterans Affairs", "DHS"]
+        awardees = ["Acme Federal, Inc.", "Beta Systems LLC", "Gamma Corp"]
+        awards = [
+            ContractAward(
+                contract_number=f"C-{i}",
+                award_date=date(2023, 1, 1) + timedelta(days=i * 7),
+                award_amount=1_000_000 + i,
+                agency=agencies[i % 4],
+                awardee_name=awardees[i % 3],
+                awardee_uei=f"UEI{i % 3:09d}",
+                naics_code="541512" if i % 2 else "541511",
+            )
+            for i in range(60)
+        ]
+        forecasts = [
+            ForecastOpportunity(
+                title=f"Forecast {i}",
+                agency=agencies[i % 4],
+                naics_code="541512" if i % 3 else "541330",
+                estimated_solicitation_date=(date.today() + timedelta(days=30 * i)) if i % 5 else None,
+                incumbent=awardees[i % 3] if i % 2 else None,
+            )
+            for i in range(20)
+        ]
+        return MarketData(recent_awards=awards, forecast_opportunities=forecasts)
+
+    def test_queries_match_linear_scans(self, bulk_market_data):
+        """Test indexed queries return the same rows, in order, as list scans."""
+        md = bulk_market_data
+        assert md.get_awards_by_naics("541512") == [a for a in md.recent_awards if a.naics_code == "541512"]
+        for agency in ["defense", "Department", "DHS", "Unknown"]:
+            assert md.get_awards_by_agency(agency) == [
+                a for a in md.recent_awards if agency.lower() in a.agency.lower()
+            ]
+            assert md.get_forecasts_by_agency(agency) == [
+                f for f in md.forecast_opportunities if agency.lower() in f.agency.lower()
+            ]
+        assert md.get_forecasts_by_naics("541330") == [
+            f for f in md.forecast_opportunities if f.naics_code == "541330"
+        ]
+
+        cutoff = date.today() + timedelta(days=180)
+        assert md.get_upcoming_forecasts(180) == [
+            f for f in md.forecast_opportunities
+            if f.estimated_solicitation_date and f.estimated_solicitation_date <= cutoff
+        ]
+
+    def test_contractor_and_date_range_queries(self, bulk_market_data):
+        """Test contractor lookups and date range queries."""
+        md = bulk_market_data
+
+        by_name = md.get_awards_by_contractor("ACME FEDERAL INC")
+        assert len(by_name) == 20
+        assert md.get_awards_by_contractor("uei000000000") == by_name
+        assert len(md.index().forecasts_by_incumbent("Beta Systems LLC")) > 0
+
+        start, end = date(2023, 3, 1), date(2023, 6, 30)
+        in_range = md.index().awards_between(start, end)
+        assert in_range == [a for a in md.recent_awards if start <= a.award_date <= end]
+
+        window = md.get_forecasts_between(date.today() + timedelta(days=60), date.today() + timedelta(days=120))
+        assert all(f.estimated_solicitation_date for f in window)
+        assert [f.title for f in window] == ["Forecast 2", "Forecast 3", "Forecast 4"]
+
+    def test_index_rebuilds_after_append(self, bulk_market_data):
+        """Test that the index picks up appended rows."""
+        md = bulk_market_data
+        before = len(md.get_awards_by_naics("336411"))
+        md.recent_awards.append(ContractAward(naics_code="336411", agency="NASA"))
+
+        assert len(md.get_awards_by_naics("336411")) == before + 1
+        assert len(md.get_awards_by_agency("nasa")) == 1
+
+    def test_load_contract_awards_from_fpds_csv(self, tmp_path):
+        """Test bulk loading awards from an FPDS-style export."""
+        csv_path = tmp_path / "awards.csv"
+        csv_path.write_text(
+            "award_id_piid,action_date,federal_action_obligation,awarding_agency_name,"
+            "recipient_name,recipient_uei,naics_code,type_of_set_aside\n"
+            "W91-001,2024-02-15,\"1,250,000.00\",Department of Defense,Acme Federal,ABC123,541512,8(a)\n"
+            "VA-002,03/01/2024,500000,Department of Veterans Affairs,Beta Systems,,541511,\n"
+        )
+
+        awards = load_contract_awards(csv_path)
+
+        assert len(awards) == 2
+        assert awards[0].contract_number == "W91-001"
+        assert awards[0].award_amount == 1_250_000.0
+        assert awards[0].award_date == date(2024, 2, 15)
+        assert awards[0].set_aside == "8(a)"
+        assert awards[1].award_date == date(2024, 3, 1)
+        assert awards[1].awardee_uei is None
+
+        md = MarketData(recent_awards=awards)
+        assert len(md.get_awards_by_contractor("ABC123")) == 1
+
+
+class TestMarketAnalytics:
+    """Tests for columnar award and budget analytics."""
+
+    @pytest.fixture
+    def awards(self):
+        """Awards across two NAICS codes, agencies and years."""
+        return [
+            ContractAward(award_amount=4_000_000, agency="DoD", awardee_name="Acme Federal, Inc.",
+                          naics_code="541512", award_date=date(2023, 5, 1)),
+            ContractAward(award_amount=1_000_000, agency="DoD", awardee_name="Beta Systems",
+                          naics_code="541512", award_date=date(2024, 2, 1)),
+            ContractAward(award_amount=3_000_000, agency="VA", awardee_name="ACME FEDERAL INC",
+                          naics_code="541511", award_date=date(2024, 6, 1)),
+            ContractAward(award_amount=2_000_000, agency="VA", awardee_name="Gamma Corp",
+                          naics_code="541511"),
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_award_aggregates(self, awards, use_numpy):
+        """Test TAM, distribution and concentration figures."""
+        analytics = compute_market_analytics(awards, naics_codes=["541512"], use_numpy=use_numpy)
+
+        assert analytics.award_count == 4
+        assert analytics.total_award_value == 10_000_000
+        assert analytics.tam_by_naics == {"541512": 5_000_000, "541511": 5_000_000}
+        assert analytics.tam_by_agency == {"DoD": 5_000_000, "VA": 5_000_000}
+        assert analytics.company_naics_tam == 5_000_000
+        assert analytics.annual_award_totals == {2023: 4_000_000, 2024: 4_000_000}
+
+        assert analytics.award_values.median == pytest.approx(2_500_000)
+        assert analytics.award_values.percentiles[25] == pytest.approx(1_750_000)
+        assert analytics.award_values.maximum == 4_000_000
+
+        # Acme's two awards are merged by normalized name
+        assert analytics.awardee_count == 3
+        assert analytics.incumbent_share["Acme Federal, Inc."] == pytest.approx(0.7)
+        assert analytics.concentration_hhi == pytest.approx(70 ** 2 + 20 ** 2 + 10 ** 2)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_budget_trend_slopes(self, use_numpy):
+        """Test fitted slopes for multi-year budgets and YoY fallback."""
+        budgets = [
+            BudgetInfo(agency="DoD", fiscal_year=2023, total_budget=800.0),
+            BudgetInfo(agency="DoD", fiscal_year=2024, total_budget=850.0),
+            BudgetInfo(agency="DoD", fiscal_year=2025, total_budget=900.0),
+            BudgetInfo(agency="VA", fiscal_year=2025, total_budget=110.0, yoy_change_percent=10.0),
+            BudgetInfo(agency="DHS", fiscal_year=2025, total_budget=50.0),
+        ]
+
+        slopes = compute_market_analytics([], budgets=budgets, use_numpy=use_numpy).budget_slopes
+
+        assert list(slopes) == ["DoD", "VA"]
+        assert slopes["DoD"] == pytest.approx(50.0)
+        assert slopes["VA"] == pytest.approx(10.0)
+
+    def test_analyze_serialized_market_data(self, sample_market_data):
+        """Test analytics from MarketData.to_dict() and the prompt summary."""
+        data = sample_market_data.to_dict()
+        analytics = analyze_market_data(data, naics_codes=["541512"])
+
+        assert analytics.budget_slopes
+        assert MarketAnalytics.from_dict(analytics.to_dict()) == analytics
+
+        lines = format_market_analytics(analytics.to_dict())
+        assert any("Award Value Distribution" in line for line in lines)
+        assert format_market_analytics(MarketAnalytics().to_dict()) == []
+
+    def test_prompt_uses_analytics_instead_of_award_rows(self, sample_company_profile, sample_market_data):
+        """Test that precomputed analytics replace the raw award listing."""
+        data = sample_market_data.to_dict()
+        analytics = analyze_market_data(data).to_dict()
+
+        prompt = get_market_analysis_prompt(
+            company_profile=sample_company_profile,
+            market_data=data,
+            market_analytics=analytics,
+        )
+
+        assert "Market Analytics" in prompt
+        assert "Recent Contract Awards" not in prompt
+
+
 class TestMarketAnalysis:
     """Tests for MarketAnalysis model."""
 
@@ -0,0 +1,174 @@
+"""
+Unit tests for server middleware metrics.
+
+Tests the fixed-memory latency histograms, windowed rates, and the
+/metrics endpoint in JSON and Prometheus formats.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from server.middleware import (
+    LatencyHistogram,
+    RateWindow,
+    RequestMetrics,
+    get_metrics,
+)
+
+pytestmark = pytest.mark.asyncio(loop_scope="function")
+
+
+# ============================================================================
+# Histogram Tests
+# ============================================================================
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    async def test_quantiles_within_bucket_error(self):
+        """Quantiles should be within the histogram's relative error."""
+        histogram = LatencyHistogram()
+        for duration in range(1, 1001):
+            histogram.record(float(duration))
+
+        assert histogram.count == 1000
+        assert histogram.min_ms == 1.0
+        assert histogram.max_ms == 1000.0
+        assert histogram.mean_ms == pytest.approx(500.5)
+        assert histogram.quantile(0.50) == pytest.approx(500, rel=0.05)
+        assert histogram.quantile(0.90) == pytest.approx(900, rel=0.05)
+        assert histogram.quantile(0.99) == pytest.approx(990, rel=0.05)
+
+    async def test_memory_is_fixed(self):
+        """Recording more samples, including out-of-range ones, should not grow storage."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(10 ** 9)
+        for _ in range(10_000):
+            histogram.record(12.5)
+
+        assert len(histogram._counts) == LatencyHistogram.NUM_BUCKETS
+        assert histogram.quantile(0.0) == 0.0
+        assert histogram.quantile(1.0) == 10 ** 9
+
+    async def test_empty_histogram(self):
+        """An empty histogram should report zeros."""
+        histogram = LatencyHistogram()
+        assert histogram.quantile(0.99) == 0.0
+        assert histogram.mean_ms == 0.0
+
+    async def test_rate_window_expires_old_events(self):
+        """Events older than the window should not count toward the rate."""
+        window = RateWindow(window_seconds=10)
+        for _ in range(20):
+            window.record(now=100.0)
+        window.record(now=105.0)
+
+        assert window.rate(now=105.0) == pytest.approx(2.1)
+        assert window.rate(now=111.0) == pytest.approx(0.1)
+        assert window.rate(now=200.0) == 0.0
+
+
+# ============================================================================
+# Request Metrics Tests
+# ============================================================================
+
+
+class TestRequestMetrics:
+    """Tests for RequestMetrics."""
+
+    async def test_stats_include_percentiles(self):
+        """Endpoint and WebSocket stats should include percentiles and rates."""
+        metrics = RequestMetrics()
+        metrics.record_request("/api/documents/{document_id}", 200, 12.0)
+        metrics.record_request("/api/documents/{document_id}", 404, 3.0)
+        metrics.record_ws_event("agent:stream-chunk", 0.5)
+
+        stats = metrics.get_stats()
+
+        endpoint = stats["endpoints"]["/api/documents/{document_id}"]
+        assert endpoint["count"] == 2
+        assert endpoint["min_ms"] == 3.0
+        assert endpoint["max_ms"] == 12.0
+        assert {"p50_ms", "p90_ms", "p99_ms", "rate_per_second_1m"} <= set(endpoint)
+        assert stats["websocket_events"]["agent:stream-chunk"]["count"] == 1
+        assert stats["total_errors"] == 1
+
+    async def test_stream_chunk_latency_by_stage(self):
+        """Stream chunk latency should be split into bus and WebSocket stages."""
+        metrics = RequestMetrics()
+        metrics.record_stream_chunk(received_at=100.0, bridged_at=100.004, sent_at=100.005)
+
+        latency = metrics.get_stats()["stream_chunk_latency"]
+
+        assert latency["bus"]["max_ms"] == pytest.approx(4.0)
+        assert latency["websocket"]["max_ms"] == pytest.approx(1.0)
+        assert latency["total"]["max_ms"] == pytest.approx(5.0)
+        assert 'llm_stream_chunk_latency_seconds_count{stage="total"} 1' in metrics.to_prometheus()
+
+    async def test_prometheus_format(self):
+        """Prometheus output should expose counters and summaries in seconds."""
+        metrics = RequestMetrics()
+        metrics.record_request('/api/"quoted"', 200, 250.0)
+
+        text = metrics.to_prometheus()
+
+        assert '# TYPE http_request_duration_seconds summary' in text
+        assert 'http_requests_total{status="200"} 1' in text
+        assert 'http_request_duration_seconds{endpoint="/api/\\"quoted\\"",quantile="0.5"}' in text
+        assert 'http_request_duration_seconds_sum{endpoint="/api/\\"quoted\\""} 0.25' in text
+        assert text.endswith("\n")
+
+
+# ============================================================================
+# Metrics Endpoint Tests
+# ============================================================================
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    async def test_routes_recorded_by_template(self, client: AsyncClient):
+        """Requests should be grouped by route template, not concrete path."""
+        get_metrics().reset()
+        await client.get("/api/documents/first-id")
+        await client.get("/api/documents/second-id")
+
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        endpoints = response.json()["endpoints"]
+
+        assert endpoints["/api/documents/{document_id}"]["count"] == 2
+        assert not any("first-id" in path for path in endpoints)
+
+    async def test_parameter_matching_literal_segment(self, client: AsyncClient):
+        """A parameter value equal to a literal path segment should keep the template."""
+        get_metrics().reset()
+        await client.get("/api/documents/share/share")
+
+        endpoints = (await client.get("/metrics")).json()["endpoints"]
+
+        assert "/api/documents/{document_id}/share" in endpoints
+        assert not any(path.endswith("{document_id}/{document_id}") for path in endpoints)
+
+    async def test_unmatched_paths_share_one_series(self, client: AsyncClient):
+        """Requests that match no route should not create a series per path."""
+        get_metrics().reset()
+        await client.get("/no/such/path-1")
+        await client.get("/no/such/path-2")
+
+        endpoints = (await client.get("/metrics")).json()["endpoints"]
+
+        assert list(endpoints) == ["<unmatched>"]
+        assert endpoints["<unmatched>"]["count"] == 2
+
+    async def test_prometheus_negotiation(self, client: AsyncClient):
+        """Scrapers asking for text/plain should get the Prometheus format."""
+        response = await client.get("/metrics", headers={"Accept": "text/plain;version=0.0.4"})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE http_requests_total counter" in response.text
+
+        response = await client.get("/metrics?format=prometheus")
+        assert "# TYPE http_requests_total counter" in response.text
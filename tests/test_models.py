@@ -19,7 +19,9 @@ from models.company_profile import (
     PerformanceRating,
     TeamMember,
     CoreCapability,
+    ProfileSnapshot,
 )
+from models.past_performance_index import PastPerformanceIndex
 from models.opportunity import (
     Opportunity,
     Agency,
@@ -253,6 +255,167 @@ class TestCompanyProfile:
         assert len(restored.certifications) == 2
 
 
+class TestProfileSnapshot:
+    """Tests for ProfileSnapshot."""
+
+    @pytest.fixture
+    def profile_data(self):
+        return {
+            "name": "Acme Federal",
+            "naics_codes": [{"code": "541512"}, {"code": "541519", "is_primary": True}],
+            "certifications": [
+                "8(a)",
+                {"cert_type": "SDVOSB", "expiration_date": "2020-01-01"},
+                {"cert_type": "HUBZone", "expiration_date": "2099-01-01"},
+            ],
+            "ownership_structure": [
+                {"name": "A", "percentage": 51, "is_veteran": True, "is_service_disabled_veteran": True},
+                {"name": "B", "percentage": 49, "is_woman": True},
+            ],
+        }
+
+    def test_derived_facts(self, profile_data):
+        """Test that derived facts are precomputed from the profile dict."""
+        snapshot = ProfileSnapshot(profile_data, as_of=date(2025, 1, 1))
+
+        assert snapshot.certification_types == ("8(a)", "SDVOSB", "HUBZone")
+        assert snapshot.valid_certification_types == {"8(a)", "HUBZone"}
+        assert snapshot.find_certification("VOSB") == profile_data["certifications"][1]
+        assert snapshot.has_certification("8(a)") and not snapshot.has_certification("WOSB")
+        assert snapshot.ownership_percentages["service_disabled_veteran"] == 51
+        assert snapshot.ownership_percentages["woman"] == 49
+        assert snapshot.naics_set == {"541512", "541519"}
+        assert snapshot.primary_naics == "541519"
+
+    def test_read_only_mapping(self, profile_data):
+        """Test that the snapshot reads like the dict but cannot be changed."""
+        snapshot = ProfileSnapshot(profile_data)
+
+        assert snapshot["name"] == "Acme Federal"
+        assert snapshot.get("missing", "default") == "default"
+        assert dict(snapshot) == profile_data
+        assert str(snapshot) == str(profile_data)
+        assert ProfileSnapshot.of(snapshot) is snapshot
+        with pytest.raises(TypeError):
+            snapshot["name"] = "Other"
+        with pytest.raises(AttributeError):
+            snapshot.primary_naics = "000000"
+        assert not hasattr(snapshot, "__dict__")
+
+    def test_empty_profile(self):
+        """Test a snapshot of a missing profile."""
+        snapshot = ProfileSnapshot.of(None)
+
+        assert len(snapshot) == 0
+        assert snapshot.certification_types == ()
+        assert snapshot.primary_naics is None
+
+
+class TestPastPerformanceIndex:
+    """Tests for PastPerformanceIndex."""
+
+    @pytest.fixture
+    def records(self) -> List[PastPerformance]:
+        return [
+            PastPerformance(
+                contract_name="VA Modernization",
+                agency="Department of Veterans Affairs",
+                contract_value=5_000_000,
+                period_of_performance_end=date(2024, 6, 30),
+                naics_codes=["541512"],
+            ),
+            PastPerformance(
+                contract_name="Army Help Desk",
+                agency="U.S. Army",
+                contract_value=800_000,
+                period_of_performance_end=date(2015, 1, 1),
+                naics_codes=["541519"],
+            ),
+            PastPerformance(
+                contract_name="VA Cloud Migration",
+                agency="Dept. of Veterans Affairs",
+                contract_value=20_000_000,
+                period_of_performance_start=date(2023, 1, 1),
+                naics_codes=["541512", "518210"],
+            ),
+            PastPerformance(
+                contract_name="DHS Analytics",
+                agency="Department of Homeland Security",
+                contract_value=4_000_000,
+                period_of_performance_end=date(2024, 12, 31),
+                naics_codes=["541511"],
+            ),
+        ]
+
+    def test_filter_matches_linear_scan(self, records):
+        """Test that indexed filters match the original list comprehensions."""
+        profile = CompanyProfile(past_performance=records)
+
+        for naics, agency, min_value in [
+            (None, None, None),
+            (["541512"], None, None),
+            (None, "veterans affairs", None),
+            (["541512", "541519"], None, 1_000_000),
+            (["541512"], "Veterans", 10_000_000),
+            (["999999"], None, None),
+        ]:
+            expected = [
+                pp for pp in records
+                if (not naics or any(code in pp.naics_codes for code in naics))
+                and (not agency or agency.lower() in pp.agency.lower().replace(".", ""))
+                and (not min_value or pp.contract_value >= min_value)
+            ]
+            assert profile.get_relevant_past_performance(naics, agency, min_value) == expected
+
+    def test_index_rebuilt_when_list_changes(self, records):
+        """Test that the cached index follows appends to the list."""
+        profile = CompanyProfile(past_performance=records[:2])
+        index = profile.past_performance_index()
+        assert profile.past_performance_index() is index
+
+        profile.past_performance.append(records[2])
+        assert profile.past_performance_index() is not index
+        assert len(profile.get_relevant_past_performance(naics_codes=["518210"])) == 1
+
+    def test_top_k_ranks_by_relevance(self, records):
+        """Test that the most relevant citations come first."""
+        index = PastPerformanceIndex(records, as_of=date(2025, 1, 1))
+
+        top = index.top_k(2, naics_codes=["541512"], agency="Veterans Affairs", value=15_000_000)
+
+        assert [s.record.contract_name for s in top] == ["VA Cloud Migration", "VA Modernization"]
+        assert top[0].naics_overlap == 1.0
+        assert top[0].agency_match == 1.0
+        assert top[0].recency == 1.0  # Ongoing
+        assert top[0].score > top[1].score
+
+    def test_top_k_pads_with_recent_records(self, records):
+        """Test that weak queries still return k citations, most recent first."""
+        index = PastPerformanceIndex(records, as_of=date(2025, 1, 1))
+
+        top = index.most_relevant(3)
+
+        assert [pp.contract_name for pp in top] == ["VA Cloud Migration", "DHS Analytics", "VA Modernization"]
+        assert index.top_k(0) == []
+
+    def test_dict_and_string_records(self):
+        """Test indexing past performance as stored on profile dicts."""
+        snapshot = ProfileSnapshot({
+            "past_performance": [
+                "Legacy help desk support",
+                {"contract_name": "EPA Data", "agency": "EPA", "value": "$2,000,000",
+                 "naics_codes": ["541512"], "period_of_performance_end": "2024-09-30"},
+            ],
+        })
+
+        index = snapshot.past_performance_index
+        assert snapshot.past_performance_index is index
+        assert index.by_naics(["541512"])[0]["contract_name"] == "EPA Data"
+        assert index.with_min_value(1_000_000)[0]["contract_name"] == "EPA Data"
+        assert index.most_relevant(5, agency="EPA")[0]["contract_name"] == "EPA Data"
+        assert len(index.most_relevant(5)) == 2
+
+
 # ============================================================================
 # Opportunity Tests
 # ============================================================================
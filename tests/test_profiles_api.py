@@ -1,11 +1,18 @@
 """Tests for the Profiles API endpoints."""
 
+from datetime import datetime
+
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from server.main import app
-from server.models.database import Base, engine
+from server.models.database import Base, CompanyProfile, engine
+from server.services.profiles import (
+    camel_to_snake,
+    convert_keys_to_snake_case,
+    normalized_profiles,
+)
 
 pytestmark = pytest.mark.asyncio(loop_scope="function")
 
@@ -284,3 +291,61 @@ class TestCertificationsAndPastPerformance:
         get_response = await client.get(f"/api/profiles/{profile_id}")
         fetched = get_response.json()
         assert fetched["pastPerformance"] == ["New Contract X", "New Contract Y"]
+
+
+class TestProfileNormalization:
+    """Tests for the normalized (snake_case) profile agents receive."""
+
+    async def test_convert_keys_to_snake_case(self):
+        """Should convert nested camelCase keys, including acronyms."""
+        data = {
+            "companyName": "Acme",
+            "pastPerformance": [{"contractValue": 100, "agencyPOC": "Jane"}],
+            "HTTPServer": {"maxConnections": 5},
+        }
+
+        assert convert_keys_to_snake_case(data) == {
+            "company_name": "Acme",
+            "past_performance": [{"contract_value": 100, "agency_poc": "Jane"}],
+            "http_server": {"max_connections": 5},
+        }
+        assert camel_to_snake("already_snake") == "already_snake"
+
+    async def test_normalized_when_saved(self, client, sample_profile_data):
+        """Should normalize on create and update, keyed by updated_at."""
+        normalized_profiles.clear()
+        sample_profile_data["fullProfile"] = {"ueiNumber": "ABC123", "employeeCount": 50}
+        profile_id = (await client.post("/api/profiles", json=sample_profile_data)).json()["id"]
+
+        entry = normalized_profiles._entries[profile_id]
+        assert entry[1]["uei_number"] == "ABC123"
+        assert entry[1]["name"] == "Acme Federal"
+
+        await client.put(
+            f"/api/profiles/{profile_id}",
+            json={"fullProfile": {"ueiNumber": "XYZ789"}},
+        )
+        assert normalized_profiles._entries[profile_id][1]["uei_number"] == "XYZ789"
+
+        await client.delete(f"/api/profiles/{profile_id}")
+        assert profile_id not in normalized_profiles._entries
+
+    async def test_stale_entry_is_recomputed(self):
+        """A profile edited elsewhere (new updated_at) should miss the cache."""
+        profile = CompanyProfile(
+            id="p-1", name="Acme", full_profile={"employeeCount": 10},
+            updated_at=datetime(2025, 1, 1),
+        )
+        normalized_profiles.store(profile)
+
+        profile.full_profile = {"employeeCount": 20}
+        assert normalized_profiles.get(profile)["employee_count"] == 10
+
+        profile.updated_at = datetime(2025, 1, 2)
+        result = normalized_profiles.get(profile)
+        assert result["employee_count"] == 20
+
+        # Callers get a copy they can extend
+        result["years_in_business"] = 5
+        assert "years_in_business" not in normalized_profiles.get(profile)
+        normalized_profiles.discard("p-1")
@@ -7,6 +7,7 @@ Tests the Strategy Architect's ability to:
 - Produce outputs conforming to document schemas
 """
 
+import asyncio
 import pytest
 from datetime import date
 from typing import Dict, Any
@@ -536,6 +537,85 @@ class TestStrategyArchitectAgent:
         assert output.success
         assert "Company Overview" in output.sections
 
+    @pytest.mark.asyncio
+    async def test_concurrent_revisions_bounded_and_tagged(
+        self,
+        sample_company_profile: Dict[str, Any],
+    ):
+        """Section revisions should run concurrently up to the limit, streamed per section."""
+        config = get_default_config(AgentRole.STRATEGY_ARCHITECT)
+        config.custom_params["max_concurrent_sections"] = 2
+        agent = StrategyArchitectAgent(config)
+
+        streamed = []
+        agent.set_stream_callback(lambda chunk, section: streamed.append((section, chunk)))
+        active = {"now": 0, "max": 0}
+        operations = set()
+
+        async def fake_llm(system_prompt, user_prompt, stream_callback=None, operation=""):
+            operations.add(operation)
+            stream_callback("revising")
+            section = streamed[-1][0]
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return {"success": True, "content": f"## {section}\n\nRevised {section}."}
+
+        agent._call_llm = fake_llm
+        sections = ["Company Overview", "Past Performance", "Certifications"]
+        context = SwarmContext(
+            document_type="Capability Statement",
+            company_profile=sample_company_profile,
+            round_type="BlueDefense",
+            section_drafts={name: f"Draft {name}." for name in sections},
+            pending_critiques=[
+                {"id": f"crit-{i}", "target_section": name, "argument": "Too vague"}
+                for i, name in enumerate(reversed(sections))
+            ],
+        )
+
+        output = await agent.process(context)
+
+        assert active["max"] == 2
+        assert operations == {"revise_from_critiques"}
+        assert {section for section, _ in streamed} == set(sections)
+        assert [r["critique_id"] for r in output.responses] == ["crit-0", "crit-1", "crit-2"]
+        assert output.sections["Certifications"] == "Revised Certifications."
+
+    @pytest.mark.asyncio
+    async def test_section_drafts_wait_for_dependencies(
+        self,
+        strategy_architect: StrategyArchitectAgent,
+        sample_context: SwarmContext,
+    ):
+        """A section should be drafted after the dependencies drafted with it."""
+        streamed = []
+        strategy_architect.set_stream_callback(lambda chunk, section: streamed.append(section))
+        events = []
+        prompts = {}
+
+        async def fake_llm(system_prompt, user_prompt, stream_callback=None, operation=""):
+            stream_callback("drafting")
+            section = streamed[-1]
+            prompts[section] = user_prompt
+            events.append(("start", section))
+            await asyncio.sleep(0.01)
+            events.append(("end", section))
+            return {"success": True, "content": f"## {section}\n\nDrafted {section} text."}
+
+        strategy_architect._call_llm = fake_llm
+        # Core Competencies depends on Company Overview
+        sample_context.round_type = None
+        sample_context.target_sections = ["Core Competencies", "Company Overview"]
+
+        output = await strategy_architect.process(sample_context)
+
+        assert output.success
+        assert events.index(("end", "Company Overview")) < events.index(("start", "Core Competencies"))
+        assert "Drafted Company Overview text." in prompts["Core Competencies"]
+        assert list(output.sections) == ["Core Competencies", "Company Overview"]
+
     def test_parse_sections_from_response(
         self, strategy_architect: StrategyArchitectAgent
     ):